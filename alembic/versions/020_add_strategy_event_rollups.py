@@ -0,0 +1,59 @@
+"""add_strategy_event_rollups
+
+Revision ID: 020_add_strategy_event_rollups
+Revises: 019_drop_validation_cache
+Create Date: 2026-10-16
+
+Per-minute rollups of strategy_events for pipeline metrics
+(maintained by src.metrics.rollups.EventRollups): event counts and
+durations, and numeric/categorical event_data fields.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '020_add_strategy_event_rollups'
+down_revision: Union[str, Sequence[str], None] = '019_drop_validation_cache'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create strategy_event_rollups and strategy_event_metric_rollups tables."""
+    op.create_table(
+        'strategy_event_rollups',
+        sa.Column('bucket', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('stage', sa.String(30), nullable=False),
+        sa.Column('event_type', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('source', sa.String(30), nullable=False, server_default=''),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('duration_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('duration_sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('duration_min', sa.Integer(), nullable=True),
+        sa.Column('duration_max', sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint('bucket', 'stage', 'event_type', 'status', 'source'),
+    )
+    op.create_table(
+        'strategy_event_metric_rollups',
+        sa.Column('bucket', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('stage', sa.String(30), nullable=False),
+        sa.Column('event_type', sa.String(50), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('source', sa.String(30), nullable=False, server_default=''),
+        sa.Column('metric', sa.String(80), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('sum', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('min', sa.Float(), nullable=True),
+        sa.Column('max', sa.Float(), nullable=True),
+        sa.PrimaryKeyConstraint('bucket', 'stage', 'event_type', 'status', 'source', 'metric'),
+    )
+
+
+def downgrade() -> None:
+    """Drop strategy_event_rollups and strategy_event_metric_rollups tables."""
+    op.drop_table('strategy_event_metric_rollups')
+    op.drop_table('strategy_event_rollups')
@@ -0,0 +1,55 @@
+"""add_signal_fingerprints
+
+Revision ID: 021_add_signal_fingerprints
+Revises: 020_add_strategy_event_rollups
+Create Date: 2026-10-16
+
+Entry-signal fingerprints for pre-backtest deduplication
+(maintained by src.backtester.signal_fingerprint.SignalFingerprinter).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '021_add_signal_fingerprints'
+down_revision: Union[str, Sequence[str], None] = '020_add_strategy_event_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create signal_fingerprints table."""
+    op.create_table(
+        'signal_fingerprints',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('signal_hash', sa.String(64), nullable=False),
+        sa.Column('timeframe', sa.String(10), nullable=False),
+        sa.Column('n_bits', sa.Integer(), nullable=False),
+        sa.Column('n_signals', sa.Integer(), nullable=False),
+        sa.Column('bitset', sa.LargeBinary(), nullable=False),
+        sa.Column('lsh_bands', postgresql.ARRAY(sa.String()), nullable=False),
+        sa.Column('strategy_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('strategy_name', sa.String(100), nullable=False),
+        sa.Column('duplicate_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_duplicate_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(['strategy_id'], ['strategies.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('signal_hash'),
+    )
+    op.create_index(
+        'idx_signal_fingerprints_bands', 'signal_fingerprints', ['lsh_bands'],
+        postgresql_using='gin',
+    )
+    op.create_index('idx_signal_fingerprints_created', 'signal_fingerprints', ['created_at'])
+
+
+def downgrade() -> None:
+    """Drop signal_fingerprints table."""
+    op.drop_index('idx_signal_fingerprints_created', table_name='signal_fingerprints')
+    op.drop_index('idx_signal_fingerprints_bands', table_name='signal_fingerprints')
+    op.drop_table('signal_fingerprints')
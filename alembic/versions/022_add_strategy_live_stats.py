@@ -0,0 +1,57 @@
+"""add_strategy_live_stats
+
+Revision ID: 022_add_strategy_live_stats
+Revises: 021_add_signal_fingerprints
+Create Date: 2026-10-16
+
+Running statistics of closed live trades per strategy
+(maintained by src.scorer.live_stats). Rows are built from the trades
+table on first use, so existing LIVE strategies need no backfill here.
+last_trade_id is the last folded trade, so a trade closed twice (executor
+exit racing TradeSync) is not folded twice.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '022_add_strategy_live_stats'
+down_revision: Union[str, Sequence[str], None] = '021_add_signal_fingerprints'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create strategy_live_stats table."""
+    op.create_table(
+        'strategy_live_stats',
+        sa.Column('strategy_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('n_trades', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('n_wins', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('n_returns', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('sum_return', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('sum_sq_return', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('n_win_returns', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('sum_win_return', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('n_loss_returns', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('sum_loss_return', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('n_pnls', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_pnl', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('peak_pnl', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('max_drawdown', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('loss_streak', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('first_entry_time', sa.DateTime(), nullable=True),
+        sa.Column('last_exit_time', sa.DateTime(), nullable=True),
+        sa.Column('last_trade_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['strategy_id'], ['strategies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('strategy_id'),
+    )
+
+
+def downgrade() -> None:
+    """Drop strategy_live_stats table."""
+    op.drop_table('strategy_live_stats')
@@ -0,0 +1,223 @@
+"""add_strategy_summaries
+
+Revision ID: 023_add_strategy_summaries
+Revises: 022_add_strategy_live_stats
+Create Date: 2026-10-16
+
+Denormalized per-strategy read model for the dashboard API
+(src.database.models.StrategySummary), kept in sync by triggers:
+
+- strategies INSERT/UPDATE: upsert identity, status, scores, live metrics
+- backtest_results INSERT/UPDATE/DELETE: recompute the best in_sample and
+  out_of_sample result (highest sharpe_ratio) of the affected strategy
+
+Deleting a strategy removes its row through the FK cascade. Existing
+strategies are backfilled here.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '023_add_strategy_summaries'
+down_revision: Union[str, Sequence[str], None] = '022_add_strategy_live_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns copied from strategies (status is the strategy_status enum there)
+STRATEGY_COLUMNS = [
+    'name', 'strategy_type', 'timeframe', 'status', 'created_at',
+    'score_backtest', 'score_live', 'sharpe_live', 'win_rate_live',
+    'total_trades_live', 'total_pnl_live', 'last_live_update',
+]
+
+# (summary suffix, backtest_results column) of the best IS/OOS result
+RESULT_COLUMNS = [
+    ('result_id', 'id'),
+    ('sharpe', 'sharpe_ratio'),
+    ('win_rate', 'win_rate'),
+    ('expectancy', 'expectancy'),
+    ('max_drawdown', 'max_drawdown'),
+    ('total_trades', 'total_trades'),
+    ('total_return', 'total_return_pct'),
+]
+
+
+def _strategy_values(row: str) -> str:
+    return ', '.join(
+        f'{row}.status::text' if col == 'status' else f'{row}.{col}'
+        for col in STRATEGY_COLUMNS
+    )
+
+
+def _best_result_assignments(prefix: str, row: str) -> str:
+    return ', '.join(f'{prefix}_{suffix} = {row}.{col}' for suffix, col in RESULT_COLUMNS)
+
+
+def upgrade() -> None:
+    """Create strategy_summaries with its sync triggers and backfill it."""
+    op.create_table(
+        'strategy_summaries',
+        sa.Column('strategy_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('strategy_type', sa.String(50), nullable=False),
+        sa.Column('timeframe', sa.String(10), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('score_backtest', sa.Float(), nullable=True),
+        sa.Column('score_live', sa.Float(), nullable=True),
+        sa.Column('sharpe_live', sa.Float(), nullable=True),
+        sa.Column('win_rate_live', sa.Float(), nullable=True),
+        sa.Column('total_trades_live', sa.Integer(), nullable=True),
+        sa.Column('total_pnl_live', sa.Float(), nullable=True),
+        sa.Column('last_live_update', sa.DateTime(), nullable=True),
+        sa.Column('is_result_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('is_sharpe', sa.Float(), nullable=True),
+        sa.Column('is_win_rate', sa.Float(), nullable=True),
+        sa.Column('is_expectancy', sa.Float(), nullable=True),
+        sa.Column('is_max_drawdown', sa.Float(), nullable=True),
+        sa.Column('is_total_trades', sa.Integer(), nullable=True),
+        sa.Column('is_total_return', sa.Float(), nullable=True),
+        sa.Column('oos_result_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('oos_sharpe', sa.Float(), nullable=True),
+        sa.Column('oos_win_rate', sa.Float(), nullable=True),
+        sa.Column('oos_expectancy', sa.Float(), nullable=True),
+        sa.Column('oos_max_drawdown', sa.Float(), nullable=True),
+        sa.Column('oos_total_trades', sa.Integer(), nullable=True),
+        sa.Column('oos_total_return', sa.Float(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(['strategy_id'], ['strategies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('strategy_id'),
+    )
+
+    op.create_index(
+        'idx_summary_created', 'strategy_summaries', ['created_at', 'strategy_id'],
+        postgresql_include=['name', 'strategy_type', 'timeframe', 'status',
+                            'is_sharpe', 'is_win_rate', 'is_total_trades', 'total_pnl_live'],
+    )
+    op.create_index(
+        'idx_summary_status_created', 'strategy_summaries', ['status', 'created_at', 'strategy_id'],
+        postgresql_include=['name', 'strategy_type', 'timeframe',
+                            'is_sharpe', 'is_win_rate', 'is_total_trades', 'total_pnl_live'],
+    )
+    op.create_index(
+        'idx_summary_status_score_backtest', 'strategy_summaries',
+        ['status', 'score_backtest', 'strategy_id'],
+        postgresql_include=['name', 'strategy_type', 'timeframe', 'is_sharpe', 'is_win_rate',
+                            'is_expectancy', 'is_max_drawdown', 'is_total_trades'],
+        postgresql_where=sa.text('score_backtest IS NOT NULL'),
+    )
+    op.create_index(
+        'idx_summary_status_score_live', 'strategy_summaries',
+        ['status', 'score_live', 'strategy_id'],
+        postgresql_include=['name', 'strategy_type', 'timeframe', 'sharpe_live', 'win_rate_live',
+                            'total_trades_live', 'total_pnl_live', 'last_live_update'],
+        postgresql_where=sa.text('score_live IS NOT NULL'),
+    )
+
+    columns = ', '.join(STRATEGY_COLUMNS)
+    updates = ', '.join(f'{col} = EXCLUDED.{col}' for col in STRATEGY_COLUMNS)
+
+    # strategies -> summary row
+    op.execute(f"""
+        CREATE FUNCTION strategy_summaries_sync_strategy() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO strategy_summaries (strategy_id, {columns}, updated_at)
+            VALUES (NEW.id, {_strategy_values('NEW')}, now())
+            ON CONFLICT (strategy_id) DO UPDATE SET {updates}, updated_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_strategy_summaries_insert
+        AFTER INSERT ON strategies
+        FOR EACH ROW EXECUTE FUNCTION strategy_summaries_sync_strategy()
+    """)
+    # Skip updates that touch none of the copied columns (processing_by, code, ...)
+    changed = ' OR '.join(f'OLD.{col} IS DISTINCT FROM NEW.{col}' for col in STRATEGY_COLUMNS)
+    op.execute(f"""
+        CREATE TRIGGER trg_strategy_summaries_update
+        AFTER UPDATE ON strategies
+        FOR EACH ROW WHEN ({changed})
+        EXECUTE FUNCTION strategy_summaries_sync_strategy()
+    """)
+
+    # backtest_results -> best IS/OOS of the strategy
+    op.execute(f"""
+        CREATE FUNCTION strategy_summaries_refresh_backtest(sid uuid) RETURNS void AS $$
+        DECLARE
+            best_is backtest_results%ROWTYPE;
+            best_oos backtest_results%ROWTYPE;
+        BEGIN
+            SELECT * INTO best_is FROM backtest_results
+            WHERE strategy_id = sid AND period_type = 'in_sample'
+            ORDER BY sharpe_ratio DESC NULLS LAST, created_at DESC
+            LIMIT 1;
+
+            SELECT * INTO best_oos FROM backtest_results
+            WHERE strategy_id = sid AND period_type = 'out_of_sample'
+            ORDER BY sharpe_ratio DESC NULLS LAST, created_at DESC
+            LIMIT 1;
+
+            UPDATE strategy_summaries SET
+                {_best_result_assignments('is', 'best_is')},
+                {_best_result_assignments('oos', 'best_oos')},
+                updated_at = now()
+            WHERE strategy_id = sid;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION strategy_summaries_sync_backtest() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP <> 'DELETE' THEN
+                PERFORM strategy_summaries_refresh_backtest(NEW.strategy_id);
+            END IF;
+            IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND OLD.strategy_id <> NEW.strategy_id) THEN
+                PERFORM strategy_summaries_refresh_backtest(OLD.strategy_id);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_strategy_summaries_backtest
+        AFTER INSERT OR DELETE OR UPDATE OF
+            strategy_id, period_type, sharpe_ratio, win_rate, expectancy,
+            max_drawdown, total_trades, total_return_pct
+        ON backtest_results
+        FOR EACH ROW EXECUTE FUNCTION strategy_summaries_sync_backtest()
+    """)
+
+    # Backfill
+    op.execute(f"""
+        INSERT INTO strategy_summaries (strategy_id, {columns}, updated_at)
+        SELECT s.id, {_strategy_values('s')}, now() FROM strategies s
+    """)
+    for prefix, period_type in [('is', 'in_sample'), ('oos', 'out_of_sample')]:
+        op.execute(f"""
+            UPDATE strategy_summaries SET {_best_result_assignments(prefix, 'b')}
+            FROM (
+                SELECT DISTINCT ON (strategy_id) *
+                FROM backtest_results
+                WHERE period_type = '{period_type}'
+                ORDER BY strategy_id, sharpe_ratio DESC NULLS LAST, created_at DESC
+            ) b
+            WHERE strategy_summaries.strategy_id = b.strategy_id
+        """)
+
+
+def downgrade() -> None:
+    """Drop strategy_summaries and its triggers."""
+    op.execute("DROP TRIGGER IF EXISTS trg_strategy_summaries_backtest ON backtest_results")
+    op.execute("DROP TRIGGER IF EXISTS trg_strategy_summaries_update ON strategies")
+    op.execute("DROP TRIGGER IF EXISTS trg_strategy_summaries_insert ON strategies")
+    op.execute("DROP FUNCTION IF EXISTS strategy_summaries_sync_backtest()")
+    op.execute("DROP FUNCTION IF EXISTS strategy_summaries_refresh_backtest(uuid)")
+    op.execute("DROP FUNCTION IF EXISTS strategy_summaries_sync_strategy()")
+    op.drop_table('strategy_summaries')
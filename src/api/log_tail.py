@@ -0,0 +1,344 @@
+"""
+Log File Tailing
+
+Parsing and filtering of service log lines for the logs API, read from the
+end of the file instead of loading it whole:
+
+- LogTailReader: newest-first matching lines, read backwards from EOF in
+  blocks until enough lines match. Results are cached per (file, level,
+  search) with the byte range they cover, so a repeat request only reads
+  the bytes appended since.
+- LogFollower: new matching lines since the previous poll (streaming).
+
+Only newline-terminated lines are read; a line still being written is
+picked up once complete. Rotation (new inode) or truncation restarts the
+file.
+
+Usage:
+    reader = LogTailReader()
+    lines = reader.read('logs/generator.log', lines=500, level='WARNING')
+
+    follower = LogFollower('logs/generator.log', LineFilter(search='backtest'))
+    new_lines = follower.poll()
+"""
+
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from src.api.schemas import LogLine
+
+# Log level order for filtering
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+TAIL_BLOCK_SIZE = 64 * 1024
+TAIL_CACHE_ENTRIES = 32
+TAIL_MAX_LINES = 5000  # Max lines per request (API limit), also the cache bound per entry
+FOLLOW_MAX_READ = 1024 * 1024  # Bytes read per poll, the rest on the next one
+
+
+def parse_log_line(line: str) -> Optional[LogLine]:
+    """
+    Parse a log line into structured format.
+
+    Supports multiple log formats:
+    1. Standard: "2025-01-02 14:32:15 INFO     src.generator.main: Message"
+    2. Metrics: "2025-01-02 14:32:15,123 - __main__ - INFO - Message"
+    3. API: "2025-01-02 14:32:15 - src.api.routes - INFO - Message"
+    4. Uvicorn: "INFO:     127.0.0.1:1234 - \"GET /api/...\" 200 OK"
+
+    Returns None if line doesn't match expected format.
+    """
+    # Try multiple patterns with named groups for clarity
+    # Pattern 1: Standard format - timestamp level logger: message
+    match = re.match(
+        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s+(\w+)\s+(\S+):\s*(.*)$',
+        line
+    )
+    if match:
+        try:
+            timestamp_str, level, logger_name, message = match.groups()
+            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+            return LogLine(
+                timestamp=timestamp,
+                level=level.upper(),
+                logger=logger_name,
+                message=message,
+            )
+        except (ValueError, AttributeError):
+            pass
+
+    # Pattern 2: Metrics/API format - timestamp - logger - level - message
+    match = re.match(
+        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),?\d*\s+-\s+(\S+)\s+-\s+(\w+)\s+-\s*(.*)$',
+        line
+    )
+    if match:
+        try:
+            timestamp_str, logger_name, level, message = match.groups()
+            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
+            return LogLine(
+                timestamp=timestamp,
+                level=level.upper(),
+                logger=logger_name,
+                message=message,
+            )
+        except (ValueError, AttributeError):
+            pass
+
+    # Pattern 3: Uvicorn format - LEVEL:     message
+    match = re.match(r'^(\w+):\s+(.*)$', line)
+    if match:
+        level, message = match.groups()
+        level_upper = level.upper()
+        return LogLine(
+            timestamp=datetime.now(),
+            level=level_upper if level_upper in LOG_LEVELS else "INFO",
+            logger="uvicorn",
+            message=message,
+        )
+
+    return None
+
+
+class LineFilter:
+    """
+    Minimum level and case-insensitive search on message or logger.
+
+    Lines with a level outside LOG_LEVELS pass the level filter.
+    """
+
+    def __init__(self, level: Optional[str] = None, search: Optional[str] = None):
+        level = level.upper() if level else None
+        self.min_level_idx = LOG_LEVELS.index(level) if level in LOG_LEVELS else 0
+        self.search = search.lower() if search else None
+        self.key = (LOG_LEVELS[self.min_level_idx], self.search)
+
+    def __call__(self, raw: bytes) -> Optional[LogLine]:
+        """Parsed line if it matches, else None"""
+        line = raw.decode('utf-8', errors='replace').strip()
+        if not line:
+            return None
+
+        parsed = parse_log_line(line)
+        if not parsed:
+            return None
+
+        if parsed.level in LOG_LEVELS and LOG_LEVELS.index(parsed.level) < self.min_level_idx:
+            return None
+
+        if self.search and self.search not in parsed.message.lower() and self.search not in parsed.logger.lower():
+            return None
+
+        return parsed
+
+
+def _complete_end(f: BinaryIO, size: int, block_size: int = TAIL_BLOCK_SIZE) -> int:
+    """Offset just after the last newline before size (0 if none)"""
+    pos = size
+    while pos > 0:
+        start = max(0, pos - block_size)
+        f.seek(start)
+        idx = f.read(pos - start).rfind(b'\n')
+        if idx >= 0:
+            return start + idx + 1
+        pos = start
+    return 0
+
+
+def _reverse_lines(f: BinaryIO, end: int, stop: int = 0,
+                   block_size: int = TAIL_BLOCK_SIZE) -> Iterator[Tuple[int, bytes]]:
+    """
+    Lines in [stop, end) from last to first, as (offset, line without newline).
+
+    end and stop must be line boundaries.
+    """
+    pos = end
+    buffer = b''
+    line_end = 0  # Lines still to yield are buffer[:line_end]
+    while pos > stop:
+        start = max(stop, pos - block_size)
+        f.seek(start)
+        buffer = f.read(pos - start) + buffer[:line_end]
+        line_end = len(buffer)
+        pos = start
+
+        # The newline before a line ends the previous one; the first line in
+        # the buffer may continue in the next block back
+        while True:
+            idx = buffer.rfind(b'\n', 0, line_end - 1)
+            if idx < 0:
+                break
+            yield pos + idx + 1, buffer[idx + 1:line_end - 1]
+            line_end = idx + 1
+
+    if line_end > 0:
+        yield stop, buffer[:line_end - 1]
+
+
+@dataclass
+class _TailEntry:
+    """Matching lines of [start, end) of one file, newest first"""
+    inode: int
+    start: int
+    end: int
+    lines: List[Tuple[int, LogLine]] = field(default_factory=list)
+
+
+class LogTailReader:
+    """
+    Newest-first matching lines of log files, read backwards from EOF.
+
+    Each (file, level, search) keeps the matching lines of the byte range
+    read so far. A repeat request scans back from EOF only to the cached
+    range (merging if it gets there before enough lines match), and
+    further back from the cached start only when it needs more lines.
+    """
+
+    def __init__(self, max_entries: int = TAIL_CACHE_ENTRIES, block_size: int = TAIL_BLOCK_SIZE):
+        self.max_entries = max_entries
+        self.block_size = block_size
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def read(
+        self,
+        filepath: str,
+        lines: int = 500,
+        level: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> List[LogLine]:
+        """
+        Last matching lines of a log file.
+
+        Args:
+            filepath: Path to log file
+            lines: Max lines to return (at most TAIL_MAX_LINES)
+            level: Minimum log level to include
+            search: Search string to filter
+
+        Returns:
+            List of LogLine objects (newest first)
+        """
+        lines = min(lines, TAIL_MAX_LINES)
+        line_filter = LineFilter(level, search)
+        key = (os.path.abspath(filepath),) + line_filter.key
+
+        try:
+            with open(filepath, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                with self._lock:
+                    entry = self._cache.pop(key, None)
+                    if entry is not None and (entry.inode != stat.st_ino or stat.st_size < entry.end):
+                        entry = None  # Rotated or truncated
+
+                    entry = self._update(f, stat, entry, lines, line_filter)
+
+                    self._cache[key] = entry
+                    while len(self._cache) > self.max_entries:
+                        self._cache.popitem(last=False)
+
+                    return [parsed for _, parsed in entry.lines[:lines]]
+        except FileNotFoundError:
+            return []
+
+    def _update(self, f: BinaryIO, stat: os.stat_result, entry: Optional[_TailEntry],
+                lines: int, line_filter: LineFilter) -> _TailEntry:
+        end = _complete_end(f, stat.st_size, self.block_size)
+
+        # Appended lines, back to the cached range
+        stop = entry.end if entry is not None else 0
+        fresh, reached = self._scan(f, end, stop, lines, line_filter)
+        if entry is not None and reached == entry.end:
+            entry.lines = fresh + entry.lines
+            entry.end = end
+        else:
+            entry = _TailEntry(inode=stat.st_ino, start=reached, end=end, lines=fresh)
+
+        # Older lines before the cached range
+        if len(entry.lines) < lines and entry.start > 0:
+            older, entry.start = self._scan(f, entry.start, 0, lines - len(entry.lines), line_filter)
+            entry.lines.extend(older)
+
+        if len(entry.lines) > TAIL_MAX_LINES:
+            del entry.lines[TAIL_MAX_LINES:]
+            entry.start = entry.lines[-1][0]
+        return entry
+
+    def _scan(self, f: BinaryIO, end: int, stop: int, needed: int,
+              line_filter: LineFilter) -> Tuple[List[Tuple[int, LogLine]], int]:
+        """
+        Matching lines of [stop, end) backwards, until needed lines match.
+
+        Returns:
+            (lines newest first, offset of the last line read)
+        """
+        matched = []
+        reached = end
+        for offset, raw in _reverse_lines(f, end, stop, self.block_size):
+            reached = offset
+            parsed = line_filter(raw)
+            if parsed:
+                matched.append((offset, parsed))
+                if len(matched) >= needed:
+                    break
+        return matched, reached
+
+    def clear(self) -> None:
+        """Drop all cached ranges"""
+        with self._lock:
+            self._cache.clear()
+
+
+class LogFollower:
+    """
+    New matching lines of a log file since the previous poll.
+
+    Starts at the end of the file; after rotation or truncation it reads
+    the new file from the start.
+    """
+
+    def __init__(self, filepath: str, line_filter: LineFilter, max_read: int = FOLLOW_MAX_READ):
+        self.filepath = filepath
+        self.line_filter = line_filter
+        self.max_read = max_read
+        self.inode: Optional[int] = None
+        self.offset: Optional[int] = None
+
+    def poll(self) -> List[LogLine]:
+        """Matching lines completed since the last poll, oldest first"""
+        try:
+            with open(self.filepath, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                if self.offset is None:
+                    self.inode = stat.st_ino
+                    self.offset = _complete_end(f, stat.st_size)
+                    return []
+                if stat.st_ino != self.inode or stat.st_size < self.offset:
+                    self.inode = stat.st_ino
+                    self.offset = 0
+
+                if stat.st_size <= self.offset:
+                    return []
+                f.seek(self.offset)
+                chunk = f.read(min(stat.st_size - self.offset, self.max_read))
+        except FileNotFoundError:
+            return []
+
+        complete = chunk.rfind(b'\n') + 1
+        if complete == 0:
+            if len(chunk) < self.max_read:
+                return []  # Line still being written
+            complete = len(chunk)  # A single line longer than max_read
+        self.offset += complete
+
+        new_lines = []
+        for raw in chunk[:complete].split(b'\n'):
+            parsed = self.line_filter(raw)
+            if parsed:
+                new_lines.append(parsed)
+        return new_lines
@@ -2,14 +2,18 @@
 Logs API routes
 
 GET /api/logs/{service} - Get log lines for a service
+GET /api/logs/{service}/stream - Follow new log lines (Server-Sent Events)
 """
-import re
+import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 
+from src.api.log_tail import LOG_LEVELS, LineFilter, LogFollower, LogTailReader
 from src.api.schemas import LogLine, LogsResponse
 from src.utils import get_logger
 
@@ -35,72 +39,12 @@ SERVICE_LOG_FILES = {
     "subaccount": str(PROJECT_ROOT / "logs/subaccount.log"),
 }
 
-# Log level order for filtering
-LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+# Shared across requests so repeat reads of a log are incremental
+_tail_reader = LogTailReader()
 
-
-def parse_log_line(line: str) -> Optional[LogLine]:
-    """
-    Parse a log line into structured format.
-
-    Supports multiple log formats:
-    1. Standard: "2025-01-02 14:32:15 INFO     src.generator.main: Message"
-    2. Metrics: "2025-01-02 14:32:15,123 - __main__ - INFO - Message"
-    3. API: "2025-01-02 14:32:15 - src.api.routes - INFO - Message"
-    4. Uvicorn: "INFO:     127.0.0.1:1234 - \"GET /api/...\" 200 OK"
-
-    Returns None if line doesn't match expected format.
-    """
-    # Try multiple patterns with named groups for clarity
-    # Pattern 1: Standard format - timestamp level logger: message
-    match = re.match(
-        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\s+(\w+)\s+(\S+):\s*(.*)$',
-        line
-    )
-    if match:
-        try:
-            timestamp_str, level, logger_name, message = match.groups()
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-            return LogLine(
-                timestamp=timestamp,
-                level=level.upper(),
-                logger=logger_name,
-                message=message,
-            )
-        except (ValueError, AttributeError):
-            pass
-
-    # Pattern 2: Metrics/API format - timestamp - logger - level - message
-    match = re.match(
-        r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),?\d*\s+-\s+(\S+)\s+-\s+(\w+)\s+-\s*(.*)$',
-        line
-    )
-    if match:
-        try:
-            timestamp_str, logger_name, level, message = match.groups()
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S")
-            return LogLine(
-                timestamp=timestamp,
-                level=level.upper(),
-                logger=logger_name,
-                message=message,
-            )
-        except (ValueError, AttributeError):
-            pass
-
-    # Pattern 3: Uvicorn format - LEVEL:     message
-    match = re.match(r'^(\w+):\s+(.*)$', line)
-    if match:
-        level, message = match.groups()
-        level_upper = level.upper()
-        return LogLine(
-            timestamp=datetime.now(),
-            level=level_upper if level_upper in LOG_LEVELS else "INFO",
-            logger="uvicorn",
-            message=message,
-        )
-
-    return None
+# Follow mode
+STREAM_POLL_SECONDS = 0.5
+STREAM_HEARTBEAT_SECONDS = 15.0
 
 
 def read_log_file(
@@ -110,7 +54,7 @@ def read_log_file(
     search: Optional[str] = None,
 ) -> List[LogLine]:
     """
-    Read and parse log file.
+    Read and parse the last lines of a log file.
 
     Args:
         filepath: Path to log file
@@ -121,55 +65,26 @@ def read_log_file(
     Returns:
         List of LogLine objects (newest first)
     """
-    path = Path(filepath)
-    if not path.exists():
-        return []
-
-    # Determine minimum level index
-    min_level_idx = 0
-    if level:
-        level = level.upper()
-        if level in LOG_LEVELS:
-            min_level_idx = LOG_LEVELS.index(level)
-
-    parsed_lines = []
-
     try:
-        # Read file from end (tail behavior)
-        with open(path, 'r', encoding='utf-8', errors='replace') as f:
-            # Read all lines and take last N
-            all_lines = f.readlines()
-            # Process in reverse order (newest first)
-            for line in reversed(all_lines):
-                line = line.strip()
-                if not line:
-                    continue
-
-                parsed = parse_log_line(line)
-                if not parsed:
-                    continue
-
-                # Filter by level
-                if parsed.level in LOG_LEVELS:
-                    line_level_idx = LOG_LEVELS.index(parsed.level)
-                    if line_level_idx < min_level_idx:
-                        continue
-
-                # Filter by search term
-                if search:
-                    search_lower = search.lower()
-                    if search_lower not in parsed.message.lower() and search_lower not in parsed.logger.lower():
-                        continue
-
-                parsed_lines.append(parsed)
-
-                if len(parsed_lines) >= lines:
-                    break
-
+        return _tail_reader.read(filepath, lines=lines, level=level, search=search)
     except Exception as e:
         logger.error(f"Error reading log file {filepath}: {e}")
+        return []
+
+
+def _validate_request(service: str, level: Optional[str]) -> None:
+    if service not in SERVICE_LOG_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid service. Valid services: {', '.join(SERVICE_LOG_FILES.keys())}"
+        )
 
-    return parsed_lines
+    # Validate level
+    if level and level.upper() not in LOG_LEVELS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid level. Valid levels: {', '.join(LOG_LEVELS)}"
+        )
 
 
 @router.get("/logs/{service}", response_model=LogsResponse)
@@ -184,18 +99,7 @@ async def get_service_logs(
 
     Returns newest lines first.
     """
-    if service not in SERVICE_LOG_FILES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid service. Valid services: {', '.join(SERVICE_LOG_FILES.keys())}"
-        )
-
-    # Validate level
-    if level and level.upper() not in LOG_LEVELS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid level. Valid levels: {', '.join(LOG_LEVELS)}"
-        )
+    _validate_request(service, level)
 
     log_file = SERVICE_LOG_FILES[service]
     log_lines = read_log_file(log_file, lines=lines, level=level, search=search)
@@ -207,6 +111,50 @@ async def get_service_logs(
     )
 
 
+@router.get("/logs/{service}/stream")
+async def stream_service_logs(
+    request: Request,
+    service: str,
+    level: Optional[str] = Query(None, description="Minimum log level (DEBUG, INFO, WARNING, ERROR)"),
+    search: Optional[str] = Query(None, description="Search filter"),
+):
+    """
+    Follow a service log as Server-Sent Events.
+
+    Starts at the current end of the file and pushes each new matching
+    line as a JSON LogLine event (oldest first). A comment line is sent
+    when idle so proxies keep the connection open.
+    """
+    _validate_request(service, level)
+    follower = LogFollower(SERVICE_LOG_FILES[service], LineFilter(level, search))
+
+    async def events():
+        last_sent = time.monotonic()
+        while not await request.is_disconnected():
+            try:
+                new_lines = follower.poll()
+            except Exception as e:
+                logger.error(f"Error following log file {follower.filepath}: {e}")
+                new_lines = []
+
+            for line in new_lines:
+                yield f"data: {line.model_dump_json()}\n\n"
+            now = time.monotonic()
+            if new_lines:
+                last_sent = now
+            elif now - last_sent >= STREAM_HEARTBEAT_SECONDS:
+                yield ": keepalive\n\n"
+                last_sent = now
+
+            await asyncio.sleep(STREAM_POLL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/logs")
 async def list_available_logs():
     """
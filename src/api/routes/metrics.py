@@ -455,83 +455,18 @@ async def get_pipeline_funnel(
     """
     since = datetime.now(UTC) - timedelta(hours=hours)
 
-    # Count events at each stage
-    generated = session.execute(
-        select(func.count(StrategyEvent.id))
-        .where(
-            and_(
-                StrategyEvent.stage == 'generation',
-                StrategyEvent.event_type == 'created',
-                StrategyEvent.timestamp >= since
-            )
-        )
-    ).scalar() or 0
-
-    validated = session.execute(
-        select(func.count(StrategyEvent.id))
-        .where(
-            and_(
-                StrategyEvent.stage == 'validation',
-                StrategyEvent.event_type == 'completed',
-                StrategyEvent.timestamp >= since
-            )
-        )
-    ).scalar() or 0
-
-    validation_failed = session.execute(
-        select(func.count(StrategyEvent.id))
-        .where(
-            and_(
-                StrategyEvent.stage == 'validation',
-                StrategyEvent.status == 'failed',
-                StrategyEvent.timestamp >= since
-            )
-        )
-    ).scalar() or 0
-
-    pool_entered = session.execute(
-        select(func.count(StrategyEvent.id))
-        .where(
-            and_(
-                StrategyEvent.stage == 'pool',
-                StrategyEvent.event_type == 'entered',
-                StrategyEvent.timestamp >= since
-            )
-        )
-    ).scalar() or 0
-
-    backtest_failed = session.execute(
-        select(func.count(StrategyEvent.id))
-        .where(
-            and_(
-                StrategyEvent.stage.in_(['backtest', 'shuffle_test', 'multi_window', 'pool']),
-                StrategyEvent.status == 'failed',
-                StrategyEvent.timestamp >= since
-            )
-        )
-    ).scalar() or 0
-
-    deployed = session.execute(
-        select(func.count(StrategyEvent.id))
-        .where(
-            and_(
-                StrategyEvent.stage == 'deployment',
-                StrategyEvent.event_type == 'succeeded',
-                StrategyEvent.timestamp >= since
-            )
-        )
-    ).scalar() or 0
-
-    retired = session.execute(
-        select(func.count(StrategyEvent.id))
-        .where(
-            and_(
-                StrategyEvent.stage == 'live',
-                StrategyEvent.event_type == 'retired',
-                StrategyEvent.timestamp >= since
-            )
-        )
-    ).scalar() or 0
+    # Count events at each stage (per-minute rollups kept by MetricsCollector)
+    totals = get_metrics_collector().rollups.totals(session, since)
+
+    generated = totals.count('generation', 'created')
+    validated = totals.count('validation', 'completed')
+    validation_failed = totals.count('validation', status='failed')
+    pool_entered = totals.count('pool', 'entered')
+    backtest_failed = totals.count(
+        ['backtest', 'shuffle_test', 'multi_window', 'pool'], status='failed'
+    )
+    deployed = totals.count('deployment', 'succeeded')
+    retired = totals.count('live', 'retired')
 
     return {
         'period_hours': hours,
@@ -653,32 +588,19 @@ async def get_timing_metrics(
     """
     since = datetime.now(UTC) - timedelta(hours=hours)
 
+    totals = get_metrics_collector().rollups.totals(session, since)
+
     stages = ['validation', 'shuffle_test', 'multi_window']
     timing = {}
 
     for stage in stages:
-        result = session.execute(
-            select(
-                func.avg(StrategyEvent.duration_ms).label('avg'),
-                func.min(StrategyEvent.duration_ms).label('min'),
-                func.max(StrategyEvent.duration_ms).label('max'),
-                func.count(StrategyEvent.id).label('count'),
-            )
-            .where(
-                and_(
-                    StrategyEvent.stage == stage,
-                    StrategyEvent.duration_ms.isnot(None),
-                    StrategyEvent.timestamp >= since
-                )
-            )
-        ).first()
-
-        if result and result.count > 0:
+        duration = totals.duration(stage)
+        if duration['count'] > 0:
             timing[stage] = {
-                'avg_ms': round(result.avg, 1) if result.avg else None,
-                'min_ms': result.min,
-                'max_ms': result.max,
-                'sample_count': result.count,
+                'avg_ms': round(duration['avg'], 1),
+                'min_ms': duration['min'],
+                'max_ms': duration['max'],
+                'sample_count': duration['count'],
             }
 
     return {
@@ -15,13 +15,17 @@ from src.api.schemas import (
     BacktestMetrics,
     DegradationPoint,
     DegradationResponse,
+    LiveStats,
     RankedStrategy,
     RankingResponse,
     StrategiesResponse,
     StrategyDetail,
     StrategyListItem,
 )
-from src.database import Strategy, BacktestResult, Trade, get_session
+from src.database import (
+    Strategy, BacktestResult, StrategyLiveStats, StrategySummary, Trade, get_session
+)
+from src.database.strategy_summary import keyset_page
 from src.utils import get_logger
 
 logger = get_logger(__name__)
@@ -35,68 +39,77 @@ async def list_strategies(
     strategy_type: Optional[str] = Query(None, alias="type", description="Filter by type (MOM, REV, TRN, etc.)"),
     timeframe: Optional[str] = Query(None, description="Filter by timeframe"),
     limit: int = Query(50, ge=1, le=500, description="Max results to return"),
-    offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    offset: int = Query(0, ge=0, description="Offset for pagination (prefer cursor)"),
 ):
     """
     List strategies with optional filters.
 
     Supports filtering by status, type, timeframe.
-    Returns paginated results.
+    Returns pages newest first from the strategy_summaries read model;
+    follow next_cursor for further pages (total is only counted on the
+    first page).
     """
     try:
         with get_session() as session:
-            query = session.query(Strategy)
+            # Columns of the covering created_at indexes (index-only scan)
+            query = session.query(
+                StrategySummary.strategy_id,
+                StrategySummary.name,
+                StrategySummary.strategy_type,
+                StrategySummary.timeframe,
+                StrategySummary.status,
+                StrategySummary.created_at,
+                StrategySummary.is_sharpe,
+                StrategySummary.is_win_rate,
+                StrategySummary.is_total_trades,
+                StrategySummary.total_pnl_live,
+            )
 
             # Apply filters
             if status:
-                query = query.filter(Strategy.status == status.upper())
+                query = query.filter(StrategySummary.status == status.upper())
             if strategy_type:
-                query = query.filter(Strategy.strategy_type == strategy_type.upper())
+                query = query.filter(StrategySummary.strategy_type == strategy_type.upper())
             if timeframe:
-                query = query.filter(Strategy.timeframe == timeframe)
-
-            # Get total count before pagination
-            total = query.count()
-
-            # Order by created_at descending (newest first)
-            query = query.order_by(desc(Strategy.created_at))
-
-            # Apply pagination
-            strategies = query.offset(offset).limit(limit).all()
-
-            # Convert to response format
-            items = []
-            for s in strategies:
-                # Get best backtest result for sharpe/win_rate (use in_sample period)
-                best_backtest = session.query(BacktestResult).filter(
-                    BacktestResult.strategy_id == s.id,
-                    BacktestResult.period_type == 'in_sample',
-                ).order_by(desc(BacktestResult.sharpe_ratio)).first()
-
-                sharpe = best_backtest.sharpe_ratio if best_backtest else None
-                win_rate = best_backtest.win_rate if best_backtest else None
-                total_trades = best_backtest.total_trades if best_backtest else None
-
-                items.append(StrategyListItem(
-                    id=s.id,
-                    name=s.name,
-                    strategy_type=s.strategy_type,
-                    timeframe=s.timeframe,
-                    status=s.status,
-                    sharpe_ratio=sharpe,
-                    win_rate=win_rate,
-                    total_trades=total_trades,
-                    total_pnl=s.total_pnl_live,
-                    created_at=s.created_at,
-                ))
+                query = query.filter(StrategySummary.timeframe == timeframe)
+
+            # Counting every page would scan the whole filtered range again
+            total = query.count() if cursor is None else None
+            if cursor is not None:
+                offset = 0
+
+            try:
+                rows, next_cursor = keyset_page(query, StrategySummary.created_at, cursor, limit, offset)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            items = [
+                StrategyListItem(
+                    id=row.strategy_id,
+                    name=row.name,
+                    strategy_type=row.strategy_type,
+                    timeframe=row.timeframe,
+                    status=row.status,
+                    sharpe_ratio=row.is_sharpe,
+                    win_rate=row.is_win_rate,
+                    total_trades=row.is_total_trades,
+                    total_pnl=row.total_pnl_live,
+                    created_at=row.created_at,
+                )
+                for row in rows
+            ]
 
             return StrategiesResponse(
                 items=items,
                 total=total,
                 limit=limit,
                 offset=offset,
+                next_cursor=next_cursor,
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error listing strategies: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -105,50 +118,57 @@ async def list_strategies(
 @router.get("/strategies/rankings/backtest", response_model=RankingResponse)
 async def get_backtest_ranking(
     limit: int = Query(50, ge=1, le=200, description="Max results to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
 ):
     """
     Get backtest ranking for ACTIVE strategies.
 
     Returns strategies ordered by backtest score (combination of Edge,
-    Sharpe, Consistency, and Drawdown penalty).
+    Sharpe, Consistency, and Drawdown penalty), with the metrics of their
+    best in-sample backtest.
     """
     try:
         with get_session() as session:
-            # Query ACTIVE strategies ordered by score_backtest
-            strategies = (
-                session.query(Strategy)
-                .filter(
-                    Strategy.status == 'ACTIVE',
-                    Strategy.score_backtest.isnot(None),
-                )
-                .order_by(desc(Strategy.score_backtest))
-                .limit(limit)
-                .all()
+            # Columns of idx_summary_status_score_backtest (index-only scan)
+            query = session.query(
+                StrategySummary.strategy_id,
+                StrategySummary.name,
+                StrategySummary.strategy_type,
+                StrategySummary.timeframe,
+                StrategySummary.status,
+                StrategySummary.score_backtest,
+                StrategySummary.is_sharpe,
+                StrategySummary.is_win_rate,
+                StrategySummary.is_expectancy,
+                StrategySummary.is_max_drawdown,
+                StrategySummary.is_total_trades,
+            ).filter(
+                StrategySummary.status == 'ACTIVE',
+                StrategySummary.score_backtest.isnot(None),
             )
 
-            # Build ranking list
-            ranking = []
-            for s in strategies:
-                # Get backtest result for additional metrics (use in_sample period)
-                backtest = session.query(BacktestResult).filter(
-                    BacktestResult.strategy_id == s.id,
-                    BacktestResult.period_type == 'in_sample',
-                ).first()
-
-                ranking.append({
-                    'id': str(s.id),
-                    'name': s.name,
-                    'strategy_type': s.strategy_type,
-                    'timeframe': s.timeframe,
-                    'status': s.status,
+            try:
+                rows, next_cursor = keyset_page(query, StrategySummary.score_backtest, cursor, limit)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            ranking = [
+                {
+                    'id': str(row.strategy_id),
+                    'name': row.name,
+                    'strategy_type': row.strategy_type,
+                    'timeframe': row.timeframe,
+                    'status': row.status,
                     'ranking_type': 'backtest',
-                    'score': s.score_backtest,
-                    'sharpe': backtest.sharpe_ratio if backtest else None,
-                    'win_rate': backtest.win_rate if backtest else None,
-                    'expectancy': backtest.expectancy if backtest else None,
-                    'max_drawdown': backtest.max_drawdown if backtest else None,
-                    'total_trades': backtest.total_trades if backtest else None,
-                })
+                    'score': row.score_backtest,
+                    'sharpe': row.is_sharpe,
+                    'win_rate': row.is_win_rate,
+                    'expectancy': row.is_expectancy,
+                    'max_drawdown': row.is_max_drawdown,
+                    'total_trades': row.is_total_trades,
+                }
+                for row in rows
+            ]
 
             # Calculate averages
             avg_score = sum(s['score'] or 0 for s in ranking) / max(len(ranking), 1)
@@ -160,8 +180,11 @@ async def get_backtest_ranking(
                 strategies=ranking,
                 avg_score=avg_score,
                 avg_sharpe=avg_sharpe,
+                next_cursor=next_cursor,
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting backtest ranking: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -170,6 +193,7 @@ async def get_backtest_ranking(
 @router.get("/strategies/rankings/live", response_model=RankingResponse)
 async def get_live_ranking(
     limit: int = Query(20, ge=1, le=100, description="Max results to return"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
 ):
     """
     Get live ranking for LIVE strategies.
@@ -179,35 +203,46 @@ async def get_live_ranking(
     """
     try:
         with get_session() as session:
-            # Query LIVE strategies ordered by score_live
-            strategies = (
-                session.query(Strategy)
-                .filter(
-                    Strategy.status == 'LIVE',
-                    Strategy.score_live.isnot(None),
-                )
-                .order_by(desc(Strategy.score_live))
-                .limit(limit)
-                .all()
+            # Columns of idx_summary_status_score_live (index-only scan)
+            query = session.query(
+                StrategySummary.strategy_id,
+                StrategySummary.name,
+                StrategySummary.strategy_type,
+                StrategySummary.timeframe,
+                StrategySummary.status,
+                StrategySummary.score_live,
+                StrategySummary.sharpe_live,
+                StrategySummary.win_rate_live,
+                StrategySummary.total_pnl_live,
+                StrategySummary.total_trades_live,
+                StrategySummary.last_live_update,
+            ).filter(
+                StrategySummary.status == 'LIVE',
+                StrategySummary.score_live.isnot(None),
             )
 
-            # Build ranking list
-            ranking = []
-            for s in strategies:
-                ranking.append({
-                    'id': str(s.id),
-                    'name': s.name,
-                    'strategy_type': s.strategy_type,
-                    'timeframe': s.timeframe,
-                    'status': s.status,
+            try:
+                rows, next_cursor = keyset_page(query, StrategySummary.score_live, cursor, limit)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+
+            ranking = [
+                {
+                    'id': str(row.strategy_id),
+                    'name': row.name,
+                    'strategy_type': row.strategy_type,
+                    'timeframe': row.timeframe,
+                    'status': row.status,
                     'ranking_type': 'live',
-                    'score': s.score_live,
-                    'sharpe': s.sharpe_live,
-                    'win_rate': s.win_rate_live,
-                    'total_pnl': s.total_pnl_live,
-                    'total_trades': s.total_trades_live,
-                    'last_update': s.last_live_update.isoformat() if s.last_live_update else None,
-                })
+                    'score': row.score_live,
+                    'sharpe': row.sharpe_live,
+                    'win_rate': row.win_rate_live,
+                    'total_pnl': row.total_pnl_live,
+                    'total_trades': row.total_trades_live,
+                    'last_update': row.last_live_update.isoformat() if row.last_live_update else None,
+                }
+                for row in rows
+            ]
 
             # Calculate averages
             avg_score = sum(s['score'] or 0 for s in ranking) / max(len(ranking), 1)
@@ -221,8 +256,11 @@ async def get_live_ranking(
                 avg_score=avg_score,
                 avg_sharpe=avg_sharpe,
                 avg_pnl=avg_pnl,
+                next_cursor=next_cursor,
             )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting live ranking: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -342,6 +380,19 @@ async def get_strategy(strategy_id: UUID):
                     period_days=backtest.period_days,
                 )
 
+            # Running live stats (no row until the strategy closes a trade or is scored)
+            stats = session.get(StrategyLiveStats, strategy_id)
+            live_stats = None
+            if stats is not None:
+                live_stats = LiveStats(
+                    total_trades=stats.n_trades,
+                    win_rate=stats.n_wins / stats.n_trades if stats.n_trades else None,
+                    total_pnl=stats.total_pnl,
+                    max_drawdown=stats.max_drawdown,
+                    loss_streak=stats.loss_streak,
+                    last_exit_time=stats.last_exit_time,
+                )
+
             return StrategyDetail(
                 id=strategy.id,
                 name=strategy.name,
@@ -356,6 +407,7 @@ async def get_strategy(strategy_id: UUID):
                 backtest=backtest_metrics,
                 live_pnl=strategy.total_pnl_live,
                 live_trades=strategy.total_trades_live,
+                live_stats=live_stats,
             )
 
     except HTTPException:
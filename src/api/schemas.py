@@ -108,6 +108,16 @@ class BacktestMetrics(BaseModel):
     period_days: Optional[int] = None
 
 
+class LiveStats(BaseModel):
+    """Running statistics of closed live trades"""
+    total_trades: int
+    win_rate: Optional[float] = None
+    total_pnl: float
+    max_drawdown: float
+    loss_streak: int
+    last_exit_time: Optional[datetime] = None
+
+
 class StrategyDetail(BaseModel):
     """Full strategy detail"""
     id: UUID
@@ -123,6 +133,7 @@ class StrategyDetail(BaseModel):
     backtest: Optional[BacktestMetrics] = None
     live_pnl: Optional[float] = None
     live_trades: Optional[int] = None
+    live_stats: Optional[LiveStats] = None
 
     class Config:
         from_attributes = True
@@ -131,9 +142,10 @@ class StrategyDetail(BaseModel):
 class StrategiesResponse(BaseModel):
     """Paginated strategies list"""
     items: List[StrategyListItem]
-    total: int
+    total: Optional[int] = None  # First page only
     limit: int
     offset: int
+    next_cursor: Optional[str] = None  # None on the last page
 
 
 # =============================================================================
@@ -384,6 +396,7 @@ class RankingResponse(BaseModel):
     avg_score: float
     avg_sharpe: Optional[float] = None
     avg_pnl: Optional[float] = None  # Live only
+    next_cursor: Optional[str] = None  # None on the last page
 
 
 # =============================================================================
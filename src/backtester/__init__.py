@@ -4,9 +4,14 @@ Backtesting module
 Portfolio backtesting system for strategy validation
 """
 
-from src.backtester.data_loader import BacktestDataLoader
-from src.backtester.backtest_engine import BacktestEngine
-from src.backtester.validator import LookaheadValidator
+from src.utils.lazy_import import lazy_exports
+
+# Lazy: importing any src.backtester submodule must not load numba
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'BacktestDataLoader': 'src.backtester.data_loader',
+    'BacktestEngine': 'src.backtester.backtest_engine',
+    'LookaheadValidator': 'src.backtester.validator',
+})
 
 __all__ = [
     'BacktestDataLoader',
@@ -7,7 +7,7 @@ Uses Numba JIT compilation for high-performance simulation loops.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple, Union
 from datetime import datetime
 import math
 import time
@@ -16,20 +16,111 @@ from numba import jit, prange
 from numba.typed import List as NumbaList
 
 from src.strategies.base import StrategyCore, Signal, StopLossType, TakeProfitType, ExitType
+from src.strategies.indicator_cache import get_indicator_cache
 from src.utils.logger import get_logger
 from src.config.loader import load_config
 from src.executor.risk_manager import RiskManager
 from src.data.coin_registry import get_registry, CoinNotFoundError
 from src.backtester.numba_kernels import calculate_atr_full_numba
+from src.backtester.trade_log import TRADE_DTYPE, TradeLog
 
 logger = get_logger(__name__)
 
+# Entry-signal warmup in _generate_signals_fast: min(SIGNAL_WARMUP_BARS, max(20, n - MIN_SIGNAL_BARS))
+SIGNAL_WARMUP_BARS = 100
+MIN_SIGNAL_BARS = 10
+# From this many bars on, the warmup no longer depends on the data length
+SIGNAL_WARMUP_STABLE_BARS = SIGNAL_WARMUP_BARS + MIN_SIGNAL_BARS
+
 
 # =============================================================================
 # NUMBA JIT-COMPILED SIMULATION KERNEL
 # =============================================================================
 
-@jit(nopython=True, cache=False)  # cache=False to force recompilation after margin tracking fix
+@jit(nopython=True, cache=True)
+def _close_open_positions(
+    bar: int,
+    close_2d: np.ndarray,
+    slippage: float,
+    fee_rate: float,
+    funding_cumsum: np.ndarray,
+    equity: float,
+    pos_entry_idx: np.ndarray,
+    pos_entry_price: np.ndarray,
+    pos_size: np.ndarray,
+    pos_margin: np.ndarray,
+    pos_direction: np.ndarray,
+    pos_leverage: np.ndarray,
+    trade_symbol_idx: np.ndarray,
+    trade_entry_idx: np.ndarray,
+    trade_exit_idx: np.ndarray,
+    trade_entry_price: np.ndarray,
+    trade_exit_price: np.ndarray,
+    trade_pnl: np.ndarray,
+    trade_direction: np.ndarray,
+    trade_leverage: np.ndarray,
+    trade_exit_reason: np.ndarray,
+    n_trades: int
+) -> Tuple[float, int]:
+    """
+    Close every open position at the close of bar (exit reason 4=end).
+
+    Records the trades in the trade_* arrays and clears the positions.
+
+    Returns:
+        (equity, n_trades) after the closes
+    """
+    n_symbols = close_2d.shape[1]
+    for j in range(n_symbols):
+        if pos_entry_idx[j] < 0:
+            continue
+
+        exit_price = close_2d[bar, j]
+        direction = pos_direction[j]
+
+        if direction == 1:
+            slipped_exit = exit_price * (1.0 - slippage)
+            pnl = (slipped_exit - pos_entry_price[j]) * pos_size[j]
+        else:
+            slipped_exit = exit_price * (1.0 + slippage)
+            pnl = (pos_entry_price[j] - slipped_exit) * pos_size[j]
+
+        notional = pos_entry_price[j] * pos_size[j]
+        fees = notional * fee_rate * 2.0
+        pnl -= fees
+
+        # Apply funding costs (O(1) lookup using cumsum)
+        entry_idx = pos_entry_idx[j]
+        if entry_idx > 0:
+            total_funding = funding_cumsum[bar, j] - funding_cumsum[entry_idx - 1, j]
+        else:
+            total_funding = funding_cumsum[bar, j]
+        funding_cost = notional * total_funding
+        if direction == 1:  # Long
+            pnl -= funding_cost
+        else:  # Short
+            pnl += funding_cost
+
+        equity += pnl
+
+        trade_symbol_idx[n_trades] = j
+        trade_entry_idx[n_trades] = entry_idx
+        trade_exit_idx[n_trades] = bar
+        trade_entry_price[n_trades] = pos_entry_price[j]
+        trade_exit_price[n_trades] = slipped_exit
+        trade_pnl[n_trades] = pnl
+        trade_direction[n_trades] = direction
+        trade_leverage[n_trades] = pos_leverage[j]
+        trade_exit_reason[n_trades] = 4  # end
+        n_trades += 1
+
+        pos_margin[j] = 0.0
+        pos_entry_idx[j] = -1
+
+    return equity, n_trades
+
+
+@jit(nopython=True, cache=True)  # Numba invalidates the cache when this file changes
 def _simulate_portfolio_numba(
     close_2d: np.ndarray,           # (n_bars, n_symbols) float64
     high_2d: np.ndarray,            # (n_bars, n_symbols) float64
@@ -53,7 +144,8 @@ def _simulate_portfolio_numba(
     slippage: float,
     min_notional: float,
     funding_cumsum: np.ndarray,     # (n_bars, n_symbols) cumulative funding rates
-    breakeven_buffer: float
+    breakeven_buffer: float,
+    split_bar: int                  # 0 = no split; else first bar of the second segment
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray,
            np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
     """
@@ -61,6 +153,12 @@ def _simulate_portfolio_numba(
 
     This is the hot path - runs 20-50x faster than pure Python.
 
+    With split_bar > 0 the bars before and from split_bar simulate as two
+    separate backtests (IS/OOS): open positions are closed at bar
+    split_bar - 1 (reason end) and the second segment restarts flat from
+    initial_capital. equity_curve[split_bar] is then the first segment's
+    final equity.
+
     Returns:
         equity_curve: (n_bars+1,) float64
         trade_symbol_idx: (max_trades,) int64 - symbol index for each trade
@@ -349,50 +447,27 @@ def _simulate_portfolio_numba(
 
         equity_curve[i + 1] = equity
 
-    # Close remaining positions at end
-    for j in range(n_symbols):
-        if pos_entry_idx[j] < 0:
-            continue
-
-        exit_price = close_2d[n_bars - 1, j]
-        direction = pos_direction[j]
-
-        if direction == 1:
-            slipped_exit = exit_price * (1.0 - slippage)
-            pnl = (slipped_exit - pos_entry_price[j]) * pos_size[j]
-        else:
-            slipped_exit = exit_price * (1.0 + slippage)
-            pnl = (pos_entry_price[j] - slipped_exit) * pos_size[j]
-
-        notional = pos_entry_price[j] * pos_size[j]
-        fees = notional * fee_rate * 2.0
-        pnl -= fees
-
-        # Apply funding costs (O(1) lookup using cumsum)
-        entry_idx = pos_entry_idx[j]
-        exit_idx = n_bars - 1
-        if entry_idx > 0:
-            total_funding = funding_cumsum[exit_idx, j] - funding_cumsum[entry_idx - 1, j]
-        else:
-            total_funding = funding_cumsum[exit_idx, j]
-        funding_cost = notional * total_funding
-        if pos_direction[j] == 1:  # Long
-            pnl -= funding_cost
-        else:  # Short
-            pnl += funding_cost
-
-        equity += pnl
+        # End of the first segment: close out and restart flat
+        if i == split_bar - 1 and i < n_bars - 1:
+            equity, n_trades = _close_open_positions(
+                i, close_2d, slippage, fee_rate, funding_cumsum, equity,
+                pos_entry_idx, pos_entry_price, pos_size, pos_margin, pos_direction, pos_leverage,
+                trade_symbol_idx, trade_entry_idx, trade_exit_idx, trade_entry_price,
+                trade_exit_price, trade_pnl, trade_direction, trade_leverage, trade_exit_reason,
+                n_trades
+            )
+            equity_curve[i + 1] = equity
+            equity = initial_capital
+            margin_used = 0.0
 
-        trade_symbol_idx[n_trades] = j
-        trade_entry_idx[n_trades] = pos_entry_idx[j]
-        trade_exit_idx[n_trades] = n_bars - 1
-        trade_entry_price[n_trades] = pos_entry_price[j]
-        trade_exit_price[n_trades] = slipped_exit
-        trade_pnl[n_trades] = pnl
-        trade_direction[n_trades] = direction
-        trade_leverage[n_trades] = pos_leverage[j]
-        trade_exit_reason[n_trades] = 4  # end
-        n_trades += 1
+    # Close remaining positions at end
+    equity, n_trades = _close_open_positions(
+        n_bars - 1, close_2d, slippage, fee_rate, funding_cumsum, equity,
+        pos_entry_idx, pos_entry_price, pos_size, pos_margin, pos_direction, pos_leverage,
+        trade_symbol_idx, trade_entry_idx, trade_exit_idx, trade_entry_price,
+        trade_exit_price, trade_pnl, trade_direction, trade_leverage, trade_exit_reason,
+        n_trades
+    )
 
     # Update final equity
     equity_curve[n_bars] = equity
@@ -402,6 +477,121 @@ def _simulate_portfolio_numba(
             trade_leverage, trade_exit_reason, n_trades)
 
 
+# Bars per year for trade-based Sharpe annualization and CAGR (crypto 24/7)
+BARS_PER_YEAR = {'2h': 4380, '1h': 8760, '30m': 17520, '15m': 35040, '5m': 105120}
+
+
+@jit(nopython=True, cache=True)
+def _portfolio_metrics_numba(
+    pnl: np.ndarray,           # (n_trades,) float64
+    notional: np.ndarray,      # (n_trades,) float64
+    margin: np.ndarray,        # (n_trades,) float64
+    leverage: np.ndarray,      # (n_trades,) int32
+    equity_curve: np.ndarray,  # (n_bars+1,) float64
+    initial_capital: float,
+    bars_per_year: float,
+) -> Tuple[float, float, float, float, float, float, float, float, float]:
+    """
+    Portfolio metrics from the trade columns and equity curve in one pass each.
+
+    Returns:
+        total_return, win_rate, expectancy, max_drawdown, sharpe,
+        profit_factor, avg_leverage, cagr, consistency
+    """
+    n_trades = pnl.shape[0]
+    n_points = equity_curve.shape[0]
+
+    # Trade stats: win rate over all trades, win/loss % over trades with notional
+    total_pnl = 0.0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    sum_leverage = 0.0
+    n_wins = 0
+    n_win_pct = 0
+    n_loss_pct = 0
+    sum_win_pct = 0.0
+    sum_loss_pct = 0.0
+    n_ret = 0
+    sum_ret = 0.0
+    for k in range(n_trades):
+        p = pnl[k]
+        total_pnl += p
+        sum_leverage += leverage[k]
+        if p > 0:
+            n_wins += 1
+            gross_profit += p
+        elif p < 0:
+            gross_loss -= p
+        if notional[k] > 0:
+            if p > 0:
+                n_win_pct += 1
+                sum_win_pct += p / notional[k]
+            else:
+                n_loss_pct += 1
+                sum_loss_pct += abs(p / notional[k])
+        if margin[k] > 0:
+            n_ret += 1
+            sum_ret += p / margin[k]
+
+    total_return = total_pnl / initial_capital
+    win_rate = n_wins / n_trades
+    avg_win_pct = sum_win_pct / n_win_pct if n_win_pct > 0 else 0.0
+    avg_loss_pct = sum_loss_pct / n_loss_pct if n_loss_pct > 0 else 0.0
+    expectancy = win_rate * avg_win_pct - (1.0 - win_rate) * avg_loss_pct
+    profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0.0
+    avg_leverage = sum_leverage / n_trades
+
+    # Drawdown on equity floored at 0, and share of bars above initial capital
+    running_max = 0.0
+    max_drawdown = 0.0
+    n_in_profit = 0
+    for i in range(n_points):
+        equity = max(equity_curve[i], 0.0)
+        if equity > running_max:
+            running_max = equity
+        if running_max > 0:
+            dd = (running_max - equity) / running_max
+            if dd > max_drawdown:
+                max_drawdown = dd
+        if equity_curve[i] > initial_capital:
+            n_in_profit += 1
+    max_drawdown = min(max(max_drawdown, 0.0), 1.0)
+    consistency = n_in_profit / n_points if n_points > 0 else 0.0
+
+    n_bars = n_points - 1
+    years = n_bars / bars_per_year if bars_per_year > 0 else 1.0
+
+    # Trade-based Sharpe: mean/std of return on margin, annualized by trade
+    # frequency (capped at sqrt(365)). Bar-by-bar Sharpe is inflated when few
+    # trades spread across many bars.
+    sharpe = 0.0
+    if n_trades >= 3 and n_ret >= 3:
+        mean_ret = sum_ret / n_ret
+        sum_sq_dev = 0.0
+        for k in range(n_trades):
+            if margin[k] > 0:
+                dev = pnl[k] / margin[k] - mean_ret
+                sum_sq_dev += dev * dev
+        std_ret = np.sqrt(sum_sq_dev / n_ret)
+        if std_ret > 1e-10:
+            trades_per_year = n_trades / years if years > 0 else float(n_trades)
+            sharpe = mean_ret / std_ret * np.sqrt(min(trades_per_year, 365.0))
+
+    # Sharpe must be consistent with total_return
+    if total_return < -0.5:
+        sharpe = min(sharpe, -abs(total_return) * 2)  # At -100% loss, Sharpe <= -2
+    elif total_return < 0 and sharpe > 0:
+        sharpe = 0.0
+
+    cagr = 0.0
+    if years > 0 and initial_capital > 0 and n_points > 0:
+        growth = equity_curve[n_points - 1] / initial_capital
+        cagr = growth ** (1.0 / years) - 1.0 if growth > 0 else -1.0
+
+    return (total_return, win_rate, expectancy, max_drawdown, sharpe,
+            profit_factor, avg_leverage, cagr, consistency)
+
+
 def _calculate_atr_at_bar(data: pd.DataFrame, bar_idx: int, period: int = 14) -> float:
     """
     Calculate ATR at a specific bar using lookback only (no future data).
@@ -588,16 +778,261 @@ class BacktestEngine:
         common_index = aligned_data['_index']
         symbols = [s for s in aligned_data.keys() if s != '_index']
 
-        # Track state across time
-        open_positions = {}  # symbol -> {entry_price, entry_idx, size, sl, tp}
-        closed_trades = []
-        equity = self.initial_capital
-        equity_curve = [equity]
-
         # Generate signals for all symbols upfront (parallelized by symbol)
         _t0 = time.perf_counter()
-        all_signals = {}
+        all_signals = self._generate_portfolio_signals(strategy, aligned_data, symbols, max_positions)
+        _t_signals = time.perf_counter() - _t0
+
+        # Prepare 2D arrays for Numba simulation
+        _t0 = time.perf_counter()
+        arrays = self._prepare_simulation_arrays(all_signals, symbols, len(common_index))
+        _t_prepare = time.perf_counter() - _t0
+
+        # DEBUG: Check sizes array values
+        sizes_at_entries = arrays['sizes'][arrays['entries']]
+        if len(sizes_at_entries) > 0:
+            # Also get SL and time exit info
+            sl_at_entries = arrays['sl_pcts'][arrays['entries']]
+            time_exit_at_entries = arrays['time_exit_flags'][arrays['entries']]
+            exit_bars_at_entries = arrays['exit_after_bars'][arrays['entries']]
+            logger.info(
+                f"[{strategy_name}] DEBUG kernel inputs: sizes=({sizes_at_entries.min():.3f}-{sizes_at_entries.max():.3f}), "
+                f"sl=({sl_at_entries.min():.3f}-{sl_at_entries.max():.3f}), "
+                f"time_exit={time_exit_at_entries.sum()}/{len(time_exit_at_entries)}, "
+                f"exit_bars=({exit_bars_at_entries.min()}-{exit_bars_at_entries.max()})"
+            )
+
+        # Run Numba-optimized simulation
+        _t0 = time.perf_counter()
+        metrics, closed_trades = self._simulate_portfolio(arrays, symbols, max_positions, timeframe)
+        _t_simulation = time.perf_counter() - _t0
+
+        # DEBUG: Count total entry signals for comparison with parametric
+        total_entry_signals = int(arrays['entries'].sum())
+        metrics['total_signals'] = total_entry_signals
+
+        # Log profiling results
+        _t_total = time.perf_counter() - _t_start
+        logger.info(
+            f"[{strategy_name}] Backtest complete: {len(closed_trades)} trades, {total_entry_signals} signals, "
+            f"{len(symbols)} symbols, {len(common_index)} bars | "
+            f"Time: {_t_total:.2f}s (align={_t_align:.2f}s, signals={_t_signals:.2f}s, "
+            f"prepare={_t_prepare:.3f}s, sim={_t_simulation:.3f}s) | "
+            f"indicator_cache={get_indicator_cache().get_stats()['hit_rate']:.0%} hits"
+        )
+
+        return metrics
+
+    def backtest_windows(
+        self,
+        strategy: StrategyCore,
+        data: Dict[str, pd.DataFrame],
+        window_ends: List[pd.Timestamp],
+        max_positions: Optional[int] = None,
+        timeframe: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Portfolio backtest of several expanding windows with one indicator pass.
+
+        Equivalent to calling backtest() on each window (data up to and
+        including window_ends[k]), but calculate_indicators() and signal
+        generation run once on the full data; only the Numba simulation runs
+        per window, on prefixes of the same signal arrays. This is exact
+        because alignment is an intersection (a window's common index is a
+        prefix of the full one), indicators are causal (lookahead-tested) and
+        the kernel closes open positions at the last bar.
+
+        Windows shorter than SIGNAL_WARMUP_STABLE_BARS get a regular
+        backtest(), since the adaptive warmup depends on their length.
+
+        Args:
+            strategy: StrategyCore instance
+            data: Dict mapping symbol -> OHLCV DataFrame (full range)
+            window_ends: Last timestamp of each window
+            max_positions: Maximum concurrent open positions (default from config)
+            timeframe: Timeframe string for Sharpe annualization
+
+        Returns:
+            List of portfolio metrics, one per window (same order as window_ends)
+        """
+        if max_positions is None:
+            if hasattr(self.config, '_raw_config'):
+                max_positions = self.config.get('risk.limits.max_open_positions_per_subaccount')
+            else:
+                max_positions = self.config.get('risk', {}).get('limits', {}).get('max_open_positions_per_subaccount')
+            if max_positions is None:
+                max_positions = 10
+
+        if timeframe is None:
+            timeframe = getattr(strategy, 'timeframe', None)
+
+        strategy_name = strategy.__class__.__name__
+        _t_start = time.perf_counter()
+
+        aligned_data = self._align_dataframes(data)
+        if aligned_data is None:
+            return [self._empty_results() for _ in window_ends]
+
+        common_index = pd.DatetimeIndex(aligned_data['_index'])
+        symbols = [s for s in aligned_data.keys() if s != '_index']
+
+        window_bars = [
+            int(common_index.searchsorted(pd.Timestamp(end), side='right'))
+            for end in window_ends
+        ]
+
+        all_signals = self._generate_portfolio_signals(strategy, aligned_data, symbols, max_positions)
+        arrays = self._prepare_simulation_arrays(all_signals, symbols, len(common_index))
+        _t_signals = time.perf_counter() - _t_start
+
+        results = []
+        for end, n_bars in zip(window_ends, window_bars):
+            if n_bars < 20:
+                # Same threshold as _align_dataframes
+                results.append(self._empty_results())
+            elif n_bars < SIGNAL_WARMUP_STABLE_BARS:
+                window_data = {
+                    symbol: df[df['timestamp'] <= end] if 'timestamp' in df.columns else df[df.index <= end]
+                    for symbol, df in data.items()
+                }
+                results.append(self.backtest(strategy, window_data, max_positions, timeframe))
+            else:
+                window_arrays = {
+                    key: arr if key == 'max_leverages' else arr[:n_bars]
+                    for key, arr in arrays.items()
+                }
+                metrics, _ = self._simulate_portfolio(window_arrays, symbols, max_positions, timeframe)
+                metrics['total_signals'] = int(window_arrays['entries'].sum())
+                results.append(metrics)
+
+        logger.info(
+            f"[{strategy_name}] Windowed backtest complete: {len(window_ends)} windows, "
+            f"{len(symbols)} symbols, {len(common_index)} bars | "
+            f"Time: {time.perf_counter() - _t_start:.2f}s (signals={_t_signals:.2f}s)"
+        )
+
+        return results
+
+    def backtest_is_oos(
+        self,
+        strategy: StrategyCore,
+        data: Dict[str, pd.DataFrame],
+        oos_start: pd.Timestamp,
+        max_positions: Optional[int] = None,
+        timeframe: Optional[str] = None,
+        min_oos_bars: int = 20
+    ) -> Tuple[Dict, Optional[Dict]]:
+        """
+        In-sample and out-of-sample backtest of one contiguous range in one pass.
+
+        calculate_indicators() and signal generation run once over IS+OOS,
+        so OOS bars see indicators warmed up on the IS history instead of a
+        cold start with its own signal warmup. One kernel pass simulates
+        both periods; at the boundary open positions are closed and the OOS
+        period restarts flat from initial capital, so the IS metrics equal
+        backtest() on the IS data alone.
+
+        Args:
+            strategy: StrategyCore instance
+            data: Dict mapping symbol -> OHLCV DataFrame (IS followed by OOS)
+            oos_start: First timestamp of the OOS period
+            max_positions: Maximum concurrent open positions (default from config)
+            timeframe: Timeframe string for Sharpe annualization
+            min_oos_bars: Minimum common OOS bars (fewer -> no OOS result)
+
+        Returns:
+            (is_metrics, oos_metrics); oos_metrics is None when the OOS period
+            has fewer than min_oos_bars common bars. OOS trade indices are
+            relative to the OOS start.
+        """
+        if max_positions is None:
+            if hasattr(self.config, '_raw_config'):
+                max_positions = self.config.get('risk.limits.max_open_positions_per_subaccount')
+            else:
+                max_positions = self.config.get('risk', {}).get('limits', {}).get('max_open_positions_per_subaccount')
+            if max_positions is None:
+                max_positions = 10
+
+        if timeframe is None:
+            timeframe = getattr(strategy, 'timeframe', None)
+
+        strategy_name = strategy.__class__.__name__
+        _t_start = time.perf_counter()
+
+        aligned_data = self._align_dataframes(data)
+        if aligned_data is None:
+            return self._empty_results(), None
+
+        common_index = pd.DatetimeIndex(aligned_data['_index'])
+        symbols = [s for s in aligned_data.keys() if s != '_index']
+        n_bars = len(common_index)
+        split = int(common_index.searchsorted(pd.Timestamp(oos_start), side='left'))
+
+        if split < SIGNAL_WARMUP_STABLE_BARS:
+            # IS too short for a length-independent warmup: IS result unreliable
+            logger.warning(f"[{strategy_name}] IS period too short for single-pass IS/OOS: {split} bars")
+            return self._empty_results(), None
+
+        all_signals = self._generate_portfolio_signals(strategy, aligned_data, symbols, max_positions)
+        arrays = self._prepare_simulation_arrays(all_signals, symbols, n_bars)
+        _t_signals = time.perf_counter() - _t_start
+
+        has_oos = n_bars - split >= min_oos_bars
+        if not has_oos:
+            # Simulate the IS period only
+            arrays = {key: arr if key == 'max_leverages' else arr[:split] for key, arr in arrays.items()}
+
+        equity_curve, trades = self._run_portfolio_kernel(
+            arrays, symbols, max_positions, split_bar=split if has_oos else 0
+        )
 
+        # IS trades all exit before the boundary (closed out at split - 1)
+        records = trades.records
+        is_mask = records['exit_idx'] < split
+        is_trades = TradeLog(records[is_mask], symbols, self.fee_rate)
+        is_result = self._calculate_portfolio_metrics(
+            is_trades, equity_curve[:split + 1], self.initial_capital, timeframe=timeframe
+        )
+        is_result['total_signals'] = int(arrays['entries'][:split].sum())
+        is_result['max_positions_used'] = max_positions
+        is_result['symbols_count'] = len(symbols)
+
+        oos_result = None
+        if has_oos:
+            oos_records = records[~is_mask]
+            oos_records['entry_idx'] -= split
+            oos_records['exit_idx'] -= split
+            oos_curve = np.concatenate(([self.initial_capital], equity_curve[split + 1:]))
+            oos_result = self._calculate_portfolio_metrics(
+                TradeLog(oos_records, symbols, self.fee_rate), oos_curve, self.initial_capital,
+                timeframe=timeframe
+            )
+            oos_result['total_signals'] = int(arrays['entries'][split:].sum())
+            oos_result['max_positions_used'] = max_positions
+            oos_result['symbols_count'] = len(symbols)
+
+        logger.info(
+            f"[{strategy_name}] IS/OOS backtest complete: {len(is_trades)} IS + "
+            f"{len(records) - len(is_trades)} OOS trades, {len(symbols)} symbols, "
+            f"{split}+{n_bars - split} bars | "
+            f"Time: {time.perf_counter() - _t_start:.2f}s (signals={_t_signals:.2f}s)"
+        )
+
+        return is_result, oos_result
+
+    def _generate_portfolio_signals(
+        self,
+        strategy: StrategyCore,
+        aligned_data: Dict[str, pd.DataFrame],
+        symbols: List[str],
+        max_positions: int
+    ) -> Dict[str, Dict]:
+        """
+        Run _generate_signals_fast for every symbol (parallelized by symbol).
+
+        Returns:
+            Dict mapping symbol -> signal data for _prepare_simulation_arrays
+        """
         def process_symbol(symbol):
             df = aligned_data[symbol]
             coin_max_lev = self._get_coin_max_leverage(symbol)
@@ -621,37 +1056,65 @@ class BacktestEngine:
         with ThreadPoolExecutor(max_workers=min(len(symbols), 8)) as executor:
             results = list(executor.map(process_symbol, symbols))
 
-        for symbol, signals_dict in results:
-            all_signals[symbol] = signals_dict
+        return dict(results)
 
-        _t_signals = time.perf_counter() - _t0
+    def _simulate_portfolio(
+        self,
+        arrays: Dict[str, np.ndarray],
+        symbols: List[str],
+        max_positions: int,
+        timeframe: Optional[str]
+    ) -> Tuple[Dict, TradeLog]:
+        """
+        Run the Numba portfolio simulation and compute metrics.
 
-        # Prepare 2D arrays for Numba simulation
-        _t0 = time.perf_counter()
-        arrays = self._prepare_simulation_arrays(all_signals, symbols, len(common_index))
-        _t_prepare = time.perf_counter() - _t0
+        Args:
+            arrays: 2D arrays from _prepare_simulation_arrays (or bar prefixes of them)
+            symbols: Symbol names (column order)
+            max_positions: Maximum concurrent open positions
+            timeframe: Timeframe string for Sharpe annualization
 
-        # DEBUG: Check sizes array values
-        sizes_at_entries = arrays['sizes'][arrays['entries']]
-        if len(sizes_at_entries) > 0:
-            # Also get SL and time exit info
-            sl_at_entries = arrays['sl_pcts'][arrays['entries']]
-            time_exit_at_entries = arrays['time_exit_flags'][arrays['entries']]
-            exit_bars_at_entries = arrays['exit_after_bars'][arrays['entries']]
-            logger.info(
-                f"[{strategy_name}] DEBUG kernel inputs: sizes=({sizes_at_entries.min():.3f}-{sizes_at_entries.max():.3f}), "
-                f"sl=({sl_at_entries.min():.3f}-{sl_at_entries.max():.3f}), "
-                f"time_exit={time_exit_at_entries.sum()}/{len(time_exit_at_entries)}, "
-                f"exit_bars=({exit_bars_at_entries.min()}-{exit_bars_at_entries.max()})"
-            )
+        Returns:
+            (metrics, closed_trades)
+        """
+        equity_curve_arr, closed_trades = self._run_portfolio_kernel(arrays, symbols, max_positions)
 
+        # Calculate metrics
+        metrics = self._calculate_portfolio_metrics(
+            closed_trades,
+            equity_curve_arr,
+            self.initial_capital,
+            timeframe=timeframe
+        )
+        metrics['max_positions_used'] = max_positions
+        metrics['symbols_count'] = len(symbols)
+
+        return metrics, closed_trades
+
+    def _run_portfolio_kernel(
+        self,
+        arrays: Dict[str, np.ndarray],
+        symbols: List[str],
+        max_positions: int,
+        split_bar: int = 0
+    ) -> Tuple[np.ndarray, TradeLog]:
+        """
+        Run _simulate_portfolio_numba on prepared arrays.
+
+        Args:
+            arrays: 2D arrays from _prepare_simulation_arrays
+            symbols: Symbol names (column order)
+            max_positions: Maximum concurrent open positions
+            split_bar: First bar of an independent second segment (0 = none)
+
+        Returns:
+            (equity_curve, closed_trades)
+        """
         # Prepare funding cumsum (zeros if not provided - caller should pass real data)
         n_bars_arr = arrays['close'].shape[0]
         n_symbols_arr = arrays['close'].shape[1]
         funding_cumsum = np.zeros((n_bars_arr, n_symbols_arr), dtype=np.float64)
 
-        # Run Numba-optimized simulation
-        _t0 = time.perf_counter()
         (equity_curve_arr, trade_symbol_idx, trade_entry_idx, trade_exit_idx,
          trade_entry_price, trade_exit_price, trade_pnl, trade_direction,
          trade_leverage, trade_exit_reason, n_trades) = _simulate_portfolio_numba(
@@ -677,45 +1140,20 @@ class BacktestEngine:
             self.slippage,
             self.min_notional,
             funding_cumsum,
-            self.breakeven_buffer
+            self.breakeven_buffer,
+            split_bar
         )
-        _t_simulation = time.perf_counter() - _t0
 
-        # Convert trade arrays back to list of dicts
-        closed_trades = self._trades_from_arrays(
+        # Compact columnar trade log (drops the n_bars * n_symbols output buffers)
+        closed_trades = self._trade_log_from_arrays(
             symbols, n_trades,
             trade_symbol_idx, trade_entry_idx, trade_exit_idx,
             trade_entry_price, trade_exit_price, trade_pnl,
             trade_direction, trade_leverage, trade_exit_reason,
-            arrays['sizes'], arrays['leverages']
+            arrays['sizes']
         )
 
-        equity_curve = equity_curve_arr.tolist()
-
-        # Calculate metrics
-        metrics = self._calculate_portfolio_metrics(
-            closed_trades,
-            equity_curve,
-            self.initial_capital,
-            timeframe=timeframe
-        )
-        metrics['max_positions_used'] = max_positions
-        metrics['symbols_count'] = len(symbols)
-
-        # DEBUG: Count total entry signals for comparison with parametric
-        total_entry_signals = int(arrays['entries'].sum())
-        metrics['total_signals'] = total_entry_signals
-
-        # Log profiling results
-        _t_total = time.perf_counter() - _t_start
-        logger.info(
-            f"[{strategy_name}] Backtest complete: {len(closed_trades)} trades, {total_entry_signals} signals, "
-            f"{len(symbols)} symbols, {len(common_index)} bars | "
-            f"Time: {_t_total:.2f}s (align={_t_align:.2f}s, signals={_t_signals:.2f}s, "
-            f"prepare={_t_prepare:.3f}s, sim={_t_simulation:.3f}s)"
-        )
-
-        return metrics
+        return equity_curve_arr, closed_trades
 
     def _prepare_simulation_arrays(
         self,
@@ -817,7 +1255,7 @@ class BacktestEngine:
             'exit_after_bars': exit_after_bars_2d,
         }
 
-    def _trades_from_arrays(
+    def _trade_log_from_arrays(
         self,
         symbols: List[str],
         n_trades: int,
@@ -830,60 +1268,38 @@ class BacktestEngine:
         trade_direction: np.ndarray,
         trade_leverage: np.ndarray,
         trade_exit_reason: np.ndarray,
-        sizes_2d: np.ndarray,
-        leverages_2d: np.ndarray
-    ) -> List[Dict]:
+        sizes_2d: np.ndarray
+    ) -> TradeLog:
         """
-        Convert Numba output arrays back to list of trade dicts.
+        Pack the Numba output arrays into a TradeLog.
 
         Args:
             symbols: List of symbol names
             n_trades: Number of actual trades
             trade_*: Arrays from Numba simulation
+            sizes_2d: Position sizes (% of equity) the simulation ran with
 
         Returns:
-            List of trade dicts compatible with _calculate_portfolio_metrics
+            TradeLog with n_trades records
         """
-        exit_reason_map = {0: 'sl', 1: 'tp', 2: 'signal', 3: 'time_exit', 4: 'end'}
-        direction_map = {1: 'long', -1: 'short'}
-
-        trades = []
-        for i in range(n_trades):
-            symbol_idx = int(trade_symbol_idx[i])
-            entry_idx = int(trade_entry_idx[i])
-            symbol = symbols[symbol_idx]
-            direction = direction_map.get(int(trade_direction[i]), 'long')
-            leverage = int(trade_leverage[i])
-            entry_price = float(trade_entry_price[i])
-            exit_price = float(trade_exit_price[i])
-            pnl = float(trade_pnl[i])
-
-            # Calculate size and margin from entry data
-            size_pct = sizes_2d[entry_idx, symbol_idx]
-            # Approximate margin (was equity * size_pct at entry time)
-            # We use initial_capital as approximation since we don't track per-trade equity
-            margin = self.initial_capital * size_pct
-            notional = margin * leverage
-            size = notional / entry_price
-
-            trades.append({
-                'symbol': symbol,
-                'entry_idx': entry_idx,
-                'exit_idx': int(trade_exit_idx[i]),
-                'entry_price': entry_price,
-                'exit_price': exit_price,
-                'size': size,
-                'margin': margin,
-                'leverage': leverage,
-                'notional': notional,
-                'pnl': pnl,
-                'return_on_margin': pnl / margin if margin > 0 else 0,
-                'fees': notional * self.fee_rate * 2,
-                'exit_reason': exit_reason_map.get(int(trade_exit_reason[i]), 'unknown'),
-                'direction': direction,
-            })
-
-        return trades
+        records = np.empty(n_trades, dtype=TRADE_DTYPE)
+        records['symbol_idx'] = trade_symbol_idx[:n_trades]
+        records['entry_idx'] = trade_entry_idx[:n_trades]
+        records['exit_idx'] = trade_exit_idx[:n_trades]
+        records['entry_price'] = trade_entry_price[:n_trades]
+        records['exit_price'] = trade_exit_price[:n_trades]
+        records['pnl'] = trade_pnl[:n_trades]
+        records['direction'] = trade_direction[:n_trades]
+        records['leverage'] = trade_leverage[:n_trades]
+        records['exit_reason'] = trade_exit_reason[:n_trades]
+
+        # Approximate margin (was equity * size_pct at entry time)
+        # We use initial_capital as approximation since we don't track per-trade equity
+        records['margin'] = self.initial_capital * sizes_2d[records['entry_idx'], records['symbol_idx']]
+        records['notional'] = records['margin'] * records['leverage']
+        records['size'] = records['notional'] / records['entry_price']
+
+        return TradeLog(records, symbols, self.fee_rate)
 
     def backtest_python(
         self,
@@ -1306,137 +1722,56 @@ class BacktestEngine:
 
     def _calculate_portfolio_metrics(
         self,
-        trades: List[Dict],
-        equity_curve: List[float],
+        trades: Union[TradeLog, List[Dict]],
+        equity_curve: Union[np.ndarray, List[float]],
         initial_capital: float,
         timeframe: Optional[str] = None
     ) -> Dict:
         """
-        Calculate metrics from trade list and equity curve
+        Calculate metrics from the trades and equity curve
 
         Args:
-            trades: List of trade dicts
+            trades: TradeLog, or list of trade dicts (backtest_python)
             equity_curve: Equity curve (one value per bar)
             initial_capital: Starting capital
             timeframe: Timeframe string ('15m', '1h', etc.) for correct Sharpe annualization
         """
-        if not trades:
+        if len(trades) == 0:
             return self._empty_results()
 
-        # Basic trade stats
-        total_trades = len(trades)
-        winning_trades = sum(1 for t in trades if t['pnl'] > 0)
-        win_rate = winning_trades / total_trades if total_trades > 0 else 0
-
-        # PnL stats
-        pnls = [t['pnl'] for t in trades]
-        total_pnl = sum(pnls)
-        avg_pnl = np.mean(pnls)
-        total_return = total_pnl / initial_capital
-
-        # Expectancy: (Win% × Avg Win%) - (Loss% × Avg Loss%)
-        # Calculate PnL as percentage of trade notional for each trade
-        win_pcts = []
-        loss_pcts = []
-        for t in trades:
-            notional = t.get('notional', 0)
-            if notional > 0:
-                pnl_pct = t['pnl'] / notional
-                if t['pnl'] > 0:
-                    win_pcts.append(pnl_pct)
-                else:
-                    loss_pcts.append(abs(pnl_pct))
-
-        avg_win_pct = np.mean(win_pcts) if win_pcts else 0.0
-        avg_loss_pct = np.mean(loss_pcts) if loss_pcts else 0.0
-        # Sanitize to avoid NaN
-        avg_win_pct = float(np.nan_to_num(avg_win_pct, nan=0.0))
-        avg_loss_pct = float(np.nan_to_num(avg_loss_pct, nan=0.0))
-        # Official expectancy formula
-        expectancy = (win_rate * avg_win_pct) - ((1 - win_rate) * avg_loss_pct)
-
-        # Drawdown - protect against division by zero and negative equity
-        equity_arr = np.array(equity_curve)
-        # Ensure equity never goes below 0 for drawdown calculation
-        equity_arr = np.maximum(equity_arr, 0.0)
-        running_max = np.maximum.accumulate(equity_arr)
-        with np.errstate(divide='ignore', invalid='ignore'):
-            # Correct formula: (peak - current) / peak = positive when underwater
-            drawdowns = np.where(running_max > 0,
-                                 (running_max - equity_arr) / running_max,
-                                 0.0)
-        # Max drawdown is the maximum value (already positive)
-        max_drawdown = np.nanmax(drawdowns)
-        # Clamp to [0, 1] range
-        max_drawdown = min(max(max_drawdown, 0.0), 1.0)
-
-        # Sharpe ratio - TRADE-BASED calculation (more robust than bar-by-bar)
-        # Bar-by-bar Sharpe is inflated when few trades spread across many bars
-        # (most bars have return=0, artificially lowering std)
-        # Trade-based Sharpe uses actual trade returns and annualizes by trade frequency
-        n_bars = len(equity_curve) - 1
-        if total_trades >= 3:  # Need at least 3 trades for meaningful Sharpe
-            # Calculate trade returns (PnL / margin for leveraged return)
-            trade_returns = [t.get('return_on_margin', t['pnl'] / t['margin'])
-                            for t in trades if t.get('margin', 0) > 0]
-
-            if len(trade_returns) >= 3:
-                trade_returns = np.array(trade_returns)
-                mean_trade_return = np.mean(trade_returns)
-                std_trade_return = np.std(trade_returns)
-
-                if std_trade_return > 1e-10:
-                    # Annualize: estimate trades per year from backtest frequency
-                    # trades_per_year = total_trades / (n_bars / bars_per_year)
-                    if timeframe:
-                        bars_per_year = {
-                            '2h': 4380, '1h': 8760, '30m': 17520,
-                            '15m': 35040, '5m': 105120
-                        }.get(timeframe, 35040)
-                    else:
-                        bars_per_year = 365
-
-                    backtest_years = n_bars / bars_per_year if bars_per_year > 0 else 1.0
-                    trades_per_year = total_trades / backtest_years if backtest_years > 0 else total_trades
-
-                    # Sharpe = mean / std * sqrt(trades_per_year)
-                    # Cap annualization factor to avoid inflation
-                    # Max sqrt(365) ~= 19.1 (crypto trades 365 days/year)
-                    annualization = np.sqrt(min(trades_per_year, 365))
-                    sharpe = mean_trade_return / std_trade_return * annualization
-                else:
-                    sharpe = 0.0
-            else:
-                sharpe = 0.0
+        if isinstance(trades, TradeLog):
+            columns = trades.records
+            pnl, notional, margin, leverage = (
+                np.ascontiguousarray(columns[name]) for name in ('pnl', 'notional', 'margin', 'leverage')
+            )
         else:
-            sharpe = 0.0
+            pnl = np.array([t['pnl'] for t in trades], dtype=np.float64)
+            notional = np.array([t.get('notional', 0) for t in trades], dtype=np.float64)
+            margin = np.array([t.get('margin', 0) for t in trades], dtype=np.float64)
+            leverage = np.array([t.get('leverage', 1) for t in trades], dtype=np.int32)
 
-        # SANITY CHECK: Sharpe must be consistent with total_return
-        # Even with trade-based calculation, extreme losses should have negative Sharpe
-        if total_return < -0.5:  # Lost more than 50%
-            sharpe = min(sharpe, -abs(total_return) * 2)  # At -100% loss, Sharpe <= -2
-        elif total_return < 0 and sharpe > 0:
-            sharpe = 0.0
+        equity_arr = np.asarray(equity_curve, dtype=np.float64)
 
-        # Profit factor
-        gross_profit = sum(p for p in pnls if p > 0)
-        gross_loss = abs(sum(p for p in pnls if p < 0))
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
+        # Without a timeframe, annualize as daily bars
+        bars_per_year = BARS_PER_YEAR.get(timeframe, 35040) if timeframe else 365
 
-        # Average leverage used
-        leverages = [t.get('leverage', 1) for t in trades]
-        avg_leverage = np.mean(leverages) if leverages else 1.0
+        (total_return, win_rate, expectancy, max_drawdown, sharpe,
+         profit_factor, avg_leverage, cagr, consistency) = _portfolio_metrics_numba(
+            pnl, notional, margin, leverage, equity_arr, float(initial_capital), float(bars_per_year)
+        )
 
         return {
             'total_return': sanitize_float(total_return),
+            'cagr': sanitize_float(cagr),
             'sharpe_ratio': sanitize_float(sharpe),
             'max_drawdown': sanitize_float(max_drawdown),
-            'total_trades': total_trades,
+            'total_trades': len(trades),
             'win_rate': sanitize_float(win_rate),
             'expectancy': sanitize_float(expectancy),
             'profit_factor': sanitize_float(profit_factor, default=1.0),
             'avg_leverage': sanitize_float(avg_leverage, default=1.0),
-            'final_equity': equity_curve[-1] if equity_curve else initial_capital,
+            'consistency': sanitize_float(consistency),
+            'final_equity': float(equity_arr[-1]) if len(equity_arr) else initial_capital,
             'trades': trades,
         }
 
@@ -1524,9 +1859,8 @@ class BacktestEngine:
 
         # Apply warmup - adaptive to ensure signals are possible
         # For short data (OOS ~30 bars), reduce warmup to leave room for signals
-        # Minimum 10 bars after warmup for signal generation
-        min_signal_bars = 10
-        warmup_bars = min(100, max(20, len(entry_signal) - min_signal_bars))
+        # Minimum MIN_SIGNAL_BARS bars after warmup for signal generation
+        warmup_bars = min(SIGNAL_WARMUP_BARS, max(20, len(entry_signal) - MIN_SIGNAL_BARS))
         if warmup_bars > 0 and warmup_bars < len(entry_signal):
             entry_signal[:warmup_bars] = False
 
@@ -0,0 +1,681 @@
+"""
+Backtester Benchmark Suite
+
+Measures throughput of the backtest hot paths on deterministic synthetic
+OHLCV panels and gates regressions against a stored baseline:
+
+1. portfolio_kernel     _simulate_portfolio_numba            bars*symbols/s
+2. single_param_set     _simulate_single_param_set           bars*symbols/s
+3. single_param_set_v2  _simulate_single_param_set_v2        bars*symbols/s
+4. engine_backtest      BacktestEngine.backtest              bars*symbols/s
+5. parametric_typed     ParametricBacktester.backtest_typed  combos/s
+6. parametric_halving   same grid, successive-halving search combos/s
+7. numba_kernels        numba_kernels ATR / swing / SL conversions  bars*symbols/s
+
+Each case runs in a fresh process, so JIT warmup (first call) and peak RSS
+are per case. validate.py checks correctness; this checks capacity.
+
+RUN:
+    python -m src.backtester.benchmark --size medium
+    python -m src.backtester.benchmark --size medium --save-baseline
+    python -m src.backtester.benchmark --size medium --baseline data/benchmarks/baseline_medium.json
+
+Exit code 1 when a metric regresses past its threshold.
+
+Successive halving must find the same top-K as the exhaustive sweep:
+    python -m src.backtester.benchmark --size medium --check-halving
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime, UTC
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+BENCHMARK_DIR = Path('data/benchmarks')
+
+# Signal every ~N bars per symbol (offset per symbol so entries don't align)
+ENTRY_EVERY = 48
+
+
+@dataclass(frozen=True)
+class BenchmarkSize:
+    n_bars: int
+    n_symbols: int
+    n_combos: int  # Target grid size for parametric_typed (actual count is reported)
+
+
+SIZES = {
+    'small': BenchmarkSize(n_bars=2_000, n_symbols=10, n_combos=100),
+    'medium': BenchmarkSize(n_bars=17_280, n_symbols=30, n_combos=500),   # 180d of 15m
+    'large': BenchmarkSize(n_bars=35_040, n_symbols=50, n_combos=1_000),  # 365d of 15m
+}
+
+# Regression gates: relative change allowed vs baseline, plus an absolute
+# floor below which differences are treated as noise
+THRESHOLDS = {
+    'throughput': {'max_drop': 0.15},                    # *_per_s metrics
+    'warmup_s': {'max_increase': 0.50, 'min_abs': 0.5},
+    'peak_rss_mb': {'max_increase': 0.20, 'min_abs': 50.0},
+}
+
+# Successive halving vs exhaustive on the benchmark panel: share of the
+# exhaustive top-K found, and score lost on the best combo
+HALVING_TOLERANCE = {'top_k': 20, 'min_recall': 0.8, 'max_best_score_gap': 1.0}
+
+
+# =============================================================================
+# SYNTHETIC DATA
+# =============================================================================
+
+def make_panel(n_bars: int, n_symbols: int, seed: int = 42) -> Dict[str, np.ndarray]:
+    """
+    Deterministic synthetic OHLCV panel.
+
+    Geometric random walk per symbol with realistic 15m volatility, plus a
+    fixed entry pattern (alternating long/short per symbol).
+
+    Returns:
+        Dict with open/high/low/close/volume (n_bars, n_symbols) float64,
+        entries (bool) and directions (int8, 1/-1 at entries, 0 elsewhere)
+    """
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.0, 0.004, size=(n_bars, n_symbols))
+    start = rng.uniform(1.0, 1000.0, size=n_symbols)
+    close = start * np.exp(np.cumsum(returns, axis=0))
+
+    open_ = np.vstack([start, close[:-1]])
+    wick = np.abs(rng.normal(0.0, 0.002, size=(n_bars, n_symbols)))
+    high = np.maximum(open_, close) * (1.0 + wick)
+    low = np.minimum(open_, close) * (1.0 - wick)
+    volume = rng.uniform(100.0, 10_000.0, size=(n_bars, n_symbols))
+
+    bars = np.arange(n_bars)[:, None]
+    offsets = (np.arange(n_symbols) * 7) % ENTRY_EVERY
+    entries = (bars % ENTRY_EVERY) == offsets[None, :]
+    entries[:50] = False  # Leave room for indicator warmup
+
+    directions = np.where(np.arange(n_symbols) % 2 == 0, 1, -1).astype(np.int8)
+    directions = np.where(entries, directions[None, :], 0).astype(np.int8)
+
+    return {
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': volume,
+        'entries': entries,
+        'directions': directions,
+    }
+
+
+def panel_frames(panel: Dict[str, np.ndarray]) -> Dict:
+    """Per-symbol OHLCV DataFrames (15m bars) for BacktestEngine"""
+    import pandas as pd
+
+    n_bars, n_symbols = panel['close'].shape
+    timestamps = pd.date_range('2024-01-01', periods=n_bars, freq='15min', tz='UTC')
+    return {
+        f"SYM{j:03d}": pd.DataFrame({
+            'timestamp': timestamps,
+            'open': panel['open'][:, j],
+            'high': panel['high'][:, j],
+            'low': panel['low'][:, j],
+            'close': panel['close'][:, j],
+            'volume': panel['volume'][:, j],
+            'entry': panel['entries'][:, j],
+        })
+        for j in range(n_symbols)
+    }
+
+
+# =============================================================================
+# CASES
+# =============================================================================
+# Each case prepares its inputs and returns (fn, work) where fn runs the
+# measured call and work = {metric: units per call}.
+
+def _case_portfolio_kernel(size: BenchmarkSize, panel: Dict[str, np.ndarray]):
+    from src.backtester.backtest_engine import _simulate_portfolio_numba
+    from src.backtester.validate import FEE_RATE, SLIPPAGE, INITIAL_CAPITAL
+
+    shape = panel['close'].shape
+    entries = panel['entries']
+    zeros_f = np.zeros(shape, dtype=np.float64)
+    zeros_b = np.zeros(shape, dtype=np.bool_)
+
+    def run():
+        _simulate_portfolio_numba(
+            panel['close'], panel['high'], panel['low'],
+            entries, zeros_b,
+            np.where(entries, 0.05, 0.0),                      # sizes
+            np.where(entries, 0.03, 0.0),                      # sl_pcts
+            np.where(entries, 0.05, 0.0),                      # tp_pcts
+            panel['directions'],
+            np.where(entries, 2, 0).astype(np.int32),          # leverages
+            np.full(shape[1], 20, dtype=np.int32),             # max_leverages
+            zeros_b, zeros_f, zeros_f,                         # trailing
+            entries, np.where(entries, 96, 0).astype(np.int32),  # time exit
+            10, INITIAL_CAPITAL, FEE_RATE, SLIPPAGE, 10.0,
+            zeros_f, 0.002, 0,
+        )
+
+    return run, {'bars_symbols_per_s': shape[0] * shape[1]}
+
+
+def _single_param_args(panel: Dict[str, np.ndarray]):
+    from src.backtester.validate import FEE_RATE, SLIPPAGE, INITIAL_CAPITAL
+
+    n_symbols = panel['close'].shape[1]
+    return dict(
+        max_leverages=np.full(n_symbols, 20, dtype=np.int32),
+        initial_capital=INITIAL_CAPITAL, fee_rate=FEE_RATE, slippage=SLIPPAGE,
+        max_positions=10, risk_pct=0.02, min_notional=10.0,
+        funding_cumsum=np.zeros(panel['close'].shape, dtype=np.float64),
+    )
+
+
+def _case_single_param_set(size: BenchmarkSize, panel: Dict[str, np.ndarray]):
+    from src.backtester.parametric_backtest import _simulate_single_param_set
+
+    a = _single_param_args(panel)
+
+    def run():
+        _simulate_single_param_set(
+            panel['close'], panel['high'], panel['low'],
+            panel['entries'], panel['directions'],
+            0.03, 0.05, 2, a['max_leverages'], 96,
+            a['initial_capital'], a['fee_rate'], a['slippage'],
+            a['max_positions'], a['risk_pct'], a['min_notional'],
+            a['funding_cumsum'],
+        )
+
+    return run, {'bars_symbols_per_s': panel['close'].size}
+
+
+def _case_single_param_set_v2(size: BenchmarkSize, panel: Dict[str, np.ndarray]):
+    from src.backtester.parametric_backtest import _simulate_single_param_set_v2
+
+    a = _single_param_args(panel)
+    sl_pcts = np.where(panel['entries'], 0.03, 0.0)
+    tp_pcts = np.where(panel['entries'], 0.05, 0.0)
+
+    def run():
+        _simulate_single_param_set_v2(
+            panel['close'], panel['high'], panel['low'],
+            panel['entries'], panel['directions'],
+            sl_pcts, tp_pcts, 2, a['max_leverages'], 96,
+            a['initial_capital'], a['fee_rate'], a['slippage'],
+            a['max_positions'], a['risk_pct'], a['min_notional'],
+            False, 0.01, 0.002, a['funding_cumsum'],
+        )
+
+    return run, {'bars_symbols_per_s': panel['close'].size}
+
+
+def _case_engine_backtest(size: BenchmarkSize, panel: Dict[str, np.ndarray]):
+    import logging
+
+    import pandas as pd
+
+    from src.backtester.backtest_engine import BacktestEngine
+    from src.backtester.validate import TEST_CONFIG, patch_coin_registry
+    from src.strategies.base import StrategyCore, StopLossType
+
+    class BenchmarkStrategy(StrategyCore):
+        """Fixed entry pattern from the panel, percentage SL/TP, time exit"""
+        signal_column = 'entry_signal'
+        direction = 'long'
+        sl_type = StopLossType.PERCENTAGE
+        sl_pct = 0.03
+        tp_pct = 0.05
+        leverage = 2
+        exit_after_bars = 96
+
+        def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+            df = df.copy()
+            df['entry_signal'] = df['entry']
+            return df
+
+        def generate_signal(self, df, symbol=None):
+            return None
+
+    patch_coin_registry()
+    logging.getLogger('src.backtester.backtest_engine').setLevel(logging.WARNING)
+    engine = BacktestEngine(config=TEST_CONFIG)
+    frames = panel_frames(panel)
+    strategy = BenchmarkStrategy()
+
+    def run():
+        engine.backtest(strategy, frames, max_positions=10, timeframe='15m')
+
+    return run, {'bars_symbols_per_s': panel['close'].size}
+
+
+def _typed_grid(size: BenchmarkSize, search_mode: str = 'exhaustive'):
+    """ParametricBacktester with a PERCENTAGE grid of ~size.n_combos combos, and the actual count"""
+    import logging
+
+    from src.backtester.parametric_backtest import ParametricBacktester
+    from src.backtester.parametric_constants import LEVERAGE_VALUES
+    from src.backtester.validate import TEST_CONFIG
+    from src.strategies.base import StopLossType, TakeProfitType
+
+    logging.getLogger('src.backtester.parametric_backtest').setLevel(logging.WARNING)
+    config = {
+        **TEST_CONFIG,
+        'backtesting': {**TEST_CONFIG['backtesting'], 'parametric_search': {'mode': search_mode}},
+    }
+    backtester = ParametricBacktester(config)
+    backtester.set_timeframe('15m')
+
+    # Size the grid: n_sl x n_tp x leverage values x exit bars ~= n_combos
+    tp_values = [0.0, 0.02, 0.03, 0.05, 0.07]
+    exit_values = [0, 20, 50, 100]
+    n_sl = max(1, round(size.n_combos / (len(tp_values) * len(LEVERAGE_VALUES) * len(exit_values))))
+    backtester.set_parameter_space({
+        'sl_pct': [float(x) for x in np.linspace(0.005, 0.05, n_sl)],
+        'tp_pct': tp_values,
+        'exit_bars': exit_values,
+    })
+
+    n_combos = len(backtester._generate_typed_param_sets(StopLossType.PERCENTAGE, TakeProfitType.PERCENTAGE)[0])
+    return backtester, n_combos
+
+
+def _run_typed_grid(backtester, panel: Dict[str, np.ndarray]):
+    from src.strategies.base import StopLossType, TakeProfitType
+
+    ohlc = {'close': panel['close'], 'high': panel['high'], 'low': panel['low']}
+    max_levs = np.full(panel['close'].shape[1], 20, dtype=np.int32)
+    return backtester.backtest_typed(
+        panel['entries'], ohlc, panel['directions'], max_levs,
+        StopLossType.PERCENTAGE, TakeProfitType.PERCENTAGE,
+    )
+
+
+def _case_parametric_typed(size: BenchmarkSize, panel: Dict[str, np.ndarray], search_mode: str = 'exhaustive'):
+    backtester, n_combos = _typed_grid(size, search_mode)
+
+    def run():
+        _run_typed_grid(backtester, panel)
+
+    return run, {
+        'combos_per_s': n_combos,
+        'bars_symbols_combos_per_s': panel['close'].size * n_combos,
+    }
+
+
+def _case_parametric_halving(size: BenchmarkSize, panel: Dict[str, np.ndarray]):
+    return _case_parametric_typed(size, panel, search_mode='halving')
+
+
+def _case_numba_kernels(size: BenchmarkSize, panel: Dict[str, np.ndarray]):
+    from src.backtester.numba_kernels import (
+        calculate_atr_full_numba,
+        calculate_swing_low_high_numba,
+        convert_sl_atr_to_pct_numba,
+        convert_sl_structure_to_pct_2d_numba,
+    )
+
+    high, low, close = panel['high'], panel['low'], panel['close']
+
+    def run():
+        atr = calculate_atr_full_numba(high, low, close, 14)
+        convert_sl_atr_to_pct_numba(panel['entries'], close, atr, 2.0)
+        swing_low, swing_high = calculate_swing_low_high_numba(high, low, 10)
+        convert_sl_structure_to_pct_2d_numba(panel['entries'], close, panel['directions'], swing_low, swing_high)
+
+    return run, {'bars_symbols_per_s': close.size}
+
+
+CASES: Dict[str, Callable] = {
+    'portfolio_kernel': _case_portfolio_kernel,
+    'single_param_set': _case_single_param_set,
+    'single_param_set_v2': _case_single_param_set_v2,
+    'engine_backtest': _case_engine_backtest,
+    'parametric_typed': _case_parametric_typed,
+    'parametric_halving': _case_parametric_halving,
+    'numba_kernels': _case_numba_kernels,
+}
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(name: str, size: BenchmarkSize, repeats: int = 3, seed: int = 42) -> Dict:
+    """
+    Run one case in the current process.
+
+    The first call is timed as JIT warmup (compilation, or loading the
+    on-disk Numba cache); throughput uses the best of `repeats` calls.
+
+    Returns:
+        Dict with warmup_s, best_s, median_s, peak_rss_mb and one *_per_s
+        throughput per work unit of the case
+    """
+    panel = make_panel(size.n_bars, size.n_symbols, seed)
+    fn, work = CASES[name](size, panel)
+
+    t0 = time.perf_counter()
+    fn()
+    warmup_s = time.perf_counter() - t0
+
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+
+    best_s = min(times)
+    result = {
+        'warmup_s': round(warmup_s, 4),
+        'best_s': round(best_s, 4),
+        'median_s': round(statistics.median(times), 4),
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+    }
+    for metric, units in work.items():
+        result[metric] = round(units / best_s, 1)
+    return result
+
+
+def _init_case_process(cold_jit: bool) -> None:
+    """Child process setup: empty Numba cache dir for cold JIT measurements"""
+    if cold_jit:
+        os.environ['NUMBA_CACHE_DIR'] = tempfile.mkdtemp(prefix='numba-bench-')
+
+
+def run_suite(
+    size: BenchmarkSize,
+    cases: Optional[List[str]] = None,
+    repeats: int = 3,
+    isolate: bool = True,
+    cold_jit: bool = False
+) -> Dict:
+    """
+    Run benchmark cases and collect machine-readable results.
+
+    Args:
+        size: Panel and grid size
+        cases: Case names (default: all)
+        repeats: Timed calls per case after warmup
+        isolate: Run each case in a fresh process (per-case warmup and RSS)
+        cold_jit: Compile from scratch (ignore the on-disk Numba cache)
+
+    Returns:
+        Dict with meta, size and per-case results
+    """
+    results = {}
+    for name in cases or list(CASES):
+        print(f"  {name} ...", end='', flush=True)
+        if isolate:
+            with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=get_context('spawn'),
+                initializer=_init_case_process,
+                initargs=(cold_jit,),
+            ) as pool:
+                results[name] = pool.submit(run_case, name, size, repeats).result()
+        else:
+            results[name] = run_case(name, size, repeats)
+        print(f" {results[name]['best_s']:.3f}s (warmup {results[name]['warmup_s']:.2f}s)")
+
+    return {'meta': _environment(cold_jit), 'size': asdict(size), 'results': results}
+
+
+def _environment(cold_jit: bool) -> Dict:
+    """Where the numbers come from (compare only like with like)"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except Exception:
+        commit = None
+
+    try:
+        import numba
+        numba_version = numba.__version__
+    except ImportError:
+        numba_version = None
+
+    return {
+        'timestamp': datetime.now(UTC).isoformat(),
+        'commit': commit,
+        'host': platform.node(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'numba': numba_version,
+        'numba_threads': os.environ.get('NUMBA_NUM_THREADS'),
+        'cold_jit': cold_jit,
+    }
+
+
+# =============================================================================
+# SEARCH AGREEMENT
+# =============================================================================
+
+def compare_search_modes(size: BenchmarkSize, top_k: int = HALVING_TOLERANCE['top_k'], seed: int = 42) -> Dict:
+    """
+    Run the typed grid exhaustively and with successive halving on the same panel.
+
+    Returns:
+        Dict with combo counts, top_k_recall (share of the exhaustive top-K
+        combos also in the halving top-K), best_score_gap (exhaustive best
+        score minus halving best score) and both wall times
+    """
+    panel = make_panel(size.n_bars, size.n_symbols, seed)
+    results = {}
+    times = {}
+    for mode in ('exhaustive', 'halving'):
+        backtester, n_combos = _typed_grid(size, mode)
+        _run_typed_grid(backtester, make_panel(300, 3, seed))  # JIT warmup
+        t0 = time.perf_counter()
+        results[mode] = _run_typed_grid(backtester, panel)
+        times[mode] = time.perf_counter() - t0
+
+    def top(df):
+        return set(df.head(top_k)['params'].map(lambda p: tuple(sorted(p.items()))))
+
+    exhaustive, halving = results['exhaustive'], results['halving']
+    return {
+        'combos': n_combos,
+        'full_panel_combos': len(halving),
+        'top_k': top_k,
+        'top_k_recall': len(top(exhaustive) & top(halving)) / min(top_k, len(exhaustive)),
+        'best_score_gap': float(exhaustive['score'].iloc[0] - halving['score'].iloc[0]),
+        'exhaustive_s': round(times['exhaustive'], 4),
+        'halving_s': round(times['halving'], 4),
+    }
+
+
+def check_halving(report: Dict, tolerance: Optional[Dict] = None) -> List[str]:
+    """Tolerance violations of a compare_search_modes() report (empty = agreement)"""
+    tolerance = tolerance or HALVING_TOLERANCE
+    failures = []
+    if report['top_k_recall'] < tolerance['min_recall']:
+        failures.append(
+            f"top-{report['top_k']} recall {report['top_k_recall']:.0%} < {tolerance['min_recall']:.0%}"
+        )
+    if report['best_score_gap'] > tolerance['max_best_score_gap']:
+        failures.append(
+            f"best score gap {report['best_score_gap']:.2f} > {tolerance['max_best_score_gap']:.2f}"
+        )
+    return failures
+
+
+# =============================================================================
+# BASELINE GATE
+# =============================================================================
+
+@dataclass
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+    change: float  # Relative change (negative = lower than baseline)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case}.{self.metric}: {self.baseline:g} -> {self.current:g} "
+            f"({self.change:+.1%})"
+        )
+
+
+def compare_to_baseline(current: Dict, baseline: Dict, thresholds: Optional[Dict] = None) -> List[Regression]:
+    """
+    Find metrics that regressed past their threshold.
+
+    Throughput (*_per_s) may not drop more than max_drop; warmup_s and
+    peak_rss_mb may not grow more than max_increase (and min_abs).
+    Cases missing on either side are skipped.
+
+    Raises:
+        ValueError: If the runs used different sizes
+    """
+    thresholds = thresholds or THRESHOLDS
+    if current['size'] != baseline['size']:
+        raise ValueError(f"Size mismatch: current {current['size']} vs baseline {baseline['size']}")
+
+    regressions = []
+    for case, metrics in current['results'].items():
+        base_metrics = baseline['results'].get(case)
+        if not base_metrics:
+            continue
+
+        for metric, value in metrics.items():
+            base = base_metrics.get(metric)
+            if not base:
+                continue
+            change = (value - base) / base
+
+            if metric.endswith('_per_s'):
+                if change < -thresholds['throughput']['max_drop']:
+                    regressions.append(Regression(case, metric, base, value, change))
+            elif metric in thresholds:
+                limit = thresholds[metric]
+                if change > limit['max_increase'] and value - base > limit.get('min_abs', 0.0):
+                    regressions.append(Regression(case, metric, base, value, change))
+
+    return regressions
+
+
+def _print_comparison(current: Dict, baseline: Dict) -> None:
+    print(f"\n{'case':<22}{'metric':<28}{'baseline':>14}{'current':>14}{'change':>9}")
+    for case, metrics in current['results'].items():
+        base_metrics = baseline['results'].get(case, {})
+        for metric, value in metrics.items():
+            base = base_metrics.get(metric)
+            change = f"{(value - base) / base:+.1%}" if base else "-"
+            print(f"{case:<22}{metric:<28}{base if base is not None else '-':>14}{value:>14}{change:>9}")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backtester performance benchmarks")
+    parser.add_argument('--size', choices=sorted(SIZES), default='small')
+    parser.add_argument('--bars', type=int, help="Override bars of the size preset")
+    parser.add_argument('--symbols', type=int, help="Override symbols of the size preset")
+    parser.add_argument('--combos', type=int, help="Override parametric grid size of the preset")
+    parser.add_argument('--cases', help=f"Comma-separated subset of: {', '.join(CASES)}")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--cold-jit', action='store_true', help="Ignore the on-disk Numba cache")
+    parser.add_argument('--in-process', action='store_true', help="Run all cases in this process")
+    parser.add_argument('--output', type=Path, help="Results file (default: data/benchmarks/...)")
+    parser.add_argument('--baseline', type=Path, help="Baseline to compare against (default per size)")
+    parser.add_argument('--save-baseline', action='store_true', help="Store these results as the baseline")
+    parser.add_argument('--check-halving', action='store_true',
+                        help="Only compare successive-halving and exhaustive top-K")
+    args = parser.parse_args()
+
+    preset = SIZES[args.size]
+    size = BenchmarkSize(
+        n_bars=args.bars or preset.n_bars,
+        n_symbols=args.symbols or preset.n_symbols,
+        n_combos=args.combos or preset.n_combos,
+    )
+    cases = args.cases.split(',') if args.cases else None
+    unknown = set(cases or []) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown cases: {', '.join(sorted(unknown))}")
+
+    if args.check_halving:
+        print(f"\nSuccessive halving vs exhaustive: {size.n_bars} bars x {size.n_symbols} symbols")
+        agreement = compare_search_modes(size)
+        for key, value in agreement.items():
+            print(f"  {key:<20}{value}")
+        failures = check_halving(agreement)
+        for failure in failures:
+            print(f"  HALVING FAILED: {failure}")
+        return 1 if failures else 0
+
+    baseline_path = args.baseline or BENCHMARK_DIR / f"baseline_{args.size}.json"
+    baseline = None
+    if not args.save_baseline and baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text())
+        # Fail before the (long) run: a resized panel is not comparable
+        if baseline['size'] != asdict(size):
+            parser.error(
+                f"--bars/--symbols/--combos give {asdict(size)}, but {baseline_path} "
+                f"was recorded with {baseline['size']} (pass --baseline or --save-baseline)"
+            )
+
+    print(f"\nBacktester benchmark: {size.n_bars} bars x {size.n_symbols} symbols, {size.n_combos} combos")
+    report = run_suite(size, cases, args.repeats, isolate=not args.in_process, cold_jit=args.cold_jit)
+
+    # Only the default locations live in BENCHMARK_DIR
+    if args.output is None or (args.save_baseline and args.baseline is None):
+        BENCHMARK_DIR.mkdir(parents=True, exist_ok=True)
+    output = args.output or BENCHMARK_DIR / f"backtester_{args.size}_{datetime.now(UTC):%Y%m%dT%H%M%S}.json"
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, indent=2))
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+
+    if baseline is None:
+        print(f"No baseline at {baseline_path} (run with --save-baseline)")
+        return 0
+
+    _print_comparison(report, baseline)
+    regressions = compare_to_baseline(report, baseline)
+
+    if regressions:
+        print(f"\nBENCHMARK FAILED: {len(regressions)} regressions vs {baseline_path}")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"\nBENCHMARK PASSED vs {baseline_path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,6 +8,10 @@ Design Principles:
 - Read-only: NEVER downloads data
 - Fast fail: Crash if data doesn't exist
 - Simple: Just read parquet files
+- Windowed: only the monthly partitions overlapping the requested window
+  are loaded (see src/data/ohlcv_store.py)
+- Shared: served from the memory-mapped OHLCV panel when one is available
+  (see panel_store.py), parquet otherwise
 """
 
 import pandas as pd
@@ -15,6 +19,8 @@ from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 
+from src.backtester.panel_store import PanelStore
+from src.data.ohlcv_store import OHLCVStore
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,14 +39,17 @@ class BacktestCacheReader:
     If data doesn't exist, raises CacheNotFoundError.
     """
 
-    def __init__(self, cache_dir: str = 'data/binance'):
+    def __init__(self, cache_dir: str = 'data/binance', panel_store: Optional[PanelStore] = None):
         """
         Initialize cache reader
 
         Args:
             cache_dir: Directory containing parquet cache files
+            panel_store: Shared OHLCV panels (None = always read parquet)
         """
         self.cache_dir = Path(cache_dir)
+        self.store = OHLCVStore(cache_dir)
+        self.panel_store = panel_store
 
         if not self.cache_dir.exists():
             raise CacheNotFoundError(
@@ -72,19 +81,36 @@ class BacktestCacheReader:
         Raises:
             CacheNotFoundError: If cache file doesn't exist
         """
-        file_path = self.cache_dir / f"{symbol}_{timeframe}.parquet"
+        bounds = self.store.bounds(symbol, timeframe)
 
-        if not file_path.exists():
+        if bounds is None:
             raise CacheNotFoundError(
-                f"Cache not found: {file_path}\n"
+                f"Cache not found: {self.store.series_dir(symbol, timeframe)}\n"
                 f"Run data_scheduler to download {symbol} {timeframe} data first."
             )
 
-        # Read parquet
-        df = pd.read_parquet(file_path)
+        if self.panel_store is not None:
+            df = self._read_from_panel(symbol, timeframe, days, end_date)
+            if df is not None:
+                return df
+
+        # Read only the partitions that can hold the window
+        window_start = None
+        if days is not None:
+            cache_end = pd.Timestamp(bounds[1], unit='ms', tz='UTC')
+            approx_end = min(cache_end, self._utc(end_date)) if end_date is not None else cache_end
+            window_start = approx_end - timedelta(days=days)
+
+        df = self.store.read(symbol, timeframe, start=window_start, end=end_date)
+
+        if window_start is not None and not df.empty:
+            # end_date inside a gap: the window ends (and starts) earlier
+            last_ts = df['timestamp'].max()
+            if last_ts < approx_end:
+                df = self.store.read(symbol, timeframe, start=last_ts - timedelta(days=days), end=end_date)
 
         if df.empty:
-            logger.warning(f"Cache file is empty: {file_path}")
+            logger.warning(f"Cache is empty for window: {symbol} {timeframe}")
             return df
 
         # Ensure timestamp column is datetime
@@ -117,6 +143,38 @@ class BacktestCacheReader:
 
         return df.reset_index(drop=True)
 
+    @staticmethod
+    def _utc(value: datetime) -> pd.Timestamp:
+        """Timestamp in UTC (naive values are taken as UTC)"""
+        ts = pd.Timestamp(value)
+        return ts.tz_convert('UTC') if ts.tzinfo else ts.tz_localize('UTC')
+
+    def _read_from_panel(
+        self,
+        symbol: str,
+        timeframe: str,
+        days: Optional[int],
+        end_date: Optional[datetime]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read from the shared panel (zero-copy columns).
+
+        Returns None when the panel can't serve the request: no panel,
+        symbol not in it, cache written after the build, or the
+        requested window starts before the panel history.
+        """
+        panel = self.panel_store.get(timeframe)
+        if panel is None or symbol not in panel:
+            return None
+
+        if self.store.version(symbol, timeframe) != panel.source_mtime_ns.get(symbol):
+            return None
+
+        df = panel.symbol_frame(symbol, days=days, end_date=end_date)
+        if df is not None:
+            logger.debug(f"Read {len(df)} candles for {symbol} {timeframe} from panel {panel.version}")
+        return df
+
     def read_dual_periods(
         self,
         symbol: str,
@@ -297,16 +355,7 @@ class BacktestCacheReader:
         Returns:
             List of symbol names
         """
-        symbols = set()
-
-        pattern = f"*_{timeframe}.parquet" if timeframe else "*.parquet"
-
-        for file in self.cache_dir.glob(pattern):
-            # File format: {symbol}_{timeframe}.parquet
-            symbol = file.stem.split('_')[0]
-            symbols.add(symbol)
-
-        return sorted(symbols)
+        return sorted({symbol for symbol, _ in self.store.list_series(timeframe)})
 
     def list_cached_timeframes(self, symbol: str) -> List[str]:
         """
@@ -318,14 +367,7 @@ class BacktestCacheReader:
         Returns:
             List of timeframes
         """
-        timeframes = []
-
-        for file in self.cache_dir.glob(f"{symbol}_*.parquet"):
-            # File format: {symbol}_{timeframe}.parquet
-            tf = file.stem.split('_')[1]
-            timeframes.append(tf)
-
-        return sorted(timeframes)
+        return sorted(tf for cached, tf in self.store.list_series() if cached == symbol)
 
     def get_cache_info(self, symbol: str, timeframe: str) -> Optional[dict]:
         """
@@ -338,32 +380,35 @@ class BacktestCacheReader:
         Returns:
             Dict with cache info or None if not found
         """
-        file_path = self.cache_dir / f"{symbol}_{timeframe}.parquet"
-
-        if not file_path.exists():
+        if not self.store.exists(symbol, timeframe):
             return None
 
-        df = pd.read_parquet(file_path)
+        # Coverage comes from the manifest, candles are not read
+        bounds = self.store.bounds(symbol, timeframe)
+        manifest = self.store.manifest(symbol, timeframe)
+        path = self.store.series_dir(symbol, timeframe) if manifest else self.store.legacy_path(symbol, timeframe)
 
-        if df.empty:
+        if bounds is None:
             return {
                 'symbol': symbol,
                 'timeframe': timeframe,
-                'file': str(file_path),
+                'file': str(path),
                 'candles': 0,
                 'start': None,
                 'end': None,
                 'days': 0
             }
 
+        start = pd.Timestamp(bounds[0], unit='ms', tz='UTC')
+        end = pd.Timestamp(bounds[1], unit='ms', tz='UTC')
         return {
             'symbol': symbol,
             'timeframe': timeframe,
-            'file': str(file_path),
-            'candles': len(df),
-            'start': df['timestamp'].min(),
-            'end': df['timestamp'].max(),
-            'days': self._calculate_data_days(df)
+            'file': str(path),
+            'candles': bounds[2],
+            'start': start,
+            'end': end,
+            'days': (end - start).days
         }
 
     def _calculate_data_days(self, df: pd.DataFrame) -> int:
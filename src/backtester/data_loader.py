@@ -8,6 +8,8 @@ Design Principles:
 - Read-only: Uses pre-downloaded cache (run data_scheduler first)
 - Fast fail: Crash if data doesn't exist
 - No network: Never calls Binance API
+- Shared memory: reads go through the OHLCV panel store when available,
+  so IS/OOS frames are zero-copy views of the shared panel
 """
 
 import pandas as pd
@@ -17,6 +19,7 @@ from datetime import datetime, timedelta
 
 from src.utils.logger import get_logger
 from src.backtester.cache_reader import BacktestCacheReader, CacheNotFoundError
+from src.backtester.panel_store import PanelStore
 
 logger = get_logger(__name__)
 
@@ -36,13 +39,21 @@ class BacktestDataLoader:
     - Dual-period backtesting (full + recent)
     """
 
-    def __init__(self, cache_dir: str = 'data/binance', config: Optional[dict] = None):
+    def __init__(
+        self,
+        cache_dir: str = 'data/binance',
+        config: Optional[dict] = None,
+        panel_store: Optional[PanelStore] = None
+    ):
         self.cache_dir = Path(cache_dir)
         self.config = config
 
+        # Shared panels (falls back to parquet until data_scheduler builds them)
+        self.panel_store = panel_store or PanelStore(cache_dir=str(cache_dir))
+
         # Use cache reader (never downloads)
         try:
-            self.cache_reader = BacktestCacheReader(cache_dir=cache_dir)
+            self.cache_reader = BacktestCacheReader(cache_dir=cache_dir, panel_store=self.panel_store)
         except CacheNotFoundError as e:
             logger.error(f"Cache not available: {e}")
             raise
@@ -135,12 +146,15 @@ class BacktestDataLoader:
 
         # Calculate split point based on oos_days from end
         if 'timestamp' in df.columns:
-            df = df.sort_values('timestamp')
+            if not df['timestamp'].is_monotonic_increasing:
+                df = df.sort_values('timestamp')
             end_ts = df['timestamp'].max()
             split_ts = end_ts - timedelta(days=oos_days)
 
-            is_df = df[df['timestamp'] < split_ts].copy()
-            oos_df = df[df['timestamp'] >= split_ts].copy()
+            # Sorted: split by position, keeping panel columns as views
+            split = int(df['timestamp'].searchsorted(split_ts, side='left'))
+            is_df = self._slice_rows(df, 0, split)
+            oos_df = self._slice_rows(df, split, len(df))
         else:
             # Use index if no timestamp column
             df = df.sort_index()
@@ -157,6 +171,16 @@ class BacktestDataLoader:
 
         return is_df, oos_df
 
+    @staticmethod
+    def _slice_rows(df: pd.DataFrame, start: int, stop: int) -> pd.DataFrame:
+        """
+        Row slice as a standalone DataFrame sharing column data (no copy).
+
+        Unlike df.iloc[start:stop] the result is not flagged as a slice of df,
+        so callers can add columns without SettingWithCopyWarning.
+        """
+        return pd.DataFrame({col: df[col].iloc[start:stop] for col in df.columns}, copy=False)
+
     def load_multi_symbol_is_oos(
         self,
         symbols: List[str],
@@ -0,0 +1,127 @@
+"""
+Numba JIT Cache Precompilation
+
+Every kernel is @jit(cache=True): the first process that calls it with a new
+type signature compiles it (seconds per kernel) and writes the machine code
+to the Numba cache (__pycache__ next to the source, or NUMBA_CACHE_DIR);
+later processes load it in milliseconds.
+
+Without a warm cache, each supervisor restart (and the scheduler's daily
+restart) pays the compilation on its first backtest. Run this once per
+deploy, as the service user, after the code is updated:
+
+    python -m src.backtester.jit_cache
+
+It calls every kernel with small inputs of the same dtypes the pipeline
+uses, so the cached signatures are the ones loaded at runtime. Numba keys
+the cache on the source file, so editing a kernel module invalidates only
+that module's entries.
+"""
+
+import sys
+import time
+from typing import Callable, Dict
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, '.')
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Small enough to compile in the minimum time, large enough for every code path
+_SIZE = dict(n_bars=300, n_symbols=3, n_combos=20)
+
+
+def _numba_kernels() -> None:
+    from src.backtester.numba_kernels import warmup_numba_kernels
+    warmup_numba_kernels()
+
+
+def _benchmark_case(name: str) -> Callable[[], None]:
+    """Run one benchmark case once (same argument dtypes as the pipeline)"""
+    def run() -> None:
+        from src.backtester.benchmark import CASES, BenchmarkSize, make_panel
+        size = BenchmarkSize(**_SIZE)
+        fn, _ = CASES[name](size, make_panel(size.n_bars, size.n_symbols))
+        fn()
+    return run
+
+
+def _lookahead_validator() -> None:
+    from src.backtester.validator import _calculate_edge_numba, _run_shuffle_iterations_numba
+
+    signals = np.array([1, -1, 1], dtype=np.int64)
+    prices = np.array([100.0, 101.0, 102.0], dtype=np.float64)
+    indices = np.array([10, 20, 30], dtype=np.int64)
+    close = np.linspace(100.0, 110.0, 50).astype(np.float64)
+    _calculate_edge_numba(signals, prices, indices, close, 10)
+    _run_shuffle_iterations_numba(signals, prices, indices, close, 2, 10)
+
+
+def _portfolio_metrics() -> None:
+    from src.backtester.backtest_engine import _portfolio_metrics_numba
+
+    pnl = np.array([5.0, -3.0, 2.0], dtype=np.float64)
+    notional = np.full(3, 100.0, dtype=np.float64)
+    margin = np.full(3, 50.0, dtype=np.float64)
+    leverage = np.full(3, 2, dtype=np.int32)
+    equity = np.array([1000.0, 1005.0, 1002.0, 1004.0], dtype=np.float64)
+    _portfolio_metrics_numba(pnl, notional, margin, leverage, equity, 1000.0, 35040.0)
+
+
+def _shuffle_test() -> None:
+    from src.validator.shuffle_test import _generate_fake_ohlcv_numba
+    _generate_fake_ohlcv_numba(100.0, 1000.0, 0.02, 10)
+
+
+KERNEL_GROUPS: Dict[str, Callable[[], None]] = {
+    'numba_kernels': _numba_kernels,
+    'portfolio_kernel': _benchmark_case('portfolio_kernel'),
+    'portfolio_metrics': _portfolio_metrics,
+    'single_param_set': _benchmark_case('single_param_set'),
+    'single_param_set_v2': _benchmark_case('single_param_set_v2'),
+    'parametric_typed': _benchmark_case('parametric_typed'),
+    'lookahead_validator': _lookahead_validator,
+    'shuffle_test': _shuffle_test,
+}
+
+
+def precompile_kernels() -> Dict[str, float]:
+    """
+    Compile (or load from cache) every Numba kernel.
+
+    Returns:
+        Seconds per kernel group (near zero when the cache was already warm)
+
+    Raises:
+        Whatever a kernel raises - a kernel that can't compile must fail the deploy
+    """
+    timings = {}
+    for name, warm in KERNEL_GROUPS.items():
+        t0 = time.perf_counter()
+        warm()
+        timings[name] = time.perf_counter() - t0
+        logger.info(f"JIT cache: {name} ready in {timings[name]:.2f}s")
+    return timings
+
+
+def main() -> int:
+    t0 = time.perf_counter()
+    try:
+        timings = precompile_kernels()
+    except Exception as e:
+        logger.critical(f"JIT precompilation failed: {type(e).__name__}: {e}")
+        return 1
+
+    import numba
+    print(f"\nNumba {numba.__version__} cache warm ({len(timings)} kernel groups, {time.perf_counter() - t0:.1f}s):")
+    for name, seconds in timings.items():
+        print(f"  {name:<22}{seconds:>8.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
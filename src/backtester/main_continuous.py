@@ -5,21 +5,20 @@ Backtests validated strategies with portfolio simulation.
 - Multi-pair backtesting (top 30 coins by volume)
 - Backtest on assigned timeframe with training/holdout validation
 - Training/Holdout split for anti-overfitting
-- Uses ThreadPoolExecutor for parallel backtesting
+- Uses ThreadPoolExecutor or a long-lived process pool for parallel backtesting
 """
 
 import asyncio
+import multiprocessing
 import os
 import signal
 import threading
 import warnings
-from concurrent.futures import ThreadPoolExecutor, Future
+from collections import OrderedDict
+from concurrent.futures import Future
 from datetime import datetime, UTC
-from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
-import importlib.util
-import tempfile
 import sys
 import time
 
@@ -31,18 +30,23 @@ import pandas as pd
 from sqlalchemy.orm import joinedload
 
 from src.config import load_config
-from src.database import get_session, Strategy, BacktestResult, StrategyProcessor
+from src.database import get_session, Strategy, BacktestResult, StrategyProcessor, ClaimQueue
 from src.backtester.backtest_engine import BacktestEngine
 from src.backtester.data_loader import BacktestDataLoader
 from src.backtester.parametric_backtest import ParametricBacktester
+from src.backtester.signal_fingerprint import SignalFingerprinter
+from src.backtester.worker_pool import create_backtest_executor, run_backtest_job, run_retest_job
 # NOTE: detect_structure not used - all strategies forced to PERCENTAGE for Numba parametric
 from src.strategies.base import StopLossType, TakeProfitType
+from src.strategies.indicator_cache import IndicatorCache
+from src.strategies.loader import StrategyLoader, get_strategy_loader
 # NOTE: MultiWindowValidator removed - replaced by WFA with parameter re-optimization
 from src.data.coin_registry import get_registry, get_active_pairs
 from src.data.funding_loader import FundingLoader
 from src.scorer import BacktestScorer, PoolManager
 from src.validator.lookahead_test import LookaheadTester
 from src.utils import get_logger, setup_logging
+from src.utils.startup import startup_phase, log_startup_report
 from src.utils.strategy_files import sync_directories_with_db
 
 # Initialize logging at module load
@@ -69,7 +73,8 @@ class ContinuousBacktesterProcess:
         engine: Optional[BacktestEngine] = None,
         data_loader: Optional[BacktestDataLoader] = None,
         processor: Optional[StrategyProcessor] = None,
-        parametric_backtester: Optional[ParametricBacktester] = None
+        parametric_backtester: Optional[ParametricBacktester] = None,
+        worker_mode: bool = False
     ):
         """
         Initialize the backtester process with dependency injection.
@@ -79,6 +84,8 @@ class ContinuousBacktesterProcess:
             data_loader: BacktestDataLoader instance (created if not provided)
             processor: StrategyProcessor instance (created if not provided)
             parametric_backtester: ParametricBacktester instance (created if enabled and not provided)
+            worker_mode: True inside a process-pool worker (runs jobs only:
+                no executor of its own, no startup file sync)
         """
         self.config = load_config()
         self.shutdown_event = threading.Event()
@@ -111,17 +118,37 @@ class ContinuousBacktesterProcess:
         self.log_interval = self.config.get_required('pipeline.monitoring.log_interval')
         self._last_log_time = datetime.min
 
-        # ThreadPoolExecutor for parallel backtesting
-        self.executor = ThreadPoolExecutor(
-            max_workers=self.parallel_threads,
-            thread_name_prefix="Backtester"
-        )
-
         # Components - use injected or create new (Dependency Injection pattern)
         self.engine = engine or BacktestEngine(self.config._raw_config)
         cache_dir = self.config.get_required('directories.data') + '/binance'
         self.data_loader = data_loader or BacktestDataLoader(cache_dir)
-        self.processor = processor or StrategyProcessor(process_id=f"backtester-{os.getpid()}")
+        # Pre-backtest dedup of strategies with identical/near-identical entry signals
+        self.signal_fingerprinter = SignalFingerprinter(self.config, cache_dir)
+        self.processor = processor or StrategyProcessor(
+            process_id=f"backtester-{os.getpid()}",
+            stale_release_interval=self.config.get('pipeline.claiming.stale_release_interval', 60)
+        )
+        # Local prefetch of VALIDATED claims (batched UPDATE ... RETURNING)
+        self.claim_queue = ClaimQueue(
+            self.processor,
+            "VALIDATED",
+            batch_size=self.config.get('pipeline.claiming.batch_size', 8),
+            low_water=self.config.get('pipeline.claiming.low_water', 2)
+        )
+
+        # Executor for parallel backtesting: 'thread' or 'process' (long-lived workers)
+        # Slot accounting below is the same for both modes (futures per slot type)
+        self.worker_mode = worker_mode
+        self.executor_mode = self.config.get('backtesting.threads.mode', 'thread')
+        self._log_listener = None
+        if worker_mode:
+            self.executor = None
+        else:
+            self.executor, self._log_listener = create_backtest_executor(
+                mode=self.executor_mode,
+                max_workers=self.parallel_threads,
+                process_id=self.processor.process_id,
+            )
 
         # Parametric backtester - use injected or create new (Dependency Injection)
         self.parametric_enabled = self.config.get_required('generation.parametric.enabled')
@@ -158,6 +185,7 @@ class ContinuousBacktesterProcess:
         self.is_days = self.config.get_required('backtesting.is_days')
         self.oos_days = self.config.get_required('backtesting.oos_days')
         self.min_coverage_pct = self.config.get_required('backtesting.min_coverage_pct')
+        self.is_oos_single_pass = self.config.get('backtesting.is_oos_single_pass', True)
 
         # Out-of-sample validation thresholds
         # Note: OOS uses same thresholds as IS (min_sharpe, min_win_rate, etc.)
@@ -185,7 +213,21 @@ class ContinuousBacktesterProcess:
         self.pool_manager = PoolManager(self.config._raw_config)
 
         # Sync strategy files with DB at startup (ensures consistency)
-        self._sync_strategy_files()
+        if not worker_mode:
+            self._sync_strategy_files()
+
+        # Indicator cache shared by all strategies backtested in this process
+        IndicatorCache.configure(
+            max_mb=self.config.get('backtesting.indicator_cache.max_mb', 512),
+            enabled=self.config.get('backtesting.indicator_cache.enabled', True),
+        )
+
+        # Strategy modules shared by validation, IS/OOS, WFA, retest and shuffle test
+        StrategyLoader.configure(
+            max_modules=self.config.get('strategy_loader.max_modules', 256),
+            cache_dir=self.config.get('strategy_loader.cache_dir', 'data/strategy_code'),
+            max_disk_files=self.config.get('strategy_loader.max_disk_files', 5000),
+        )
 
         # Lookahead tester for post-scoring shuffle test (anti-lookahead)
         self.lookahead_tester = LookaheadTester()
@@ -193,14 +235,18 @@ class ContinuousBacktesterProcess:
 
         # NOTE: multi_window_validator removed - replaced by WFA with parameter re-optimization
 
-        # Preloaded data cache: {(symbols_hash, timeframe): data}
-        self._data_cache: Dict[str, Dict[str, any]] = {}
+        # Preloaded IS/OOS data: {timeframe_pairshash_panelversion: (is_data, oos_data)}
+        # Bounded LRU: frames are views of the shared panel, but parquet
+        # fallback frames are private copies and must not accumulate
+        self._data_cache: OrderedDict = OrderedDict()
+        self._data_cache_lock = threading.Lock()
+        self._data_cache_size = self.config.get('backtesting.data_cache_size', 16)
 
         # CoinRegistry handles caching and invalidation
         # No need for local pairs cache anymore
 
         logger.info(
-            f"ContinuousBacktesterProcess initialized: "
+            f"ContinuousBacktesterProcess initialized ({self.executor_mode} mode): "
             f"{self.validated_threads} VALIDATED threads + {self.retest_threads} elastic thread, "
             f"{len(self.timeframes)} TFs, retest every {self.retest_interval_days}d, pool max {self.pool_max_size}"
         )
@@ -346,17 +392,16 @@ class ContinuousBacktesterProcess:
         Returns:
             Tuple of (is_data_dict, oos_data_dict)
         """
-        # Cache key includes pairs hash - different strategies have different pairs
-        pairs_hash = hash(tuple(sorted(pairs)))
-        is_cache_key = f"{timeframe}_{pairs_hash}_is"
-        oos_cache_key = f"{timeframe}_{pairs_hash}_oos"
-
-        # Check if both are cached
-        if is_cache_key in self._data_cache and oos_cache_key in self._data_cache:
-            return (
-                self._data_cache[is_cache_key],
-                self._data_cache[oos_cache_key]
-            )
+        # Cache key includes pairs hash - different strategies have different pairs -
+        # and the panel version, so a rebuilt panel invalidates stale entries
+        panel = self.data_loader.panel_store.get(timeframe)
+        panel_version = panel.version if panel is not None else 'parquet'
+        cache_key = f"{timeframe}_{hash(tuple(sorted(pairs)))}_{panel_version}"
+
+        with self._data_cache_lock:
+            if cache_key in self._data_cache:
+                self._data_cache.move_to_end(cache_key)
+                return self._data_cache[cache_key]
 
         try:
             # Use all validated pairs from strategy's trading_coins
@@ -368,8 +413,10 @@ class ContinuousBacktesterProcess:
                 target_count=len(pairs)  # Use all validated pairs
             )
 
-            self._data_cache[is_cache_key] = is_data
-            self._data_cache[oos_cache_key] = oos_data
+            with self._data_cache_lock:
+                self._data_cache[cache_key] = (is_data, oos_data)
+                while len(self._data_cache) > self._data_cache_size:
+                    self._data_cache.popitem(last=False)
 
             logger.info(
                 f"Loaded IS/OOS data for {timeframe}: "
@@ -424,6 +471,12 @@ class ContinuousBacktesterProcess:
             # Log pipeline status periodically
             self._log_pipeline_status()
 
+            # Release claims of crashed processes (periodic, not per claim)
+            try:
+                self.processor.release_stale_claims_if_due()
+            except Exception as e:
+                logger.warning(f"Failed to release stale claims: {e}")
+
             # Process completed backtests (both types)
             for futures_dict, future_type in [
                 (validated_futures, "VALIDATED"),
@@ -463,7 +516,7 @@ class ContinuousBacktesterProcess:
                 if strategy_data:
                     # Submit re-backtest task
                     future = self.executor.submit(
-                        self._retest_strategy,
+                        run_retest_job if self.executor_mode == 'process' else self._retest_strategy,
                         strategy_data['id'],
                         strategy_data['name'],
                         strategy_data['code'],
@@ -482,10 +535,10 @@ class ContinuousBacktesterProcess:
                 max_validated = self.parallel_threads  # Elastic slot available for VALIDATED
 
             if len(validated_futures) < max_validated:
-                strategy = self.processor.claim_strategy("VALIDATED")
+                strategy = self.claim_queue.get()
                 if strategy:
                     future = self.executor.submit(
-                        self._backtest_strategy,
+                        run_backtest_job if self.executor_mode == 'process' else self._backtest_strategy,
                         strategy.id,
                         strategy.name,
                         strategy.code,
@@ -604,6 +657,25 @@ class ContinuousBacktesterProcess:
             # Store validated coins
             validated_coins_list = list(is_data.keys())
 
+            # Skip functional duplicates before the parametric sweep: same entries
+            # on the reference panel as an already backtested strategy. Runs after
+            # the coin/IS-data checks, so only strategies that get backtested
+            # register a fingerprint
+            try:
+                duplicate = self.signal_fingerprinter.check(
+                    strategy_instance, original_tf, strategy_id, strategy_name
+                )
+            except Exception as e:
+                logger.warning(f"[{strategy_name}] Signal fingerprint failed, backtesting anyway: {e}")
+                duplicate = None
+            if duplicate is not None:
+                duplicate_of, similarity = duplicate
+                EventTracker.backtest_duplicate_signals(
+                    strategy_id, strategy_name, original_tf, duplicate_of, similarity, base_code_hash
+                )
+                self._delete_strategy(strategy_id, f"Duplicate signals of {duplicate_of}")
+                return (False, f"Duplicate signals of {duplicate_of} (similarity {similarity:.2f})")
+
             # STEP 1: PARAMETRIC OPTIMIZATION (screening)
             # Tests ~1050 combinations, finds best combo, discards #2-1050
             # Supports all SL/TP types via typed parametric backtest:
@@ -688,8 +760,8 @@ class ContinuousBacktesterProcess:
 
                     # STEP 2: Final IS backtest with best params for metrics
                     is_start_time = time.time()  # Track IS phase timing (excludes parametric)
-                    is_result = self._run_multi_symbol_backtest(
-                        strategy_instance, is_data, assigned_tf
+                    is_result, single_pass_oos = self._run_is_backtest(
+                        strategy_instance, is_data, oos_data, assigned_tf
                     )
 
                     # DEBUG: Compare parametric vs IS trades
@@ -714,8 +786,8 @@ class ContinuousBacktesterProcess:
                     # Force PERCENTAGE and use original params
                     is_start_time = time.time()
                     strategy_instance.sl_type = StopLossType.PERCENTAGE
-                    is_result = self._run_multi_symbol_backtest(
-                        strategy_instance, is_data, assigned_tf
+                    is_result, single_pass_oos = self._run_is_backtest(
+                        strategy_instance, is_data, oos_data, assigned_tf
                     )
                     optimal_params = {
                         'sl_pct': getattr(strategy_instance, 'SL_PCT', 0.02),
@@ -812,7 +884,9 @@ class ContinuousBacktesterProcess:
             oos_start_time = time.time()  # Track OOS phase timing
             oos_result = None
             try:
-                if oos_data and len(oos_data) >= 5:
+                if self.is_oos_single_pass:
+                    oos_result = single_pass_oos
+                elif oos_data and len(oos_data) >= 5:
                     oos_result = self._run_multi_symbol_backtest(
                         strategy_instance, oos_data, assigned_tf,
                         min_bars=20  # Lower threshold for OOS period
@@ -1057,6 +1131,154 @@ class ContinuousBacktesterProcess:
             logger.error(f"Portfolio backtest failed: {e}\n{traceback.format_exc()}")
             return {'total_trades': 0}
 
+    def _run_is_backtest(
+        self,
+        strategy_instance,
+        is_data: Dict[str, any],
+        oos_data: Dict[str, any],
+        timeframe: str
+    ) -> Tuple[Dict, Optional[Dict]]:
+        """
+        IS backtest, plus the OOS backtest when is_oos_single_pass is enabled.
+
+        Single pass: each symbol's IS and OOS frames are joined back into
+        the contiguous range and BacktestEngine.backtest_is_oos() computes
+        indicators once, with the OOS period warmed up on the IS history.
+        Symbols follow the IS rules (>= 100 bars); OOS needs >= 20 common
+        OOS bars, like the separate OOS run.
+
+        The single pass aligns symbols on common bars, so it needs >= 20 OOS
+        bars for every IS symbol (and at least 5 symbols): one short OOS frame
+        would cap the common OOS range. Otherwise IS and OOS run
+        separately, as with is_oos_single_pass disabled, so the IS metrics
+        always cover all IS symbols.
+
+        Returns:
+            (is_result, oos_result); oos_result is None when OOS was not run
+            (always None when is_oos_single_pass is disabled)
+        """
+        if not self.is_oos_single_pass:
+            return self._run_multi_symbol_backtest(strategy_instance, is_data, timeframe), None
+
+        valid_is = {
+            symbol: df for symbol, df in is_data.items()
+            if not df.empty and len(df) >= 100
+        }
+        if not valid_is:
+            return {'total_trades': 0}, None
+
+        min_oos_bars = 20  # Lower threshold for OOS period
+        with_oos = [
+            s for s in valid_is
+            if oos_data and s in oos_data and len(oos_data[s]) >= min_oos_bars
+        ]
+        if len(with_oos) < 5 or len(with_oos) < len(valid_is):
+            is_result = self._run_multi_symbol_backtest(strategy_instance, valid_is, timeframe)
+            oos_result = None
+            if oos_data and len(oos_data) >= 5:
+                oos_result = self._run_multi_symbol_backtest(
+                    strategy_instance, oos_data, timeframe, min_bars=min_oos_bars
+                )
+            return is_result, oos_result
+
+        contiguous = {
+            symbol: pd.concat([valid_is[symbol], oos_data[symbol]], ignore_index=True)
+            for symbol in with_oos
+        }
+        # Earliest OOS bar: no symbol's OOS data ends up in the IS period
+        oos_start = min(
+            oos_data[s]['timestamp'].iloc[0] if 'timestamp' in oos_data[s].columns else oos_data[s].index[0]
+            for s in with_oos
+        )
+
+        try:
+            return self.engine.backtest_is_oos(
+                strategy=strategy_instance,
+                data=contiguous,
+                oos_start=oos_start,
+                max_positions=None,  # Uses config value
+                timeframe=timeframe,
+                min_oos_bars=min_oos_bars
+            )
+        except Exception as e:
+            import traceback
+            logger.error(f"IS/OOS backtest failed: {e}\n{traceback.format_exc()}")
+            return {'total_trades': 0}, None
+
+    def _parametric_combo_stats(self, results_df, valid_results, min_trades_tf: int) -> Dict:
+        """
+        combo_stats of a parametric_stats event.
+
+        Args:
+            results_df: Parametric results (attrs['combinations_total'] = full grid size)
+            valid_results: Rows of results_df passing all thresholds
+            min_trades_tf: Min trades threshold used for the timeframe
+
+        Returns:
+            {total, passed, failed, eliminated, fail_reasons, failed_avg, passed_avg}
+        """
+        # Calculate combo stats for metrics (CUMULATIVE - each combo counted for ALL violated thresholds).
+        # Totals cover the full grid: combos eliminated by successive halving
+        # count as failed; fail_reasons and averages cover the evaluated ones.
+        n_total = results_df.attrs.get('combinations_total', len(results_df))
+        n_eliminated = n_total - len(results_df)
+        n_passed = len(valid_results)
+        n_failed = n_total - n_passed
+
+        # Failed combos = those NOT in valid_results
+        failed_results = results_df[
+            ~((results_df['sharpe'] >= self.min_sharpe) &
+              (results_df['win_rate'] >= self.min_win_rate) &
+              (results_df['expectancy'] >= self.min_expectancy) &
+              (results_df['max_drawdown'] <= self.max_drawdown) &
+              (results_df['total_trades'] >= min_trades_tf))
+        ]
+
+        # CUMULATIVE threshold violations (each combo counted for EACH threshold it violates)
+        cum_fail_sharpe = int((results_df['sharpe'] < self.min_sharpe).sum())
+        cum_fail_trades = int((results_df['total_trades'] < min_trades_tf).sum())
+        cum_fail_wr = int((results_df['win_rate'] < self.min_win_rate).sum())
+        cum_fail_exp = int((results_df['expectancy'] < self.min_expectancy).sum())
+        cum_fail_dd = int((results_df['max_drawdown'] > self.max_drawdown).sum())
+
+        # Avg metrics for failed combos
+        if len(failed_results) > 0:
+            failed_avg = {
+                'sharpe': float(failed_results['sharpe'].mean()),
+                'wr': float(failed_results['win_rate'].mean()),
+                'exp': float(failed_results['expectancy'].mean()),
+                'trades': float(failed_results['total_trades'].mean()),
+            }
+        else:
+            failed_avg = {'sharpe': 0, 'wr': 0, 'exp': 0, 'trades': 0}
+
+        # Avg metrics for passed combos
+        if len(valid_results) > 0:
+            passed_avg = {
+                'sharpe': float(valid_results['sharpe'].mean()),
+                'wr': float(valid_results['win_rate'].mean()),
+                'exp': float(valid_results['expectancy'].mean()),
+                'trades': float(valid_results['total_trades'].mean()),
+            }
+        else:
+            passed_avg = {'sharpe': 0, 'wr': 0, 'exp': 0, 'trades': 0}
+
+        return {
+            'total': n_total,
+            'passed': n_passed,
+            'failed': n_failed,
+            'eliminated': n_eliminated,
+            'fail_reasons': {
+                'sharpe': cum_fail_sharpe,
+                'trades': cum_fail_trades,
+                'wr': cum_fail_wr,
+                'exp': cum_fail_exp,
+                'dd': cum_fail_dd,
+            },
+            'failed_avg': failed_avg,
+            'passed_avg': passed_avg,
+        }
+
     def _emit_empty_parametric_stats(
         self,
         base_code_hash: str,
@@ -1081,6 +1303,7 @@ class ContinuousBacktesterProcess:
             'total': 0,
             'passed': 0,
             'failed': 0,
+            'eliminated': 0,
             'fail_reasons': {'sharpe': 0, 'trades': 0, 'wr': 0, 'exp': 0, 'dd': 0},
             'failed_avg': {'sharpe': 0, 'wr': 0, 'exp': 0, 'trades': 0},
             'passed_avg': {'sharpe': 0, 'wr': 0, 'exp': 0, 'trades': 0},
@@ -1408,67 +1631,11 @@ class ContinuousBacktesterProcess:
             (results_df['total_trades'] >= min_trades_tf)
         ].copy()
 
-        # Track total combinations tested (for metrics)
-        combinations_tested = len(results_df)
+        # Track total combinations tested (for metrics; successive halving
+        # returns only the combos that reached the full panel)
+        combinations_tested = results_df.attrs.get('combinations_total', len(results_df))
 
-        # Calculate combo stats for metrics (CUMULATIVE - each combo counted for ALL violated thresholds)
-        n_total = len(results_df)
-        n_passed = len(valid_results)
-        n_failed = n_total - n_passed
-
-        # Failed combos = those NOT in valid_results
-        failed_results = results_df[
-            ~((results_df['sharpe'] >= self.min_sharpe) &
-              (results_df['win_rate'] >= self.min_win_rate) &
-              (results_df['expectancy'] >= self.min_expectancy) &
-              (results_df['max_drawdown'] <= self.max_drawdown) &
-              (results_df['total_trades'] >= min_trades_tf))
-        ]
-
-        # CUMULATIVE threshold violations (each combo counted for EACH threshold it violates)
-        cum_fail_sharpe = int((results_df['sharpe'] < self.min_sharpe).sum())
-        cum_fail_trades = int((results_df['total_trades'] < min_trades_tf).sum())
-        cum_fail_wr = int((results_df['win_rate'] < self.min_win_rate).sum())
-        cum_fail_exp = int((results_df['expectancy'] < self.min_expectancy).sum())
-        cum_fail_dd = int((results_df['max_drawdown'] > self.max_drawdown).sum())
-
-        # Avg metrics for failed combos
-        if len(failed_results) > 0:
-            failed_avg = {
-                'sharpe': float(failed_results['sharpe'].mean()),
-                'wr': float(failed_results['win_rate'].mean()),
-                'exp': float(failed_results['expectancy'].mean()),
-                'trades': float(failed_results['total_trades'].mean()),
-            }
-        else:
-            failed_avg = {'sharpe': 0, 'wr': 0, 'exp': 0, 'trades': 0}
-
-        # Avg metrics for passed combos
-        if len(valid_results) > 0:
-            passed_avg = {
-                'sharpe': float(valid_results['sharpe'].mean()),
-                'wr': float(valid_results['win_rate'].mean()),
-                'exp': float(valid_results['expectancy'].mean()),
-                'trades': float(valid_results['total_trades'].mean()),
-            }
-        else:
-            passed_avg = {'sharpe': 0, 'wr': 0, 'exp': 0, 'trades': 0}
-
-        # Build combo_stats dict for event tracking
-        combo_stats = {
-            'total': n_total,
-            'passed': n_passed,
-            'failed': n_failed,
-            'fail_reasons': {
-                'sharpe': cum_fail_sharpe,
-                'trades': cum_fail_trades,
-                'wr': cum_fail_wr,
-                'exp': cum_fail_exp,
-                'dd': cum_fail_dd,
-            },
-            'failed_avg': failed_avg,
-            'passed_avg': passed_avg,
-        }
+        combo_stats = self._parametric_combo_stats(results_df, valid_results, min_trades_tf)
 
         # Emit parametric_stats event for metrics aggregation (ALWAYS, regardless of results)
         if base_code_hash:
@@ -1908,6 +2075,58 @@ class ContinuousBacktesterProcess:
                 sliced[symbol] = df.iloc[:n_rows].copy()
         return sliced
 
+    def _run_wfa_windows_incremental(
+        self,
+        strategy_instance,
+        is_data: Dict[str, pd.DataFrame],
+        window_percentages: List[float],
+        timeframe: str,
+        min_bars: int = 20
+    ) -> Optional[List[Dict]]:
+        """
+        Backtest all WFA windows with a single indicator/signal pass.
+
+        Produces the same per-window results as slicing with
+        _slice_data_by_percentage() + _run_multi_symbol_backtest(), via
+        BacktestEngine.backtest_windows(): each window ends at the earliest
+        per-symbol slice end, which is where the aligned (intersected) data
+        of the sliced window stops.
+
+        Returns:
+            List of results (one per window), or None when the windows can't
+            share one pass (a symbol drops below min_bars in some window, no
+            timestamp column) or the pass fails - caller falls back to
+            per-window backtests
+        """
+        valid_data = {
+            symbol: df for symbol, df in is_data.items()
+            if not df.empty and len(df) >= min_bars
+        }
+        if not valid_data or any('timestamp' not in df.columns for df in valid_data.values()):
+            return None
+
+        window_ends = []
+        for window_pct in window_percentages:
+            ends = []
+            for df in valid_data.values():
+                n_rows = int(len(df) * window_pct)
+                if n_rows < min_bars:
+                    return None  # Symbol set would differ from the full window
+                ends.append(df['timestamp'].iloc[n_rows - 1])
+            window_ends.append(min(ends))
+
+        try:
+            return self.engine.backtest_windows(
+                strategy=strategy_instance,
+                data=valid_data,
+                window_ends=window_ends,
+                max_positions=None,  # Uses config value
+                timeframe=timeframe
+            )
+        except Exception as e:
+            logger.warning(f"Incremental WFA failed, falling back to per-window backtests: {e}")
+            return None
+
     def _run_wfa_fixed_params(
         self,
         strategy: 'Strategy',
@@ -1994,20 +2213,30 @@ class ContinuousBacktesterProcess:
                 f"{len(window_percentages)} windows (sl={wfa_sl}, tp={wfa_tp}, lev={wfa_lev})"
             )
 
+            # One indicator pass for all windows when possible (incremental WFA)
+            window_results_raw = None
+            if wfa_config.get('incremental', True):
+                window_results_raw = self._run_wfa_windows_incremental(
+                    strategy_instance, is_data, window_percentages, timeframe, min_bars=20
+                )
+
             for window_idx, window_pct in enumerate(window_percentages):
-                # Slice data for this window
-                window_data = self._slice_data_by_percentage(is_data, window_pct)
+                if window_results_raw is not None:
+                    result = window_results_raw[window_idx]
+                else:
+                    # Slice data for this window
+                    window_data = self._slice_data_by_percentage(is_data, window_pct)
 
-                if not window_data:
-                    logger.warning(
-                        f"[{strategy.name}] WFA window {window_idx+1}: no data at {window_pct:.0%}"
-                    )
-                    continue
+                    if not window_data:
+                        logger.warning(
+                            f"[{strategy.name}] WFA window {window_idx+1}: no data at {window_pct:.0%}"
+                        )
+                        continue
 
-                # Run backtest with FIXED params (no re-optimization)
-                result = self._run_multi_symbol_backtest(
-                    strategy_instance, window_data, timeframe, min_bars=20
-                )
+                    # Run backtest with FIXED params (no re-optimization)
+                    result = self._run_multi_symbol_backtest(
+                        strategy_instance, window_data, timeframe, min_bars=20
+                    )
 
                 if result is None:
                     logger.warning(
@@ -2390,46 +2619,22 @@ class ContinuousBacktesterProcess:
         return match.group(1) if match else None
 
     def _load_strategy_instance(self, code: str, class_name: str):
-        """Load strategy instance from code"""
-        temp_path = None
+        """Load strategy instance from code (module cached by content hash)"""
         try:
             # Check if code is valid
             if not code or len(code.strip()) < 50:
                 logger.warning(f"[{class_name}] Code is empty or too short ({len(code) if code else 0} chars)")
                 return None
 
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_path = f.name
-
-            spec = importlib.util.spec_from_file_location(
-                f"temp_{class_name}",
-                temp_path
-            )
-
-            if not spec or not spec.loader:
-                logger.warning(f"[{class_name}] Could not create module spec")
-                return None
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[spec.name] = module
-            spec.loader.exec_module(module)
-
-            if hasattr(module, class_name):
-                cls = getattr(module, class_name)
-                return cls()
-            else:
-                # Log available classes in module
-                available = [name for name in dir(module) if not name.startswith('_')]
-                logger.warning(f"[{class_name}] Class not found in module. Available: {available[:5]}")
+            cls = get_strategy_loader().load_class(code, class_name)
+            if cls is None:
+                logger.warning(f"[{class_name}] Class not found in module")
                 return None
+            return cls()
 
         except Exception as e:
             logger.warning(f"[{class_name}] Load failed: {type(e).__name__}: {e}")
             return None
-        finally:
-            if temp_path:
-                Path(temp_path).unlink(missing_ok=True)
 
     def _delete_strategy(self, strategy_id, reason: str):
         """Delete failed strategy (removes from DB entirely)"""
@@ -2580,8 +2785,8 @@ class ContinuousBacktesterProcess:
                 return (False, "No IS data")
 
             # Run IS backtest (no parametric - use existing params)
-            is_result = self._run_multi_symbol_backtest(
-                strategy_instance, is_data, assigned_tf
+            is_result, single_pass_oos = self._run_is_backtest(
+                strategy_instance, is_data, oos_data, assigned_tf
             )
 
             if is_result is None or is_result.get('total_trades', 0) == 0:
@@ -2590,7 +2795,9 @@ class ContinuousBacktesterProcess:
 
             # Run OOS backtest (min_bars=20 for 1d timeframe support)
             oos_result = None
-            if oos_data and len(oos_data) >= 5:
+            if self.is_oos_single_pass:
+                oos_result = single_pass_oos
+            elif oos_data and len(oos_data) >= 5:
                 oos_result = self._run_multi_symbol_backtest(
                     strategy_instance, oos_data, assigned_tf,
                     min_bars=20  # Lower threshold for OOS period
@@ -3019,13 +3226,26 @@ class ContinuousBacktesterProcess:
         self.shutdown_event.set()
         self.force_exit = True
 
-        # Release any claimed strategies
+        # One UPDATE by processing_by releases prefetched and in-flight claims
+        # alike (claim_queue claims under this processor's id)
         self.processor.release_all_by_process()
 
         # Shutdown executor (cancels pending futures)
         if self.executor:
             self.executor.shutdown(wait=False, cancel_futures=True)
 
+        # Process mode: os._exit below skips pool cleanup, stop workers explicitly
+        if self.executor_mode == 'process':
+            for child in multiprocessing.active_children():
+                child.terminate()
+        if self._log_listener:
+            self._log_listener.stop()
+
+        from src.database.event_tracker import EventTracker
+
+        # Write queued pipeline events before exiting (os._exit skips atexit)
+        EventTracker.flush(timeout=5.0)
+
         os._exit(0)
 
     def run(self):
@@ -3033,17 +3253,22 @@ class ContinuousBacktesterProcess:
         # STEP 1: Validate backtester before starting
         logger.info("Running backtester validation...")
         from src.backtester.validate import validate_backtester
-        if not validate_backtester():
+        with startup_phase('validate'):
+            valid = validate_backtester()
+        if not valid:
             logger.critical("BACKTESTER VALIDATION FAILED - BLOCKING STARTUP")
             logger.critical("Fix the backtester bugs before running the daemon.")
             sys.exit(1)
         logger.info("Backtester validation passed - starting daemon")
 
         # STEP 2: Warm up Numba kernels to avoid compilation delay on first use
+        # (loads from the on-disk cache when `python -m src.backtester.jit_cache` ran at deploy)
         logger.info("Warming up Numba kernels...")
         from src.backtester.numba_kernels import warmup_numba_kernels
-        warmup_numba_kernels()
+        with startup_phase('jit_warmup'):
+            warmup_numba_kernels()
         logger.info("Numba kernels ready")
+        log_startup_report('backtester')
 
         signal.signal(signal.SIGINT, self.handle_shutdown)
         signal.signal(signal.SIGTERM, self.handle_shutdown)
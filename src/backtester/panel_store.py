@@ -0,0 +1,359 @@
+"""
+OHLCV Panel Store
+
+Shared, memory-mapped OHLCV panels for all backtester processes.
+
+One panel per timeframe holds aligned (n_bars, n_symbols) float64 arrays for
+open/high/low/close/volume plus an int64 timestamp index (UTC nanoseconds).
+Arrays are stored as Fortran-ordered .npy files, so every symbol column is
+contiguous and per-symbol DataFrames are zero-copy views of the mapping.
+All processes map the same files: the OS page cache holds one copy of the
+history instead of one per worker.
+
+Layout (under panel_dir):
+    {timeframe}.json                  manifest of the current version (atomic swap)
+    {timeframe}/{version}/{field}.npy  panel arrays of that version
+
+Design Principles:
+- Read-only for readers: arrays are mapped with mmap_mode='r'
+- Atomic rebuild: new version dir is fully written before the manifest swap
+- Fallback: readers use parquet when no panel exists, the symbol is missing,
+  its cache changed after the build, or the request starts before the panel
+"""
+
+import json
+import os
+import shutil
+import time
+from datetime import datetime, timedelta, UTC
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.data.ohlcv_store import OHLCVStore
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PANEL_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+# Old versions kept on disk after a rebuild (readers may still map them)
+KEEP_VERSIONS = 2
+
+
+class OHLCVPanel:
+    """
+    Aligned OHLCV arrays for one timeframe (read-only, memory-mapped).
+
+    Attributes:
+        timeframe: Panel timeframe
+        version: Build version (changes on every rebuild)
+        symbols: Column order of the arrays
+        timestamps: (n_bars,) int64 UTC nanoseconds, sorted
+        arrays: field -> (n_bars, n_symbols) float64, NaN where a symbol has no bar
+    """
+
+    def __init__(self, panel_path: Path, manifest: dict):
+        self.timeframe: str = manifest['timeframe']
+        self.version: str = manifest['version']
+        self.symbols: List[str] = manifest['symbols']
+        self.source_mtime_ns: Dict[str, int] = manifest['source_mtime_ns']
+        self.truncated = np.array(manifest['truncated'], dtype=bool)
+        self.first_valid = np.array(manifest['first_valid'], dtype=np.int64)
+        self.last_valid = np.array(manifest['last_valid'], dtype=np.int64)
+        self.has_gaps = np.array(manifest['has_gaps'], dtype=bool)
+        self.symbol_index: Dict[str, int] = {s: j for j, s in enumerate(self.symbols)}
+
+        self.timestamps: np.ndarray = np.load(panel_path / 'timestamp.npy', mmap_mode='r')
+        self.arrays: Dict[str, np.ndarray] = {
+            field: np.load(panel_path / f'{field}.npy', mmap_mode='r')
+            for field in PANEL_FIELDS
+        }
+
+    @property
+    def n_bars(self) -> int:
+        return len(self.timestamps)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.symbol_index
+
+    def symbol_frame(
+        self,
+        symbol: str,
+        days: Optional[int] = None,
+        end_date: Optional[datetime] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Per-symbol OHLCV DataFrame with BacktestCacheReader.read() semantics.
+
+        Columns are zero-copy views of the panel when the symbol has no
+        interior gaps (the common case); otherwise the valid rows are copied.
+
+        Args:
+            symbol: Symbol to extract
+            days: Number of days up to the symbol's last bar (None = whole panel)
+            end_date: Drop bars after this timestamp
+
+        Returns:
+            DataFrame [timestamp, open, high, low, close, volume], or None if the
+            panel cannot answer the request (caller falls back to parquet)
+        """
+        j = self.symbol_index.get(symbol)
+        if j is None or self.last_valid[j] < 0:
+            return None
+
+        ts = self.timestamps
+        lo = int(self.first_valid[j])
+        hi = int(self.last_valid[j]) + 1
+
+        if end_date is not None:
+            end_ts = pd.Timestamp(end_date)
+            end_ns = (end_ts.tz_convert('UTC') if end_ts.tzinfo else end_ts.tz_localize('UTC')).value
+            hi = min(hi, int(np.searchsorted(ts, end_ns, side='right')))
+
+        if self.has_gaps[j]:
+            rows = np.flatnonzero(~np.isnan(self.arrays['close'][lo:hi, j])) + lo
+        else:
+            rows = None
+
+        if hi <= lo or (rows is not None and len(rows) == 0):
+            return self._empty_frame()
+
+        if days is not None:
+            data_end = ts[rows[-1]] if rows is not None else ts[hi - 1]
+            start_ns = int(data_end) - int(timedelta(days=days).total_seconds() * 1e9)
+            if self.truncated[j] and start_ns < ts[lo]:
+                return None  # Older history is only in parquet
+            lo = max(lo, int(np.searchsorted(ts, start_ns, side='left')))
+            if rows is not None:
+                rows = rows[rows >= lo]
+        elif self.truncated[j]:
+            return None
+
+        if rows is None:
+            columns = {field: self.arrays[field][lo:hi, j] for field in PANEL_FIELDS}
+            ts_slice = ts[lo:hi]
+        else:
+            columns = {field: self.arrays[field][rows, j] for field in PANEL_FIELDS}
+            ts_slice = ts[rows]
+
+        frame = {'timestamp': pd.DatetimeIndex(np.asarray(ts_slice).view('datetime64[ns]'), tz='UTC')}
+        frame.update(columns)
+        return pd.DataFrame(frame, copy=False)
+
+    @staticmethod
+    def _empty_frame() -> pd.DataFrame:
+        return pd.DataFrame(columns=['timestamp', *PANEL_FIELDS])
+
+
+class PanelStore:
+    """
+    Builds and serves OHLCV panels from the parquet cache.
+
+    Writers (data scheduler) call rebuild() after a download; readers
+    (cache reader / backtester workers) call get(), which re-maps the panel
+    only when the manifest version changes.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = 'data/binance',
+        panel_dir: Optional[str] = None,
+        history_days: Optional[int] = None
+    ):
+        """
+        Initialize panel store
+
+        Args:
+            cache_dir: OHLCV cache directory (see src/data/ohlcv_store.py)
+            panel_dir: Panel directory (default: 'panels' next to cache_dir)
+            history_days: Days of history kept in each panel (None = all)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.store = OHLCVStore(cache_dir)
+        self.panel_dir = Path(panel_dir) if panel_dir else self.cache_dir.parent / 'panels'
+        self.history_days = history_days
+        self._panels: Dict[str, OHLCVPanel] = {}
+        self._manifest_mtimes: Dict[str, int] = {}
+
+    def _manifest_path(self, timeframe: str) -> Path:
+        return self.panel_dir / f"{timeframe}.json"
+
+    def get(self, timeframe: str) -> Optional[OHLCVPanel]:
+        """
+        Get the current panel for a timeframe (None if never built).
+
+        Cheap to call per read: one stat of the manifest, re-map on change.
+        """
+        manifest_path = self._manifest_path(timeframe)
+        try:
+            mtime = manifest_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._panels.pop(timeframe, None)
+            return None
+
+        if self._manifest_mtimes.get(timeframe) != mtime:
+            try:
+                manifest = json.loads(manifest_path.read_text())
+                panel = OHLCVPanel(self.panel_dir / timeframe / manifest['version'], manifest)
+            except Exception as e:
+                logger.warning(f"Failed to load {timeframe} panel: {e}")
+                return None
+            self._panels[timeframe] = panel
+            self._manifest_mtimes[timeframe] = mtime
+            logger.info(
+                f"Mapped {timeframe} panel {panel.version}: "
+                f"{panel.n_bars} bars x {len(panel.symbols)} symbols"
+            )
+
+        return self._panels.get(timeframe)
+
+    def rebuild(self, timeframe: str, symbols: Optional[List[str]] = None) -> Optional[str]:
+        """
+        Rebuild the panel for a timeframe from parquet and swap it in atomically.
+
+        Args:
+            timeframe: Timeframe to build
+            symbols: Symbols to include (default: every cached symbol)
+
+        Returns:
+            New version string, or None if there was nothing to build
+        """
+        start = time.time()
+
+        if symbols is None:
+            symbols = [symbol for symbol, _ in self.store.list_series(timeframe)]
+
+        # Global end decides the cutoff so all symbols share the same window.
+        # Coverage comes from the manifests: only partitions after the cutoff are read.
+        bounds = {}
+        for symbol in symbols:
+            try:
+                symbol_bounds = self.store.bounds(symbol, timeframe)
+            except Exception as e:
+                logger.debug(f"Panel {timeframe}: skipping {symbol}: {e}")
+                continue
+            if symbol_bounds is not None:
+                bounds[symbol] = symbol_bounds
+
+        cutoff_ns = None
+        if self.history_days is not None and bounds:
+            global_end_ms = max(last_ts for _, last_ts, _ in bounds.values())
+            cutoff_ns = (global_end_ms - int(timedelta(days=self.history_days).total_seconds() * 1000)) * 1_000_000
+
+        frames: Dict[str, pd.DataFrame] = {}
+        source_mtime_ns: Dict[str, int] = {}
+
+        for symbol in bounds:
+            try:
+                mtime_ns = self.store.version(symbol, timeframe)
+                df = self.store.read(
+                    symbol, timeframe,
+                    start=pd.Timestamp(cutoff_ns, unit='ns', tz='UTC') if cutoff_ns is not None else None,
+                    columns=PANEL_FIELDS,
+                )
+            except Exception as e:
+                logger.debug(f"Panel {timeframe}: skipping {symbol}: {e}")
+                continue
+            if df is None or df.empty:
+                continue
+            ts = pd.to_datetime(df['timestamp'], utc=True)
+            df = df.assign(timestamp=ts.values.astype('datetime64[ns]').astype(np.int64))
+            frames[symbol] = df.sort_values('timestamp')
+            source_mtime_ns[symbol] = mtime_ns
+
+        if not frames:
+            logger.warning(f"Panel {timeframe}: no cached data to build from")
+            return None
+
+        built_symbols = list(frames)
+        truncated = [
+            cutoff_ns is not None and bounds[symbol][0] * 1_000_000 < cutoff_ns
+            for symbol in built_symbols
+        ]
+
+        timestamps = np.unique(np.concatenate([
+            frames[s]['timestamp'].values for s in built_symbols
+        ]))
+        n_bars, n_symbols = len(timestamps), len(built_symbols)
+
+        version = datetime.now(UTC).strftime('%Y%m%dT%H%M%S%f')
+        tmp_dir = self.panel_dir / timeframe / f".{version}.tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        np.save(tmp_dir / 'timestamp.npy', timestamps)
+        arrays = {
+            field: np.lib.format.open_memmap(
+                tmp_dir / f'{field}.npy', mode='w+', dtype=np.float64,
+                shape=(n_bars, n_symbols), fortran_order=True,
+            )
+            for field in PANEL_FIELDS
+        }
+
+        first_valid, last_valid, has_gaps = [], [], []
+        for j, symbol in enumerate(built_symbols):
+            df = frames[symbol]
+            rows = np.searchsorted(timestamps, df['timestamp'].values)
+            for field in PANEL_FIELDS:
+                column = arrays[field][:, j]
+                column[:] = np.nan
+                column[rows] = df[field].values.astype(np.float64)
+            first_valid.append(int(rows[0]))
+            last_valid.append(int(rows[-1]))
+            has_gaps.append(bool(len(rows) != rows[-1] - rows[0] + 1))
+
+        for array in arrays.values():
+            array.flush()
+        del arrays
+
+        final_dir = self.panel_dir / timeframe / version
+        os.replace(tmp_dir, final_dir)
+
+        manifest = {
+            'timeframe': timeframe,
+            'version': version,
+            'built_at': datetime.now(UTC).isoformat(),
+            'history_days': self.history_days,
+            'symbols': built_symbols,
+            'source_mtime_ns': source_mtime_ns,
+            'truncated': truncated,
+            'first_valid': first_valid,
+            'last_valid': last_valid,
+            'has_gaps': has_gaps,
+        }
+        manifest_path = self._manifest_path(timeframe)
+        tmp_manifest = manifest_path.with_suffix('.json.tmp')
+        tmp_manifest.write_text(json.dumps(manifest))
+        os.replace(tmp_manifest, manifest_path)
+
+        self._cleanup_old_versions(timeframe, keep=version)
+
+        logger.info(
+            f"Rebuilt {timeframe} panel {version}: {n_bars} bars x {n_symbols} symbols "
+            f"in {time.time() - start:.1f}s"
+        )
+        return version
+
+    def rebuild_all(self, timeframes: List[str]) -> Dict[str, Optional[str]]:
+        """Rebuild panels for several timeframes (errors are logged per timeframe)"""
+        versions = {}
+        for timeframe in timeframes:
+            try:
+                versions[timeframe] = self.rebuild(timeframe)
+            except Exception as e:
+                logger.error(f"Panel rebuild failed for {timeframe}: {e}", exc_info=True)
+                versions[timeframe] = None
+        return versions
+
+    def _cleanup_old_versions(self, timeframe: str, keep: str) -> None:
+        """Delete all but the newest KEEP_VERSIONS versions (mapped files stay valid on unlink)"""
+        tf_dir = self.panel_dir / timeframe
+        versions = sorted(
+            (d for d in tf_dir.iterdir() if d.is_dir() and not d.name.startswith('.')),
+            key=lambda d: d.name,
+        )
+        for old in versions[:-KEEP_VERSIONS]:
+            if old.name != keep:
+                shutil.rmtree(old, ignore_errors=True)
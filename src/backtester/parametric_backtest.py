@@ -926,6 +926,449 @@ def _calc_metrics(
     return sharpe, max_dd, win_rate, expectancy, n_trades, total_return
 
 
+# =============================================================================
+# BATCHED GRID KERNEL (all parameter combinations in one Numba call)
+# =============================================================================
+
+# Column layout of the metrics matrix returned by _simulate_param_grid
+METRIC_COLUMNS = (
+    'sharpe', 'max_drawdown', 'win_rate', 'expectancy', 'total_trades', 'total_return',
+)
+N_METRICS = len(METRIC_COLUMNS)
+
+
+@jit(nopython=True, cache=True)
+def _simulate_combo_metrics(
+    close: np.ndarray,           # (n_bars, n_symbols)
+    high: np.ndarray,            # (n_bars, n_symbols)
+    low: np.ndarray,             # (n_bars, n_symbols)
+    entry_ordinal: np.ndarray,   # (n_bars, n_symbols) int64 - entry index or -1
+    directions: np.ndarray,      # (n_bars, n_symbols) int8
+    sl_values: np.ndarray,       # (n_entries,) SL pct per entry signal
+    tp_values: np.ndarray,       # (n_entries,) TP pct per entry signal
+    leverage: int,
+    max_leverages: np.ndarray,   # (n_symbols,) per-coin max
+    exit_bars: int,
+    initial_capital: float,
+    fee_rate: float,
+    slippage: float,
+    max_positions: int,
+    risk_pct: float,
+    min_notional: float,
+    is_trailing: bool,
+    trailing_activation_pct: float,
+    breakeven_buffer: float,
+    funding_cumsum: np.ndarray,  # (n_bars, n_symbols) cumulative funding rates
+    bars_per_year: float,
+) -> Tuple[float, float, float, float, int, float]:
+    """
+    Simulate one parameter combination and compute its metrics in one pass.
+
+    Same trading semantics as _simulate_single_param_set_v2, but instead of
+    materializing the equity curve and trade arrays it keeps running
+    accumulators (trade count, wins, sums and sums of squares of trade
+    returns, running equity peak). Memory is O(n_symbols) per combination,
+    which is what makes it safe to run many combinations in parallel.
+
+    Returns:
+        Same tuple as _calc_metrics:
+        sharpe, max_drawdown, win_rate, expectancy, total_trades, total_return
+    """
+    n_bars, n_symbols = close.shape
+
+    equity = initial_capital
+    running_max = initial_capital
+    max_dd = 0.0
+
+    # Streaming trade statistics (trade returns as pct of notional)
+    n_trades = 0
+    n_wins = 0
+    sum_win_pct = 0.0
+    sum_loss_pct = 0.0
+    sum_ret = 0.0
+    sum_ret_sq = 0.0
+
+    # Position state per symbol
+    pos_entry_idx = np.full(n_symbols, -1, dtype=np.int64)
+    pos_entry_price = np.zeros(n_symbols, dtype=np.float64)
+    pos_size = np.zeros(n_symbols, dtype=np.float64)
+    pos_direction = np.zeros(n_symbols, dtype=np.int8)
+    pos_sl = np.zeros(n_symbols, dtype=np.float64)
+    pos_tp = np.zeros(n_symbols, dtype=np.float64)
+    pos_margin = np.zeros(n_symbols, dtype=np.float64)
+
+    # Trailing stop state
+    pos_high_water_mark = np.zeros(n_symbols, dtype=np.float64)
+    pos_trailing_active = np.zeros(n_symbols, dtype=np.bool_)
+    pos_trailing_pct = np.zeros(n_symbols, dtype=np.float64)
+
+    n_open = 0
+    margin_used = 0.0
+
+    for i in range(n_bars):
+        # 1. UPDATE TRAILING STOPS (before exit checks)
+        if is_trailing:
+            for j in range(n_symbols):
+                if pos_entry_idx[j] < 0:
+                    continue
+
+                direction = pos_direction[j]
+                current_high = high[i, j]
+                current_low = low[i, j]
+                current_price = close[i, j]
+
+                if not pos_trailing_active[j]:
+                    if direction == 1:
+                        profit_pct = (current_price - pos_entry_price[j]) / pos_entry_price[j]
+                    else:
+                        profit_pct = (pos_entry_price[j] - current_price) / pos_entry_price[j]
+
+                    if profit_pct >= trailing_activation_pct:
+                        pos_trailing_active[j] = True
+                        if direction == 1:
+                            pos_high_water_mark[j] = current_high
+                        else:
+                            pos_high_water_mark[j] = current_low
+                    continue
+
+                if direction == 1:
+                    if current_high > pos_high_water_mark[j]:
+                        pos_high_water_mark[j] = current_high
+                    theoretical_sl = pos_high_water_mark[j] * (1.0 - pos_trailing_pct[j])
+                    floor_price = pos_entry_price[j] * (1.0 + breakeven_buffer)
+                    new_sl = max(theoretical_sl, floor_price)
+                    if new_sl > pos_sl[j]:
+                        pos_sl[j] = new_sl
+                else:
+                    if current_low < pos_high_water_mark[j]:
+                        pos_high_water_mark[j] = current_low
+                    theoretical_sl = pos_high_water_mark[j] * (1.0 + pos_trailing_pct[j])
+                    ceiling_price = pos_entry_price[j] * (1.0 - breakeven_buffer)
+                    new_sl = min(theoretical_sl, ceiling_price)
+                    if new_sl < pos_sl[j]:
+                        pos_sl[j] = new_sl
+
+        # 2. CHECK EXITS
+        for j in range(n_symbols):
+            if pos_entry_idx[j] < 0:
+                continue
+
+            direction = pos_direction[j]
+            current_high = high[i, j]
+            current_low = low[i, j]
+
+            should_close = False
+            exit_price = close[i, j]
+
+            bars_held = i - pos_entry_idx[j]
+            if exit_bars > 0 and bars_held >= exit_bars:
+                should_close = True
+
+            if not should_close:
+                if direction == 1 and current_low <= pos_sl[j]:
+                    should_close = True
+                    exit_price = pos_sl[j]
+                elif direction == -1 and current_high >= pos_sl[j]:
+                    should_close = True
+                    exit_price = pos_sl[j]
+
+            if not should_close and pos_tp[j] > 0:
+                if direction == 1 and current_high >= pos_tp[j]:
+                    should_close = True
+                    exit_price = pos_tp[j]
+                elif direction == -1 and current_low <= pos_tp[j]:
+                    should_close = True
+                    exit_price = pos_tp[j]
+
+            if should_close:
+                if direction == 1:
+                    slipped_exit = exit_price * (1.0 - slippage)
+                    pnl = (slipped_exit - pos_entry_price[j]) * pos_size[j]
+                else:
+                    slipped_exit = exit_price * (1.0 + slippage)
+                    pnl = (pos_entry_price[j] - slipped_exit) * pos_size[j]
+
+                notional = pos_entry_price[j] * pos_size[j]
+                pnl -= notional * fee_rate * 2.0
+
+                entry_idx = pos_entry_idx[j]
+                if entry_idx > 0:
+                    total_funding = funding_cumsum[i, j] - funding_cumsum[entry_idx - 1, j]
+                else:
+                    total_funding = funding_cumsum[i, j]
+                funding_cost = notional * total_funding
+                if direction == 1:
+                    pnl -= funding_cost
+                else:
+                    pnl += funding_cost
+
+                equity += pnl
+
+                trade_pnl_pct = pnl / notional if notional > 0 else 0.0
+                n_trades += 1
+                sum_ret += trade_pnl_pct
+                sum_ret_sq += trade_pnl_pct * trade_pnl_pct
+                if pnl > 0:
+                    n_wins += 1
+                    sum_win_pct += trade_pnl_pct
+                else:
+                    sum_loss_pct += abs(trade_pnl_pct)
+
+                margin_used -= pos_margin[j]
+                pos_margin[j] = 0.0
+                pos_entry_idx[j] = -1
+                pos_trailing_active[j] = False
+                n_open -= 1
+
+        # 3. CHECK ENTRIES
+        if n_open < max_positions:
+            for j in range(n_symbols):
+                if n_open >= max_positions:
+                    break
+                if pos_entry_idx[j] >= 0:
+                    continue
+                e = entry_ordinal[i, j]
+                if e < 0:
+                    continue
+
+                direction = directions[i, j]
+                if direction == 0:
+                    continue
+
+                price = close[i, j]
+
+                if direction == 1:
+                    slipped_entry = price * (1.0 + slippage)
+                else:
+                    slipped_entry = price * (1.0 - slippage)
+
+                sl_pct = sl_values[e]
+                tp_pct = tp_values[e]
+
+                if sl_pct <= 0:
+                    continue
+
+                risk_amount = equity * risk_pct
+                notional = risk_amount / sl_pct
+
+                actual_lev = leverage
+                if max_leverages[j] < leverage:
+                    actual_lev = max_leverages[j]
+                if actual_lev < 1:
+                    actual_lev = 1
+
+                margin_needed = notional / actual_lev
+
+                max_margin_per_trade = equity / max_positions
+                if margin_needed > max_margin_per_trade:
+                    margin_needed = max_margin_per_trade
+                    notional = margin_needed * actual_lev
+
+                margin_available = equity - margin_used
+                if margin_needed > margin_available:
+                    continue
+
+                if notional < min_notional:
+                    continue
+
+                size = notional / slipped_entry
+
+                if direction == 1:
+                    sl_price = slipped_entry * (1.0 - sl_pct)
+                    tp_price = slipped_entry * (1.0 + tp_pct) if tp_pct > 0 else 0.0
+                else:
+                    sl_price = slipped_entry * (1.0 + sl_pct)
+                    tp_price = slipped_entry * (1.0 - tp_pct) if tp_pct > 0 else 0.0
+
+                pos_entry_idx[j] = i
+                pos_entry_price[j] = slipped_entry
+                pos_size[j] = size
+                pos_direction[j] = direction
+                pos_sl[j] = sl_price
+                pos_tp[j] = tp_price
+                pos_margin[j] = margin_needed
+                margin_used += margin_needed
+                n_open += 1
+
+                if is_trailing:
+                    pos_high_water_mark[j] = price
+                    pos_trailing_active[j] = False
+                    pos_trailing_pct[j] = sl_pct
+
+        # Drawdown on the bar-close equity (last bar is settled after the final close-out)
+        if i < n_bars - 1:
+            if equity > running_max:
+                running_max = equity
+            if running_max > 0:
+                dd = (running_max - equity) / running_max
+                if dd > max_dd:
+                    max_dd = dd
+
+    # Close remaining positions at end
+    for j in range(n_symbols):
+        if pos_entry_idx[j] < 0:
+            continue
+
+        exit_price = close[n_bars - 1, j]
+        direction = pos_direction[j]
+
+        if direction == 1:
+            slipped_exit = exit_price * (1.0 - slippage)
+            pnl = (slipped_exit - pos_entry_price[j]) * pos_size[j]
+        else:
+            slipped_exit = exit_price * (1.0 + slippage)
+            pnl = (pos_entry_price[j] - slipped_exit) * pos_size[j]
+
+        notional = pos_entry_price[j] * pos_size[j]
+        pnl -= notional * fee_rate * 2.0
+
+        entry_idx = pos_entry_idx[j]
+        exit_idx = n_bars - 1
+        if entry_idx > 0:
+            total_funding = funding_cumsum[exit_idx, j] - funding_cumsum[entry_idx - 1, j]
+        else:
+            total_funding = funding_cumsum[exit_idx, j]
+        funding_cost = notional * total_funding
+        if direction == 1:
+            pnl -= funding_cost
+        else:
+            pnl += funding_cost
+
+        equity += pnl
+
+        trade_pnl_pct = pnl / notional if notional > 0 else 0.0
+        n_trades += 1
+        sum_ret += trade_pnl_pct
+        sum_ret_sq += trade_pnl_pct * trade_pnl_pct
+        if pnl > 0:
+            n_wins += 1
+            sum_win_pct += trade_pnl_pct
+        else:
+            sum_loss_pct += abs(trade_pnl_pct)
+
+    if n_bars > 0:
+        if equity > running_max:
+            running_max = equity
+        if running_max > 0:
+            dd = (running_max - equity) / running_max
+            if dd > max_dd:
+                max_dd = dd
+
+    if n_trades == 0:
+        return 0.0, 0.0, 0.0, 0.0, 0, 0.0
+
+    total_return = (equity - initial_capital) / initial_capital
+
+    win_rate = n_wins / n_trades
+    n_losses = n_trades - n_wins
+    avg_win_pct = sum_win_pct / n_wins if n_wins > 0 else 0.0
+    avg_loss_pct = sum_loss_pct / n_losses if n_losses > 0 else 0.0
+    expectancy = (win_rate * avg_win_pct) - ((1.0 - win_rate) * avg_loss_pct)
+
+    if max_dd > 1.0:
+        max_dd = 1.0
+    if max_dd < 0.0:
+        max_dd = 0.0
+
+    # Trade-based Sharpe (same annualization and cap as _calc_metrics)
+    sharpe = 0.0
+    if n_trades >= 3:
+        mean_trade_ret = sum_ret / n_trades
+        var_trade_ret = sum_ret_sq / n_trades - mean_trade_ret * mean_trade_ret
+        if var_trade_ret < 0.0:
+            var_trade_ret = 0.0
+        std_trade_ret = var_trade_ret ** 0.5
+
+        if std_trade_ret > 1e-10:
+            curve_len = n_bars + 1
+            backtest_years = curve_len / bars_per_year if bars_per_year > 0 else 1.0
+            trades_per_year = n_trades / backtest_years if backtest_years > 0 else n_trades
+            if trades_per_year > 250.0:
+                trades_per_year = 250.0
+            sharpe = mean_trade_ret / std_trade_ret * (trades_per_year ** 0.5)
+
+    if total_return < -0.5:
+        max_sharpe = -abs(total_return) * 2.0
+        if sharpe > max_sharpe:
+            sharpe = max_sharpe
+    elif total_return < 0.0 and sharpe > 0.0:
+        sharpe = 0.0
+
+    return sharpe, max_dd, win_rate, expectancy, n_trades, total_return
+
+
+@jit(nopython=True, cache=True, parallel=True)
+def _simulate_param_grid(
+    close: np.ndarray,            # (n_bars, n_symbols)
+    high: np.ndarray,             # (n_bars, n_symbols)
+    low: np.ndarray,              # (n_bars, n_symbols)
+    entry_ordinal: np.ndarray,    # (n_bars, n_symbols) int64 - entry index or -1
+    directions: np.ndarray,       # (n_bars, n_symbols) int8
+    sl_values: np.ndarray,        # (n_variants, n_entries) SL pct per entry
+    tp_values: np.ndarray,        # (n_variants, n_entries) TP pct per entry
+    combo_variant: np.ndarray,    # (n_combos,) int64 - row into sl_values/tp_values
+    combo_leverage: np.ndarray,   # (n_combos,) int64
+    combo_exit_bars: np.ndarray,  # (n_combos,) int64
+    combo_activation: np.ndarray, # (n_combos,) float64 - trailing activation pct
+    max_leverages: np.ndarray,    # (n_symbols,) per-coin max
+    initial_capital: float,
+    fee_rate: float,
+    slippage: float,
+    max_positions: int,
+    risk_pct: float,
+    min_notional: float,
+    is_trailing: bool,
+    breakeven_buffer: float,
+    funding_cumsum: np.ndarray,   # (n_bars, n_symbols) cumulative funding rates
+    bars_per_year: float,
+) -> np.ndarray:
+    """
+    Simulate the whole parameter grid in parallel (prange over combinations).
+
+    SL/TP values are stored only for entry bars: entry_ordinal maps each
+    (bar, symbol) with a signal to a column of sl_values/tp_values, so a grid
+    with many SL/TP variants costs O(n_variants * n_entries) memory instead of
+    one (n_bars, n_symbols) array per variant.
+
+    Returns:
+        metrics: (n_combos, N_METRICS) float64, columns in METRIC_COLUMNS order
+    """
+    n_combos = combo_variant.shape[0]
+    metrics = np.zeros((n_combos, N_METRICS), dtype=np.float64)
+
+    for k in prange(n_combos):
+        v = combo_variant[k]
+        sharpe, max_dd, win_rate, expectancy, n_trades, total_return = _simulate_combo_metrics(
+            close, high, low, entry_ordinal, directions,
+            sl_values[v], tp_values[v],
+            combo_leverage[k], max_leverages, combo_exit_bars[k],
+            initial_capital, fee_rate, slippage,
+            max_positions, risk_pct, min_notional,
+            is_trailing, combo_activation[k], breakeven_buffer,
+            funding_cumsum, bars_per_year,
+        )
+        metrics[k, 0] = sharpe
+        metrics[k, 1] = max_dd
+        metrics[k, 2] = win_rate
+        metrics[k, 3] = expectancy
+        metrics[k, 4] = n_trades
+        metrics[k, 5] = total_return
+
+    return metrics
+
+
+def _build_entry_ordinal(entries: np.ndarray) -> np.ndarray:
+    """
+    Map every entry signal to its position in entries-masked (C order) arrays.
+
+    Returns:
+        (n_bars, n_symbols) int64 array: ordinal of the entry, -1 where no signal
+    """
+    entry_ordinal = np.full(entries.shape, -1, dtype=np.int64)
+    entry_ordinal[entries] = np.arange(int(entries.sum()), dtype=np.int64)
+    return entry_ordinal
+
+
 # =============================================================================
 # MAIN CLASS
 # =============================================================================
@@ -946,6 +1389,13 @@ class ParametricBacktester:
         'exit_bars': [0, 10, 20, 50, 100],  # 0 = no time exit (for 15m reference)
     }
 
+    # Successive-halving rungs before the full-panel run: (fraction of the most
+    # recent bars, fraction of symbols) - see _search_param_grid
+    DEFAULT_HALVING_RUNGS = [
+        {'bars': 0.25, 'symbols': 0.5},
+        {'bars': 0.5, 'symbols': 1.0},
+    ]
+
     # Timeframe to minutes mapping
     TF_TO_MINUTES = {
         '5m': 5,
@@ -989,6 +1439,20 @@ class ParametricBacktester:
             'stability': class_config.get('stability', 0.10),
         }
 
+        # Search mode: 'exhaustive' = every combo on the full panel,
+        # 'halving' = prune on low-fidelity slices first (_search_param_grid)
+        search_config = bt_config.get('parametric_search', {})
+        self.search_mode = search_config.get('mode', 'exhaustive')
+        if self.search_mode not in ('exhaustive', 'halving'):
+            raise ValueError(f"Unknown backtesting.parametric_search.mode: {self.search_mode}")
+        self.halving_min_combos = search_config.get('min_combos', 200)
+        self.halving_keep_fraction = search_config.get('keep_fraction', 0.33)
+        self.halving_min_survivors = search_config.get('min_survivors', 50)
+        self.halving_rungs = [
+            (float(rung['bars']), float(rung['symbols']))
+            for rung in search_config.get('rungs', self.DEFAULT_HALVING_RUNGS)
+        ]
+
         # Default bars_per_year for 15m (crypto 24/7)
         self.bars_per_year = 35040.0
 
@@ -1182,60 +1646,44 @@ class ParametricBacktester:
             f"max_lev={max_levs.min()}-{max_levs.max()}x"
         )
 
-        results = []
-
         # Use provided funding_cumsum or zeros if not provided
         if funding_cumsum is None:
             funding_cumsum = np.zeros((n_bars, n_symbols), dtype=np.float64)
 
-        for sl_pct, tp_pct, leverage, exit_bars in param_sets:
-            # Run simulation (leverage capping done per-coin inside kernel)
-            equity_curve, trade_pnls, trade_wins = _simulate_single_param_set(
-                close, high, low, entries, dirs,
-                sl_pct, tp_pct, leverage, max_levs, exit_bars,
-                self.initial_capital, self.fee_rate, self.slippage,
-                self.max_positions, self.risk_pct, self.min_notional,
-                funding_cumsum,
-            )
-
-            # Calculate metrics
-            sharpe, max_dd, win_rate, expectancy, n_trades, total_return = _calc_metrics(
-                equity_curve, trade_pnls, trade_wins, self.initial_capital, self.bars_per_year
-            )
-
-            result = ParametricResult(
-                sl_pct=sl_pct,
-                tp_pct=tp_pct,
-                leverage=leverage,  # Target leverage (capped per-coin at runtime)
-                exit_bars=exit_bars,
-                sharpe=sharpe,
-                max_drawdown=max_dd,
-                win_rate=win_rate,
-                expectancy=expectancy,
-                total_trades=n_trades,
-                total_return=total_return,
-                score=0.0,  # Will be calculated below
-            )
-            result.score = self._calculate_score(result)
-            results.append(result)
+        # One SL/TP variant per distinct (sl_pct, tp_pct) pair
+        entry_ordinal = _build_entry_ordinal(entries)
+        n_entries = int(entries.sum())
+        variant_index: Dict[Tuple[float, float], int] = {}
+        combo_variant = np.empty(len(param_sets), dtype=np.int64)
+        for k, (sl_pct, tp_pct, _, _) in enumerate(param_sets):
+            combo_variant[k] = variant_index.setdefault((sl_pct, tp_pct), len(variant_index))
+
+        sl_values = np.empty((len(variant_index), n_entries), dtype=np.float64)
+        tp_values = np.empty((len(variant_index), n_entries), dtype=np.float64)
+        for (sl_pct, tp_pct), v in variant_index.items():
+            sl_values[v, :] = sl_pct
+            tp_values[v, :] = tp_pct
+
+        combo_leverage = np.array([p[2] for p in param_sets], dtype=np.int64)
+        combo_exit_bars = np.array([p[3] for p in param_sets], dtype=np.int64)
+
+        # Run all combos in parallel kernel calls (leverage capped per-coin inside)
+        combo_idx, metrics = self._search_param_grid(
+            close, high, low, entry_ordinal, dirs, max_levs, funding_cumsum,
+            sl_values, tp_values, combo_variant, combo_leverage, combo_exit_bars,
+            combo_activation=np.zeros(len(param_sets), dtype=np.float64),
+            is_trailing=False,
+            log_prefix=log_prefix,
+        )
 
-        # Convert to DataFrame
-        df = pd.DataFrame([
-            {
-                'sl_pct': r.sl_pct,
-                'tp_pct': r.tp_pct,
-                'leverage': r.leverage,
-                'exit_bars': r.exit_bars,
-                'sharpe': r.sharpe,
-                'max_drawdown': r.max_drawdown,
-                'win_rate': r.win_rate,
-                'expectancy': r.expectancy,
-                'total_trades': r.total_trades,
-                'total_return': r.total_return,
-                'score': r.score,
-            }
-            for r in results
-        ])
+        df = self._metrics_to_frame(
+            metrics,
+            sl_pct=np.array([p[0] for p in param_sets], dtype=np.float64)[combo_idx],
+            tp_pct=np.array([p[1] for p in param_sets], dtype=np.float64)[combo_idx],
+            leverage=combo_leverage[combo_idx],
+            exit_bars=combo_exit_bars[combo_idx],
+        )
+        df.attrs['combinations_total'] = len(param_sets)
 
         # Sort by score descending
         df = df.sort_values('score', ascending=False).reset_index(drop=True)
@@ -1250,6 +1698,161 @@ class ParametricBacktester:
 
         return df
 
+    def _run_param_grid(
+        self,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        entry_ordinal: np.ndarray,
+        directions: np.ndarray,
+        max_leverages: np.ndarray,
+        funding_cumsum: np.ndarray,
+        sl_values: np.ndarray,
+        tp_values: np.ndarray,
+        combo_variant: np.ndarray,
+        combo_leverage: np.ndarray,
+        combo_exit_bars: np.ndarray,
+        combo_activation: np.ndarray,
+        is_trailing: bool,
+    ) -> np.ndarray:
+        """
+        Run the batched grid kernel with this backtester's execution settings.
+
+        Returns:
+            (n_combos, N_METRICS) metrics matrix (columns in METRIC_COLUMNS order)
+        """
+        return _simulate_param_grid(
+            close, high, low, entry_ordinal, directions,
+            sl_values, tp_values,
+            combo_variant, combo_leverage, combo_exit_bars, combo_activation,
+            max_leverages,
+            self.initial_capital, self.fee_rate, self.slippage,
+            self.max_positions, self.risk_pct, self.min_notional,
+            is_trailing, BREAKEVEN_BUFFER,
+            funding_cumsum, self.bars_per_year,
+        )
+
+    def _search_param_grid(
+        self,
+        close: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        entry_ordinal: np.ndarray,
+        directions: np.ndarray,
+        max_leverages: np.ndarray,
+        funding_cumsum: np.ndarray,
+        sl_values: np.ndarray,
+        tp_values: np.ndarray,
+        combo_variant: np.ndarray,
+        combo_leverage: np.ndarray,
+        combo_exit_bars: np.ndarray,
+        combo_activation: np.ndarray,
+        is_trailing: bool,
+        log_prefix: str = "",
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the grid with the configured search mode.
+
+        exhaustive: every combo on the full panel.
+
+        halving (successive halving): each rung scores the surviving combos on
+        a slice of the panel - the most recent fraction of bars, restricted to
+        the fraction of symbols with most entries in that window - and keeps
+        the best keep_fraction of them (at least min_survivors). Survivors of
+        the last rung run on the full panel, so every returned row has exactly
+        the metrics exhaustive mode reports for that combo; pruned combos are
+        simply missing. Grids smaller than min_combos run exhaustively.
+
+        Slices reuse sl_values/tp_values: entry_ordinal keeps the full-panel
+        entry ordinals, and funding is rebased to the first bar of the window.
+
+        Returns:
+            (combo_idx, metrics): sorted indices of the combos evaluated on the
+            full panel, and their (len(combo_idx), N_METRICS) metrics
+        """
+        n_bars, n_symbols = close.shape
+        n_combos = len(combo_variant)
+        alive = np.arange(n_combos, dtype=np.int64)
+
+        if self.search_mode == 'halving' and n_combos >= self.halving_min_combos:
+            cost = 0
+            for bars_fraction, symbols_fraction in self.halving_rungs:
+                n_keep = max(self.halving_min_survivors, int(np.ceil(self.halving_keep_fraction * len(alive))))
+                if n_keep >= len(alive):
+                    break
+
+                start = n_bars - min(n_bars, max(1, int(round(bars_fraction * n_bars))))
+                window_entries = (entry_ordinal[start:] >= 0).sum(axis=0)
+                n_cols = min(n_symbols, max(1, int(round(symbols_fraction * n_symbols))))
+                cols = np.sort(np.argsort(-window_entries, kind='stable')[:n_cols])
+
+                funding = funding_cumsum[start:, cols]
+                if start > 0:
+                    funding = funding - funding_cumsum[start - 1, cols]
+
+                metrics = self._run_param_grid(
+                    close[start:, cols], high[start:, cols], low[start:, cols],
+                    entry_ordinal[start:, cols], directions[start:, cols],
+                    max_leverages[cols], funding,
+                    sl_values, tp_values,
+                    combo_variant[alive], combo_leverage[alive], combo_exit_bars[alive],
+                    combo_activation[alive], is_trailing,
+                )
+                cost += (n_bars - start) * n_cols * len(alive)
+
+                scores = self._calculate_scores(pd.DataFrame(metrics, columns=METRIC_COLUMNS))
+                alive = np.sort(alive[np.argsort(-scores, kind='stable')[:n_keep]])
+
+            cost += n_bars * n_symbols * len(alive)
+            logger.info(
+                f"{log_prefix}Successive halving: {n_combos} -> {len(alive)} combos on the full panel, "
+                f"{cost / (n_bars * n_symbols * n_combos):.0%} of exhaustive cost"
+            )
+
+        metrics = self._run_param_grid(
+            close, high, low, entry_ordinal, directions, max_leverages, funding_cumsum,
+            sl_values, tp_values,
+            combo_variant[alive], combo_leverage[alive], combo_exit_bars[alive],
+            combo_activation[alive], is_trailing,
+        )
+        return alive, metrics
+
+    def _calculate_scores(self, df: pd.DataFrame) -> np.ndarray:
+        """Vectorized _calculate_score over a results DataFrame"""
+        edge_norm = np.clip(df['expectancy'].values / self.initial_capital / 0.10, 0, 1)
+        sharpe_norm = np.clip(df['sharpe'].values / 3.0, 0, 1)
+        stability = 1.0 - df['max_drawdown'].values
+
+        score = (
+            self.score_weights['edge'] * edge_norm +
+            self.score_weights['sharpe'] * sharpe_norm +
+            self.score_weights['win_rate'] * df['win_rate'].values +
+            self.score_weights['stability'] * stability
+        )
+
+        return np.clip(score * 100, 0, 100)
+
+    def _metrics_to_frame(
+        self,
+        metrics: np.ndarray,
+        sl_pct: np.ndarray,
+        tp_pct: np.ndarray,
+        leverage: np.ndarray,
+        exit_bars: np.ndarray,
+    ) -> pd.DataFrame:
+        """Build the (unsorted) results DataFrame straight from the metrics matrix"""
+        df = pd.DataFrame({
+            'sl_pct': sl_pct,
+            'tp_pct': tp_pct,
+            'leverage': leverage,
+            'exit_bars': exit_bars,
+        })
+        for col_idx, name in enumerate(METRIC_COLUMNS):
+            df[name] = metrics[:, col_idx]
+        df['total_trades'] = df['total_trades'].astype(np.int64)
+        df['score'] = self._calculate_scores(df)
+        return df
+
     def get_top_k(self, df: pd.DataFrame, k: int = 5) -> pd.DataFrame:
         """Get top K candidate strategies"""
         return df.head(k).copy()
@@ -1698,18 +2301,35 @@ class ParametricBacktester:
                 swing_cache[lookback] = (swing_low_cached, swing_high_cached)
             logger.debug(f"{log_prefix}Swing cache ready")
 
-        results = []
-
         # Use provided funding_cumsum or zeros if not provided
         if funding_cumsum is None:
             funding_cumsum = np.zeros((n_bars, n_symbols), dtype=np.float64)
 
-        for params in param_sets:
-            sl_params = params['sl_params']
-            tp_params = params['tp_params']
-            leverage = params['leverage']
-            exit_bars = params['exit_bars']
-
+        is_trailing = sl_type == StopLossType.TRAILING
+        entry_ordinal = _build_entry_ordinal(entries)
+
+        # Group combos by (sl_params, tp_params): each group shares one SL/TP
+        # conversion, stored only at entry bars for the grid kernel
+        variant_index: Dict[Tuple[tuple, tuple], int] = {}
+        variant_params: List[Tuple[dict, dict]] = []
+        combo_variant = np.empty(len(param_sets), dtype=np.int64)
+        for k, params in enumerate(param_sets):
+            key = (
+                tuple(sorted(params['sl_params'].items())),
+                tuple(sorted(params['tp_params'].items())),
+            )
+            if key not in variant_index:
+                variant_index[key] = len(variant_params)
+                variant_params.append((params['sl_params'], params['tp_params']))
+            combo_variant[k] = variant_index[key]
+
+        n_entries = int(entries.sum())
+        sl_values = np.empty((len(variant_params), n_entries), dtype=np.float64)
+        tp_values = np.empty((len(variant_params), n_entries), dtype=np.float64)
+        variant_median_sl = np.empty(len(variant_params), dtype=np.float64)
+        variant_median_tp = np.empty(len(variant_params), dtype=np.float64)
+
+        for v, (sl_params, tp_params) in enumerate(variant_params):
             # Get structure arrays from pre-calculated cache
             if sl_type == StopLossType.STRUCTURE:
                 lookback = sl_params.get('lookback', 10)
@@ -1742,82 +2362,56 @@ class ParametricBacktester:
                 rr_ratio=tp_params.get('rr_ratio'),
             )
 
-            # Determine trailing parameters
-            is_trailing = sl_type == StopLossType.TRAILING
-            trailing_activation_pct = sl_params.get('activation_pct', 0.01) if is_trailing else 0.0
-
-            # Run simulation with v2 kernel
-            equity_curve, trade_pnls, trade_wins = _simulate_single_param_set_v2(
-                close, high, low, entries, dirs,
-                sl_pcts, tp_pcts,
-                leverage, max_levs, exit_bars,
-                self.initial_capital, self.fee_rate, self.slippage,
-                self.max_positions, self.risk_pct, self.min_notional,
-                is_trailing, trailing_activation_pct, BREAKEVEN_BUFFER,
-                funding_cumsum,
-            )
-
-            # Calculate metrics
-            sharpe, max_dd, win_rate, expectancy, n_trades, total_return = _calc_metrics(
-                equity_curve, trade_pnls, trade_wins, self.initial_capital, self.bars_per_year
-            )
-
-            # Build full params dict for reconstruction
-            full_params = {
-                'sl_type': sl_type.value,
-                'tp_type': tp_type.value if tp_type else None,
-                **sl_params,
-                **tp_params,
-                'leverage': leverage,
-                'exit_bars': exit_bars,
-            }
-
-            # Extract representative sl_pct/tp_pct for ParametricResult
-            # (median of non-zero values at entry bars)
             entry_sl_vals = sl_pcts[entries]
             entry_tp_vals = tp_pcts[entries]
-            median_sl = float(np.median(entry_sl_vals[entry_sl_vals > 0])) if np.any(entry_sl_vals > 0) else 0.02
-            median_tp = float(np.median(entry_tp_vals[entry_tp_vals > 0])) if np.any(entry_tp_vals > 0) else 0.0
-
-            result = ParametricResult(
-                sl_pct=median_sl,
-                tp_pct=median_tp,
-                leverage=leverage,
-                exit_bars=exit_bars,
-                sharpe=sharpe,
-                max_drawdown=max_dd,
-                win_rate=win_rate,
-                expectancy=expectancy,
-                total_trades=n_trades,
-                total_return=total_return,
-                score=0.0,
-                sl_type=sl_type,
-                tp_type=tp_type,
-                params=full_params,
-            )
-            result.score = self._calculate_score(result)
-            results.append(result)
+            sl_values[v] = entry_sl_vals
+            tp_values[v] = entry_tp_vals
 
-        # Convert to DataFrame
-        df = pd.DataFrame([
+            # Representative sl_pct/tp_pct for the results
+            # (median of non-zero values at entry bars)
+            variant_median_sl[v] = float(np.median(entry_sl_vals[entry_sl_vals > 0])) if np.any(entry_sl_vals > 0) else 0.02
+            variant_median_tp[v] = float(np.median(entry_tp_vals[entry_tp_vals > 0])) if np.any(entry_tp_vals > 0) else 0.0
+
+        combo_leverage = np.array([p['leverage'] for p in param_sets], dtype=np.int64)
+        combo_exit_bars = np.array([p['exit_bars'] for p in param_sets], dtype=np.int64)
+        combo_activation = np.array([
+            p['sl_params'].get('activation_pct', 0.01) if is_trailing else 0.0
+            for p in param_sets
+        ], dtype=np.float64)
+
+        # Run all combos in parallel kernel calls
+        combo_idx, metrics = self._search_param_grid(
+            close, high, low, entry_ordinal, dirs, max_levs, funding_cumsum,
+            sl_values, tp_values, combo_variant, combo_leverage, combo_exit_bars,
+            combo_activation=combo_activation,
+            is_trailing=is_trailing,
+            log_prefix=log_prefix,
+        )
+
+        # Full params dicts for reconstruction
+        full_params = [
             {
-                'sl_pct': r.sl_pct,
-                'tp_pct': r.tp_pct,
-                'leverage': r.leverage,
-                'exit_bars': r.exit_bars,
-                'sharpe': r.sharpe,
-                'max_drawdown': r.max_drawdown,
-                'win_rate': r.win_rate,
-                'expectancy': r.expectancy,
-                'total_trades': r.total_trades,
-                'total_return': r.total_return,
-                'score': r.score,
-                'sl_type': r.sl_type.value,
-                'tp_type': r.tp_type.value if r.tp_type else None,
-                'params': r.params,
+                'sl_type': sl_type.value,
+                'tp_type': tp_type.value if tp_type else None,
+                **p['sl_params'],
+                **p['tp_params'],
+                'leverage': p['leverage'],
+                'exit_bars': p['exit_bars'],
             }
-            for r in results
-        ])
+            for p in (param_sets[k] for k in combo_idx)
+        ]
+
+        df = self._metrics_to_frame(
+            metrics,
+            sl_pct=variant_median_sl[combo_variant[combo_idx]],
+            tp_pct=variant_median_tp[combo_variant[combo_idx]],
+            leverage=combo_leverage[combo_idx],
+            exit_bars=combo_exit_bars[combo_idx],
+        )
+        df['sl_type'] = sl_type.value
+        df['tp_type'] = tp_type.value if tp_type else None
+        df['params'] = full_params
+        df.attrs['combinations_total'] = len(param_sets)
 
         # Sort by score descending
         df = df.sort_values('score', ascending=False).reset_index(drop=True)
@@ -0,0 +1,352 @@
+"""
+Signal Fingerprint Deduplication
+
+Generators deduplicate by code (base_code_hash), but many different code
+strings - pattern_gen formulas, unger entry/filter combos, pandas_ta
+indicators - produce the same entry signals. The parametric sweep then
+runs the same simulation again for each of them.
+
+Before the sweep, the backtester runs calculate_indicators() on a small
+fixed reference panel (same coins and historical window for everyone) and
+fingerprints the resulting entry series:
+
+- Exact: sha256 of the packed entry bitset, keyed by everything else that
+  defines the strategy (panel, timeframe, direction, SL/TP types, the exit
+  parameters and, when calculate_indicators() sets one, the exit_signal
+  series)
+- Near: MinHash over the entry positions, split into LSH bands; candidates
+  sharing a band are compared by exact Jaccard similarity of their bitsets
+
+A strategy matching a fingerprint in signal_fingerprints (registered within
+max_age_days) is a functional duplicate: it is skipped and the existing
+fingerprint counts the hit. An expired fingerprint is taken over by the
+next strategy producing it.
+Strategies with too few signals on the reference panel are not
+fingerprinted (an empty series would make every silent strategy a
+duplicate of every other).
+
+Entries during the engine's signal warmup are ignored, like in the backtest.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+
+from src.backtester.backtest_engine import SIGNAL_WARMUP_BARS
+from src.data.ohlcv_store import OHLCVStore
+from src.database import get_session, SignalFingerprint
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# MinHash: NUM_PERM = LSH_BANDS x LSH_ROWS. With 16 bands of 4 rows, pairs
+# at Jaccard 0.9 share a band with probability > 0.999, pairs at 0.3 ~12%.
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERM // LSH_BANDS
+_MERSENNE = np.int64((1 << 31) - 1)
+_MINHASH_SEED = 0x51C7
+
+# Near-duplicate candidates checked per lookup
+MAX_CANDIDATES = 50
+
+# Strategy attributes defining its exits (part of the fingerprint key)
+EXIT_PARAMS = (
+    'sl_pct', 'tp_pct', 'atr_stop_multiplier', 'atr_take_multiplier', 'atr_period',
+    'trailing_stop_pct', 'trailing_activation_pct', 'exit_after_bars', 'leverage',
+)
+# Template constants read before the lowercase StrategyCore defaults, as BacktestEngine does
+EXIT_PARAM_OVERRIDES = {'sl_pct': 'SL_PCT', 'tp_pct': 'TP_PCT', 'leverage': 'LEVERAGE'}
+EXIT_SIGNAL_COLUMN = 'exit_signal'
+
+
+def exit_param(strategy, name: str):
+    """Exit parameter value as the backtest engine sees it (uppercase template constant first)"""
+    override = EXIT_PARAM_OVERRIDES.get(name)
+    value = getattr(strategy, override, None) if override else None
+    if value is None:
+        value = getattr(strategy, name, None)
+    return value
+
+
+def _minhash_params() -> Tuple[np.ndarray, np.ndarray]:
+    """Fixed (a, b) of h(x) = (a*x + b) mod p: identical across processes and restarts"""
+    rng = np.random.default_rng(_MINHASH_SEED)
+    a = rng.integers(1, _MERSENNE, size=NUM_PERM, dtype=np.int64)
+    b = rng.integers(0, _MERSENNE, size=NUM_PERM, dtype=np.int64)
+    return a, b
+
+
+_MINHASH_A, _MINHASH_B = _minhash_params()
+
+
+def minhash(positions: np.ndarray) -> np.ndarray:
+    """
+    MinHash signature of a set of bit positions.
+
+    Args:
+        positions: Set bit indices (< 2^31)
+
+    Returns:
+        (NUM_PERM,) int64 signature
+    """
+    x = positions.astype(np.int64)[None, :]
+    # a, x < 2^31: a*x < 2^62 fits int64
+    hashed = (_MINHASH_A[:, None] * x + _MINHASH_B[:, None]) % _MERSENNE
+    return hashed.min(axis=1)
+
+
+def lsh_bands(signature: np.ndarray, key: str) -> List[str]:
+    """Band keys of a MinHash signature (namespaced by key: only same-key strategies collide)"""
+    bands = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.sha1(f"{key}|{band}|".encode() + rows.tobytes()).hexdigest()[:16]
+        bands.append(f"{band}:{digest}")
+    return bands
+
+
+def jaccard(bitset_a: bytes, bitset_b: bytes) -> float:
+    """Jaccard similarity of two packed bitsets of the same length"""
+    a = np.frombuffer(bitset_a, dtype=np.uint8)
+    b = np.frombuffer(bitset_b, dtype=np.uint8)
+    union = int(np.unpackbits(a | b).sum())
+    if union == 0:
+        return 1.0
+    return int(np.unpackbits(a & b).sum()) / union
+
+
+@dataclass
+class Fingerprint:
+    """Entry-signal fingerprint of one strategy on the reference panel"""
+    signal_hash: str
+    key: str
+    timeframe: str
+    n_bits: int
+    n_signals: int
+    bitset: bytes
+    bands: List[str]
+
+
+def fingerprint_entries(entries: np.ndarray, key: str, timeframe: str) -> Fingerprint:
+    """
+    Fingerprint a flat boolean entry series.
+
+    Args:
+        entries: Entry flags of all reference symbols, concatenated in order
+        key: Everything besides the entries that defines equivalence
+        timeframe: Strategy timeframe (stored for inspection)
+    """
+    entries = np.asarray(entries, dtype=bool)
+    bitset = np.packbits(entries).tobytes()
+    positions = np.flatnonzero(entries)
+    signal_hash = hashlib.sha256(f"{key}|{len(entries)}|".encode() + bitset).hexdigest()
+
+    return Fingerprint(
+        signal_hash=signal_hash,
+        key=key,
+        timeframe=timeframe,
+        n_bits=len(entries),
+        n_signals=len(positions),
+        bitset=bitset,
+        bands=lsh_bands(minhash(positions), key) if len(positions) else [],
+    )
+
+
+class SignalFingerprinter:
+    """
+    Pre-backtest duplicate check against the signal_fingerprints index.
+
+    One instance per backtester process; reference panels are loaded once
+    per timeframe from the OHLCV cache.
+    """
+
+    def __init__(self, config, cache_dir: str):
+        """
+        Args:
+            config: Config object (reads backtesting.signal_fingerprint.*)
+            cache_dir: OHLCV cache directory
+        """
+        self.enabled = config.get('backtesting.signal_fingerprint.enabled', True)
+        self.symbols = list(config.get('backtesting.signal_fingerprint.reference_symbols', ['BTC', 'ETH', 'SOL', 'XRP']))
+        self.reference_end = pd.Timestamp(
+            config.get('backtesting.signal_fingerprint.reference_end', '2025-06-01'), tz='UTC'
+        )
+        self.reference_days = config.get('backtesting.signal_fingerprint.reference_days', 30)
+        self.min_signals = config.get('backtesting.signal_fingerprint.min_signals', 5)
+        self.near_duplicates = config.get('backtesting.signal_fingerprint.near_duplicates', True)
+        self.near_threshold = config.get('backtesting.signal_fingerprint.near_duplicate_jaccard', 0.95)
+        self.max_age_days = config.get('backtesting.signal_fingerprint.max_age_days', 30)
+
+        self.store = OHLCVStore(cache_dir)
+        self._panels: Dict[str, Optional[Dict[str, pd.DataFrame]]] = {}
+
+        # Identifies the reference panel: changing it starts a fresh index
+        self.panel_id = hashlib.sha1(
+            f"{','.join(self.symbols)}|{self.reference_end.isoformat()}|{self.reference_days}".encode()
+        ).hexdigest()[:12]
+
+    def reference_panel(self, timeframe: str) -> Optional[Dict[str, pd.DataFrame]]:
+        """Reference OHLCV per symbol (None if the cache doesn't cover the window)"""
+        if timeframe not in self._panels:
+            start = self.reference_end - timedelta(days=self.reference_days)
+            panel = {}
+            for symbol in self.symbols:
+                try:
+                    df = self.store.read(symbol, timeframe, start=start, end=self.reference_end)
+                except Exception as e:
+                    logger.warning(f"Signal fingerprint: cannot read {symbol} {timeframe}: {e}")
+                    df = None
+                if df is None or df.empty or df['timestamp'].min() > start + timedelta(days=1):
+                    logger.warning(
+                        f"Signal fingerprint disabled for {timeframe}: "
+                        f"{symbol} not cached for {start.date()} -> {self.reference_end.date()}"
+                    )
+                    panel = None
+                    break
+                panel[symbol] = df.reset_index(drop=True)
+            self._panels[timeframe] = panel
+        return self._panels[timeframe]
+
+    def fingerprint(self, strategy, timeframe: str) -> Optional[Fingerprint]:
+        """
+        Fingerprint a strategy's entries on the reference panel.
+
+        Returns:
+            Fingerprint, or None if disabled, the panel is unavailable or the
+            strategy has fewer than min_signals entries
+        """
+        if not self.enabled:
+            return None
+        panel = self.reference_panel(timeframe)
+        if panel is None:
+            return None
+
+        signal_column = getattr(strategy, 'signal_column', 'entry_signal')
+        series = []
+        exit_digest = hashlib.sha1()
+        has_exit_signal = False
+        for symbol, df in panel.items():
+            result = strategy.calculate_indicators(df)
+            entries = result[signal_column].fillna(False).values.astype(bool)
+            entries[:SIGNAL_WARMUP_BARS] = False
+            series.append(entries)
+            if EXIT_SIGNAL_COLUMN in result.columns:
+                has_exit_signal = True
+                exit_digest.update(np.packbits(result[EXIT_SIGNAL_COLUMN].fillna(False).values.astype(bool)).tobytes())
+        entries = np.concatenate(series)
+
+        if entries.sum() < self.min_signals:
+            return None
+
+        sl_type = getattr(strategy, 'sl_type', None)
+        tp_type = getattr(strategy, 'tp_type', None)
+        key = '|'.join([
+            self.panel_id,
+            timeframe,
+            str(getattr(strategy, 'direction', 'long')),
+            str(getattr(sl_type, 'value', sl_type)),
+            str(getattr(tp_type, 'value', tp_type)),
+            ','.join(f"{name}={exit_param(strategy, name)!r}" for name in EXIT_PARAMS),
+            exit_digest.hexdigest()[:16] if has_exit_signal else '-',
+        ])
+        return fingerprint_entries(entries, key, timeframe)
+
+    def find_duplicate(self, fp: Fingerprint) -> Optional[Tuple[SignalFingerprint, float]]:
+        """
+        Look up an indexed fingerprint equal or similar to fp.
+
+        Returns:
+            (row, similarity) of the best match, or None
+        """
+        since = datetime.now(UTC) - timedelta(days=self.max_age_days)
+        with get_session() as session:
+            row = session.query(SignalFingerprint).filter(
+                SignalFingerprint.signal_hash == fp.signal_hash,
+                SignalFingerprint.created_at >= since,
+            ).first()
+            if row is not None:
+                session.expunge(row)
+                return row, 1.0
+
+            if not self.near_duplicates or not fp.bands:
+                return None
+
+            candidates = session.query(SignalFingerprint).filter(
+                SignalFingerprint.lsh_bands.overlap(fp.bands),
+                SignalFingerprint.n_bits == fp.n_bits,
+                SignalFingerprint.created_at >= since,
+            ).limit(MAX_CANDIDATES).all()
+
+            best = None
+            for candidate in candidates:
+                similarity = jaccard(fp.bitset, candidate.bitset)
+                if similarity >= self.near_threshold and (best is None or similarity > best[1]):
+                    best = (candidate, similarity)
+            if best is not None:
+                session.expunge(best[0])
+            return best
+
+    def check(self, strategy, timeframe: str, strategy_id, strategy_name: str) -> Optional[Tuple[str, float]]:
+        """
+        Fingerprint a strategy and register it unless it duplicates an indexed one.
+
+        Concurrent workers fingerprinting identical strategies race on the
+        unique signal_hash: the loser sees the winner as its duplicate. A
+        row older than max_age_days is taken over by this strategy.
+
+        Returns:
+            (duplicate_of_name, similarity) if the strategy is a duplicate, else None
+        """
+        fp = self.fingerprint(strategy, timeframe)
+        if fp is None:
+            return None
+
+        match = self.find_duplicate(fp)
+        if match is None:
+            now = datetime.now(UTC)
+            stmt = insert(SignalFingerprint).values(
+                signal_hash=fp.signal_hash,
+                timeframe=fp.timeframe,
+                n_bits=fp.n_bits,
+                n_signals=fp.n_signals,
+                bitset=fp.bitset,
+                lsh_bands=fp.bands,
+                strategy_id=strategy_id,
+                strategy_name=strategy_name,
+                created_at=now,
+            )
+            with get_session() as session:
+                inserted = session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=['signal_hash'],
+                        set_={
+                            'strategy_id': stmt.excluded.strategy_id,
+                            'strategy_name': stmt.excluded.strategy_name,
+                            'created_at': stmt.excluded.created_at,
+                            'duplicate_count': 0,
+                            'last_duplicate_at': None,
+                        },
+                        # Expired rows only; a live row makes this strategy a duplicate
+                        where=SignalFingerprint.created_at < now - timedelta(days=self.max_age_days),
+                    ).returning(SignalFingerprint.id)
+                ).first()
+            if inserted is not None:
+                return None
+            match = self.find_duplicate(fp)
+            if match is None:
+                return None
+
+        row, similarity = match
+        with get_session() as session:
+            session.query(SignalFingerprint).filter(SignalFingerprint.id == row.id).update({
+                SignalFingerprint.duplicate_count: SignalFingerprint.duplicate_count + 1,
+                SignalFingerprint.last_duplicate_at: func.now(),
+            }, synchronize_session=False)
+        return row.strategy_name, similarity
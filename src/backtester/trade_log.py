@@ -0,0 +1,120 @@
+"""
+Columnar Trade Log
+
+BacktestEngine keeps closed trades as one NumPy structured array (one field
+per trade attribute) from the Numba simulation through the metrics kernel.
+Callers of backtest() get a TradeLog in results['trades']: it behaves like
+the list of trade dicts it replaces (len, indexing, iteration), but each
+dict is only built when it is accessed.
+
+Usage:
+    trades = results['trades']
+    trades.records['pnl'].sum()        # column access, no dicts
+    trades[0]['exit_reason']           # one dict, built on access
+    for trade in trades: ...           # dicts, built lazily
+"""
+
+from collections.abc import Sequence
+from typing import Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+# One row per closed trade
+TRADE_DTYPE = np.dtype([
+    ('symbol_idx', np.int32),
+    ('entry_idx', np.int64),
+    ('exit_idx', np.int64),
+    ('entry_price', np.float64),
+    ('exit_price', np.float64),
+    ('size', np.float64),
+    ('margin', np.float64),
+    ('leverage', np.int32),
+    ('notional', np.float64),
+    ('pnl', np.float64),
+    ('exit_reason', np.int8),
+    ('direction', np.int8),
+])
+
+# Codes written by _simulate_portfolio_numba
+EXIT_REASONS = {0: 'sl', 1: 'tp', 2: 'signal', 3: 'time_exit', 4: 'end'}
+DIRECTIONS = {1: 'long', -1: 'short'}
+
+
+class TradeLog(Sequence):
+    """
+    Read-only sequence of closed trades backed by a TRADE_DTYPE array.
+
+    Items are the same dicts the engine used to return (symbol, entry_idx,
+    exit_idx, entry_price, exit_price, size, margin, leverage, notional,
+    pnl, return_on_margin, fees, exit_reason, direction).
+    """
+
+    def __init__(self, records: np.ndarray, symbols: List[str], fee_rate: float):
+        """
+        Args:
+            records: TRADE_DTYPE array, one row per trade in close order
+            symbols: Symbol names indexed by records['symbol_idx']
+            fee_rate: Fee rate per side (for the 'fees' item field)
+        """
+        self.records = records
+        self.symbols = list(symbols)
+        self.fee_rate = fee_rate
+        self._dicts: Optional[List[Dict]] = None
+
+    def _trade(self, row: np.void) -> Dict:
+        margin = float(row['margin'])
+        notional = float(row['notional'])
+        pnl = float(row['pnl'])
+        return {
+            'symbol': self.symbols[int(row['symbol_idx'])],
+            'entry_idx': int(row['entry_idx']),
+            'exit_idx': int(row['exit_idx']),
+            'entry_price': float(row['entry_price']),
+            'exit_price': float(row['exit_price']),
+            'size': float(row['size']),
+            'margin': margin,
+            'leverage': int(row['leverage']),
+            'notional': notional,
+            'pnl': pnl,
+            'return_on_margin': pnl / margin if margin > 0 else 0,
+            'fees': notional * self.fee_rate * 2,
+            'exit_reason': EXIT_REASONS.get(int(row['exit_reason']), 'unknown'),
+            'direction': DIRECTIONS.get(int(row['direction']), 'long'),
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dict, List[Dict]]:
+        if self._dicts is not None:
+            return self._dicts[index]
+        if isinstance(index, slice):
+            return [self._trade(row) for row in self.records[index]]
+        return self._trade(self.records[index])
+
+    def __iter__(self) -> Iterator[Dict]:
+        if self._dicts is not None:
+            return iter(self._dicts)
+        return (self._trade(row) for row in self.records)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TradeLog):
+            return (
+                self.symbols == other.symbols and
+                np.array_equal(self.records, other.records) and
+                self.fee_rate == other.fee_rate
+            )
+        if isinstance(other, list):
+            return self.to_dicts() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"TradeLog({len(self)} trades, {len(self.symbols)} symbols)"
+
+    def to_dicts(self) -> List[Dict]:
+        """All trades as dicts (built once, then cached)"""
+        if self._dicts is None:
+            self._dicts = [self._trade(row) for row in self.records]
+        return self._dicts
@@ -0,0 +1,178 @@
+"""
+Backtest Worker Pool
+
+Process-pool execution mode for ContinuousBacktesterProcess.
+
+Backtest jobs are mostly pandas and Python-level calculate_indicators work,
+so ThreadPoolExecutor workers serialize on the GIL. In process mode each job
+runs in a long-lived worker process instead:
+
+- Workers are spawned once and reused (Numba JIT caches stay warm)
+- Each worker holds one ContinuousBacktesterProcess built in worker mode
+  (no nested pool, no startup file sync)
+- Workers share the parent's processor id, so release/mark_failed ownership
+  checks on claimed strategies keep working
+- Worker log records are forwarded to the parent's handlers through a queue
+  (single writer for the rotating log file)
+
+Usage:
+    executor, log_listener = create_backtest_executor(
+        mode='process', max_workers=4, process_id=processor.process_id
+    )
+    future = executor.submit(run_backtest_job, strategy_id, name, code, tf, coins, hash)
+"""
+
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import signal
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional, Tuple
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+EXECUTOR_MODES = ('thread', 'process')
+
+# Per-process backtester instance (set by _init_worker in worker processes)
+_worker = None
+
+
+def _init_worker(
+    process_id: str,
+    log_queue,
+    numba_threads: int,
+    worker_factory: Optional[Callable] = None
+) -> None:
+    """
+    Initialize a worker process (runs once per worker).
+
+    Args:
+        process_id: Parent's StrategyProcessor id (claim owner)
+        log_queue: Queue for forwarding log records to the parent
+        numba_threads: Numba thread budget for this worker (avoids oversubscription)
+        worker_factory: Builds the worker's backtester from process_id
+            (module-level function; None = default components)
+    """
+    global _worker
+
+    # Parent owns shutdown: workers must not react to terminal Ctrl+C
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    # Importing main_continuous configures file logging; route records to the parent instead
+    from src.backtester.main_continuous import ContinuousBacktesterProcess
+    from src.database import StrategyProcessor
+
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    import numba
+    numba.set_num_threads(max(1, min(numba_threads, numba.config.NUMBA_NUM_THREADS)))
+
+    if worker_factory is not None:
+        _worker = worker_factory(process_id)
+    else:
+        _worker = ContinuousBacktesterProcess(
+            processor=StrategyProcessor(process_id=process_id),
+            worker_mode=True,
+        )
+
+    from src.backtester.numba_kernels import warmup_numba_kernels
+    warmup_numba_kernels()
+
+    logger.info(f"Backtest worker ready (pid={os.getpid()}, numba_threads={numba.get_num_threads()})")
+
+
+def run_backtest_job(
+    strategy_id,
+    strategy_name: str,
+    code: str,
+    original_tf: str,
+    trading_coins: Optional[List[str]] = None,
+    base_code_hash: Optional[str] = None,
+) -> Tuple[bool, str]:
+    """Run ContinuousBacktesterProcess._backtest_strategy in a worker process"""
+    try:
+        return _worker._backtest_strategy(
+            strategy_id, strategy_name, code, original_tf, trading_coins, base_code_hash
+        )
+    finally:
+        # Parent terminates workers on shutdown: don't leave job events queued
+        from src.database.event_tracker import EventTracker
+        EventTracker.flush()
+
+
+def run_retest_job(
+    strategy_id,
+    strategy_name: str,
+    code: str,
+    assigned_tf: str,
+    pairs: List[str],
+) -> Tuple[bool, str]:
+    """Run ContinuousBacktesterProcess._retest_strategy in a worker process"""
+    try:
+        return _worker._retest_strategy(strategy_id, strategy_name, code, assigned_tf, pairs)
+    finally:
+        from src.database.event_tracker import EventTracker
+        EventTracker.flush()
+
+
+def create_backtest_executor(
+    mode: str,
+    max_workers: int,
+    process_id: str,
+    worker_factory: Optional[Callable] = None,
+) -> Tuple[Executor, Optional[logging.handlers.QueueListener]]:
+    """
+    Create the executor used for backtest jobs.
+
+    Args:
+        mode: 'thread' (ThreadPoolExecutor) or 'process' (long-lived worker processes)
+        max_workers: Number of concurrent backtest jobs
+        process_id: StrategyProcessor id that owns the claimed strategies
+        worker_factory: Process mode only: picklable callable building each
+            worker's ContinuousBacktesterProcess from process_id (for tests)
+
+    Returns:
+        (executor, log_listener) - log_listener is None in thread mode and must
+        be stopped by the caller on shutdown in process mode
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    if mode not in EXECUTOR_MODES:
+        raise ValueError(f"Unknown backtesting executor mode '{mode}'. Supported: {EXECUTOR_MODES}")
+
+    if mode == 'thread':
+        return ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="Backtester"
+        ), None
+
+    # spawn: workers must not inherit the parent's DB connections or asyncio loop
+    ctx = multiprocessing.get_context('spawn')
+    log_queue = ctx.Queue()
+    log_listener = logging.handlers.QueueListener(
+        log_queue, *logging.getLogger().handlers, respect_handler_level=True
+    )
+    log_listener.start()
+
+    numba_threads = max(1, (os.cpu_count() or 1) // max_workers)
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=ctx,
+        initializer=_init_worker,
+        initargs=(process_id, log_queue, numba_threads, worker_factory),
+    )
+
+    logger.info(
+        f"Backtest process pool: {max_workers} workers x {numba_threads} numba threads"
+    )
+
+    return executor, log_listener
@@ -9,26 +9,53 @@ Design Principles:
 - Fast Fail: Crash if exchange unavailable (no silent failures)
 - No Defaults: All parameters from config
 - Auto-Healing: Corrupted/incomplete caches are detected and repaired
+- Concurrent: symbol x timeframe downloads run on a thread pool, throttled
+  by one shared token bucket (Binance request weight budget)
 """
 
 import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 
 import ccxt
+import numpy as np
 import pandas as pd
 import requests
 from tqdm import tqdm
 
 from src.config.loader import load_config
+from src.data.ohlcv_store import OHLCVStore
+from src.data.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
-# Minimum valid parquet file size (parquet header is 8 bytes minimum)
-MIN_PARQUET_SIZE = 12
+
+def _klines_weight(limit: int) -> int:
+    """Binance USDT-M request weight of a klines call"""
+    if limit < 100:
+        return 1
+    if limit < 500:
+        return 2
+    if limit <= 1000:
+        return 5
+    return 10
+
+
+def _create_exchange() -> Any:
+    """CCXT Binance USDT-M futures client"""
+    return ccxt.binance({
+        'enableRateLimit': True,  # Respect rate limits
+        'options': {
+            'defaultType': 'future',  # Use USDT-M futures
+        }
+    })
 
 
 @dataclass
@@ -76,31 +103,47 @@ class BinanceDataDownloader:
     - Fetches HL-Binance symbol intersection
     - Volume filtering (min 24h volume)
     - Incremental updates (only missing candles)
-    - Parquet storage (fast, compressed)
+    - Monthly-partitioned parquet storage (see ohlcv_store.py): updates
+      rewrite only the months they touch
     - Multi-symbol parallel download
     """
 
-    def __init__(self, config: Optional[Dict] = None):
+    def __init__(
+        self,
+        config: Optional[Dict] = None,
+        exchange_factory: Optional[Callable[[], Any]] = None
+    ):
         """
         Initialize Binance downloader
 
         Args:
             config: Configuration dict (loads from file if None)
+            exchange_factory: Creates exchange clients (default: CCXT Binance
+                futures); tests pass a local fake exchange
         """
         self.config = config or load_config()
 
         # Initialize CCXT Binance
-        self.exchange = ccxt.binance({
-            'enableRateLimit': True,  # Respect rate limits
-            'options': {
-                'defaultType': 'future',  # Use USDT-M futures
-            }
-        })
+        self._exchange_factory = exchange_factory or _create_exchange
+        self.exchange = self._exchange_factory()
+
+        # Concurrent download engine: one client per worker thread, all
+        # throttled by the same request weight budget
+        self.download_workers = self.config.get('data_scheduler.download.workers', 8)
+        weight_per_minute = self.config.get('data_scheduler.download.weight_per_minute', 1800)
+        self.rate_limiter = TokenBucket(
+            rate=weight_per_minute / 60,
+            capacity=self.config.get('data_scheduler.download.burst_weight', 100)
+        )
+        self.max_retries = self.config.get('data_scheduler.download.max_retries', 4)
+        self.retry_backoff = self.config.get('data_scheduler.download.retry_backoff', 1.0)
+        self._local = threading.local()
 
         # Data directory from config or default
         cache_dir = self.config.get('data.cache_dir', 'data/binance')
         self.data_dir = Path(cache_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.store = OHLCVStore(self.data_dir)
 
         # Volume threshold (0 = no filter, pairs_updater already handles selection)
         self.min_volume_24h = self.config.get('data_scheduler.min_volume_usd', 0)
@@ -140,7 +183,8 @@ class BinanceDataDownloader:
             Number of temp files removed
         """
         count = 0
-        for tmp_file in self.data_dir.glob("*.tmp"):
+        tmp_files = [*self.data_dir.glob("*.tmp"), *self.data_dir.glob("*/*.tmp")]
+        for tmp_file in tmp_files:
             try:
                 tmp_file.unlink()
                 count += 1
@@ -149,6 +193,56 @@ class BinanceDataDownloader:
                 pass
         return count
 
+    def _worker_exchange(self) -> Any:
+        """Exchange client of the current thread (created on first use)"""
+        exchange = getattr(self._local, 'exchange', None)
+        if exchange is None:
+            exchange = self._exchange_factory()
+            # The shared token bucket throttles instead of per-client limits
+            exchange.enableRateLimit = False
+            markets = getattr(self.exchange, 'markets', None)
+            if markets:
+                exchange.set_markets(markets)
+            self._local.exchange = exchange
+        return exchange
+
+    def _fetch_ohlcv(
+        self,
+        ccxt_symbol: str,
+        timeframe: str,
+        since: int,
+        limit: int = 1000
+    ) -> List[List]:
+        """
+        Rate-limited fetch_ohlcv with retry and exponential backoff.
+
+        Network errors are retried up to max_retries times; rate limit
+        responses (429/418) also pause every worker on the shared bucket.
+
+        Raises:
+            ccxt.NetworkError: If all retries fail
+        """
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire(_klines_weight(limit))
+            try:
+                return self._worker_exchange().fetch_ohlcv(
+                    ccxt_symbol,
+                    timeframe=timeframe,
+                    since=since,
+                    limit=limit
+                )
+            except ccxt.NetworkError as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.retry_backoff * 2 ** attempt + random.uniform(0, self.retry_backoff)
+                if isinstance(e, ccxt.DDoSProtection):
+                    self.rate_limiter.pause(delay)
+                logger.warning(
+                    f"{ccxt_symbol} {timeframe}: {type(e).__name__}, "
+                    f"retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
     def get_symbol_listing_date(self, symbol: str, timeframe: str = '1d') -> int:
         """
         Get the listing date for a symbol on Binance Futures.
@@ -175,7 +269,7 @@ class BinanceDataDownloader:
             # Query with very early start date - Binance returns from listing
             since = int(datetime(2017, 1, 1, tzinfo=timezone.utc).timestamp() * 1000)
 
-            candles = self.exchange.fetch_ohlcv(
+            candles = self._fetch_ohlcv(
                 ccxt_symbol,
                 timeframe='1d',  # Always use 1d for efficiency
                 since=since,
@@ -585,7 +679,7 @@ class BinanceDataDownloader:
             all_candles = []
 
             while True:
-                candles = self.exchange.fetch_ohlcv(
+                candles = self._fetch_ohlcv(
                     ccxt_symbol,
                     timeframe=timeframe,
                     since=since,
@@ -614,17 +708,17 @@ class BinanceDataDownloader:
                         return df
                     raise ValueError("Downloaded data is invalid")
 
+                new_df = self._sanitize_dataframe(new_df)
+
+                # Save only the new candles (rewrites just the months they fall in)
+                saved_path = self.save_data(symbol, timeframe, new_df, replace=force_refresh)
+
                 # Merge with existing
                 if not df.empty:
-                    df = pd.concat([df, new_df], ignore_index=True)
+                    df = self._sanitize_dataframe(pd.concat([df, new_df], ignore_index=True))
                 else:
                     df = new_df
 
-                df = self._sanitize_dataframe(df)
-
-                # Save cache
-                saved_path = self.save_data(symbol, timeframe, df)
-
                 # Save metadata
                 if saved_path:
                     # Determine is_full_history based on what we downloaded
@@ -688,16 +782,16 @@ class BinanceDataDownloader:
         Returns:
             Dict mapping symbol to DataFrame
         """
-        results = {}
-
-        for symbol in tqdm(symbols, desc=f"Downloading {timeframe}"):
-            try:
-                df = self.download_ohlcv(symbol, timeframe, days, force_refresh)
-                results[symbol] = df
-
-            except Exception as e:
-                logger.error(f"Skipping {symbol} due to error: {e}")
-                continue
+        downloaded = self._run_parallel(
+            [(symbol, timeframe) for symbol in symbols],
+            lambda symbol, tf: self.download_ohlcv(symbol, tf, days, force_refresh),
+            desc=f"Downloading {timeframe}",
+            load_markets=True
+        )
+        results = {
+            symbol: downloaded[(symbol, timeframe)]
+            for symbol in symbols if (symbol, timeframe) in downloaded
+        }
 
         logger.info(
             f"Downloaded {len(results)}/{len(symbols)} symbols "
@@ -738,19 +832,20 @@ class BinanceDataDownloader:
                 timeframes.append(regime_tf)
                 logger.info(f"Adding {regime_tf} timeframe for regime detection")
 
-        # Download all combinations
-        results = {}
-
-        for timeframe in timeframes:
-            logger.info(f"Downloading timeframe: {timeframe}")
-
-            tf_data = self.download_multiple(symbols, timeframe, days, force_refresh)
+        # Download all combinations on one pool (shared rate limit budget)
+        tasks = [(symbol, timeframe) for timeframe in timeframes for symbol in symbols]
+        downloaded = self._run_parallel(
+            tasks,
+            lambda symbol, tf: self.download_ohlcv(symbol, tf, days, force_refresh),
+            desc="Downloading",
+            load_markets=True
+        )
 
-            # Organize by symbol
-            for symbol, df in tf_data.items():
-                if symbol not in results:
-                    results[symbol] = {}
-                results[symbol][timeframe] = df
+        # Organize by symbol
+        results = {}
+        for symbol, timeframe in tasks:
+            if (symbol, timeframe) in downloaded:
+                results.setdefault(symbol, {})[timeframe] = downloaded[(symbol, timeframe)]
 
         logger.info(
             f"Download complete: {len(results)} symbols × "
@@ -795,6 +890,62 @@ class BinanceDataDownloader:
             force_refresh=force_refresh
         )
 
+    def _run_parallel(
+        self,
+        tasks: List[Tuple[str, str]],
+        fn: Callable[[str, str], Any],
+        desc: str,
+        load_markets: bool = False
+    ) -> Dict[Tuple[str, str], Any]:
+        """
+        Run fn(symbol, timeframe) for each task on the download worker pool.
+
+        Reports per-task progress (progress bar + one log line per task).
+        Failed tasks are logged and left out of the result.
+
+        Args:
+            tasks: (symbol, timeframe) pairs
+            fn: Task function
+            desc: Progress description
+            load_markets: Load markets once up front so worker clients share them
+
+        Returns:
+            Dict mapping (symbol, timeframe) to fn's result
+        """
+        results: Dict[Tuple[str, str], Any] = {}
+        if not tasks:
+            return results
+
+        if load_markets:
+            try:
+                self.exchange.load_markets()
+            except Exception as e:
+                logger.warning(f"Failed to preload markets (workers load their own): {e}")
+
+        def timed(symbol: str, timeframe: str) -> Tuple[Any, float]:
+            start = time.monotonic()
+            return fn(symbol, timeframe), time.monotonic() - start
+
+        workers = max(1, min(self.download_workers, len(tasks)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='binance') as pool:
+            futures = {pool.submit(timed, symbol, tf): (symbol, tf) for symbol, tf in tasks}
+
+            with tqdm(total=len(tasks), desc=desc) as progress:
+                for done, future in enumerate(as_completed(futures), start=1):
+                    symbol, timeframe = futures[future]
+                    try:
+                        results[(symbol, timeframe)], elapsed = future.result()
+                        logger.info(
+                            f"{desc} [{done}/{len(tasks)}] {symbol} {timeframe} "
+                            f"done in {elapsed:.1f}s"
+                        )
+                    except Exception as e:
+                        logger.error(f"{desc} [{done}/{len(tasks)}] Skipping {symbol} {timeframe} due to error: {e}")
+                    progress.set_postfix_str(f"{symbol} {timeframe}")
+                    progress.update()
+
+        return results
+
     @staticmethod
     def _timeframe_to_seconds(timeframe: str) -> int:
         """
@@ -828,15 +979,7 @@ class BinanceDataDownloader:
         if not self.data_dir.exists():
             return []
 
-        # Extract unique symbols from cached files
-        symbols = set()
-
-        for file in self.data_dir.glob("*.parquet"):
-            # File format: {symbol}_{timeframe}.parquet
-            symbol = file.stem.split('_')[0]
-            symbols.add(symbol)
-
-        return sorted(symbols)
+        return sorted({symbol for symbol, _ in self.store.list_series()})
 
     def get_cached_data(
         self,
@@ -867,18 +1010,19 @@ class BinanceDataDownloader:
         Args:
             symbol: Symbol to clear (all if None)
         """
+        for cached_symbol, timeframe in self.store.list_series():
+            if symbol is None or cached_symbol == symbol:
+                self.store.delete(cached_symbol, timeframe)
+                if symbol:
+                    logger.info(f"Deleted cache: {cached_symbol}_{timeframe}")
+
         if symbol:
-            # Clear specific symbol - data and metadata
-            for file in self.data_dir.glob(f"{symbol}_*.parquet"):
-                file.unlink()
-                logger.info(f"Deleted cache: {file}")
+            # Clear specific symbol - metadata
             for file in self.data_dir.glob(f"{symbol}_*.meta.json"):
                 file.unlink()
                 logger.info(f"Deleted metadata: {file}")
         else:
-            # Clear all - data and metadata
-            for file in self.data_dir.glob("*.parquet"):
-                file.unlink()
+            # Clear all - metadata
             for file in self.data_dir.glob("*.meta.json"):
                 file.unlink()
             logger.info("Cleared all cached data and metadata")
@@ -914,21 +1058,23 @@ class BinanceDataDownloader:
         self,
         symbol: str,
         timeframe: str,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        replace: bool = False
     ) -> Optional[Path]:
         """
-        Save OHLCV data to Parquet file with atomic write.
+        Merge OHLCV data into the partitioned cache with atomic writes.
 
-        Uses temp file + rename pattern to prevent partial writes.
-        Never saves empty DataFrames.
+        Only the monthly partitions covered by df are rewritten; pass just the
+        new candles for incremental updates. Never saves empty DataFrames.
 
         Args:
             symbol: Symbol base
             timeframe: Timeframe
             df: DataFrame to save
+            replace: Drop existing candles first (force refresh)
 
         Returns:
-            Path to saved file, or None if save failed/skipped
+            Path to the series directory, or None if save failed/skipped
         """
         # Never save empty data
         if df is None or df.empty:
@@ -943,38 +1089,24 @@ class BinanceDataDownloader:
         # Ensure data is clean
         df = self._sanitize_dataframe(df)
 
-        file_path = self.data_dir / f"{symbol}_{timeframe}.parquet"
-        tmp_path = file_path.with_suffix('.parquet.tmp')
-
         try:
-            # Write to temp file first
-            df.to_parquet(tmp_path, index=False)
-
-            # Verify temp file was written correctly
-            if tmp_path.stat().st_size < MIN_PARQUET_SIZE:
-                raise IOError("Written file too small, likely corrupted")
+            self.store.migrate_legacy(symbol, timeframe)
+            series_dir = self.store.write(symbol, timeframe, df, replace=replace)
 
-            # Atomic rename (won't leave partial files)
-            tmp_path.rename(file_path)
-
-            logger.debug(f"Saved {len(df)} candles to {file_path.name}")
-            return file_path
+            logger.debug(f"Saved {len(df)} candles to {series_dir.name}/")
+            return series_dir
 
         except Exception as e:
             logger.error(f"Failed to save {symbol}_{timeframe}: {e}")
-            # Clean up temp file if it exists
-            try:
-                if tmp_path.exists():
-                    tmp_path.unlink()
-            except Exception:
-                pass
             return None
 
     def load_data(self, symbol: str, timeframe: str) -> Optional[pd.DataFrame]:
         """
         Load cached OHLCV data with auto-repair of corrupted files.
 
-        If file is corrupted or too small, it is deleted and None is returned,
+        Legacy single-file caches are migrated to partitions first. Corrupted
+        partitions are dropped (the hole is healed by fill_gaps or the next
+        backfill); a cache with invalid OHLCV structure is deleted entirely,
         triggering a fresh download on next access.
 
         Args:
@@ -984,45 +1116,42 @@ class BinanceDataDownloader:
         Returns:
             DataFrame if exists and valid, None otherwise
         """
-        file_path = self.data_dir / f"{symbol}_{timeframe}.parquet"
-
-        if not file_path.exists():
-            return None
-
-        # Check file size (catch empty/truncated files)
+        legacy_path = self.store.legacy_path(symbol, timeframe)
         try:
-            file_size = file_path.stat().st_size
-            if file_size < MIN_PARQUET_SIZE:
-                logger.warning(
-                    f"File too small ({file_size} bytes), deleting: {file_path.name}"
-                )
-                file_path.unlink()
-                return None
+            self.store.migrate_legacy(symbol, timeframe)
         except Exception as e:
-            logger.warning(f"Cannot stat file {file_path.name}: {e}")
+            # Legacy file is corrupted - delete it (will trigger re-download)
+            logger.warning(f"Corrupted parquet file, deleting: {legacy_path.name} - {e}")
+            legacy_path.unlink(missing_ok=True)
             return None
 
-        # Try to read parquet
-        try:
-            df = pd.read_parquet(file_path)
+        if not self.store.exists(symbol, timeframe):
+            return None
 
-            # Validate structure
-            if not self.validate_ohlcv(df):
-                logger.warning(f"Invalid OHLCV structure, deleting: {file_path.name}")
-                file_path.unlink()
+        try:
+            df = self.store.read(symbol, timeframe)
+        except Exception as e:
+            logger.warning(f"Unreadable cache {symbol}_{timeframe}, repairing: {e}")
+            for key in self.store.corrupted_partitions(symbol, timeframe):
+                self.store.drop_partition(symbol, timeframe, key)
+            try:
+                df = self.store.read(symbol, timeframe)
+            except Exception as e:
+                logger.warning(f"Cache {symbol}_{timeframe} still unreadable, deleting: {e}")
+                self.store.delete(symbol, timeframe)
                 return None
 
-            return df
+        if df is None or df.empty:
+            return None
 
-        except Exception as e:
-            # File is corrupted - delete and return None (will trigger re-download)
-            logger.warning(f"Corrupted parquet file, deleting: {file_path.name} - {e}")
-            try:
-                file_path.unlink()
-            except Exception:
-                pass
+        # Validate structure
+        if not self.validate_ohlcv(df):
+            logger.warning(f"Invalid OHLCV structure, deleting: {symbol}_{timeframe}")
+            self.store.delete(symbol, timeframe)
             return None
 
+        return df
+
     def update_data(self, symbol: str, timeframe: str) -> pd.DataFrame:
         """
         Update cached data with latest candles
@@ -1115,20 +1244,20 @@ class BinanceDataDownloader:
         tf_seconds = self._timeframe_to_seconds(timeframe)
         expected_delta = pd.Timedelta(seconds=tf_seconds)
 
-        gaps = []
         timestamps = df['timestamp']
+        deltas = timestamps.diff()
 
-        for i in range(1, len(timestamps)):
-            actual_delta = timestamps.iloc[i] - timestamps.iloc[i-1]
-
-            # Allow 1 second tolerance for floating point issues
-            if actual_delta > expected_delta + pd.Timedelta(seconds=1):
-                gap_start = timestamps.iloc[i-1]
-                gap_end = timestamps.iloc[i]
-                missing_candles = int(actual_delta / expected_delta) - 1
-                gaps.append((gap_start, gap_end, missing_candles))
+        # Allow 1 second tolerance for floating point issues
+        holes = np.flatnonzero((deltas > expected_delta + pd.Timedelta(seconds=1)).values)
 
-        return gaps
+        return [
+            (
+                timestamps.iloc[i - 1],
+                timestamps.iloc[i],
+                int(deltas.iloc[i] / expected_delta) - 1
+            )
+            for i in holes
+        ]
 
     def fill_gaps(
         self,
@@ -1151,15 +1280,27 @@ class BinanceDataDownloader:
             'success': True
         }
 
-        # Load existing data
-        df = self.load_data(symbol, timeframe)
+        # Gaps are tracked in the manifest: no need to load the candles
+        try:
+            self.store.migrate_legacy(symbol, timeframe)
+        except Exception as e:
+            logger.error(f"{symbol} {timeframe}: Legacy cache migration failed - {e}")
+            result['success'] = False
+            return result
+        manifest = self.store.manifest(symbol, timeframe)
 
-        if df is None or df.empty:
+        if manifest is None or not manifest['partitions']:
             logger.info(f"{symbol} {timeframe}: No cached data to check")
             return result
 
-        # Detect gaps
-        gaps = self.detect_gaps(df, timeframe)
+        gaps = [
+            (
+                pd.Timestamp(before, unit='ms', tz='UTC'),
+                pd.Timestamp(after, unit='ms', tz='UTC'),
+                missing
+            )
+            for before, after, missing in manifest['gaps']
+        ]
         result['gaps_found'] = len(gaps)
 
         if not gaps:
@@ -1172,6 +1313,8 @@ class BinanceDataDownloader:
         ccxt_symbol = f"{symbol}/USDT:USDT"
         tf_seconds = self._timeframe_to_seconds(timeframe)
 
+        filled = []
+
         try:
             for gap_start, gap_end, missing_count in gaps:
                 # Download missing range
@@ -1182,7 +1325,7 @@ class BinanceDataDownloader:
                 current_since = since
 
                 while current_since < until:
-                    candles = self.exchange.fetch_ohlcv(
+                    candles = self._fetch_ohlcv(
                         ccxt_symbol,
                         timeframe=timeframe,
                         since=current_since,
@@ -1211,14 +1354,11 @@ class BinanceDataDownloader:
                     )
                     new_df['timestamp'] = pd.to_datetime(new_df['timestamp'], unit='ms', utc=True)
 
-                    df = pd.concat([df, new_df], ignore_index=True)
+                    filled.append(new_df)
 
-            # Deduplicate and sort
-            df = df.drop_duplicates(subset=['timestamp'], keep='last')
-            df = df.sort_values('timestamp').reset_index(drop=True)
-
-            # Save updated data
-            self.save_data(symbol, timeframe, df)
+            # Save only the filled candles (rewrites just the affected months)
+            if filled:
+                self.save_data(symbol, timeframe, pd.concat(filled, ignore_index=True))
 
             logger.info(
                 f"{symbol} {timeframe}: Filled {result['candles_added']} candles "
@@ -1300,12 +1440,15 @@ class BinanceDataDownloader:
         Returns:
             Dict mapping 'SYMBOL_TF' to verification results
         """
-        results = {}
+        tasks = [(symbol, tf) for symbol in symbols for tf in timeframes]
+        verified = self._run_parallel(tasks, self.verify_data_integrity, desc="Verifying")
 
-        for symbol in symbols:
-            for tf in timeframes:
-                key = f"{symbol}_{tf}"
-                results[key] = self.verify_data_integrity(symbol, tf)
+        results = {}
+        for symbol, tf in tasks:
+            results[f"{symbol}_{tf}"] = verified.get((symbol, tf)) or {
+                'valid': False, 'candle_count': 0, 'gap_count': 0,
+                'gaps': [], 'first_date': None, 'last_date': None
+            }
 
         # Summary
         valid_count = sum(1 for r in results.values() if r['valid'])
@@ -1330,12 +1473,14 @@ class BinanceDataDownloader:
         Returns:
             Dict mapping 'SYMBOL_TF' to fill results
         """
-        results = {}
+        tasks = [(symbol, tf) for symbol in symbols for tf in timeframes]
+        filled = self._run_parallel(tasks, self.fill_gaps, desc="Filling gaps", load_markets=True)
 
-        for symbol in symbols:
-            for tf in timeframes:
-                key = f"{symbol}_{tf}"
-                results[key] = self.fill_gaps(symbol, tf)
+        results = {}
+        for symbol, tf in tasks:
+            results[f"{symbol}_{tf}"] = filled.get((symbol, tf)) or {
+                'gaps_found': 0, 'candles_added': 0, 'success': False
+            }
 
         # Summary
         total_gaps = sum(r['gaps_found'] for r in results.values())
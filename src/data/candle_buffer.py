@@ -0,0 +1,152 @@
+"""
+Columnar Candle Ring Buffer
+
+Live OHLCV storage for HyperliquidDataProvider, one buffer per
+(symbol, interval):
+
+- Preallocated NumPy arrays with a head pointer (no per-candle objects)
+- Forming candle updated in place (same timestamp = same slot)
+- Every slot is written twice (slot and slot + capacity), so the last N
+  candles are always one contiguous slice: reads are zero-copy views
+- DataFrames are built once per closed candle and cached; forming-candle
+  updates patch the cached frames' last row instead of rebuilding them.
+  Readers get a copy of the cached frame (one block memcpy), so columns
+  they add or values they change never reach other readers or the cache
+
+The executor reads the same (symbol, interval) frame for every LIVE
+strategy on every loop, so reads must not rebuild DataFrames.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class CandleBuffer:
+    """
+    Fixed-capacity columnar ring buffer of OHLCV candles (oldest first).
+
+    Not locked: callers serialize writes (HyperliquidDataProvider.async_lock).
+    """
+
+    def __init__(self, capacity: int = 1000):
+        """
+        Args:
+            capacity: Maximum number of candles kept (older ones are overwritten)
+        """
+        self.capacity = capacity
+        # Mirrored storage: slot i lives at i and i + capacity
+        self._timestamps = np.empty(2 * capacity, dtype='datetime64[ns]')
+        self._values = np.empty((2 * capacity, len(COLUMNS)), dtype=np.float64)
+        self._head = 0  # Slot of the next new candle
+        self._size = 0
+        # Cached DataFrames by row count (dropped when a candle closes)
+        self._frames: Dict[int, pd.DataFrame] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_timestamp(self) -> Optional[np.datetime64]:
+        """Timestamp of the newest (possibly forming) candle"""
+        if not self._size:
+            return None
+        return self._timestamps[self._head - 1 + self.capacity]
+
+    def update(
+        self,
+        timestamp: datetime,
+        open: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float
+    ) -> bool:
+        """
+        Append a new candle or update the forming one in place.
+
+        Candles older than the newest one are ignored (late/duplicate
+        bootstrap data must not break time order).
+
+        Returns:
+            True if a new candle was appended (previous one closed)
+        """
+        ts = np.datetime64(timestamp, 'ns')
+        last = self.last_timestamp
+
+        if last is not None and ts < last:
+            return False
+
+        if last is not None and ts == last:
+            # Same timestamp - update in-progress candle
+            slot = (self._head - 1) % self.capacity
+            self._write(slot, ts, open, high, low, close, volume)
+            for frame in self._frames.values():
+                frame.iloc[-1] = self._values[slot]
+            return False
+
+        # New candle - previous one is closed, cached frames are stale
+        self._write(self._head, ts, open, high, low, close, volume)
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+        self._frames.clear()
+        return True
+
+    def _write(self, slot: int, ts: np.datetime64, *values: float) -> None:
+        """Write one candle to a slot and its mirror"""
+        mirror = slot + self.capacity
+        self._timestamps[slot] = ts
+        self._timestamps[mirror] = ts
+        self._values[slot] = values
+        self._values[mirror] = values
+
+    def _window(self, limit: Optional[int]) -> slice:
+        """Contiguous slice of the last `limit` candles in mirrored storage"""
+        n = self._size if limit is None else max(0, min(limit, self._size))
+        end = self._head + self.capacity
+        return slice(end - n, end)
+
+    def arrays(self, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Zero-copy views of the last `limit` candles.
+
+        Views are read-only and only valid until the next write.
+
+        Returns:
+            (timestamps [n], values [n, 5] with columns open/high/low/close/volume)
+        """
+        window = self._window(limit)
+        timestamps = self._timestamps[window]
+        values = self._values[window]
+        timestamps.flags.writeable = False
+        values.flags.writeable = False
+        return timestamps, values
+
+    def to_dataframe(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Last `limit` candles as a DataFrame indexed by timestamp.
+
+        Built once and cached until the next candle closes; each call
+        returns a copy the caller may modify.
+
+        Returns:
+            DataFrame with columns [open, high, low, close, volume] (empty if no data)
+        """
+        window = self._window(limit)
+        n = window.stop - window.start
+        if n == 0:
+            return pd.DataFrame()
+
+        frame = self._frames.get(n)
+        if frame is None:
+            frame = pd.DataFrame(
+                self._values[window].copy(),
+                index=pd.DatetimeIndex(self._timestamps[window].copy(), name='timestamp'),
+                columns=COLUMNS,
+            )
+            self._frames[n] = frame
+        return frame.copy()
@@ -64,6 +64,11 @@ class DataScheduler:
         funding_config = self.config.get('funding', {})
         self.funding_enabled = funding_config.get('enabled', False)
 
+        # Shared OHLCV panels for backtester workers (rebuilt after each download)
+        panels_config = sched_config.get('panels', {})
+        self.panels_enabled = panels_config.get('enabled', True)
+        self.panel_history_days = panels_config.get('history_days')
+
         logger.info(
             f"DataScheduler initialized: hours={self.update_hours}, enabled={self.enabled}"
         )
@@ -124,6 +129,9 @@ class DataScheduler:
             self.binance_downloader.download_for_pairs()
             logger.info("Data download complete")
 
+            if self.panels_enabled:
+                self.rebuild_panels()
+
             # Sync funding rates if enabled
             if self.funding_enabled:
                 self.sync_funding()
@@ -131,6 +139,26 @@ class DataScheduler:
         except Exception as e:
             logger.error(f"Data download failed: {e}", exc_info=True)
 
+    def rebuild_panels(self) -> None:
+        """
+        Rebuild the memory-mapped OHLCV panels from the parquet cache.
+
+        Backtester processes pick up the new version on their next read.
+        """
+        from src.backtester.panel_store import PanelStore
+
+        timeframes = list(self.config.get('timeframes', []))
+        logger.info(f"Rebuilding OHLCV panels for {timeframes}...")
+
+        store = PanelStore(
+            cache_dir=str(self.binance_downloader.data_dir),
+            history_days=self.panel_history_days,
+        )
+        versions = store.rebuild_all(timeframes)
+
+        built = sum(1 for v in versions.values() if v is not None)
+        logger.info(f"Panel rebuild complete: {built}/{len(timeframes)} timeframes")
+
     def sync_funding(self) -> None:
         """
         Sync funding rates for all active coins from Hyperliquid.
@@ -8,6 +8,7 @@ Features:
 - HTTP Bootstrap: Historical candles loaded before WebSocket starts
 - allMids: Real-time mid prices for all coins
 - Candle streaming: OHLCV updates for subscribed coins/timeframes
+- Candle close events: callback per (symbol, interval) when a candle closes
 - Auto-reconnection with exponential backoff
 
 Design Principles:
@@ -32,6 +33,7 @@ import pandas as pd
 import ccxt
 
 from src.config.loader import load_config
+from src.data.candle_buffer import CandleBuffer
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -184,9 +186,9 @@ class HyperliquidDataProvider:
         self._ccxt_client = None
 
         # Data storage with thread-safe locks
-        # Candles: {symbol: {interval: deque([Candle, ...])}}
-        self.candles: Dict[str, Dict[str, Deque[Candle]]] = defaultdict(
-            lambda: defaultdict(lambda: deque(maxlen=1000))
+        # Candles: {symbol: {interval: CandleBuffer}} (columnar ring buffers)
+        self.candles: Dict[str, Dict[str, CandleBuffer]] = defaultdict(
+            lambda: defaultdict(lambda: CandleBuffer(capacity=1000))
         )
         self.current_candles: Dict[str, Dict[str, Candle]] = defaultdict(dict)
 
@@ -211,6 +213,9 @@ class HyperliquidDataProvider:
         self.ledger_updates: Deque[LedgerUpdate] = deque(maxlen=1000)
         self._ledger_callback: Optional[Callable] = None
 
+        # Candle close events (event-driven executor scheduling)
+        self._candle_close_callback: Optional[Callable[[str, str, pd.Timestamp], None]] = None
+
         # WebSocket health monitoring
         self.last_webdata2_update: Optional[datetime] = None
         self._sync_task: Optional[asyncio.Task] = None
@@ -287,19 +292,17 @@ class HyperliquidDataProvider:
                         logger.warning(f"Empty OHLCV for {symbol} {tf}")
                         continue
 
-                    # Convert to Candle objects and store
+                    # Store in the columnar buffer (bars already present are skipped)
+                    candle_buffer = self.candles[symbol][tf]
                     for bar in ohlcv:
-                        candle = Candle(
-                            timestamp=datetime.fromtimestamp(bar[0] / 1000),
-                            symbol=symbol,
-                            interval=tf,
-                            open=float(bar[1]),
-                            high=float(bar[2]),
-                            low=float(bar[3]),
-                            close=float(bar[4]),
-                            volume=float(bar[5]) if len(bar) > 5 else 0.0,
+                        candle_buffer.update(
+                            datetime.fromtimestamp(bar[0] / 1000),
+                            float(bar[1]),
+                            float(bar[2]),
+                            float(bar[3]),
+                            float(bar[4]),
+                            float(bar[5]) if len(bar) > 5 else 0.0,
                         )
-                        self.candles[symbol][tf].append(candle)
 
                     fetched += 1
                     logger.debug(
@@ -470,6 +473,21 @@ class HyperliquidDataProvider:
         self._ledger_callback = callback
         logger.debug("Ledger callback registered")
 
+    def set_candle_close_callback(self, callback: Callable[[str, str, pd.Timestamp], None]):
+        """
+        Set callback for candle close events.
+
+        A candle is closed when the first update of the next candle arrives
+        on the WebSocket (bootstrap data does not publish events).
+
+        Args:
+            callback: Function called as callback(symbol, interval, closed_at),
+                      closed_at being the open timestamp of the closed candle.
+                      Runs on the event loop - must not block.
+        """
+        self._candle_close_callback = callback
+        logger.debug("Candle close callback registered")
+
     async def _fetch_initial_account_state_snapshot(self):
         """
         Fetch initial account state via HTTP API.
@@ -574,19 +592,26 @@ class HyperliquidDataProvider:
                 volume=float(candle_data.get("v", 0)),
             )
 
+            closed_at = None
             async with self.async_lock:
                 # Update current candle
                 self.current_candles[symbol][interval] = candle
 
-                # Update or append to candle history
-                candle_deque = self.candles[symbol][interval]
-
-                if candle_deque and candle_deque[-1].timestamp == candle.timestamp:
-                    # Same timestamp - update in-progress candle
-                    candle_deque[-1] = candle
-                else:
-                    # New candle - append to history
-                    candle_deque.append(candle)
+                # Update in-progress candle in place, or append a new one
+                candle_buffer = self.candles[symbol][interval]
+                previous = candle_buffer.last_timestamp
+                if candle_buffer.update(
+                    candle.timestamp, candle.open, candle.high,
+                    candle.low, candle.close, candle.volume
+                ) and previous is not None:
+                    # New candle started - the previous one is closed
+                    closed_at = pd.Timestamp(previous)
+
+            if closed_at is not None and self._candle_close_callback:
+                try:
+                    self._candle_close_callback(symbol, interval, closed_at)
+                except Exception as e:
+                    logger.error(f"Error in candle close callback: {e}", exc_info=True)
 
             logger.debug(
                 f"Candle update: {symbol} {interval} "
@@ -974,15 +999,28 @@ class HyperliquidDataProvider:
             List of Candle objects (oldest first)
         """
         async with self.async_lock:
-            candles = list(self.candles.get(symbol, {}).get(interval, []))
+            candle_buffer = self.candles.get(symbol, {}).get(interval)
 
-            if not candles:
+            if not candle_buffer:
                 logger.warning(
                     f"No cached candles for {symbol} {interval}"
                 )
                 return []
 
-            return candles[-limit:]
+            timestamps, values = candle_buffer.arrays(limit)
+            return [
+                Candle(
+                    timestamp=pd.Timestamp(ts).to_pydatetime(),
+                    symbol=symbol,
+                    interval=interval,
+                    open=float(row[0]),
+                    high=float(row[1]),
+                    low=float(row[2]),
+                    close=float(row[3]),
+                    volume=float(row[4]),
+                )
+                for ts, row in zip(timestamps, values)
+            ]
 
     async def get_candles_as_dataframe(
         self,
@@ -993,34 +1031,27 @@ class HyperliquidDataProvider:
         """
         Get candles as pandas DataFrame
 
+        The frame is cached by the candle buffer until the next candle closes;
+        each caller gets its own copy.
+
         Args:
             symbol: Symbol (e.g., 'BTC')
             interval: Timeframe (e.g., '15m', '1h')
             limit: Maximum number of candles
 
         Returns:
-            DataFrame with columns [timestamp, open, high, low, close, volume]
+            DataFrame indexed by timestamp with columns [open, high, low, close, volume]
         """
-        candles = await self.get_candles(symbol, interval, limit)
-
-        if not candles:
-            return pd.DataFrame()
-
-        # Convert to DataFrame
-        df = pd.DataFrame([
-            {
-                'timestamp': c.timestamp,
-                'open': c.open,
-                'high': c.high,
-                'low': c.low,
-                'close': c.close,
-                'volume': c.volume,
-            }
-            for c in candles
-        ])
+        async with self.async_lock:
+            candle_buffer = self.candles.get(symbol, {}).get(interval)
+
+            if not candle_buffer:
+                logger.warning(
+                    f"No cached candles for {symbol} {interval}"
+                )
+                return pd.DataFrame()
 
-        df.set_index('timestamp', inplace=True)
-        return df
+            return candle_buffer.to_dataframe(limit)
 
     async def get_current_price(self, symbol: str, interval: str = '15m') -> Optional[float]:
         """
@@ -1085,23 +1116,11 @@ class HyperliquidDataProvider:
             if loop.is_running():
                 # Can't use asyncio.run() in running loop
                 # Return sync data from cache directly
-                candles = list(self.candles.get(symbol, {}).get(timeframe, []))
-                if not candles:
+                candle_buffer = self.candles.get(symbol, {}).get(timeframe)
+                if not candle_buffer:
                     return None
 
-                df = pd.DataFrame([
-                    {
-                        'timestamp': c.timestamp,
-                        'open': c.open,
-                        'high': c.high,
-                        'low': c.low,
-                        'close': c.close,
-                        'volume': c.volume,
-                    }
-                    for c in candles[-limit:]
-                ])
-                df.set_index('timestamp', inplace=True)
-                return df
+                return candle_buffer.to_dataframe(limit)
             else:
                 return asyncio.run(self.get_candles_as_dataframe(symbol, timeframe, limit))
         except RuntimeError:
@@ -0,0 +1,465 @@
+"""
+Partitioned OHLCV Storage
+
+One parquet file per UTC calendar month instead of one file per series, so
+an incremental update rewrites only the months it touches (normally just
+the newest one) and readers load only the months overlapping their window.
+
+Layout (under data_dir):
+    {symbol}_{timeframe}/{YYYY-MM}.parquet   candles of that month
+    {symbol}_{timeframe}/manifest.json       partitions, coverage, gaps
+
+Manifest:
+    {
+        "symbol": "BTC", "timeframe": "15m",
+        "first_ts": ms, "last_ts": ms, "rows": n,
+        "partitions": {"2024-01": {"first_ts": ms, "last_ts": ms, "rows": n, "gaps": [...]}},
+        "gaps": [[last_ts_before_gap, first_ts_after_gap, missing_candles], ...],
+        "updated_at": iso
+    }
+
+Design Principles:
+- Atomic writes: partitions and manifest use temp file + rename; partitions
+  are written before the manifest, so readers never see a manifest entry
+  without its file
+- Single writer (BinanceDataDownloader), any number of readers
+- Legacy {symbol}_{timeframe}.parquet files are still readable; the writer
+  migrates them into partitions (migrate_legacy)
+"""
+
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+# Minimum valid parquet file size (parquet header is 8 bytes minimum)
+MIN_PARQUET_SIZE = 12
+
+_TIMEFRAME_SECONDS = {'m': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """Candle length in milliseconds (e.g., '15m' -> 900000)"""
+    return int(timeframe[:-1]) * _TIMEFRAME_SECONDS[timeframe[-1]] * 1000
+
+
+def to_ms(value) -> int:
+    """Timestamp-like value (naive = UTC) to epoch milliseconds"""
+    ts = pd.Timestamp(value)
+    ts = ts.tz_convert('UTC') if ts.tzinfo else ts.tz_localize('UTC')
+    return ts.value // 1_000_000
+
+
+def _timestamps_ms(timestamps: pd.Series) -> np.ndarray:
+    """Timestamp column (datetime of any unit, or epoch ms) to int64 ms"""
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        if getattr(timestamps.dt, 'tz', None) is not None:
+            timestamps = timestamps.dt.tz_convert('UTC').dt.tz_localize(None)
+        return timestamps.values.astype('datetime64[ms]').astype(np.int64)
+    return timestamps.astype(np.int64).values
+
+
+def _find_gaps(ts_ms: np.ndarray, step_ms: int) -> List[List[int]]:
+    """[before, after, missing] for each hole in sorted ms timestamps"""
+    if len(ts_ms) < 2:
+        return []
+    deltas = np.diff(ts_ms)
+    # 1 second tolerance, same as BinanceDataDownloader.detect_gaps
+    holes = np.flatnonzero(deltas > step_ms + 1000)
+    return [
+        [int(ts_ms[i]), int(ts_ms[i + 1]), int(deltas[i] // step_ms) - 1]
+        for i in holes
+    ]
+
+
+class OHLCVStore:
+    """
+    Monthly-partitioned OHLCV parquet store.
+
+    Timestamps are returned as tz-aware UTC datetimes, like the rest of the
+    data layer.
+    """
+
+    def __init__(self, data_dir: str = 'data/binance'):
+        """
+        Args:
+            data_dir: Root directory of the cache
+        """
+        self.data_dir = Path(data_dir)
+
+    # =========================================================================
+    # PATHS / MANIFEST
+    # =========================================================================
+
+    def series_dir(self, symbol: str, timeframe: str) -> Path:
+        """Directory holding the partitions of one series"""
+        return self.data_dir / f"{symbol}_{timeframe}"
+
+    def legacy_path(self, symbol: str, timeframe: str) -> Path:
+        """Pre-partitioning single-file location"""
+        return self.data_dir / f"{symbol}_{timeframe}.parquet"
+
+    def _manifest_path(self, symbol: str, timeframe: str) -> Path:
+        return self.series_dir(symbol, timeframe) / MANIFEST_NAME
+
+    def manifest(self, symbol: str, timeframe: str) -> Optional[dict]:
+        """Manifest of a partitioned series (None if not partitioned or unreadable)"""
+        try:
+            return json.loads(self._manifest_path(symbol, timeframe).read_text())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Unreadable manifest for {symbol}_{timeframe}: {e}")
+            return None
+
+    def exists(self, symbol: str, timeframe: str) -> bool:
+        """True if the series has data (partitioned or legacy)"""
+        manifest = self.manifest(symbol, timeframe)
+        if manifest is not None:
+            return bool(manifest['partitions'])
+        return self.legacy_path(symbol, timeframe).exists()
+
+    def version(self, symbol: str, timeframe: str) -> Optional[int]:
+        """
+        Change token of a series (mtime_ns of its manifest, or of the legacy
+        file). Changes on every write.
+        """
+        for path in (self._manifest_path(symbol, timeframe), self.legacy_path(symbol, timeframe)):
+            try:
+                return path.stat().st_mtime_ns
+            except FileNotFoundError:
+                continue
+        return None
+
+    def bounds(self, symbol: str, timeframe: str) -> Optional[Tuple[int, int, int]]:
+        """
+        (first_ts_ms, last_ts_ms, rows) of a series without reading candles.
+
+        Legacy files have no manifest and are read once.
+        """
+        manifest = self.manifest(symbol, timeframe)
+        if manifest is not None:
+            if not manifest['partitions']:
+                return None
+            return manifest['first_ts'], manifest['last_ts'], manifest['rows']
+
+        df = self._read_legacy(symbol, timeframe, columns=['timestamp'])
+        if df is None or df.empty:
+            return None
+        ts = _timestamps_ms(df['timestamp'])
+        return int(ts.min()), int(ts.max()), len(ts)
+
+    def list_series(self, timeframe: Optional[str] = None) -> List[Tuple[str, str]]:
+        """
+        All cached (symbol, timeframe) pairs, partitioned and legacy.
+
+        Args:
+            timeframe: Only this timeframe (optional)
+        """
+        series = set()
+        suffix = f"_{timeframe}" if timeframe else ""
+
+        for manifest_path in self.data_dir.glob(f"*{suffix}/{MANIFEST_NAME}"):
+            try:
+                manifest = json.loads(manifest_path.read_text())
+            except Exception:
+                continue
+            if manifest['partitions']:
+                series.add((manifest['symbol'], manifest['timeframe']))
+
+        for path in self.data_dir.glob(f"*{suffix}.parquet"):
+            symbol, tf = path.stem.rsplit('_', 1)
+            series.add((symbol, tf))
+
+        return sorted(series)
+
+    # =========================================================================
+    # READ
+    # =========================================================================
+
+    def read(
+        self,
+        symbol: str,
+        timeframe: str,
+        start=None,
+        end=None,
+        columns: Optional[Sequence[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read candles in [start, end], loading only overlapping partitions.
+
+        Args:
+            symbol: Symbol base
+            timeframe: Timeframe
+            start: First timestamp to include (None = from the beginning)
+            end: Last timestamp to include (None = to the end)
+            columns: Columns to load (timestamp is always included)
+
+        Returns:
+            DataFrame sorted by timestamp, or None if the series doesn't exist
+
+        Raises:
+            Exception: If a partition can't be read (corrupted file)
+        """
+        if columns is not None and 'timestamp' not in columns:
+            columns = ['timestamp', *columns]
+
+        start_ms = to_ms(start) if start is not None else None
+        end_ms = to_ms(end) if end is not None else None
+
+        manifest = self.manifest(symbol, timeframe)
+        if manifest is None:
+            df = self._read_legacy(symbol, timeframe, columns=columns)
+            if df is None:
+                return None
+        else:
+            keys = [
+                key for key, part in sorted(manifest['partitions'].items())
+                if (start_ms is None or part['last_ts'] >= start_ms)
+                and (end_ms is None or part['first_ts'] <= end_ms)
+            ]
+            series_dir = self.series_dir(symbol, timeframe)
+            frames = [
+                pd.read_parquet(series_dir / f"{key}.parquet", columns=columns)
+                for key in keys
+            ]
+            if not frames:
+                return self._empty_frame(columns)
+            df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+        if df.empty:
+            return df
+
+        if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+
+        if start_ms is not None or end_ms is not None:
+            ts = _timestamps_ms(df['timestamp'])
+            mask = np.ones(len(ts), dtype=bool)
+            if start_ms is not None:
+                mask &= ts >= start_ms
+            if end_ms is not None:
+                mask &= ts <= end_ms
+            df = df[mask]
+
+        return df.reset_index(drop=True)
+
+    def _read_legacy(
+        self,
+        symbol: str,
+        timeframe: str,
+        columns: Optional[Sequence[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        path = self.legacy_path(symbol, timeframe)
+        if not path.exists():
+            return None
+        df = pd.read_parquet(path, columns=columns)
+        return df.sort_values('timestamp') if not df.empty else df
+
+    @staticmethod
+    def _empty_frame(columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        return pd.DataFrame(columns=list(columns or ['timestamp', 'open', 'high', 'low', 'close', 'volume']))
+
+    # =========================================================================
+    # WRITE
+    # =========================================================================
+
+    def write(
+        self,
+        symbol: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        replace: bool = False
+    ) -> Optional[Path]:
+        """
+        Merge candles into the series, rewriting only the months they touch.
+
+        Rows in df win over stored rows with the same timestamp. df must be
+        validated by the caller. Manifest entries whose file is missing are
+        dropped, and an unreadable touched partition is rebuilt from df (the
+        repair the read path does with corrupted_partitions/drop_partition).
+
+        Args:
+            symbol: Symbol base
+            timeframe: Timeframe
+            df: Candles to add (any range, any order)
+            replace: Drop all stored candles first (force refresh)
+
+        Returns:
+            Series directory, or None if nothing was written
+        """
+        if df is None or df.empty:
+            return None
+
+        series_dir = self.series_dir(symbol, timeframe)
+        series_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = self.manifest(symbol, timeframe)
+        if manifest is None:
+            manifest = {'symbol': symbol, 'timeframe': timeframe, 'partitions': {}}
+        partitions: Dict[str, dict] = manifest['partitions']
+        stale = set(partitions) if replace else set()
+
+        # Partitions deleted behind the manifest's back: forget them
+        for key in [k for k in partitions if not (series_dir / f"{k}.parquet").exists()]:
+            logger.warning(f"Missing partition {symbol}_{timeframe}/{key}, dropping from manifest")
+            del partitions[key]
+            stale.discard(key)
+
+        df = df.copy()
+        if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
+        elif df['timestamp'].dt.tz is None:
+            df['timestamp'] = df['timestamp'].dt.tz_localize('UTC')
+        else:
+            df['timestamp'] = df['timestamp'].dt.tz_convert('UTC')
+
+        step_ms = timeframe_to_ms(timeframe)
+        months = df['timestamp'].dt.strftime('%Y-%m')
+
+        for key, part in df.groupby(months, sort=True):
+            path = series_dir / f"{key}.parquet"
+            if key in partitions and key not in stale:
+                try:
+                    existing = pd.read_parquet(path)
+                except Exception as e:
+                    logger.warning(f"Corrupted partition {symbol}_{timeframe}/{key}, rebuilding: {e}")
+                    existing = self._empty_frame()
+                if not existing.empty:
+                    existing['timestamp'] = pd.to_datetime(existing['timestamp'], utc=True)
+                    part = pd.concat([existing, part], ignore_index=True)
+
+            part = (
+                part.drop_duplicates(subset=['timestamp'], keep='last')
+                .sort_values('timestamp')
+                .reset_index(drop=True)
+            )
+            self._write_parquet(part, path)
+
+            ts = _timestamps_ms(part['timestamp'])
+            partitions[key] = {
+                'first_ts': int(ts[0]),
+                'last_ts': int(ts[-1]),
+                'rows': len(ts),
+                'gaps': _find_gaps(ts, step_ms),
+            }
+            stale.discard(key)
+
+        for key in stale:
+            del partitions[key]
+
+        self._write_manifest(symbol, timeframe, manifest)
+
+        for key in stale:
+            (series_dir / f"{key}.parquet").unlink(missing_ok=True)
+
+        return series_dir
+
+    def corrupted_partitions(self, symbol: str, timeframe: str) -> List[str]:
+        """Keys of partitions that are missing, truncated or unreadable"""
+        manifest = self.manifest(symbol, timeframe)
+        if manifest is None:
+            return []
+
+        corrupted = []
+        series_dir = self.series_dir(symbol, timeframe)
+        for key in manifest['partitions']:
+            path = series_dir / f"{key}.parquet"
+            try:
+                if path.stat().st_size < MIN_PARQUET_SIZE:
+                    raise IOError(f"file too small ({path.stat().st_size} bytes)")
+                pd.read_parquet(path, columns=['timestamp'])
+            except Exception as e:
+                logger.warning(f"Corrupted partition {symbol}_{timeframe}/{key}: {e}")
+                corrupted.append(key)
+        return corrupted
+
+    def drop_partition(self, symbol: str, timeframe: str, key: str) -> None:
+        """Remove one partition (e.g., corrupted) from the series"""
+        manifest = self.manifest(symbol, timeframe)
+        if manifest is not None and manifest['partitions'].pop(key, None) is not None:
+            self._write_manifest(symbol, timeframe, manifest)
+        (self.series_dir(symbol, timeframe) / f"{key}.parquet").unlink(missing_ok=True)
+
+    def delete(self, symbol: str, timeframe: str) -> None:
+        """Delete a series (partitions, manifest and legacy file)"""
+        series_dir = self.series_dir(symbol, timeframe)
+        self._manifest_path(symbol, timeframe).unlink(missing_ok=True)
+        if series_dir.exists():
+            for path in series_dir.iterdir():
+                path.unlink(missing_ok=True)
+            series_dir.rmdir()
+        self.legacy_path(symbol, timeframe).unlink(missing_ok=True)
+
+    def migrate_legacy(self, symbol: str, timeframe: str) -> bool:
+        """
+        Split a legacy single-file series into partitions.
+
+        Returns:
+            True if a legacy file was migrated
+        """
+        path = self.legacy_path(symbol, timeframe)
+        if not path.exists() or self.manifest(symbol, timeframe) is not None:
+            return False
+
+        df = pd.read_parquet(path)
+        if not df.empty:
+            self.write(symbol, timeframe, df, replace=True)
+        path.unlink()
+        logger.info(f"Migrated {path.name} to monthly partitions")
+        return True
+
+    def _write_manifest(self, symbol: str, timeframe: str, manifest: dict) -> None:
+        """Recompute coverage and gaps from the partitions and swap the manifest"""
+        partitions = manifest['partitions']
+        keys = sorted(partitions)
+        step_ms = timeframe_to_ms(timeframe)
+
+        gaps: List[List[int]] = []
+        previous = None
+        for key in keys:
+            part = partitions[key]
+            # Hole across a partition boundary
+            if previous is not None and part['first_ts'] - previous['last_ts'] > step_ms + 1000:
+                gaps.append([
+                    previous['last_ts'], part['first_ts'],
+                    (part['first_ts'] - previous['last_ts']) // step_ms - 1
+                ])
+            gaps.extend(part['gaps'])
+            previous = part
+
+        manifest.update({
+            'first_ts': partitions[keys[0]]['first_ts'] if keys else None,
+            'last_ts': partitions[keys[-1]]['last_ts'] if keys else None,
+            'rows': sum(part['rows'] for part in partitions.values()),
+            'partitions': {key: partitions[key] for key in keys},
+            'gaps': gaps,
+            'updated_at': datetime.now(timezone.utc).isoformat(),
+        })
+
+        path = self._manifest_path(symbol, timeframe)
+        tmp_path = path.with_suffix('.json.tmp')
+        tmp_path.write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, path: Path) -> None:
+        """Atomic parquet write (temp file + rename)"""
+        tmp_path = path.with_suffix('.parquet.tmp')
+        try:
+            df.to_parquet(tmp_path, index=False)
+            if tmp_path.stat().st_size < MIN_PARQUET_SIZE:
+                raise IOError("Written file too small, likely corrupted")
+            os.replace(tmp_path, path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
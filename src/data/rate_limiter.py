@@ -0,0 +1,89 @@
+"""
+Token Bucket Rate Limiter
+
+Shared request budget for concurrent exchange clients. Binance limits
+request *weight* per IP per minute, not request count, so callers acquire
+the weight of each request (e.g., klines with limit=1000 cost 5).
+
+Usage:
+    bucket = TokenBucket(rate=2000 / 60, capacity=100)
+    bucket.acquire(5)      # Blocks until 5 tokens are available
+    bucket.pause(30)       # 429/418 received: stop everyone for 30s
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    acquire() blocks until the requested tokens are available.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst (bucket size)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError(f"rate and capacity must be positive (got {rate}, {capacity})")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens earned since the last update (lock held)"""
+        if now > self._updated_at:  # Nothing accrues during a pause
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens, waiting for them if needed.
+
+        Requests larger than capacity wait for a full bucket and drive the
+        balance negative, so they still consume their whole cost.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                wait = max(
+                    self._paused_until - now,
+                    (min(tokens, self.capacity) - self._tokens) / self.rate,
+                )
+                if wait <= 0:
+                    self._tokens -= tokens
+                    return waited
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquirers for `seconds` and empty the bucket (server backoff)"""
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._tokens = 0.0
+            self._updated_at = now + seconds
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (informational)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
@@ -11,10 +11,12 @@ Provides:
 from .models import (
     Base, Strategy, StrategyTemplate, BacktestResult, PipelineMetricsSnapshot,
     Trade, PerformanceSnapshot, Subaccount, Coin, ScheduledTaskExecution,
-    PairsUpdateLog, StrategyEvent, MarketRegime
+    PairsUpdateLog, StrategyEvent, StrategyEventRollup, StrategyEventMetricRollup, SignalFingerprint, StrategyLiveStats,
+    StrategySummary, MarketRegime
 )
 from .connection import get_engine, get_session, get_db, init_db
 from .strategy_processor import StrategyProcessor
+from .claim_queue import ClaimQueue
 from .event_tracker import EventTracker
 
 __all__ = [
@@ -30,6 +32,11 @@ __all__ = [
     "ScheduledTaskExecution",
     "PairsUpdateLog",
     "StrategyEvent",
+    "StrategyEventRollup",
+    "StrategyEventMetricRollup",
+    "SignalFingerprint",
+    "StrategyLiveStats",
+    "StrategySummary",
     "MarketRegime",
     "EventTracker",
     "get_engine",
@@ -37,4 +44,5 @@ __all__ = [
     "get_db",
     "init_db",
     "StrategyProcessor",
+    "ClaimQueue",
 ]
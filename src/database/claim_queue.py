@@ -0,0 +1,124 @@
+"""
+Claim Queue - Local prefetch of claimed strategies
+
+Worker loops (validator, backtester) need one strategy per free slot. Claiming
+them one by one costs a locking query per strategy; ClaimQueue claims them in
+batches (StrategyProcessor.claim_batch) and hands them out locally:
+
+- Refills when the local queue drops to low_water
+- Prefetched claims older than max_age_seconds are given back instead of
+  processed (they may already have been released as stale and re-claimed)
+- A claim handed out has its processing_started_at restamped, so the
+  stale-claim timeout runs from hand-out, not from the batch claim; claims
+  lost meanwhile are skipped
+
+On shutdown the worker releases everything it holds with
+StrategyProcessor.release_all_by_process(), prefetched claims included.
+
+Usage:
+    queue = ClaimQueue(processor, "GENERATED", batch_size=8, low_water=2)
+    strategy = queue.get()
+"""
+
+import time
+from collections import deque
+from typing import Deque, Optional, Tuple
+
+from src.database.models import Strategy
+from src.database.strategy_processor import StrategyProcessor
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class ClaimQueue:
+    """
+    Per-process prefetch queue of strategies claimed for one status.
+
+    Not thread-safe: owned by the worker loop that claims.
+    """
+
+    def __init__(
+        self,
+        processor: StrategyProcessor,
+        status: str,
+        batch_size: int = 8,
+        low_water: int = 2,
+        max_age_seconds: Optional[float] = None
+    ):
+        """
+        Args:
+            processor: StrategyProcessor used to claim and release
+            status: Strategy status to claim (e.g., "GENERATED", "VALIDATED")
+            batch_size: Queue size after a refill
+            low_water: Refill when the queue holds this many strategies or fewer
+            max_age_seconds: Give back prefetched claims older than this
+                (default: half the processor's stale claim timeout)
+        """
+        self.processor = processor
+        self.status = status
+        self.batch_size = max(1, batch_size)
+        self.low_water = max(0, min(low_water, self.batch_size - 1))
+        self.max_age_seconds = (
+            max_age_seconds if max_age_seconds is not None
+            else processor.timeout_seconds / 2
+        )
+        # (claimed_at monotonic, strategy)
+        self._queue: Deque[Tuple[float, Strategy]] = deque()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def get(self) -> Optional[Strategy]:
+        """
+        Next claimed strategy, refilling from the database at low water.
+
+        Returns:
+            Strategy claimed by this process, None if none available
+        """
+        while True:
+            self._drop_expired()
+
+            if len(self._queue) <= self.low_water:
+                self._refill()
+
+            if not self._queue:
+                return None
+            strategy = self._queue.popleft()[1]
+
+            # Timeout restarts now; a claim lost while queued is skipped
+            if self.processor.touch_claim(strategy.id):
+                return strategy
+            logger.warning(f"Prefetched claim on {strategy.id} was lost, skipping")
+
+    def release(self) -> int:
+        """
+        Give back the prefetched claims not handed out yet.
+
+        Claims already handed out stay with their worker. The continuous
+        processes release everything on shutdown with
+        StrategyProcessor.release_all_by_process() instead.
+
+        Returns:
+            Number of claims released
+        """
+        strategy_ids = [strategy.id for _, strategy in self._queue]
+        self._queue.clear()
+        return self.processor.release_claims(strategy_ids)
+
+    def _refill(self) -> None:
+        """Claim enough strategies to fill the queue up to batch_size"""
+        strategies = self.processor.claim_batch(self.status, self.batch_size - len(self._queue))
+        claimed_at = time.monotonic()
+        self._queue.extend((claimed_at, strategy) for strategy in strategies)
+
+    def _drop_expired(self) -> None:
+        """Give back prefetched claims that waited longer than max_age_seconds"""
+        cutoff = time.monotonic() - self.max_age_seconds
+        expired = []
+        while self._queue and self._queue[0][0] < cutoff:
+            expired.append(self._queue.popleft()[1].id)
+
+        if expired:
+            logger.warning(f"Releasing {len(expired)} expired prefetched {self.status} claims")
+            self.processor.release_claims(expired)
@@ -21,28 +21,282 @@ Usage:
     # Or use convenience methods
     EventTracker.validation_passed(strategy_id, name, "syntax", duration_ms=150)
     EventTracker.validation_failed(strategy_id, name, "lookahead", reason="shift(-1)")
+
+Writes are asynchronous: emit() puts the event on a bounded queue and a
+background thread inserts queued events in multi-row INSERTs (every
+batch_size events or flush_interval seconds, config: pipeline.events).
+Call EventTracker.flush() before exiting a process (os._exit skips atexit).
 """
 
+import atexit
 import logging
+import os
+import queue
+import threading
+import time
+import uuid
 from datetime import datetime, UTC
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, List
 from uuid import UUID
 
+from sqlalchemy import insert
+
 from src.database import get_session
 from src.database.models import StrategyEvent
 
 logger = logging.getLogger(__name__)
 
+# Writer defaults (overridden by pipeline.events in config)
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Queue marker: write the batch collected so far (EventWriter.flush)
+_FLUSH = object()
+
+
+class EventWriter:
+    """
+    Background writer for strategy_events.
+
+    Events (column dicts) go through a bounded queue; a daemon thread
+    inserts them in batches. When the queue is full new events are dropped
+    (counted) instead of blocking the pipeline.
+    """
+
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ):
+        """
+        Args:
+            queue_size: Maximum queued events (backlog) before dropping
+            batch_size: Insert as soon as this many events are queued
+            flush_interval: Insert queued events at least this often (seconds)
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._idle = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+        # Counters (backlog = submitted but not yet written or failed)
+        self.backlog = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def submit(self, row: Dict[str, Any]) -> bool:
+        """
+        Queue one event for insertion.
+
+        Returns:
+            True if queued, False if dropped (queue full)
+        """
+        self._ensure_started()
+        with self._idle:
+            self.backlog += 1
+        try:
+            self._queue.put_nowait(row)
+            return True
+        except queue.Full:
+            with self._idle:
+                self.backlog -= 1
+                self.dropped += 1
+            return False
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait until all queued events are written.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if the backlog is empty
+        """
+        if self._thread is None or not self._thread.is_alive():
+            # Writer thread not running: write inline
+            self._write(self._drain())
+            return self.backlog == 0
+
+        # Cut the current batch short instead of waiting for flush_interval
+        try:
+            self._queue.put_nowait(_FLUSH)
+        except queue.Full:
+            pass  # Full queue means full batches: no wait for flush_interval anyway
+
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self.backlog > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Writer counters"""
+        with self._idle:
+            return {
+                'written': self.written,
+                'dropped': self.dropped,
+                'failed': self.failed,
+                'backlog': self.backlog,
+            }
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread on first use"""
+        if self._thread is not None:
+            return
+        with self._idle:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="EventWriter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Writer loop: block for the first event, then collect a batch"""
+        while True:
+            first = self._queue.get()
+            if first is _FLUSH:
+                continue
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if row is _FLUSH:
+                    break
+                batch.append(row)
+            self._write(batch)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        """Take all queued events without blocking"""
+        rows = []
+        while True:
+            try:
+                row = self._queue.get_nowait()
+            except queue.Empty:
+                return rows
+            if row is not _FLUSH:
+                rows.append(row)
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert events in one multi-row INSERT (failures are counted, not raised).
+
+        If the batch fails, rows are retried one INSERT each so a single bad
+        event (too-long name, unserializable event_data) only loses itself.
+        """
+        if not rows:
+            return
+        written = 0
+        try:
+            with get_session() as session:
+                session.execute(insert(StrategyEvent), rows)
+            written = len(rows)
+        except Exception as e:
+            logger.warning(f"Failed to write {len(rows)} events, retrying one by one: {e}")
+            written = self._write_rows(rows)
+
+        with self._idle:
+            self.backlog -= len(rows)
+            self.written += written
+            self.failed += len(rows) - written
+            self._idle.notify_all()
+
+    @staticmethod
+    def _write_rows(rows: List[Dict[str, Any]]) -> int:
+        """Insert events one per transaction; returns how many were written"""
+        written = 0
+        for row in rows:
+            try:
+                with get_session() as session:
+                    session.execute(insert(StrategyEvent), [row])
+                written += 1
+            except Exception as e:
+                logger.warning(
+                    f"Dropped event {row.get('event_type')} for "
+                    f"{row.get('strategy_name')}: {e}"
+                )
+        return written
+
+
+_writer: Optional[EventWriter] = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> EventWriter:
+    """Process-wide EventWriter, configured from pipeline.events"""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                try:
+                    from src.config import load_config
+                    config = load_config()
+                    settings = {
+                        'queue_size': config.get('pipeline.events.queue_size', DEFAULT_QUEUE_SIZE),
+                        'batch_size': config.get('pipeline.events.batch_size', DEFAULT_BATCH_SIZE),
+                        'flush_interval': config.get('pipeline.events.flush_interval', DEFAULT_FLUSH_INTERVAL),
+                    }
+                except Exception as e:
+                    logger.debug(f"Event writer using defaults: {e}")
+                    settings = {}
+                _writer = EventWriter(**settings)
+    return _writer
+
+
+def _reset_writer_after_fork() -> None:
+    """Forked children start with their own writer (the parent's thread and queue stay with it)"""
+    global _writer, _writer_lock
+    _writer = None
+    _writer_lock = threading.Lock()
+
+
+def _flush_at_exit() -> None:
+    if _writer is not None:
+        _writer.flush()
+
+
+os.register_at_fork(after_in_child=_reset_writer_after_fork)
+atexit.register(_flush_at_exit)
+
 
 class EventTracker:
     """
     Static helper class for emitting pipeline events.
 
     All methods are static - no instance needed.
-    Events are written synchronously to database.
+    Events are queued and written to the database in batches by EventWriter.
     Failures are logged but don't block pipeline execution.
     """
 
+    @staticmethod
+    def flush(timeout: float = 10.0) -> bool:
+        """
+        Write all queued events (call on shutdown and at the end of worker jobs).
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if no events are left in the queue
+        """
+        return _get_writer().flush(timeout)
+
+    @staticmethod
+    def stats() -> Dict[str, int]:
+        """Writer counters: written, dropped, failed, backlog"""
+        return _get_writer().stats()
+
     @staticmethod
     def emit(
         event_type: str,
@@ -68,7 +322,7 @@ class EventTracker:
             **metadata: Additional key-value pairs stored as JSON
 
         Returns:
-            True if event was saved, False if error occurred
+            True if event was queued, False if dropped or error occurred
         """
         try:
             # Handle event_data passed as kwarg - flatten it into metadata
@@ -85,23 +339,18 @@ class EventTracker:
                 else:
                     final_data = metadata
 
-            event = StrategyEvent(
-                timestamp=datetime.now(UTC),
-                strategy_id=strategy_id,
-                strategy_name=strategy_name,
-                base_code_hash=base_code_hash,
-                event_type=event_type,
-                stage=stage,
-                status=status,
-                duration_ms=duration_ms,
-                event_data=final_data if final_data else None
-            )
-
-            with get_session() as session:
-                session.add(event)
-                session.commit()
-
-            return True
+            return _get_writer().submit({
+                'id': uuid.uuid4(),
+                'timestamp': datetime.now(UTC),
+                'strategy_id': strategy_id,
+                'strategy_name': strategy_name,
+                'base_code_hash': base_code_hash,
+                'event_type': event_type,
+                'stage': stage,
+                'status': status,
+                'duration_ms': duration_ms,
+                'event_data': final_data if final_data else None,
+            })
 
         except Exception as e:
             # Log error but don't crash pipeline
@@ -371,6 +620,29 @@ class EventTracker:
             combinations_tested=combinations_tested
         )
 
+    @staticmethod
+    def backtest_duplicate_signals(
+        strategy_id: UUID,
+        strategy_name: str,
+        timeframe: str,
+        duplicate_of: str,
+        similarity: float,
+        base_code_hash: Optional[str] = None
+    ) -> bool:
+        """Emit event when a strategy is skipped as a signal duplicate (before parametric)."""
+        return EventTracker.emit(
+            event_type="duplicate_signals",
+            stage="backtest",
+            status="failed",
+            strategy_id=strategy_id,
+            strategy_name=strategy_name,
+            base_code_hash=base_code_hash,
+            timeframe=timeframe,
+            reason="duplicate_signals",
+            duplicate_of=duplicate_of,
+            similarity=round(similarity, 4)
+        )
+
     @staticmethod
     def backtest_parametric_stats(
         base_code_hash: str,
@@ -387,8 +659,10 @@ class EventTracker:
         Args:
             base_code_hash: Hash of the base strategy code
             combo_stats: Dict with combo statistics:
-                {total, passed, failed, fail_reasons: {sharpe, trades, wr, exp, dd},
+                {total, passed, failed, eliminated, fail_reasons: {sharpe, trades, wr, exp, dd},
                  failed_avg: {sharpe, wr, exp, trades}, passed_avg: {...}}
+                total covers the full grid; eliminated = combos dropped by
+                successive halving (counted in failed)
         """
         return EventTracker.emit(
             event_type="parametric_stats",
@@ -419,8 +693,10 @@ class EventTracker:
 
         Args:
             combo_stats: Dict with combo statistics:
-                {total, passed, failed, fail_reasons: {sharpe, trades, wr, exp, dd},
+                {total, passed, failed, eliminated, fail_reasons: {sharpe, trades, wr, exp, dd},
                  failed_avg: {sharpe, wr, exp, trades}, passed_avg: {...}}
+                total covers the full grid; eliminated = combos dropped by
+                successive halving (counted in failed)
         """
         return EventTracker.emit(
             event_type="parametric_failed",
@@ -14,7 +14,7 @@ from typing import Optional
 
 from sqlalchemy import (
     Column, String, Integer, Float, DateTime, Boolean, Text, JSON,
-    ForeignKey, Enum, Index, UniqueConstraint
+    ForeignKey, Enum, Index, UniqueConstraint, LargeBinary
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB, ARRAY
 from sqlalchemy.ext.declarative import declarative_base
@@ -875,6 +875,244 @@ class StrategyEvent(Base):
         return f"<StrategyEvent({self.event_type}, {self.strategy_name}, {self.status})>"
 
 
+class StrategyEventRollup(Base):
+    """
+    Per-minute rollup of strategy_events.
+
+    Counters and duration aggregates by (stage, event_type, status, source),
+    maintained incrementally by src.metrics.rollups.EventRollups. 24h pipeline
+    figures are sums over at most 1440 buckets per key instead of scans of
+    the raw events.
+
+    source is the generation source for generation.created events
+    (same derivation as MetricsCollector by_source), '' otherwise.
+    """
+    __tablename__ = 'strategy_event_rollups'
+
+    bucket = Column(DateTime(timezone=True), primary_key=True)  # Minute start (UTC)
+    stage = Column(String(30), primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+    status = Column(String(20), primary_key=True)
+    source = Column(String(30), primary_key=True, default='')
+
+    count = Column(Integer, nullable=False, default=0)
+
+    # Duration aggregates over events with duration_ms
+    duration_count = Column(Integer, nullable=False, default=0)
+    duration_sum = Column(Float, nullable=False, default=0.0)
+    duration_min = Column(Integer, nullable=True)
+    duration_max = Column(Integer, nullable=True)
+
+    def __repr__(self):
+        return f"<StrategyEventRollup({self.bucket}, {self.stage}.{self.event_type}, {self.count})>"
+
+
+class StrategyEventMetricRollup(Base):
+    """
+    Per-minute rollup of numeric event_data fields of strategy_events.
+
+    Same buckets and keys as StrategyEventRollup, one row per metric
+    (src.metrics.rollups.METRICS): count, sum, min and max of the field over
+    the events that have it. Categorical fields are counted per value, as
+    metric '<name>:<value>' (sum/min/max unused).
+    """
+    __tablename__ = 'strategy_event_metric_rollups'
+
+    bucket = Column(DateTime(timezone=True), primary_key=True)  # Minute start (UTC)
+    stage = Column(String(30), primary_key=True)
+    event_type = Column(String(50), primary_key=True)
+    status = Column(String(20), primary_key=True)
+    source = Column(String(30), primary_key=True, default='')
+    metric = Column(String(80), primary_key=True)
+
+    count = Column(Integer, nullable=False, default=0)
+    sum = Column(Float, nullable=False, default=0.0)
+    min = Column(Float, nullable=True)
+    max = Column(Float, nullable=True)
+
+    def __repr__(self):
+        return f"<StrategyEventMetricRollup({self.bucket}, {self.stage}.{self.event_type}, {self.metric})>"
+
+
+# ==============================================================================
+# SIGNAL FINGERPRINTS (Backtest deduplication)
+# ==============================================================================
+
+class SignalFingerprint(Base):
+    """
+    Entry-signal fingerprint of a backtested strategy.
+
+    Written by the backtester before the parametric sweep (see
+    src.backtester.signal_fingerprint). Strategies whose entries on the
+    fixed reference panel match an existing fingerprint (exact hash, or
+    Jaccard similarity above the configured threshold via LSH candidates)
+    are functional duplicates and skip the backtest.
+
+    Rows outlive their strategy (strategy_id is nulled on delete): a failed
+    strategy's fingerprint still spares its duplicates the sweep.
+    """
+    __tablename__ = 'signal_fingerprints'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    # sha256 of (reference panel, timeframe, direction, SL/TP types, entry bitset)
+    signal_hash = Column(String(64), nullable=False, unique=True)
+    timeframe = Column(String(10), nullable=False)
+    n_bits = Column(Integer, nullable=False)  # Bars in the reference panel (all symbols)
+    n_signals = Column(Integer, nullable=False)
+    bitset = Column(LargeBinary, nullable=False)  # np.packbits of the entry series
+    lsh_bands = Column(ARRAY(String), nullable=False)  # MinHash band keys (near-duplicate lookup)
+
+    strategy_id = Column(UUID(as_uuid=True), ForeignKey('strategies.id', ondelete='SET NULL'), nullable=True)
+    strategy_name = Column(String(100), nullable=False)
+
+    duplicate_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+    last_duplicate_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index('idx_signal_fingerprints_bands', 'lsh_bands', postgresql_using='gin'),
+        Index('idx_signal_fingerprints_created', 'created_at'),
+    )
+
+    def __repr__(self):
+        return f"<SignalFingerprint({self.strategy_name}, {self.timeframe}, dups={self.duplicate_count})>"
+
+
+# ==============================================================================
+# STRATEGY LIVE STATS
+# ==============================================================================
+
+class StrategyLiveStats(Base):
+    """
+    Running statistics of a strategy's closed live trades.
+
+    Updated in the transaction that closes a trade (TradeSync, executor
+    exits) by src.scorer.live_stats, so LiveScorer, RetirementPolicy and
+    the API read one row instead of the strategy's trade history. Trades
+    are folded in exit order; a row is rebuilt from the trades table when
+    missing or when a trade closes before last_exit_time.
+    """
+    __tablename__ = 'strategy_live_stats'
+
+    strategy_id = Column(UUID(as_uuid=True), ForeignKey('strategies.id', ondelete='CASCADE'), primary_key=True)
+
+    # Closed trades (all) and winners (pnl_usd > 0)
+    n_trades = Column(Integer, nullable=False, default=0)
+    n_wins = Column(Integer, nullable=False, default=0)
+
+    # Return moments, fraction of entry notional (expectancy, Sharpe)
+    n_returns = Column(Integer, nullable=False, default=0)
+    sum_return = Column(Float, nullable=False, default=0.0)
+    sum_sq_return = Column(Float, nullable=False, default=0.0)
+    n_win_returns = Column(Integer, nullable=False, default=0)
+    sum_win_return = Column(Float, nullable=False, default=0.0)
+    n_loss_returns = Column(Integer, nullable=False, default=0)
+    sum_loss_return = Column(Float, nullable=False, default=0.0)
+
+    # Cumulative pnl_usd curve
+    n_pnls = Column(Integer, nullable=False, default=0)
+    total_pnl = Column(Float, nullable=False, default=0.0)
+    peak_pnl = Column(Float, nullable=False, default=0.0)
+    max_drawdown = Column(Float, nullable=False, default=0.0)  # Fraction of peak cumulative PnL
+
+    loss_streak = Column(Integer, nullable=False, default=0)  # Current run of pnl_usd < 0
+
+    first_entry_time = Column(DateTime)
+    last_exit_time = Column(DateTime)
+    last_trade_id = Column(UUID(as_uuid=True))  # Last folded trade (a repeated close is skipped)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+
+    def __repr__(self):
+        return f"<StrategyLiveStats({self.strategy_id}, trades={self.n_trades}, pnl={self.total_pnl:.2f})>"
+
+
+# ==============================================================================
+# STRATEGY SUMMARIES (Dashboard read model)
+# ==============================================================================
+
+class StrategySummary(Base):
+    """
+    Denormalized per-strategy read model for the dashboard API.
+
+    Maintained by PostgreSQL triggers (migration 023): identity, status,
+    scores and live metrics are copied on every insert/update of strategies
+    (status changes come from many processes, some as bulk UPDATEs), and
+    the best in-sample and out-of-sample backtest (highest sharpe_ratio)
+    is recomputed when backtest_results rows of the strategy change.
+    Read-only from Python.
+
+    List and ranking endpoints page over it by keyset on the covering
+    indexes below (src.database.strategy_summary).
+    """
+    __tablename__ = 'strategy_summaries'
+
+    strategy_id = Column(UUID(as_uuid=True), ForeignKey('strategies.id', ondelete='CASCADE'), primary_key=True)
+
+    # Copied from strategies
+    name = Column(String(255), nullable=False)
+    strategy_type = Column(String(50), nullable=False)
+    timeframe = Column(String(10), nullable=False)
+    status = Column(String(20), nullable=False)
+    created_at = Column(DateTime, nullable=False)
+    score_backtest = Column(Float)
+    score_live = Column(Float)
+    sharpe_live = Column(Float)
+    win_rate_live = Column(Float)
+    total_trades_live = Column(Integer)
+    total_pnl_live = Column(Float)
+    last_live_update = Column(DateTime)
+
+    # Best in_sample backtest result
+    is_result_id = Column(UUID(as_uuid=True))
+    is_sharpe = Column(Float)
+    is_win_rate = Column(Float)
+    is_expectancy = Column(Float)
+    is_max_drawdown = Column(Float)
+    is_total_trades = Column(Integer)
+    is_total_return = Column(Float)
+
+    # Best out_of_sample backtest result
+    oos_result_id = Column(UUID(as_uuid=True))
+    oos_sharpe = Column(Float)
+    oos_win_rate = Column(Float)
+    oos_expectancy = Column(Float)
+    oos_max_drawdown = Column(Float)
+    oos_total_trades = Column(Integer)
+    oos_total_return = Column(Float)
+
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
+
+    # Keyset indexes; INCLUDE columns make the list/ranking pages index-only
+    __table_args__ = (
+        Index(
+            'idx_summary_created', 'created_at', 'strategy_id',
+            postgresql_include=['name', 'strategy_type', 'timeframe', 'status',
+                                'is_sharpe', 'is_win_rate', 'is_total_trades', 'total_pnl_live'],
+        ),
+        Index(
+            'idx_summary_status_created', 'status', 'created_at', 'strategy_id',
+            postgresql_include=['name', 'strategy_type', 'timeframe',
+                                'is_sharpe', 'is_win_rate', 'is_total_trades', 'total_pnl_live'],
+        ),
+        Index(
+            'idx_summary_status_score_backtest', 'status', 'score_backtest', 'strategy_id',
+            postgresql_include=['name', 'strategy_type', 'timeframe', 'is_sharpe', 'is_win_rate',
+                                'is_expectancy', 'is_max_drawdown', 'is_total_trades'],
+            postgresql_where=score_backtest.isnot(None),
+        ),
+        Index(
+            'idx_summary_status_score_live', 'status', 'score_live', 'strategy_id',
+            postgresql_include=['name', 'strategy_type', 'timeframe', 'sharpe_live', 'win_rate_live',
+                                'total_trades_live', 'total_pnl_live', 'last_live_update'],
+            postgresql_where=score_live.isnot(None),
+        ),
+    )
+
+    def __repr__(self):
+        return f"<StrategySummary({self.name}, status={self.status}, score={self.score_backtest})>"
+
+
 # ==============================================================================
 # MARKET REGIME (Unger Method)
 # ==============================================================================
@@ -15,13 +15,18 @@ Pattern:
             processor.release_strategy(strategy.id, "VALIDATED")
         except Exception as e:
             processor.mark_failed(strategy.id, str(e))
+
+Long-running workers claim in batches (claim_batch) through a local
+ClaimQueue, and release stale claims periodically (release_stale_claims_if_due)
+instead of on every claim.
 """
 
 import os
 import socket
+import time
 from datetime import datetime, timedelta, UTC
-from typing import Optional
-from sqlalchemy import text
+from typing import Iterable, List, Optional
+from sqlalchemy import select, text, update
 from sqlalchemy.orm import Session
 
 from src.database.connection import get_session, get_session_factory
@@ -34,6 +39,9 @@ logger = get_logger(__name__)
 # Must be longer than max expected processing time (6 TFs x ~60s each + overhead)
 DEFAULT_PROCESSING_TIMEOUT_SECONDS = 900
 
+# Default interval between stale claim releases (release_stale_claims_if_due)
+DEFAULT_STALE_RELEASE_INTERVAL_SECONDS = 60
+
 
 class StrategyProcessor:
     """
@@ -43,16 +51,25 @@ class StrategyProcessor:
     Each process instance should create its own StrategyProcessor with a unique process_id.
     """
 
-    def __init__(self, process_id: Optional[str] = None, timeout_seconds: int = DEFAULT_PROCESSING_TIMEOUT_SECONDS):
+    def __init__(
+        self,
+        process_id: Optional[str] = None,
+        timeout_seconds: int = DEFAULT_PROCESSING_TIMEOUT_SECONDS,
+        stale_release_interval: float = DEFAULT_STALE_RELEASE_INTERVAL_SECONDS
+    ):
         """
         Initialize StrategyProcessor.
 
         Args:
             process_id: Unique identifier for this process (auto-generated if None)
             timeout_seconds: Seconds before a processing claim is considered stale
+            stale_release_interval: Seconds between stale claim releases
+                (release_stale_claims_if_due)
         """
         self.process_id = process_id or self._generate_process_id()
         self.timeout_seconds = timeout_seconds
+        self.stale_release_interval = stale_release_interval
+        self._last_stale_release: Optional[float] = None
         self._session_factory = get_session_factory()
 
         logger.info(f"StrategyProcessor initialized: {self.process_id}")
@@ -71,55 +88,163 @@ class StrategyProcessor:
         """
         Atomically claim a strategy with the given status for processing.
 
-        Uses FOR UPDATE SKIP LOCKED to prevent race conditions:
+        Single-row claim_batch: stale claims are not released here, call
+        release_stale_claims_if_due periodically.
+
+        Args:
+            status: Strategy status to claim (e.g., "GENERATED", "VALIDATED")
+
+        Returns:
+            Strategy object if one was claimed, None if no strategies available
+        """
+        strategies = self.claim_batch(status, 1)
+        return strategies[0] if strategies else None
+
+    def claim_batch(self, status: str, n: int) -> List[Strategy]:
+        """
+        Atomically claim up to n strategies with the given status.
+
+        One UPDATE ... RETURNING statement; the inner SELECT uses
+        FOR UPDATE SKIP LOCKED to prevent race conditions:
         - Only one process can claim a specific strategy
         - Other processes skip locked rows and get different strategies
 
         Args:
             status: Strategy status to claim (e.g., "GENERATED", "VALIDATED")
+            n: Maximum number of strategies to claim
 
         Returns:
-            Strategy object if one was claimed, None if no strategies available
+            Claimed strategies (detached) ordered by created_at, empty if none available
         """
+        if n <= 0:
+            return []
+
         session = self._get_session()
 
         try:
-            # First, release any stale claims (timed out)
-            self._release_stale_claims(session)
-
-            # Atomic claim using FOR UPDATE SKIP LOCKED
-            # This query:
-            # 1. Finds strategies with matching status AND no current processor
-            # 2. Orders by created_at for deterministic processing order
-            # 3. Locks the first available row (skipping already-locked rows)
-            # 4. Returns the locked row for update
-            strategy = (
-                session.query(Strategy)
-                .filter(
+            # Oldest unclaimed rows first (deterministic order), skipping rows
+            # locked by concurrent claimers
+            candidates = (
+                select(Strategy.id)
+                .where(
                     Strategy.status == status,
                     Strategy.processing_by.is_(None)
                 )
-                .order_by(Strategy.created_at, Strategy.id)  # Deterministic order
+                .order_by(Strategy.created_at, Strategy.id)
+                .limit(n)
                 .with_for_update(skip_locked=True)
-                .first()
             )
+            stmt = (
+                update(Strategy)
+                .where(Strategy.id.in_(candidates))
+                .values(
+                    processing_by=self.process_id,
+                    processing_started_at=datetime.now(UTC)
+                )
+                .returning(Strategy)
+                .execution_options(synchronize_session=False)
+            )
+            strategies = list(session.scalars(stmt).all())
 
-            if strategy is None:
-                session.rollback()
-                return None
+            # Detach before commit so returned rows stay loaded after close
+            for strategy in strategies:
+                session.expunge(strategy)
+            session.commit()
+
+            # RETURNING order is not guaranteed
+            strategies.sort(key=lambda s: (s.created_at, str(s.id)))
+
+            if strategies:
+                logger.debug(f"Claimed {len(strategies)} strategies (status={status})")
+            return strategies
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to claim strategies: {e}")
+            raise
+        finally:
+            session.close()
+
+    def release_claims(self, strategy_ids: Iterable) -> int:
+        """
+        Give back claimed strategies without changing their status.
+
+        Used for prefetched claims that were never processed. Only claims
+        owned by this process are released.
+
+        Args:
+            strategy_ids: Strategy IDs (UUID)
+
+        Returns:
+            Number of claims released
+        """
+        strategy_ids = list(strategy_ids)
+        if not strategy_ids:
+            return 0
+
+        session = self._get_session()
 
-            # Update the strategy to mark it as being processed
-            strategy.processing_by = self.process_id
-            strategy.processing_started_at = datetime.now(UTC)
+        try:
+            result = (
+                session.query(Strategy)
+                .filter(
+                    Strategy.id.in_(strategy_ids),
+                    Strategy.processing_by == self.process_id
+                )
+                .update({
+                    Strategy.processing_by: None,
+                    Strategy.processing_started_at: None
+                }, synchronize_session=False)
+            )
 
             session.commit()
 
-            logger.debug(f"Claimed strategy {strategy.name} (status={status})")
-            return strategy
+            if result > 0:
+                logger.info(f"Released {result} unused claims")
+
+            return result
 
         except Exception as e:
             session.rollback()
-            logger.error(f"Failed to claim strategy: {e}")
+            logger.error(f"Failed to release claims: {e}")
+            raise
+        finally:
+            session.close()
+
+    def touch_claim(self, strategy_id) -> bool:
+        """
+        Restart the stale-claim timeout of a claim owned by this process.
+
+        Prefetched claims are stamped when claimed; ClaimQueue touches them
+        when handed out so time spent waiting locally does not count
+        towards timeout_seconds.
+
+        Args:
+            strategy_id: Strategy ID (UUID)
+
+        Returns:
+            True if the claim is still owned by this process
+        """
+        session = self._get_session()
+
+        try:
+            result = (
+                session.query(Strategy)
+                .filter(
+                    Strategy.id == strategy_id,
+                    Strategy.processing_by == self.process_id
+                )
+                .update({
+                    Strategy.processing_started_at: datetime.now(UTC)
+                }, synchronize_session=False)
+            )
+
+            session.commit()
+            return result > 0
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to touch claim on {strategy_id}: {e}")
             raise
         finally:
             session.close()
@@ -255,6 +380,45 @@ class StrategyProcessor:
         finally:
             session.close()
 
+    def release_stale_claims(self) -> int:
+        """
+        Release strategies that have been processing for too long (timeout).
+
+        Returns:
+            Number of stale claims released
+        """
+        session = self._get_session()
+
+        try:
+            result = self._release_stale_claims(session)
+            session.commit()
+            self._last_stale_release = time.monotonic()
+            return result
+
+        except Exception as e:
+            session.rollback()
+            logger.error(f"Failed to release stale claims: {e}")
+            raise
+        finally:
+            session.close()
+
+    def release_stale_claims_if_due(self) -> int:
+        """
+        Release stale claims if stale_release_interval has elapsed.
+
+        Called from the worker loops (cheap when not due).
+
+        Returns:
+            Number of stale claims released (0 if not due)
+        """
+        now = time.monotonic()
+        if (
+            self._last_stale_release is not None
+            and now - self._last_stale_release < self.stale_release_interval
+        ):
+            return 0
+        return self.release_stale_claims()
+
     def _release_stale_claims(self, session: Session) -> int:
         """
         Release strategies that have been processing for too long (timeout).
@@ -0,0 +1,106 @@
+"""
+Keyset Pagination over Strategy Summaries
+
+The dashboard lists and rankings read StrategySummary (kept in sync by
+triggers, see migration 023) ordered by (sort column DESC, strategy_id
+DESC). A page continues strictly after the last row of the previous one,
+so every page is an index range scan on the covering indexes, whatever
+its depth; OFFSET would scan and discard all earlier rows.
+
+Cursors are opaque URL-safe strings encoding the (sort value, strategy_id)
+of the last row of a page.
+
+Usage:
+    with get_session() as session:
+        query = session.query(StrategySummary).filter(StrategySummary.status == 'ACTIVE')
+        rows, next_cursor = keyset_page(query, StrategySummary.created_at, cursor, limit=100)
+
+Select only columns of the matching index's key and INCLUDE list to keep
+the page an index-only scan.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import DateTime, tuple_
+from sqlalchemy.orm import Query
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+
+from src.database.models import StrategySummary
+
+
+def encode_cursor(value: Any, strategy_id: UUID) -> str:
+    """Cursor positioned after a row with this sort value and id"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps([value, str(strategy_id)], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, sort_column: InstrumentedAttribute) -> Tuple[Any, UUID]:
+    """
+    Parse a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: Malformed cursor
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        value, strategy_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if isinstance(sort_column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        else:
+            value = float(value)
+        return value, UUID(strategy_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def keyset_page(
+    query: Query,
+    sort_column: InstrumentedAttribute,
+    cursor: Optional[str],
+    limit: int,
+    offset: int = 0,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    One page of summaries ordered by (sort_column DESC, strategy_id DESC).
+
+    The sort column must be non-NULL on all rows of the query (created_at
+    is NOT NULL; the rankings filter scores IS NOT NULL, which also
+    selects their partial indexes).
+
+    Args:
+        query: Query over StrategySummary (entity or columns, including
+            sort_column and strategy_id) with filters applied
+        sort_column: StrategySummary column to order by
+        cursor: Cursor from the previous page, None for the first page
+        limit: Page size
+        offset: Rows to skip (legacy offset pagination, first page only)
+
+    Returns:
+        (rows, next_cursor) - next_cursor is None on the last page
+
+    Raises:
+        ValueError: Malformed cursor
+    """
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_column)
+        query = query.filter(tuple_(sort_column, StrategySummary.strategy_id) < tuple_(value, last_id))
+
+    rows = (
+        query
+        .order_by(sort_column.desc(), StrategySummary.strategy_id.desc())
+        .offset(offset or None)
+        .limit(limit + 1)
+        .all()
+    )
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), last.strategy_id)
@@ -2,10 +2,15 @@
 Executor Module - Live Trading Execution
 """
 
-from src.executor.hyperliquid_client import HyperliquidClient
-from src.executor.risk_manager import RiskManager
-from src.executor.position_tracker import PositionTracker
-from src.executor.trailing_service import TrailingService
+from src.utils.lazy_import import lazy_exports
+
+# Lazy: importing any src.executor submodule must not load ccxt / Hyperliquid SDK
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'HyperliquidClient': 'src.executor.hyperliquid_client',
+    'RiskManager': 'src.executor.risk_manager',
+    'PositionTracker': 'src.executor.position_tracker',
+    'TrailingService': 'src.executor.trailing_service',
+})
 
 __all__ = [
     'HyperliquidClient',
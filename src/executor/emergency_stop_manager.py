@@ -22,6 +22,8 @@ Rule #4b: WebSocket First
 """
 
 import logging
+import threading
+import time
 from datetime import datetime, UTC, timedelta
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
@@ -49,7 +51,10 @@ class EmergencyStopManager:
     """
     Centralized emergency stop logic with multi-scope support.
 
-    Thread-safe via database state. No in-memory caching of state.
+    Thread-safe via database state. No in-memory caching of state unless
+    enable_state_index() is called (executor hot path): can_trade() then
+    reads an in-memory index of active stops, updated on trigger/reset and
+    reconciled against the database periodically.
     Throttled checks to reduce database load.
     """
 
@@ -114,6 +119,12 @@ class EmergencyStopManager:
         # Client for force_close
         self.client = hyperliquid_client
 
+        # Optional in-memory index of active stops: {(scope, scope_id): (reason, cooldown_until)}
+        self._stop_index: Optional[Dict[Tuple[str, str], Tuple[Optional[str], Optional[datetime]]]] = None
+        self._stop_index_refresh_seconds = 60.0
+        self._stop_index_refreshed_at: Optional[float] = None
+        self._stop_index_lock = threading.Lock()
+
         logger.info(
             f"EmergencyStopManager initialized: "
             f"portfolio_dd={self.max_portfolio_drawdown:.0%}, "
@@ -177,15 +188,36 @@ class EmergencyStopManager:
         reasons = []
         max_cooldown = None
 
-        with get_session() as session:
-            # Check all relevant stops
-            checks = [
-                (self.SCOPE_PORTFOLIO, "global"),
-                (self.SCOPE_SYSTEM, "data_feed"),
-                (self.SCOPE_SUBACCOUNT, str(subaccount_id)),
-                (self.SCOPE_STRATEGY, str(strategy_id)),
-            ]
+        # Check all relevant stops
+        checks = [
+            (self.SCOPE_PORTFOLIO, "global"),
+            (self.SCOPE_SYSTEM, "data_feed"),
+            (self.SCOPE_SUBACCOUNT, str(subaccount_id)),
+            (self.SCOPE_STRATEGY, str(strategy_id)),
+        ]
+
+        if self._stop_index is not None:
+            self._refresh_state_index_if_stale()
+            with self._stop_index_lock:
+                for scope, scope_id in checks:
+                    stop = self._stop_index.get((scope, scope_id))
+                    if stop is None:
+                        continue
+                    reason, cooldown_until = stop
+                    blocked_by.append(f"{scope}_{scope_id}")
+                    reasons.append(reason or "Unknown reason")
+                    if cooldown_until:
+                        if max_cooldown is None or cooldown_until > max_cooldown:
+                            max_cooldown = cooldown_until
+
+            return {
+                'allowed': len(blocked_by) == 0,
+                'blocked_by': blocked_by,
+                'reasons': reasons,
+                'cooldown_until': max_cooldown
+            }
 
+        with get_session() as session:
             for scope, scope_id in checks:
                 state = session.query(EmergencyStopState).filter(
                     EmergencyStopState.scope == scope,
@@ -206,6 +238,57 @@ class EmergencyStopManager:
             'cooldown_until': max_cooldown
         }
 
+    # =========================================================================
+    # IN-MEMORY STATE INDEX (executor hot path)
+    # =========================================================================
+
+    def enable_state_index(self, refresh_seconds: float = 60.0):
+        """
+        Answer can_trade() from an in-memory index of active stops.
+
+        The index is updated by trigger_stop() and the reset methods once
+        their session has committed, and reloaded from the database every
+        refresh_seconds (stops changed by other processes, e.g. the rotator,
+        are picked up within that interval).
+
+        Args:
+            refresh_seconds: Interval between database reconciliations
+        """
+        self._stop_index_refresh_seconds = refresh_seconds
+        self.refresh_state_index()
+
+    def refresh_state_index(self):
+        """Reload the in-memory stop index from the database."""
+        with get_session() as session:
+            stops = session.query(EmergencyStopState).filter(
+                EmergencyStopState.is_stopped == True
+            ).all()
+            index = {
+                (stop.scope, stop.scope_id): (stop.stop_reason, stop.cooldown_until)
+                for stop in stops
+            }
+
+        with self._stop_index_lock:
+            self._stop_index = index
+            self._stop_index_refreshed_at = time.monotonic()
+
+    def _refresh_state_index_if_stale(self):
+        """Reconcile the stop index with the database if it is too old."""
+        if time.monotonic() - self._stop_index_refreshed_at >= self._stop_index_refresh_seconds:
+            self.refresh_state_index()
+
+    def _index_stop(self, scope: str, scope_id: str, reason: Optional[str], cooldown_until: Optional[datetime]):
+        """Record an active stop in the index (no-op when the index is disabled)."""
+        if self._stop_index is not None:
+            with self._stop_index_lock:
+                self._stop_index[(scope, scope_id)] = (reason, cooldown_until)
+
+    def _unindex_stop(self, scope: str, scope_id: str):
+        """Remove a stop from the index (no-op when the index is disabled)."""
+        if self._stop_index is not None:
+            with self._stop_index_lock:
+                self._stop_index.pop((scope, scope_id), None)
+
     # =========================================================================
     # CONDITION CHECKING (throttled)
     # =========================================================================
@@ -602,6 +685,7 @@ class EmergencyStopManager:
 
             if state and state.is_stopped:
                 logger.debug(f"Emergency stop already active for {scope}:{scope_id}")
+                self._index_stop(scope, scope_id, state.stop_reason, state.cooldown_until)
                 return
 
             if state:
@@ -626,6 +710,8 @@ class EmergencyStopManager:
 
             session.commit()
 
+        self._index_stop(scope, scope_id, reason, cooldown_until)
+
         # Log critical event
         logger.critical(f"EMERGENCY STOP [{scope}:{scope_id}] {action}: {reason}")
 
@@ -751,6 +837,9 @@ class EmergencyStopManager:
 
             session.commit()
 
+        for reset in resets:
+            self._unindex_stop(reset['scope'], reset['scope_id'])
+
         return resets
 
     def _check_portfolio_dd_rotation_ready(self, session: Session) -> bool:
@@ -812,15 +901,19 @@ class EmergencyStopManager:
                 EmergencyStopState.is_stopped == True
             ).first()
 
-            if state:
-                self._reset_stop(
-                    self.SCOPE_SUBACCOUNT,
-                    str(subaccount_id),
-                    "New strategy deployed via rotation",
-                    session
-                )
-                session.commit()
-                logger.info(f"Reset subaccount {subaccount_id} stop after rotation")
+            if not state:
+                return
+
+            self._reset_stop(
+                self.SCOPE_SUBACCOUNT,
+                str(subaccount_id),
+                "New strategy deployed via rotation",
+                session
+            )
+            session.commit()
+
+        self._unindex_stop(self.SCOPE_SUBACCOUNT, str(subaccount_id))
+        logger.info(f"Reset subaccount {subaccount_id} stop after rotation")
 
     def reset_portfolio_dd_after_rotation(self):
         """
@@ -836,17 +929,19 @@ class EmergencyStopManager:
                 EmergencyStopState.is_stopped == True
             ).first()
 
-            if state and state.cooldown_until:
-                now = datetime.now(UTC)
-                if now >= state.cooldown_until:
-                    self._reset_stop(
-                        self.SCOPE_PORTFOLIO,
-                        "global",
-                        "Cooldown expired + losing strategies rotated",
-                        session
-                    )
-                    session.commit()
-                    logger.info("Reset portfolio DD stop after rotation")
+            if not state or not state.cooldown_until or datetime.now(UTC) < state.cooldown_until:
+                return
+
+            self._reset_stop(
+                self.SCOPE_PORTFOLIO,
+                "global",
+                "Cooldown expired + losing strategies rotated",
+                session
+            )
+            session.commit()
+
+        self._unindex_stop(self.SCOPE_PORTFOLIO, "global")
+        logger.info("Reset portfolio DD stop after rotation")
 
     def _reset_stop(self, scope: str, scope_id: str, reason: str, session: Session):
         """Reset a stop state."""
@@ -861,6 +956,8 @@ class EmergencyStopManager:
             state.stopped_at = None
             state.cooldown_until = None
 
+        # Callers unindex after the commit (a rollback keeps the stop active)
+
         logger.info(f"Auto-reset [{scope}:{scope_id}]: {reason}")
 
         # Re-activate subaccount if it was paused/stopped
@@ -981,15 +1078,19 @@ class EmergencyStopManager:
                 EmergencyStopState.is_stopped == True
             ).first()
 
-            if state:
-                self._reset_stop(
-                    self.SCOPE_SYSTEM,
-                    "data_feed",
-                    "Data feed restored",
-                    session
-                )
-                session.commit()
-                logger.info("Reset data stale stop - data feed restored")
+            if not state:
+                return
+
+            self._reset_stop(
+                self.SCOPE_SYSTEM,
+                "data_feed",
+                "Data feed restored",
+                session
+            )
+            session.commit()
+
+        self._unindex_stop(self.SCOPE_SYSTEM, "data_feed")
+        logger.info("Reset data stale stop - data feed restored")
 
     def check_portfolio_dd_rotation_ready(self) -> bool:
         """
@@ -0,0 +1,72 @@
+"""
+Executor Loop Duration Histogram
+
+Fixed-bucket histogram of executor loop durations, summarized in the
+heartbeat log (p50/p95/max since the previous heartbeat).
+
+A single last-loop duration hides the tail: with many LIVE subaccounts a
+few slow loops are what make signals fire late after candle close.
+"""
+
+import bisect
+from typing import List, Optional, Sequence
+
+# Upper bounds (seconds) of the histogram buckets; last bucket is open-ended
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 15.0, 30.0, 60.0)
+
+
+class LoopDurationHistogram:
+    """Bucketed loop durations with approximate percentiles"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            buckets: Sorted bucket upper bounds in seconds
+        """
+        self.buckets = tuple(buckets)
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all observations"""
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max: Optional[float] = None
+
+    def observe(self, seconds: float) -> None:
+        """Record one loop duration"""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = seconds if self.max is None else max(self.max, seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Approximate percentile: upper bound of the bucket holding it.
+
+        The open-ended last bucket reports the observed max.
+
+        Args:
+            pct: Percentile in [0, 100]
+
+        Returns:
+            Duration in seconds, or None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = max(1, int(round(pct / 100.0 * self.count)))
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return min(self.buckets[i], self.max) if i < len(self.buckets) else self.max
+        return self.max
+
+    def summary(self) -> str:
+        """Short summary for log lines"""
+        if not self.count:
+            return "no loops"
+        return (
+            f"p50={self.percentile(50):.1f}s p95={self.percentile(95):.1f}s "
+            f"max={self.max:.1f}s n={self.count}"
+        )
@@ -3,19 +3,23 @@ Continuous Executor Process
 
 Executes trading signals on Hyperliquid for live strategies.
 Monitors candle closes and generates/executes signals.
+
+Scheduling (executor.scheduling):
+- candle_close: strategies are evaluated when the WebSocket reports a closed
+  candle for their timeframe and coin (housekeeping still runs every
+  check_interval_seconds)
+- poll: every strategy and coin is evaluated every check_interval_seconds
 """
 
 import asyncio
 import os
 import signal
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
 from typing import Dict, Optional, List
 from uuid import UUID
-import importlib.util
-import tempfile
-import sys
-from pathlib import Path
 
 from src.config import load_config
 from src.database import get_session, Strategy, Subaccount, Trade
@@ -26,9 +30,13 @@ from src.executor.emergency_stop_manager import EmergencyStopManager
 from src.executor.balance_sync import BalanceSyncService
 from src.executor.balance_reconciliation import BalanceReconciliationService
 from src.executor.statistics_service import StatisticsService
+from src.executor.loop_histogram import LoopDurationHistogram
+from src.executor.position_index import OpenPositionIndex
+from src.scorer.live_stats import record_closed_trade
 from src.data.hyperliquid_websocket import get_data_provider, HyperliquidDataProvider
 from src.data.coin_registry import get_registry, get_active_pairs, CoinNotFoundError
 from src.strategies.base import StrategyCore, Signal, StopLossType, ExitType
+from src.strategies.loader import StrategyLoader, get_strategy_loader
 from src.utils import get_logger, setup_logging
 
 # Initialize logging at module load
@@ -40,6 +48,9 @@ setup_logging(
 
 logger = get_logger(__name__)
 
+SIGNAL_EVALUATION_MODES = ('sequential', 'concurrent')
+SCHEDULING_MODES = ('candle_close', 'poll')
+
 
 class ContinuousExecutorProcess:
     """
@@ -106,10 +117,21 @@ class ContinuousExecutorProcess:
             statistics_service=self.statistics_service
         )
 
+        # In-memory open-position and emergency-state indexes (hot path without DB
+        # round trips), reconciled against the DB every refresh_seconds
+        index_refresh_seconds = self.config.get('executor.state_index.refresh_seconds', 60)
+        self.position_index = OpenPositionIndex(refresh_seconds=index_refresh_seconds)
+        self.emergency_manager.enable_state_index(refresh_seconds=index_refresh_seconds)
+
         # Load trading pairs (multi-coin support)
         self.trading_pairs = self._load_trading_pairs()
 
-        # Strategy cache
+        # Strategy cache (instances by strategy id; modules shared via StrategyLoader)
+        StrategyLoader.configure(
+            max_modules=self.config.get('strategy_loader.max_modules', 256),
+            cache_dir=self.config.get('strategy_loader.cache_dir', 'data/strategy_code'),
+            max_disk_files=self.config.get('strategy_loader.max_disk_files', 5000),
+        )
         self._strategy_cache: Dict[str, StrategyCore] = {}
         self._data_cache: Dict[str, any] = {}
         self._indicators_cache: Dict[str, any] = {}  # Cache for pre-calculated indicators
@@ -121,12 +143,51 @@ class ContinuousExecutorProcess:
         # Check interval - from config (NO hardcoding)
         self.check_interval_seconds = self.config.get_required('executor.check_interval_seconds')
 
+        # Signal evaluation mode:
+        # - sequential: one subaccount and one coin at a time (event loop thread)
+        # - concurrent: subaccounts in parallel, calculate_indicators/generate_signal
+        #   in a thread pool (bounded per subaccount), orders serialized per subaccount
+        self.signal_mode = self.config.get_required('executor.signal_evaluation.mode')
+        if self.signal_mode not in SIGNAL_EVALUATION_MODES:
+            raise ValueError(
+                f"executor.signal_evaluation.mode must be one of {SIGNAL_EVALUATION_MODES}, "
+                f"got {self.signal_mode!r}"
+            )
+        self.max_coins_per_subaccount = self.config.get_required(
+            'executor.signal_evaluation.max_coins_per_subaccount'
+        )
+        self._signal_pool: Optional[ThreadPoolExecutor] = None
+        if self.signal_mode == 'concurrent':
+            self._signal_pool = ThreadPoolExecutor(
+                max_workers=self.config.get_required('executor.signal_evaluation.workers'),
+                thread_name_prefix='signal-eval'
+            )
+        self._indicators_cache_lock = threading.Lock()
+        self._order_locks: Dict[int, asyncio.Lock] = {}
+
+        # Scheduling: evaluate on candle close events, or poll every check interval
+        self.scheduling = self.config.get_required('executor.scheduling')
+        if self.scheduling not in SCHEDULING_MODES:
+            raise ValueError(
+                f"executor.scheduling must be one of {SCHEDULING_MODES}, got {self.scheduling!r}"
+            )
+        self._candle_close_queue: Optional[asyncio.Queue] = None
+        self._candle_close_task: Optional[asyncio.Task] = None
+        # Active subaccounts as of the last main loop pass (read by _candle_close_worker)
+        self._active_subaccounts: List[Dict] = []
+
+        # Loop durations since the last heartbeat
+        self.loop_histogram = LoopDurationHistogram()
+        # Candle close -> signals evaluated latency (candle_close scheduling)
+        self.close_latency_histogram = LoopDurationHistogram()
+
         # Minimum notional for Hyperliquid orders
         self.min_notional = self.config.get_required('hyperliquid.min_notional')
 
         logger.info(
             f"ContinuousExecutorProcess initialized: dry_run={self.dry_run}, "
-            f"pairs={len(self.trading_pairs)}"
+            f"pairs={len(self.trading_pairs)}, signal_mode={self.signal_mode}, "
+            f"scheduling={self.scheduling}"
         )
 
     def _load_trading_pairs(self) -> List[str]:
@@ -255,6 +316,12 @@ class ContinuousExecutorProcess:
         # Start trailing service
         await self.trailing_service.start()
 
+        # Event-driven signal evaluation (candle close events from WebSocket)
+        if self.scheduling == 'candle_close':
+            self._candle_close_queue = asyncio.Queue()
+            self.data_provider.set_candle_close_callback(self._on_candle_close)
+            self._candle_close_task = asyncio.create_task(self._candle_close_worker())
+
         # Heartbeat tracking (log every 60s using WebSocket data)
         last_heartbeat = datetime.now(UTC)
         heartbeat_interval = 60  # seconds
@@ -280,6 +347,7 @@ class ContinuousExecutorProcess:
 
                 # Get active subaccounts with LIVE strategies
                 active_subaccounts = self._get_active_subaccounts()
+                self._active_subaccounts = active_subaccounts
 
                 if active_subaccounts:
                     # Update trailing stops with current prices
@@ -288,13 +356,22 @@ class ContinuousExecutorProcess:
                     # Check TIME_BASED exits
                     await self._check_time_based_exits(active_subaccounts)
 
-                    # Process each subaccount
-                    for subaccount in active_subaccounts:
-                        await self._process_subaccount(subaccount)
+                    # Process each subaccount (in parallel in concurrent mode)
+                    # candle_close scheduling: signals are evaluated by _candle_close_worker
+                    if self.scheduling == 'poll':
+                        if self._signal_pool is None:
+                            for subaccount in active_subaccounts:
+                                await self._process_subaccount(subaccount)
+                        else:
+                            await asyncio.gather(*(
+                                self._process_subaccount(subaccount)
+                                for subaccount in active_subaccounts
+                            ))
 
                 # Heartbeat log (every 60s) - ALWAYS runs (Rule #4b: WebSocket data)
                 now = datetime.now(UTC)
                 loop_duration = (now - loop_start).total_seconds()
+                self.loop_histogram.observe(loop_duration)
                 if (now - last_heartbeat).total_seconds() >= heartbeat_interval:
                     last_heartbeat = now
                     self._log_heartbeat(len(active_subaccounts), loop_duration)
@@ -312,6 +389,18 @@ class ContinuousExecutorProcess:
         # Stop trailing service
         await self.trailing_service.stop()
 
+        # Stop candle close worker
+        if self._candle_close_task is not None:
+            self._candle_close_task.cancel()
+            try:
+                await self._candle_close_task
+            except asyncio.CancelledError:
+                pass
+
+        # Stop signal evaluation pool
+        if self._signal_pool is not None:
+            self._signal_pool.shutdown(wait=False, cancel_futures=True)
+
         # Stop WebSocket data provider
         logger.info("Stopping WebSocket data provider...")
         await self.data_provider.stop()
@@ -481,6 +570,7 @@ class ContinuousExecutorProcess:
         - Account balance and positions from webData2
         - Price feed status from allMids
         - Data freshness from last update timestamp
+        - Loop duration histogram since the previous heartbeat
         """
         try:
             # Get WebSocket data (from account_state object)
@@ -517,8 +607,15 @@ class ContinuousExecutorProcess:
             logger.info(
                 f"[HEARTBEAT] {active_subaccounts_count} subs | "
                 f"${account_value:.2f} ({'+' if unrealized_pnl >= 0 else ''}{unrealized_pnl:.2f} uPnL) | "
-                f"{pos_summary} | {mid_prices_count} prices | WS:{freshness} | loop:{loop_duration:.1f}s"
+                f"{pos_summary} | {mid_prices_count} prices | WS:{freshness} | "
+                f"loop:{loop_duration:.1f}s ({self.loop_histogram.summary()})"
+                + (
+                    f" | close->eval: {self.close_latency_histogram.summary()}"
+                    if self.scheduling == 'candle_close' else ""
+                )
             )
+            self.loop_histogram.reset()
+            self.close_latency_histogram.reset()
 
         except Exception as e:
             logger.warning(f"[HEARTBEAT] Error getting WebSocket data: {e}")
@@ -551,7 +648,12 @@ class ContinuousExecutorProcess:
 
         return subaccounts
 
-    async def _process_subaccount(self, subaccount: Dict):
+    async def _process_subaccount(
+        self,
+        subaccount: Dict,
+        symbols: Optional[set] = None,
+        closed_at: Optional[datetime] = None
+    ):
         """
         Process a single subaccount - scan tradable coins for signals
 
@@ -562,84 +664,183 @@ class ContinuousExecutorProcess:
         This ensures we only trade pairs that:
         1. Were assigned by generator and validated in backtest
         2. Are currently liquid enough for live trading
+
+        Args:
+            subaccount: Subaccount info dict
+            symbols: Only scan these coins (candle close event), None = all tradable
+            closed_at: Timestamp of the closed candle to evaluate on (candle close event)
         """
         try:
-            strategy_id = subaccount['strategy_id']
-            strategy_name = subaccount['strategy_name']
-            timeframe = subaccount['timeframe']
-
-            # Check if trading is allowed (emergency stop check)
-            trade_status = self.emergency_manager.can_trade(
-                subaccount['id'],
-                UUID(strategy_id) if isinstance(strategy_id, str) else strategy_id
+            # Emergency stop check and strategy load hit the DB: keep them off the
+            # event loop (signal pool in concurrent mode, default executor otherwise)
+            prepared = await asyncio.get_running_loop().run_in_executor(
+                self._signal_pool, self._prepare_subaccount, subaccount
             )
-            if not trade_status['allowed']:
-                logger.warning(
-                    f"Trading blocked for subaccount {subaccount['id']}: "
-                    f"{trade_status['blocked_by']} - {trade_status['reasons']}"
-                )
+            if prepared is None:
                 return
+            strategy, trading_pairs = prepared
+            timeframe = subaccount['timeframe']
+
+            if symbols is not None:
+                trading_pairs = [symbol for symbol in trading_pairs if symbol in symbols]
+
+            # Scan tradable coins for signals
+            if self._signal_pool is None:
+                for symbol in trading_pairs:
+                    try:
+                        await self._process_coin(
+                            subaccount=subaccount,
+                            strategy=strategy,
+                            symbol=symbol,
+                            timeframe=timeframe,
+                            closed_at=closed_at
+                        )
+                    except Exception as e:
+                        logger.error(f"Error processing {symbol}: {e}")
+                        continue
+            else:
+                # Bounded concurrency per subaccount (shared thread pool)
+                semaphore = asyncio.Semaphore(self.max_coins_per_subaccount)
+
+                async def process_coin_bounded(symbol: str):
+                    async with semaphore:
+                        try:
+                            await self._process_coin(
+                                subaccount=subaccount,
+                                strategy=strategy,
+                                symbol=symbol,
+                                timeframe=timeframe,
+                                closed_at=closed_at
+                            )
+                        except Exception as e:
+                            logger.error(f"Error processing {symbol}: {e}")
 
-            # Get or load strategy instance
-            strategy = self._get_strategy(
-                strategy_id,
-                strategy_name,
-                subaccount['strategy_code']
+                await asyncio.gather(*(process_coin_bounded(symbol) for symbol in trading_pairs))
+
+        except Exception as e:
+            logger.error(
+                f"Error processing subaccount {subaccount['id']}: {e}",
+                exc_info=True
             )
 
-            if strategy is None:
-                logger.warning(f"Could not load strategy {strategy_name}")
-                return
+    def _on_candle_close(self, symbol: str, interval: str, closed_at) -> None:
+        """
+        Candle close callback from the data provider (runs on the event loop).
 
-            # Get tradable pairs for this strategy
-            # CoinRegistry handles liquidity validation (no fallback)
-            trading_coins = subaccount.get('trading_coins', [])
-            if not trading_coins:
-                logger.warning(f"Strategy {strategy_name} has no trading_coins - skipping")
-                return
+        Only queues the event: evaluation happens in _candle_close_worker.
+        """
+        self._candle_close_queue.put_nowait((symbol, interval, closed_at, time.perf_counter()))
+
+    async def _candle_close_worker(self) -> None:
+        """
+        Evaluate strategies as soon as a candle closes for their timeframe and coin.
+
+        Events that arrive together (all coins closing the same interval) are
+        drained as one batch: each subscribed subaccount is prepared once and
+        scans only the coins whose candle closed. Subaccounts are the list the
+        main loop refreshes every check interval (no DB query per batch).
+        """
+        while True:
+            events = [await self._candle_close_queue.get()]
+            while not self._candle_close_queue.empty():
+                events.append(self._candle_close_queue.get_nowait())
+
+            try:
+                # {(interval, closed_at): {symbols}}
+                closed: Dict[tuple, set] = {}
+                for symbol, interval, closed_at, _ in events:
+                    closed.setdefault((interval, closed_at), set()).add(symbol)
+
+                active_subaccounts = self._active_subaccounts
+                jobs = [
+                    self._process_subaccount(subaccount, symbols=symbols, closed_at=closed_at)
+                    for (interval, closed_at), symbols in closed.items()
+                    for subaccount in active_subaccounts
+                    if subaccount['timeframe'] == interval
+                    and symbols.intersection(subaccount['trading_coins'])
+                ]
+
+                if self._signal_pool is None:
+                    for job in jobs:
+                        await job
+                else:
+                    await asyncio.gather(*jobs)
+
+                now = time.perf_counter()
+                for _, _, _, received_at in events:
+                    self.close_latency_histogram.observe(now - received_at)
+
+            except Exception as e:
+                logger.error(f"Candle close evaluation error: {e}", exc_info=True)
+
+    def _prepare_subaccount(self, subaccount: Dict):
+        """
+        Emergency stop check, strategy instance and tradable pairs for a subaccount.
+
+        Blocking (DB reads): called from a worker thread, never on the event loop.
+
+        Returns:
+            (strategy, trading_pairs), or None if the subaccount can't trade now
+        """
+        strategy_id = subaccount['strategy_id']
+        strategy_name = subaccount['strategy_name']
 
-            trading_pairs = get_registry().get_tradable_for_strategy(
-                trading_coins=trading_coins
+        # Check if trading is allowed (emergency stop check)
+        trade_status = self.emergency_manager.can_trade(
+            subaccount['id'],
+            UUID(strategy_id) if isinstance(strategy_id, str) else strategy_id
+        )
+        if not trade_status['allowed']:
+            logger.warning(
+                f"Trading blocked for subaccount {subaccount['id']}: "
+                f"{trade_status['blocked_by']} - {trade_status['reasons']}"
             )
+            return None
 
-            if not trading_pairs:
-                logger.warning(
-                    f"Strategy {strategy_name}: no tradable pairs "
-                    f"(assigned={len(trading_coins)}, liquid=0)"
-                )
-                return
+        # Get or load strategy instance
+        strategy = self._get_strategy(
+            strategy_id,
+            strategy_name,
+            subaccount['strategy_code']
+        )
 
-            if len(trading_pairs) < 5:
-                logger.warning(
-                    f"Strategy {strategy_name} has only {len(trading_pairs)} tradable pairs "
-                    f"(assigned={len(trading_coins)})"
-                )
+        if strategy is None:
+            logger.warning(f"Could not load strategy {strategy_name}")
+            return None
 
-            # Scan tradable coins for signals
-            for symbol in trading_pairs:
-                try:
-                    await self._process_coin(
-                        subaccount=subaccount,
-                        strategy=strategy,
-                        symbol=symbol,
-                        timeframe=timeframe
-                    )
-                except Exception as e:
-                    logger.error(f"Error processing {symbol}: {e}")
-                    continue
+        # Get tradable pairs for this strategy
+        # CoinRegistry handles liquidity validation (no fallback)
+        trading_coins = subaccount.get('trading_coins', [])
+        if not trading_coins:
+            logger.warning(f"Strategy {strategy_name} has no trading_coins - skipping")
+            return None
 
-        except Exception as e:
-            logger.error(
-                f"Error processing subaccount {subaccount['id']}: {e}",
-                exc_info=True
+        trading_pairs = get_registry().get_tradable_for_strategy(
+            trading_coins=trading_coins
+        )
+
+        if not trading_pairs:
+            logger.warning(
+                f"Strategy {strategy_name}: no tradable pairs "
+                f"(assigned={len(trading_coins)}, liquid=0)"
+            )
+            return None
+
+        if len(trading_pairs) < 5:
+            logger.warning(
+                f"Strategy {strategy_name} has only {len(trading_pairs)} tradable pairs "
+                f"(assigned={len(trading_coins)})"
             )
 
+        return strategy, trading_pairs
+
     async def _process_coin(
         self,
         subaccount: Dict,
         strategy: StrategyCore,
         symbol: str,
-        timeframe: str
+        timeframe: str,
+        closed_at: Optional[datetime] = None
     ):
         """
         Process a single coin for a strategy using two-phase approach
@@ -657,39 +858,29 @@ class ContinuousExecutorProcess:
             strategy: Strategy instance
             symbol: Trading pair (e.g., 'BTC', 'ETH')
             timeframe: Candle timeframe
+            closed_at: Evaluate on candles up to this closed candle (drops the
+                forming one); None = latest data including the forming candle
         """
         # Get market data for this coin
         data = await self._get_market_data(symbol, timeframe)
 
+        if data is not None and closed_at is not None and len(data) and data.index[-1] > closed_at:
+            data = data.loc[:closed_at]
+
         if data is None or len(data) < 50:
             return
 
-        # PHASE 1: Calculate indicators (cached per strategy/symbol/timeframe)
-        # Cache key includes data length to invalidate when new data arrives
+        # PHASE 1 + 2: CPU-bound, runs in the signal pool in concurrent mode
         strategy_id = subaccount['strategy_id']
-        cache_key = f"{strategy_id}:{symbol}:{timeframe}:{len(data)}"
-
-        if cache_key in self._indicators_cache:
-            df_with_indicators = self._indicators_cache[cache_key]
+        if self._signal_pool is None:
+            df_with_indicators, signal = self._evaluate_signal(
+                strategy, strategy_id, data, symbol, timeframe
+            )
         else:
-            try:
-                df_with_indicators = strategy.calculate_indicators(data)
-                # Keep only last 10 entries to avoid memory bloat
-                if len(self._indicators_cache) > 100:
-                    # Remove oldest entries
-                    keys_to_remove = list(self._indicators_cache.keys())[:50]
-                    for k in keys_to_remove:
-                        del self._indicators_cache[k]
-                self._indicators_cache[cache_key] = df_with_indicators
-            except Exception as e:
-                logger.warning(f"calculate_indicators() failed for {symbol}: {e}")
-                df_with_indicators = data
-
-        # Check for open position
-        open_trade = self._get_open_trade(subaccount['id'], symbol)
-
-        # PHASE 2: Generate signal from pre-calculated indicators
-        signal = strategy.generate_signal(df_with_indicators, symbol)
+            df_with_indicators, signal = await asyncio.get_running_loop().run_in_executor(
+                self._signal_pool, self._evaluate_signal,
+                strategy, strategy_id, data, symbol, timeframe
+            )
 
         if signal is None:
             return
@@ -697,18 +888,73 @@ class ContinuousExecutorProcess:
         # Log signal generation (this means conditions were met!)
         logger.info(f"[SIGNAL] {symbol}/{timeframe}: {signal.direction} signal generated")
 
-        # CASE 1: Exit signal + open position -> close it
-        if signal.direction == 'close' and open_trade:
-            current_price = df_with_indicators['close'].iloc[-1]
-            await self._close_position(subaccount, open_trade, signal, current_price)
-            return
+        # Order placement is serialized per subaccount (position checks stay consistent)
+        async with self._order_locks.setdefault(subaccount['id'], asyncio.Lock()):
+            # Check for open position
+            open_trade = self._get_open_trade(subaccount['id'], symbol)
 
-        # CASE 2: Entry signal + no position -> open it
-        if signal.direction in ['long', 'short'] and not open_trade:
-            # Check max positions limit
-            if self._is_at_max_positions(subaccount['id']):
+            # CASE 1: Exit signal + open position -> close it
+            if signal.direction == 'close' and open_trade:
+                current_price = df_with_indicators['close'].iloc[-1]
+                await self._close_position(subaccount, open_trade, signal, current_price)
                 return
-            await self._execute_signal(subaccount, signal, df_with_indicators, symbol)
+
+            # CASE 2: Entry signal + no position -> open it
+            if signal.direction in ['long', 'short'] and not open_trade:
+                # Check max positions limit
+                if self._is_at_max_positions(subaccount['id']):
+                    return
+                await self._execute_signal(subaccount, signal, df_with_indicators, symbol)
+
+    def _evaluate_signal(
+        self,
+        strategy: StrategyCore,
+        strategy_id: str,
+        data,
+        symbol: str,
+        timeframe: str
+    ):
+        """
+        Calculate indicators (cached) and generate the signal for one coin.
+
+        Thread-safe: called from the signal pool in concurrent mode.
+
+        Args:
+            strategy: Strategy instance
+            strategy_id: Strategy ID (indicator cache key)
+            data: Market data DataFrame
+            symbol: Trading pair (e.g., 'BTC', 'ETH')
+            timeframe: Candle timeframe
+
+        Returns:
+            (df_with_indicators, signal or None)
+        """
+        # PHASE 1: Calculate indicators (cached per strategy/symbol/timeframe)
+        # Cache key includes data length and last candle to invalidate when new data
+        # arrives (the live window has a fixed length once the buffer is full)
+        cache_key = f"{strategy_id}:{symbol}:{timeframe}:{len(data)}:{data.index[-1]}"
+
+        with self._indicators_cache_lock:
+            df_with_indicators = self._indicators_cache.get(cache_key)
+
+        if df_with_indicators is None:
+            try:
+                df_with_indicators = strategy.calculate_indicators(data)
+                with self._indicators_cache_lock:
+                    # Keep only last 10 entries to avoid memory bloat
+                    if len(self._indicators_cache) > 100:
+                        # Remove oldest entries
+                        keys_to_remove = list(self._indicators_cache.keys())[:50]
+                        for k in keys_to_remove:
+                            del self._indicators_cache[k]
+                    self._indicators_cache[cache_key] = df_with_indicators
+            except Exception as e:
+                logger.warning(f"calculate_indicators() failed for {symbol}: {e}")
+                df_with_indicators = data
+
+        # PHASE 2: Generate signal from pre-calculated indicators
+        signal = strategy.generate_signal(df_with_indicators, symbol)
+        return df_with_indicators, signal
 
     def _get_open_trade(self, subaccount_id: int, symbol: str) -> Optional[Dict]:
         """
@@ -721,25 +967,7 @@ class ContinuousExecutorProcess:
         Returns:
             Dict with trade info or None if no open position
         """
-        with get_session() as session:
-            trade = (
-                session.query(Trade)
-                .filter(
-                    Trade.subaccount_id == subaccount_id,
-                    Trade.symbol == symbol,
-                    Trade.exit_time.is_(None)  # Open position = no exit time
-                )
-                .first()
-            )
-            if trade:
-                return {
-                    'id': str(trade.id),
-                    'symbol': trade.symbol,
-                    'direction': trade.direction,
-                    'entry_price': trade.entry_price,
-                    'entry_size': trade.entry_size,
-                }
-            return None
+        return self.position_index.get(subaccount_id, symbol)
 
     def _has_open_position(self, subaccount_id: int, symbol: str) -> bool:
         """Check if subaccount has an open position for this symbol"""
@@ -748,17 +976,7 @@ class ContinuousExecutorProcess:
     def _is_at_max_positions(self, subaccount_id: int) -> bool:
         """Check if subaccount has reached max position limit"""
         max_positions = self.risk_manager.max_positions_per_subaccount
-
-        with get_session() as session:
-            open_count = (
-                session.query(Trade)
-                .filter(
-                    Trade.subaccount_id == subaccount_id,
-                    Trade.exit_time.is_(None)  # Open position = no exit time
-                )
-                .count()
-            )
-            return open_count >= max_positions
+        return self.position_index.count(subaccount_id) >= max_positions
 
     def _get_coin_max_leverage(self, symbol: str) -> int:
         """
@@ -800,34 +1018,17 @@ class ContinuousExecutorProcess:
 
             class_name = match.group(1)
 
-            # Load strategy
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-                f.write(code)
-                temp_path = f.name
-
-            spec = importlib.util.spec_from_file_location(
-                f"live_{class_name}",
-                temp_path
-            )
-
-            if spec and spec.loader:
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[spec.name] = module
-                spec.loader.exec_module(module)
+            cls = get_strategy_loader().load_class(code, class_name)
+            if cls is None:
+                return None
 
-                if hasattr(module, class_name):
-                    cls = getattr(module, class_name)
-                    instance = cls()
-                    self._strategy_cache[strategy_id] = instance
-                    return instance
-
-            return None
+            instance = cls()
+            self._strategy_cache[strategy_id] = instance
+            return instance
 
         except Exception as e:
             logger.error(f"Failed to load strategy {strategy_name}: {e}")
             return None
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
 
     async def _get_market_data(self, symbol: str, timeframe: str):
         """
@@ -1050,6 +1251,16 @@ class ContinuousExecutorProcess:
                 signal_reason=signal.reason
             )
             session.add(trade)
+            session.flush()  # Assigns trade.id
+            trade_info = {
+                'id': str(trade.id),
+                'symbol': trade.symbol,
+                'direction': trade.direction,
+                'entry_price': trade.entry_price,
+                'entry_size': trade.entry_size,
+            }
+
+        self.position_index.add(subaccount['id'], trade_info)
 
     async def _close_position(
         self,
@@ -1082,6 +1293,13 @@ class ContinuousExecutorProcess:
             )
             return
 
+        # The index may lag TradeSync: don't close on the exchange a trade its
+        # SL/TP already closed (_record_exit then only cleans up local tracking)
+        if not self.position_index.confirm_open(open_trade['id']):
+            logger.info(f"Position {symbol} for subaccount {subaccount['id']} already closed, skipping")
+            self._record_exit(open_trade, current_price, exit_reason)
+            return
+
         # Close on exchange
         success = self.client.close_position(subaccount['id'], symbol, reason=exit_reason)
 
@@ -1104,8 +1322,10 @@ class ContinuousExecutorProcess:
             exit_reason: Reason for exit
         """
         with get_session() as session:
+            # The position index may lag: TradeSync can have closed it already
             trade = session.query(Trade).filter(
-                Trade.id == open_trade['id']
+                Trade.id == open_trade['id'],
+                Trade.exit_time.is_(None)
             ).first()
 
             if trade:
@@ -1119,8 +1339,9 @@ class ContinuousExecutorProcess:
                 else:
                     pnl_pct = (trade.entry_price - exit_price) / trade.entry_price
 
-                trade.pnl_pct = pnl_pct
+                trade.pnl_pct = pnl_pct * 100  # Stored in percent, as TradeSync does
                 trade.pnl_usd = pnl_pct * trade.entry_price * trade.entry_size
+                record_closed_trade(session, trade)
 
                 logger.info(
                     f"Trade closed: {trade.symbol} PnL={trade.pnl_usd:.2f} USD "
@@ -1141,6 +1362,8 @@ class ContinuousExecutorProcess:
                     except Exception as e:
                         logger.warning(f"Failed to update emergency balance tracking: {e}")
 
+        self.position_index.remove(open_trade['id'])
+
         # Clean up time exit tracking
         key = f"{open_trade['symbol']}:{open_trade.get('subaccount_id', 0)}"
         self._time_exit_tracking.pop(key, None)
@@ -0,0 +1,127 @@
+"""
+Open Position Index - In-memory view of open trades for the executor
+
+The executor checks "open trade for (subaccount, coin)?" and "subaccount at
+max positions?" for every coin it evaluates. This index answers both in
+O(1) without a database round trip:
+
+- Updated on the executor's own writes (_record_trade, _record_exit)
+- Reconciled against the database every refresh_seconds, which picks up
+  trades opened/closed by other components (trade sync, force close, ...)
+- confirm_open() checks one trade against the database before acting on it
+  on the exchange (TradeSync may have recorded an SL/TP close since)
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from src.database import get_session, Trade
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class OpenPositionIndex:
+    """
+    Open trades by subaccount and symbol.
+
+    Trade records are dicts with id, symbol, direction, entry_price,
+    entry_size (same shape the executor used to read from the database).
+    """
+
+    def __init__(self, refresh_seconds: float = 60.0):
+        """
+        Args:
+            refresh_seconds: Interval between database reconciliations
+        """
+        self.refresh_seconds = refresh_seconds
+        self._lock = threading.Lock()
+        # {subaccount_id: {symbol: [trade, ...]}}
+        self._trades: Dict[int, Dict[str, List[Dict]]] = {}
+        self._refreshed_at: Optional[float] = None
+
+    def refresh(self) -> None:
+        """Rebuild the index from open trades in the database"""
+        trades: Dict[int, Dict[str, List[Dict]]] = {}
+
+        with get_session() as session:
+            open_trades = (
+                session.query(Trade)
+                .filter(Trade.exit_time.is_(None))  # Open position = no exit time
+                .all()
+            )
+            for trade in open_trades:
+                # Keep every open trade: count() must match COUNT(*) on Trade
+                trades.setdefault(trade.subaccount_id, {}).setdefault(trade.symbol, []).append({
+                    'id': str(trade.id),
+                    'symbol': trade.symbol,
+                    'direction': trade.direction,
+                    'entry_price': trade.entry_price,
+                    'entry_size': trade.entry_size,
+                })
+
+        with self._lock:
+            self._trades = trades
+            self._refreshed_at = time.monotonic()
+
+        logger.debug(
+            f"Open position index refreshed: "
+            f"{sum(len(t) for s in trades.values() for t in s.values())} open trades"
+        )
+
+    def refresh_if_stale(self) -> None:
+        """Reconcile with the database if the last refresh is too old"""
+        if self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.refresh_seconds:
+            self.refresh()
+
+    def get(self, subaccount_id: int, symbol: str) -> Optional[Dict]:
+        """Open trade for this subaccount and symbol (a copy), or None"""
+        self.refresh_if_stale()
+        with self._lock:
+            trades = self._trades.get(subaccount_id, {}).get(symbol)
+            # First open trade, like .first() on the query it replaces
+            return dict(trades[0]) if trades else None
+
+    def count(self, subaccount_id: int) -> int:
+        """Number of open trades for a subaccount"""
+        self.refresh_if_stale()
+        with self._lock:
+            return sum(len(t) for t in self._trades.get(subaccount_id, {}).values())
+
+    def confirm_open(self, trade_id: str) -> bool:
+        """
+        Check in the database that a trade is still open.
+
+        A trade closed by another component (e.g. TradeSync recording an
+        exchange-side SL/TP) is dropped from the index.
+
+        Returns:
+            True if the trade exists and has no exit time
+        """
+        with get_session() as session:
+            is_open = session.query(Trade.id).filter(
+                Trade.id == trade_id,
+                Trade.exit_time.is_(None)
+            ).first() is not None
+
+        if not is_open:
+            self.remove(trade_id)
+        return is_open
+
+    def add(self, subaccount_id: int, trade: Dict) -> None:
+        """Register a trade the executor just opened"""
+        with self._lock:
+            self._trades.setdefault(subaccount_id, {}).setdefault(trade['symbol'], []).append(dict(trade))
+
+    def remove(self, trade_id: str) -> None:
+        """Forget a trade the executor just closed"""
+        with self._lock:
+            for by_symbol in self._trades.values():
+                for symbol, trades in by_symbol.items():
+                    for i, trade in enumerate(trades):
+                        if trade['id'] == trade_id:
+                            del trades[i]
+                            if not trades:
+                                del by_symbol[symbol]
+                            return
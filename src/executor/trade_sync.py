@@ -5,7 +5,7 @@ When positions are closed on Hyperliquid, this module:
 1. Detects closed positions (by comparing with previous iteration)
 2. Fetches fills from Hyperliquid API
 3. Reconstructs complete trade records
-4. Updates Trade table with exit data
+4. Updates Trade table with exit data (and the strategy's running live stats)
 
 This enables the Dual-Ranking system to calculate live performance metrics.
 
@@ -23,6 +23,7 @@ from uuid import UUID
 from src.config.loader import load_config
 from src.database import get_session
 from src.database.models import Trade, Strategy
+from src.scorer.live_stats import record_closed_trade
 from src.data.hyperliquid_websocket import (
     HyperliquidDataProvider,
     UserPosition,
@@ -326,6 +327,9 @@ class TradeSync:
                     if trade.entry_price and trade.entry_size:
                         trade.pnl_pct = trade_data['net_pnl'] / (trade.entry_price * trade.entry_size) * 100
 
+                    # Running live stats commit with the trade
+                    record_closed_trade(session, trade)
+
                     logger.info(
                         f"Synced trade: {trade_data['symbol']} {trade_data['side']} "
                         f"PnL=${trade_data['net_pnl']:.2f} "
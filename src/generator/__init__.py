@@ -4,8 +4,13 @@ SixBTC Strategy Generator
 AI-powered strategy generation using multiple providers and pattern discovery.
 """
 
-from src.generator.ai_manager import AIManager
-from src.generator.pattern_fetcher import PatternFetcher
-from src.generator.strategy_builder import StrategyBuilder
+from src.utils.lazy_import import lazy_exports
+
+# Lazy: importing any src.generator submodule must not load the AI clients and templates
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'AIManager': 'src.generator.ai_manager',
+    'PatternFetcher': 'src.generator.pattern_fetcher',
+    'StrategyBuilder': 'src.generator.strategy_builder',
+})
 
 __all__ = ['AIManager', 'PatternFetcher', 'StrategyBuilder']
@@ -1107,6 +1107,11 @@ class ContinuousGeneratorProcess:
         if self.executor:
             self.executor.shutdown(wait=False)
 
+        from src.database.event_tracker import EventTracker
+
+        # Write queued pipeline events before exiting (os._exit skips atexit)
+        EventTracker.flush(timeout=5.0)
+
         os._exit(0)
 
     def run(self):
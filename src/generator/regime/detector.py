@@ -393,16 +393,16 @@ class RegimeDetector:
         Returns:
             RegimeResult
         """
-        from pathlib import Path
+        from src.data.ohlcv_store import OHLCVStore
 
-        file_path = Path(self.data_dir) / f"{symbol}_{timeframe}.parquet"
+        store = OHLCVStore(self.data_dir)
 
-        if not file_path.exists():
-            logger.warning(f"{symbol}: No {timeframe} data file found at {file_path}")
+        if not store.exists(symbol, timeframe):
+            logger.warning(f"{symbol}: No {timeframe} data found in {self.data_dir}")
             return self._empty_result(symbol)
 
         try:
-            df = pd.read_parquet(file_path)
+            df = store.read(symbol, timeframe)
             return self.detect(df, symbol)
         except Exception as e:
             logger.error(f"{symbol}: Failed to read data file: {e}")
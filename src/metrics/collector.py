@@ -31,6 +31,7 @@ from sqlalchemy import select, func, and_, or_, desc, cast, Integer, text
 from src.config import load_config
 from src.database import get_session, PipelineMetricsSnapshot, Strategy
 from src.database.models import StrategyEvent, BacktestResult, ScheduledTaskExecution, Subaccount
+from src.metrics.rollups import EventRollups, RollupTotals
 from src.utils import setup_logging, get_logger
 
 # TYPE_CHECKING imports to avoid circular dependencies
@@ -40,6 +41,21 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Stats keys -> event_data fields rolled up for is_failed / oos_failed events
+IS_METRIC_FIELDS = {
+    'sharpe': 'is_sharpe',
+    'wr': 'is_win_rate',
+    'exp': 'is_expectancy',
+    'trades': 'is_trades',
+}
+OOS_METRIC_FIELDS = {
+    'sharpe': 'oos_sharpe',
+    'wr': 'oos_win_rate',
+    'exp': 'oos_expectancy',
+    'trades': 'oos_trades',
+    'dd': 'oos_max_drawdown',
+}
+
 
 class MetricsCollector:
     """
@@ -75,6 +91,13 @@ class MetricsCollector:
         metrics_config = self.config.get('metrics', {})
         self.interval_seconds = metrics_config.get('collection_interval', 60)
 
+        # Per-minute event rollups (24h counts without scanning strategy_events)
+        rollups_config = metrics_config.get('rollups', {})
+        self.rollups = EventRollups(
+            grace_minutes=rollups_config.get('grace_minutes', 5),
+            retention_hours=rollups_config.get('retention_hours', 168),
+        )
+
         # Queue limits from pipeline config
         pipeline_config = self.config.get('pipeline', {})
         queue_limits = pipeline_config.get('queue_limits', {})
@@ -120,37 +143,42 @@ class MetricsCollector:
     def collect_snapshot(self) -> None:
         """Collect current pipeline metrics and save to database."""
         try:
+            self._refresh_rollups()
+
             with get_session() as session:
                 # Time windows
                 now = datetime.now(UTC)
                 window_1min = now - timedelta(seconds=self.interval_seconds)
                 window_24h = now - timedelta(hours=24)
 
+                # 24h rollup sums shared by the event-based sections
+                totals = self.rollups.totals(session, window_24h)
+
                 # Collect all metrics
                 queue_depths = self._get_queue_depths(session)
-                generation_by_source = self._get_generation_by_source(session, window_24h)
-                generator_stats = self._get_generator_stats_24h(session, window_24h)
+                generation_by_source = self._get_generation_by_source(totals)
+                generator_stats = self._get_generator_stats_24h(totals)
                 ai_calls_today = self._get_ai_calls_today()
                 unused_patterns = self._get_unused_patterns(session)
-                funnel = self._get_funnel_24h(session, window_24h)
+                funnel = self._get_funnel_24h(session, window_24h, totals)
                 validation_by_source = self._get_validation_by_source_24h(session, window_24h)
                 pool_added_by_source = self._get_pool_added_by_source_24h(session, window_24h)
-                timing = self._get_timing_avg_24h(session, window_24h)
+                timing = self._get_timing_avg_24h(totals)
                 throughput = self._get_throughput_interval(session, window_1min)
-                failures = self._get_failures_24h(session, window_24h)
+                failures = self._get_failures_24h(totals)
                 backpressure = self._get_backpressure_status(session, queue_depths)
                 pool_stats = self._get_pool_stats(session)
                 pool_quality = self._get_pool_quality(session)
                 pool_by_source = self._get_pool_by_source(session)
                 pool_avg_score_by_source = self._get_pool_avg_score_by_source(session)
-                is_stats = self._get_is_stats_24h(session, window_24h)
-                oos_stats = self._get_oos_stats_24h(session, window_24h)
-                score_stats = self._get_score_stats_24h(session, window_24h)
+                is_stats = self._get_is_stats_24h(session, window_24h, totals)
+                oos_stats = self._get_oos_stats_24h(session, window_24h, totals)
+                score_stats = self._get_score_stats_24h(totals)
                 retest_stats = self._get_retest_stats_24h(session, window_24h)
                 robustness_stats = self._get_robustness_stats_24h(session, window_24h)
                 pool_robustness = self._get_pool_robustness_stats(session)
                 live_stats = self._get_live_rotation_stats(session, window_24h)
-                combo_stats = self._get_combo_stats_24h(session, window_24h)
+                combo_stats = self._get_combo_stats_24h(session, window_24h, totals)
                 scheduler_stats = self._get_scheduler_stats(session)
                 subaccount_stats = self._get_subaccount_stats(session)
 
@@ -197,6 +225,13 @@ class MetricsCollector:
         except Exception as e:
             logger.error(f"Failed to collect metrics snapshot: {e}", exc_info=True)
 
+    def _refresh_rollups(self) -> None:
+        """Fold new events into the per-minute rollups (failures are logged)"""
+        try:
+            self.rollups.refresh()
+        except Exception as e:
+            logger.warning(f"Failed to refresh event rollups: {e}")
+
     def _get_queue_depths(self, session) -> Dict[str, int]:
         """Get count of strategies by status."""
         result = session.execute(
@@ -206,7 +241,7 @@ class MetricsCollector:
 
         return {status: count for status, count in result}
 
-    def _get_generation_by_source(self, session, since: datetime) -> Dict[str, int]:
+    def _get_generation_by_source(self, totals: RollupTotals) -> Dict[str, int]:
         """
         Get generation counts by source type (pattern, ai_free, ai_assigned).
 
@@ -214,38 +249,15 @@ class MetricsCollector:
         - pattern_based=true → 'pattern'
         - pattern_based=false with ai_provider → 'ai' (can't distinguish free vs assigned from events)
         """
-        # Query generation events with breakdown by pattern_based
-        result = session.execute(
-            text("""
-                SELECT
-                    CASE
-                        WHEN (event_data->>'pattern_based')::boolean = true THEN 'pattern'
-                        WHEN event_data->>'ai_provider' IS NOT NULL THEN 'ai'
-                        ELSE 'unknown'
-                    END as source_type,
-                    COUNT(*) as count
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'generation'
-                  AND event_type = 'created'
-                GROUP BY
-                    CASE
-                        WHEN (event_data->>'pattern_based')::boolean = true THEN 'pattern'
-                        WHEN event_data->>'ai_provider' IS NOT NULL THEN 'ai'
-                        ELSE 'unknown'
-                    END
-            """),
-            {'since': since}
-        ).all()
+        origins = totals.categories('origin', 'generation', 'created')
 
         # Build dict with defaults
         sources = {'pattern': 0, 'ai': 0, 'unknown': 0}
-        for source_type, count in result:
-            sources[source_type] = count
+        sources.update(origins)
 
         return sources
 
-    def _get_generator_stats_24h(self, session, since: datetime) -> Dict[str, Any]:
+    def _get_generator_stats_24h(self, totals: RollupTotals) -> Dict[str, Any]:
         """
         Get detailed generator statistics for last 24h.
 
@@ -259,81 +271,6 @@ class MetricsCollector:
             - timing_by_source: Average generation time (ms) by source
             - leverage: Dict with min, max, avg leverage
         """
-        # Single atomic query for all counts using CTE to avoid race conditions
-        # All breakdowns are calculated from the same snapshot of data
-        stats_result = session.execute(
-            text("""
-                WITH base AS (
-                    SELECT
-                        id,
-                        strategy_id,
-                        event_data,
-                        duration_ms
-                    FROM strategy_events
-                    WHERE timestamp >= :since
-                      AND stage = 'generation'
-                      AND event_type = 'created'
-                ),
-                -- Total count
-                total_count AS (
-                    SELECT COUNT(*) as cnt FROM base
-                ),
-                -- By source
-                by_source AS (
-                    SELECT
-                        COALESCE(event_data->>'generation_mode',
-                            CASE
-                                WHEN (event_data->>'pattern_based')::boolean = true THEN 'pattern'
-                                ELSE 'ai_free'
-                            END
-                        ) as source,
-                        COUNT(*) as cnt
-                    FROM base
-                    GROUP BY 1
-                ),
-                -- By type (from event_data - persists even if strategy deleted)
-                by_type AS (
-                    SELECT
-                        event_data->>'strategy_type' as stype,
-                        COUNT(*) as cnt
-                    FROM base
-                    WHERE event_data->>'strategy_type' IS NOT NULL
-                    GROUP BY 1
-                ),
-                -- By direction
-                by_direction AS (
-                    SELECT
-                        COALESCE(event_data->>'direction', 'UNKNOWN') as direction,
-                        COUNT(*) as cnt
-                    FROM base
-                    GROUP BY 1
-                ),
-                -- By timeframe
-                by_timeframe AS (
-                    SELECT
-                        event_data->>'timeframe' as tf,
-                        COUNT(*) as cnt
-                    FROM base
-                    WHERE event_data->>'timeframe' IS NOT NULL
-                    GROUP BY 1
-                )
-                SELECT
-                    'total' as category, 'total' as key, cnt
-                FROM total_count
-                UNION ALL
-                SELECT 'source' as category, source as key, cnt FROM by_source
-                UNION ALL
-                SELECT 'type' as category, stype as key, cnt FROM by_type WHERE stype IS NOT NULL
-                UNION ALL
-                SELECT 'direction' as category, direction as key, cnt FROM by_direction
-                UNION ALL
-                SELECT 'timeframe' as category, tf as key, cnt FROM by_timeframe WHERE tf IS NOT NULL
-            """),
-            {'since': since}
-        ).all()
-
-        # Parse results
-        total = 0
         by_source = {
             'pattern': 0,
             'pattern_gen': 0,
@@ -348,39 +285,21 @@ class MetricsCollector:
         by_direction = {'LONG': 0, 'SHORT': 0, 'BIDIR': 0}
         by_timeframe = {}
 
-        for category, key, cnt in stats_result:
-            if category == 'total':
-                total = cnt
-            elif category == 'source' and key in by_source:
+        total = totals.count('generation', 'created')
+        for key, cnt in totals.count_by_source('generation', 'created').items():
+            if key in by_source:
                 by_source[key] = cnt
-            elif category == 'type' and key:
+        for key, cnt in totals.categories('type', 'generation', 'created').items():
+            if key:
                 by_type[key] = cnt
-            elif category == 'direction' and key in by_direction:
+        for key, cnt in totals.categories('direction', 'generation', 'created').items():
+            if key in by_direction:
                 by_direction[key] = cnt
-            elif category == 'timeframe' and key:
+        for key, cnt in totals.categories('timeframe', 'generation', 'created').items():
+            if key:
                 by_timeframe[key] = cnt
 
         # Average timing by source
-        timing_result = session.execute(
-            text("""
-                SELECT
-                    COALESCE(event_data->>'generation_mode',
-                        CASE
-                            WHEN (event_data->>'pattern_based')::boolean = true THEN 'pattern'
-                            ELSE 'ai_free'
-                        END
-                    ) as source,
-                    AVG(duration_ms) as avg_ms
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'generation'
-                  AND event_type = 'created'
-                  AND duration_ms IS NOT NULL
-                GROUP BY 1
-            """),
-            {'since': since}
-        ).all()
-
         timing_by_source = {
             'pattern': None,
             'pattern_gen': None,
@@ -391,62 +310,26 @@ class MetricsCollector:
             'ai_free': None,
             'ai_assigned': None,
         }
-        for source, avg_ms in timing_result:
-            if source in timing_by_source and avg_ms is not None:
-                timing_by_source[source] = float(avg_ms)
+        for source, avg_ms in totals.avg_duration_by_source('generation', 'created').items():
+            if source in timing_by_source:
+                timing_by_source[source] = avg_ms
 
         # Leverage stats (min, max, avg)
-        leverage_result = session.execute(
-            text("""
-                SELECT
-                    MIN((event_data->>'leverage')::int) as min_lev,
-                    MAX((event_data->>'leverage')::int) as max_lev,
-                    AVG((event_data->>'leverage')::int) as avg_lev
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'generation'
-                  AND event_type = 'created'
-                  AND event_data->>'leverage' IS NOT NULL
-            """),
-            {'since': since}
-        ).first()
-
+        leverage_stats = totals.metric('leverage', 'generation', 'created')
         leverage = {
-            'min': int(leverage_result[0]) if leverage_result and leverage_result[0] else None,
-            'max': int(leverage_result[1]) if leverage_result and leverage_result[1] else None,
-            'avg': float(leverage_result[2]) if leverage_result and leverage_result[2] else None
+            'min': int(leverage_stats['min']) if leverage_stats['min'] else None,
+            'max': int(leverage_stats['max']) if leverage_stats['max'] else None,
+            'avg': leverage_stats['avg'] or None,
         }
 
         # By AI provider (claude, gemini, etc.) - excludes pattern-based (direct)
-        by_provider_result = session.execute(
-            text("""
-                SELECT
-                    COALESCE(event_data->>'ai_provider', 'unknown') as provider,
-                    COUNT(*) as count
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'generation'
-                  AND event_type = 'created'
-                  AND COALESCE(event_data->>'ai_provider', 'direct') != 'direct'
-                GROUP BY 1
-                ORDER BY count DESC
-            """),
-            {'since': since}
-        ).all()
-
-        by_provider = {}
-        for provider, count in by_provider_result:
-            by_provider[provider] = count
+        by_provider = dict(sorted(
+            totals.categories('provider', 'generation', 'created').items(),
+            key=lambda item: item[1], reverse=True,
+        ))
 
         # Generation failures (validation failed before DB save)
-        gen_failures = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'generation',
-                StrategyEvent.event_type == 'failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        gen_failures = totals.count('generation', 'failed')
 
         return {
             'total': total,
@@ -631,145 +514,51 @@ class MetricsCollector:
 
         return sources
 
-    def _get_funnel_24h(self, session, since: datetime) -> Dict[str, Any]:
+    def _get_funnel_24h(self, session, since: datetime, totals: RollupTotals) -> Dict[str, Any]:
         """
         Get pipeline funnel metrics for last 24h.
 
         Returns counts and pass rates for each stage.
+        Counts come from the per-minute rollups; distinct base counts
+        still read strategy_events.
         """
-        # Generated
-        generated = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'generation',
-                StrategyEvent.event_type == 'created',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        generated = totals.count('generation', 'created')
 
         # Validated (passed validation)
-        validated = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'validation',
-                StrategyEvent.event_type == 'completed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        validated = totals.count('validation', 'completed')
 
         # Validation failed (for funnel clarity)
-        validation_failed = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'validation',
-                StrategyEvent.status == 'failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        validation_failed = totals.count('validation', status='failed')
 
         # Parametric output: strategies that exited parametric (passed IS threshold)
         # = scored (passed OOS) + oos_failed (failed OOS but exited parametric)
-        parametric_scored = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'backtest',
-                StrategyEvent.event_type == 'scored',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        parametric_oos_failed = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'backtest',
-                StrategyEvent.event_type == 'oos_failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        parametric_scored = totals.count('backtest', 'scored')
+        parametric_oos_failed = totals.count('backtest', 'oos_failed')
 
         # Total strategies that exited parametric (before OOS validation)
         parametric_output = parametric_scored + parametric_oos_failed
 
         # Parametric failed (no valid combinations found - base rejected)
-        parametric_failed = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'backtest',
-                StrategyEvent.event_type == 'parametric_failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        parametric_failed = totals.count('backtest', 'parametric_failed')
+
+        # Skipped before parametric: entry signals duplicate an already backtested strategy
+        duplicate_signals = totals.count('backtest', 'duplicate_signals')
 
         # Score OK (passed score threshold) - counts shuffle_test.started events
-        score_ok = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'shuffle_test',
-                StrategyEvent.event_type == 'started',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        score_ok = totals.count('shuffle_test', 'started')
 
         # Shuffle tested = all completed shuffle tests (passed + failed, including cached)
         # This is the correct denominator for shuffle pass rate
-        shuffle_tested = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'shuffle_test',
-                StrategyEvent.event_type.in_(['passed', 'failed']),
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Shuffle OK
-        shuffle_ok = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'shuffle_test',
-                StrategyEvent.status == 'passed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Multi-window started (for in_progress tracking)
-        mw_started = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'multi_window',
-                StrategyEvent.event_type == 'started',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Multi-window OK
-        mw_ok = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'multi_window',
-                StrategyEvent.status == 'passed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        shuffle_tested = totals.count('shuffle_test', ['passed', 'failed'])
+        shuffle_ok = totals.count('shuffle_test', status='passed')
 
-        # Multi-window failed (for in_progress calculation)
-        mw_failed = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'multi_window',
-                StrategyEvent.status == 'failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        # Multi-window started / OK / failed (for in_progress tracking)
+        mw_started = totals.count('multi_window', 'started')
+        mw_ok = totals.count('multi_window', status='passed')
+        mw_failed = totals.count('multi_window', status='failed')
 
         # Pool entries
-        pool_entered = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'pool',
-                StrategyEvent.event_type == 'entered',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
+        pool_entered = totals.count('pool', 'entered')
 
         # Sum combinations_tested per UNIQUE base (not per strategy output)
         # Each base tests ~1015 combos, but multiple strategies may pass from same base
@@ -841,6 +630,7 @@ class MetricsCollector:
             'parametric_oos_failed': parametric_oos_failed,  # Failed OOS
             'parametric_failed': parametric_failed,  # Base rejected (no valid combos)
             'parametric_completed': parametric_output + parametric_failed,
+            'duplicate_signals': duplicate_signals,  # Skipped (signal fingerprint match)
             'score_ok': score_ok,
             'score_ok_pct': pct(score_ok, parametric_scored),
             'shuffle_tested': shuffle_tested,
@@ -953,7 +743,7 @@ class MetricsCollector:
 
         return sources
 
-    def _get_combo_stats_24h(self, session, since: datetime) -> Dict:
+    def _get_combo_stats_24h(self, session, since: datetime, totals: RollupTotals) -> Dict:
         """
         Aggregate combo_stats from parametric_stats events.
 
@@ -966,7 +756,22 @@ class MetricsCollector:
             passed_avg: {sharpe, wr, exp, trades}
         }
         """
-        result = session.execute(
+        def combo_sum(name: str) -> int:
+            return int(totals.metric(f'combo.{name}', 'backtest', 'parametric_stats')['sum'])
+
+        total_combos = combo_sum('total')
+        if total_combos == 0:
+            return {}
+
+        def weighted_avg(group: str, field: str) -> float:
+            combos = combo_sum(group)
+            if combos == 0:
+                return 0
+            weighted = totals.metric(f'combo.{group}_avg.{field}.weighted', 'backtest', 'parametric_stats')
+            return weighted['sum'] / combos
+
+        # Distinct bases can't be summed across rollup buckets: counted on events
+        bases_result = session.execute(
             text("""
                 WITH valid_bases AS (
                     -- Only count bases that have a matching generation.created event
@@ -978,118 +783,49 @@ class MetricsCollector:
                       AND timestamp >= :since
                 )
                 SELECT
-                    COALESCE(SUM((event_data->'combo_stats'->>'total')::int), 0) as total_combos,
-                    COALESCE(SUM((event_data->'combo_stats'->>'passed')::int), 0) as passed_combos,
-                    COALESCE(SUM((event_data->'combo_stats'->>'failed')::int), 0) as failed_combos,
                     COUNT(DISTINCT CASE WHEN (event_data->'combo_stats'->>'passed')::int > 0
-                          AND base_code_hash IN (SELECT base_code_hash FROM valid_bases)
                           THEN base_code_hash END) as bases_with_passed,
                     COUNT(DISTINCT CASE WHEN (event_data->'combo_stats'->>'passed')::int = 0
-                          AND base_code_hash IN (SELECT base_code_hash FROM valid_bases)
                           THEN base_code_hash END) as bases_with_failed,
-                    COALESCE(SUM((event_data->'combo_stats'->'fail_reasons'->>'sharpe')::int), 0) as fail_sharpe,
-                    COALESCE(SUM((event_data->'combo_stats'->'fail_reasons'->>'trades')::int), 0) as fail_trades,
-                    COALESCE(SUM((event_data->'combo_stats'->'fail_reasons'->>'wr')::int), 0) as fail_wr,
-                    COALESCE(SUM((event_data->'combo_stats'->'fail_reasons'->>'exp')::int), 0) as fail_exp,
-                    COALESCE(SUM((event_data->'combo_stats'->'fail_reasons'->>'dd')::int), 0) as fail_dd,
-                    -- Weighted averages for failed combos
-                    CASE WHEN SUM((event_data->'combo_stats'->>'failed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'failed_avg'->>'sharpe')::float *
-                            (event_data->'combo_stats'->>'failed')::int) /
-                        SUM((event_data->'combo_stats'->>'failed')::int)
-                    ELSE 0 END as failed_avg_sharpe,
-                    CASE WHEN SUM((event_data->'combo_stats'->>'failed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'failed_avg'->>'wr')::float *
-                            (event_data->'combo_stats'->>'failed')::int) /
-                        SUM((event_data->'combo_stats'->>'failed')::int)
-                    ELSE 0 END as failed_avg_wr,
-                    CASE WHEN SUM((event_data->'combo_stats'->>'failed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'failed_avg'->>'exp')::float *
-                            (event_data->'combo_stats'->>'failed')::int) /
-                        SUM((event_data->'combo_stats'->>'failed')::int)
-                    ELSE 0 END as failed_avg_exp,
-                    CASE WHEN SUM((event_data->'combo_stats'->>'failed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'failed_avg'->>'trades')::float *
-                            (event_data->'combo_stats'->>'failed')::int) /
-                        SUM((event_data->'combo_stats'->>'failed')::int)
-                    ELSE 0 END as failed_avg_trades,
-                    -- Weighted averages for passed combos
-                    CASE WHEN SUM((event_data->'combo_stats'->>'passed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'passed_avg'->>'sharpe')::float *
-                            (event_data->'combo_stats'->>'passed')::int) /
-                        SUM((event_data->'combo_stats'->>'passed')::int)
-                    ELSE 0 END as passed_avg_sharpe,
-                    CASE WHEN SUM((event_data->'combo_stats'->>'passed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'passed_avg'->>'wr')::float *
-                            (event_data->'combo_stats'->>'passed')::int) /
-                        SUM((event_data->'combo_stats'->>'passed')::int)
-                    ELSE 0 END as passed_avg_wr,
-                    CASE WHEN SUM((event_data->'combo_stats'->>'passed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'passed_avg'->>'exp')::float *
-                            (event_data->'combo_stats'->>'passed')::int) /
-                        SUM((event_data->'combo_stats'->>'passed')::int)
-                    ELSE 0 END as passed_avg_exp,
-                    CASE WHEN SUM((event_data->'combo_stats'->>'passed')::int) > 0 THEN
-                        SUM((event_data->'combo_stats'->'passed_avg'->>'trades')::float *
-                            (event_data->'combo_stats'->>'passed')::int) /
-                        SUM((event_data->'combo_stats'->>'passed')::int)
-                    ELSE 0 END as passed_avg_trades,
-                    -- Count total valid bases (using CTE defined above)
-                    COUNT(DISTINCT CASE
-                        WHEN base_code_hash IN (SELECT base_code_hash FROM valid_bases)
-                        THEN base_code_hash
-                    END) as total_bases,
-                    -- Duration stats per base (parametric backtest time)
-                    AVG(duration_ms) as avg_duration_ms,
-                    MIN(duration_ms) as min_duration_ms,
-                    MAX(duration_ms) as max_duration_ms
+                    COUNT(DISTINCT base_code_hash) as total_bases
                 FROM strategy_events
                 WHERE timestamp >= :since
                   AND stage = 'backtest'
                   AND event_type = 'parametric_stats'
                   AND event_data->'combo_stats' IS NOT NULL
+                  AND base_code_hash IN (SELECT base_code_hash FROM valid_bases)
             """),
             {'since': since}
         ).first()
 
-        if not result or result[0] == 0:
-            return {}
+        duration = totals.metric('combo.duration_ms', 'backtest', 'parametric_stats')
 
         return {
-            'total_combos': result[0],
-            'passed_combos': result[1],
-            'failed_combos': result[2],
-            'bases_with_passed': result[3],
-            'bases_with_failed': result[4],
+            'total_combos': total_combos,
+            'passed_combos': combo_sum('passed'),
+            'failed_combos': combo_sum('failed'),
+            'bases_with_passed': bases_result[0] if bases_result else 0,
+            'bases_with_failed': bases_result[1] if bases_result else 0,
             'fail_reasons': {
-                'sharpe': result[5],
-                'trades': result[6],
-                'wr': result[7],
-                'exp': result[8],
-                'dd': result[9],
+                reason: combo_sum(f'fail_reasons.{reason}')
+                for reason in ('sharpe', 'trades', 'wr', 'exp', 'dd')
             },
             'failed_avg': {
-                'sharpe': result[10] or 0,
-                'wr': result[11] or 0,
-                'exp': result[12] or 0,
-                'trades': result[13] or 0,
+                field: weighted_avg('failed', field)
+                for field in ('sharpe', 'wr', 'exp', 'trades')
             },
             'passed_avg': {
-                'sharpe': result[14] or 0,
-                'wr': result[15] or 0,
-                'exp': result[16] or 0,
-                'trades': result[17] or 0,
+                field: weighted_avg('passed', field)
+                for field in ('sharpe', 'wr', 'exp', 'trades')
             },
-            'total_bases': result[18],
-            'avg_duration_ms': float(result[19]) if result[19] else None,
-            'min_duration_ms': float(result[20]) if result[20] else None,
-            'max_duration_ms': float(result[21]) if result[21] else None,
+            'total_bases': bases_result[2] if bases_result else 0,
+            'avg_duration_ms': duration['avg'] or None,
+            'min_duration_ms': duration['min'] or None,
+            'max_duration_ms': duration['max'] or None,
         }
 
-    def _get_timing_avg_24h(self, session, since: datetime) -> Dict[str, Optional[float]]:
-        """Get average timing metrics per phase for last 24h."""
-        timing = {}
-
+    def _get_timing_avg_24h(self, totals: RollupTotals) -> Dict[str, Optional[float]]:
+        """Get average timing metrics per phase for last 24h (rollups)."""
         stages = [
             ('validation', 'validation'),
             ('backtest', 'backtest'),
@@ -1097,19 +833,7 @@ class MetricsCollector:
             ('multi_window', 'multiwindow'),
         ]
 
-        for db_stage, key in stages:
-            avg_ms = session.execute(
-                select(func.avg(StrategyEvent.duration_ms))
-                .where(and_(
-                    StrategyEvent.stage == db_stage,
-                    StrategyEvent.duration_ms.isnot(None),
-                    StrategyEvent.timestamp >= since
-                ))
-            ).scalar()
-
-            timing[key] = float(avg_ms) if avg_ms is not None else None
-
-        return timing
+        return {key: totals.duration(db_stage)['avg'] for db_stage, key in stages}
 
     def _get_throughput_interval(
         self, session, since: datetime
@@ -1196,75 +920,17 @@ class MetricsCollector:
             'pool': pool,
         }
 
-    def _get_failures_24h(self, session, since: datetime) -> Dict[str, int]:
-        """Get failure counts by type for last 24h."""
-        # Validation failures
-        validation_fail = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'validation',
-                StrategyEvent.status == 'failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Parametric failed (no valid combinations)
-        parametric_fail = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'backtest',
-                StrategyEvent.event_type == 'parametric_failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Score rejected
-        score_reject = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'backtest',
-                StrategyEvent.event_type == 'score_rejected',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Shuffle failed
-        shuffle_fail = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'shuffle_test',
-                StrategyEvent.status == 'failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Multi-window failed
-        mw_fail = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'multi_window',
-                StrategyEvent.status == 'failed',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
-        # Pool rejected
-        pool_reject = session.execute(
-            select(func.count(StrategyEvent.id))
-            .where(and_(
-                StrategyEvent.stage == 'pool',
-                StrategyEvent.event_type == 'rejected',
-                StrategyEvent.timestamp >= since
-            ))
-        ).scalar() or 0
-
+    def _get_failures_24h(self, totals: RollupTotals) -> Dict[str, int]:
+        """Get failure counts by type for last 24h (rollups)."""
         return {
-            'validation': validation_fail,
-            'parametric_fail': parametric_fail,
-            'score_reject': score_reject,
-            'shuffle_fail': shuffle_fail,
-            'mw_fail': mw_fail,
-            'pool_reject': pool_reject,
+            'validation': totals.count('validation', status='failed'),
+            # Parametric failed (no valid combinations)
+            'parametric_fail': totals.count('backtest', 'parametric_failed'),
+            'duplicate_signals': totals.count('backtest', 'duplicate_signals'),
+            'score_reject': totals.count('backtest', 'score_rejected'),
+            'shuffle_fail': totals.count('shuffle_test', status='failed'),
+            'mw_fail': totals.count('multi_window', status='failed'),
+            'pool_reject': totals.count('pool', 'rejected'),
         }
 
     def _get_backpressure_status(
@@ -1358,7 +1024,7 @@ class MetricsCollector:
             'dd_avg': None,
         }
 
-    def _get_is_stats_24h(self, session, since: datetime) -> Dict[str, Any]:
+    def _get_is_stats_24h(self, session, since: datetime, totals: RollupTotals) -> Dict[str, Any]:
         """
         Get IN-SAMPLE backtest statistics for last 24h.
 
@@ -1380,17 +1046,7 @@ class MetricsCollector:
         ).scalar() or 0
 
         # IS passed count from oos_failed events (passed IS, failed OOS)
-        oos_failed_count_result = session.execute(
-            text("""
-                SELECT COUNT(*)
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type = 'oos_failed'
-                  AND event_data->>'reason' NOT LIKE 'IS %'
-            """),
-            {'since': since}
-        ).scalar() or 0
+        oos_failed_count_result = totals.metric('events', 'backtest', 'oos_failed')['count']
 
         passed_count = oos_passed_result + oos_failed_count_result
 
@@ -1419,29 +1075,10 @@ class MetricsCollector:
         }
 
         # From oos_failed events (passed IS, failed OOS) - get IS metrics
-        oos_failed_is_result = session.execute(
-            text("""
-                SELECT
-                    COUNT(*),
-                    SUM((event_data->>'is_sharpe')::float),
-                    SUM((event_data->>'is_win_rate')::float),
-                    SUM((event_data->>'is_expectancy')::float),
-                    SUM((event_data->>'is_trades')::float)
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type = 'oos_failed'
-                  AND event_data->>'reason' NOT LIKE 'IS %'
-            """),
-            {'since': since}
-        ).first()
-
-        oos_f_count = oos_failed_is_result[0] if oos_failed_is_result else 0
+        oos_f_count = oos_failed_count_result
         oos_f_sums = {
-            'sharpe': float(oos_failed_is_result[1]) if oos_failed_is_result and oos_failed_is_result[1] else 0,
-            'wr': float(oos_failed_is_result[2]) if oos_failed_is_result and oos_failed_is_result[2] else 0,
-            'exp': float(oos_failed_is_result[3]) if oos_failed_is_result and oos_failed_is_result[3] else 0,
-            'trades': float(oos_failed_is_result[4]) if oos_failed_is_result and oos_failed_is_result[4] else 0,
+            key: totals.metric(field, 'backtest', 'oos_failed')['sum']
+            for key, field in IS_METRIC_FIELDS.items()
         }
 
         # Weighted average
@@ -1457,70 +1094,20 @@ class MetricsCollector:
             passed_avg = {'sharpe': None, 'wr': None, 'exp': None, 'trades': None}
 
         # Failed strategies: from is_failed events
-        failed_result = session.execute(
-            text("""
-                SELECT
-                    COUNT(*),
-                    AVG((event_data->>'is_sharpe')::float),
-                    AVG((event_data->>'is_win_rate')::float),
-                    AVG((event_data->>'is_expectancy')::float),
-                    AVG((event_data->>'is_trades')::float),
-                    AVG(duration_ms)
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type = 'is_failed'
-            """),
-            {'since': since}
-        ).first()
-
-        failed_count = failed_result[0] if failed_result else 0
+        failed_count = totals.count('backtest', 'is_failed')
         failed_avg = {
-            'sharpe': float(failed_result[1]) if failed_result and failed_result[1] else None,
-            'wr': float(failed_result[2]) if failed_result and failed_result[2] else None,
-            'exp': float(failed_result[3]) if failed_result and failed_result[3] else None,
-            'trades': float(failed_result[4]) if failed_result and failed_result[4] else None,
+            key: totals.metric(field, 'backtest', 'is_failed')['avg'] or None
+            for key, field in IS_METRIC_FIELDS.items()
         }
 
         # Average timing from ALL IS events (both passed and failed)
-        is_timing_result = session.execute(
-            text("""
-                SELECT AVG(duration_ms)
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type IN ('is_passed', 'is_failed')
-                  AND duration_ms IS NOT NULL
-            """),
-            {'since': since}
-        ).scalar()
-        is_avg_duration_ms = float(is_timing_result) if is_timing_result else None
+        is_avg_duration_ms = totals.duration('backtest', ['is_passed', 'is_failed'])['avg'] or None
 
         # Fail reasons breakdown (from fail_types dict in is_failed events)
         # CUMULATIVE: each strategy counted for ALL thresholds it violates (like PARAMETRIC)
-        fail_reasons_result = session.execute(
-            text("""
-                SELECT
-                    COALESCE(SUM((event_data->'fail_types'->>'sharpe')::int), 0) as fail_sharpe,
-                    COALESCE(SUM((event_data->'fail_types'->>'wr')::int), 0) as fail_wr,
-                    COALESCE(SUM((event_data->'fail_types'->>'exp')::int), 0) as fail_exp,
-                    COALESCE(SUM((event_data->'fail_types'->>'dd')::int), 0) as fail_dd,
-                    COALESCE(SUM((event_data->'fail_types'->>'trades')::int), 0) as fail_trades
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type = 'is_failed'
-                  AND event_data->'fail_types' IS NOT NULL
-            """),
-            {'since': since}
-        ).first()
-
         fail_reasons = {
-            'sharpe': int(fail_reasons_result[0]) if fail_reasons_result else 0,
-            'wr': int(fail_reasons_result[1]) if fail_reasons_result else 0,
-            'exp': int(fail_reasons_result[2]) if fail_reasons_result else 0,
-            'dd': int(fail_reasons_result[3]) if fail_reasons_result else 0,
-            'trades': int(fail_reasons_result[4]) if fail_reasons_result else 0,
+            reason: int(totals.metric(f'fail_types.{reason}', 'backtest', 'is_failed')['sum'])
+            for reason in ('sharpe', 'wr', 'exp', 'dd', 'trades')
         }
 
         total_count = passed_count + failed_count
@@ -1535,7 +1122,7 @@ class MetricsCollector:
             'avg_duration_ms': is_avg_duration_ms,
         }
 
-    def _get_oos_stats_24h(self, session, since: datetime) -> Dict[str, Any]:
+    def _get_oos_stats_24h(self, session, since: datetime, totals: RollupTotals) -> Dict[str, Any]:
         """
         Get OUT-OF-SAMPLE validation statistics for last 24h.
 
@@ -1573,75 +1160,20 @@ class MetricsCollector:
         # Failed strategies: from oos_failed events (includes OOS metrics now)
         # Exclude old events where IS failures were incorrectly logged as oos_failed
         # (before is_failed event type was introduced)
-        failed_result = session.execute(
-            text("""
-                SELECT
-                    COUNT(*),
-                    AVG((event_data->>'oos_sharpe')::float),
-                    AVG((event_data->>'oos_win_rate')::float),
-                    AVG((event_data->>'oos_expectancy')::float),
-                    AVG((event_data->>'oos_trades')::float),
-                    AVG((event_data->>'oos_max_drawdown')::float),
-                    AVG(duration_ms)
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type = 'oos_failed'
-                  AND event_data->>'reason' NOT LIKE 'IS %'
-            """),
-            {'since': since}
-        ).first()
-
-        failed_count = failed_result[0] if failed_result else 0
+        failed_count = totals.metric('events', 'backtest', 'oos_failed')['count']
         failed_avg = {
-            'sharpe': float(failed_result[1]) if failed_result and failed_result[1] else None,
-            'wr': float(failed_result[2]) if failed_result and failed_result[2] else None,
-            'exp': float(failed_result[3]) if failed_result and failed_result[3] else None,
-            'trades': float(failed_result[4]) if failed_result and failed_result[4] else None,
-            'dd': float(failed_result[5]) if failed_result and failed_result[5] else None,
+            key: totals.metric(field, 'backtest', 'oos_failed')['avg'] or None
+            for key, field in OOS_METRIC_FIELDS.items()
         }
 
         # Average timing from ALL OOS events (both passed and failed)
-        oos_timing_result = session.execute(
-            text("""
-                SELECT AVG(duration_ms)
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type IN ('oos_passed', 'oos_failed')
-                  AND duration_ms IS NOT NULL
-            """),
-            {'since': since}
-        ).scalar()
-        oos_avg_duration_ms = float(oos_timing_result) if oos_timing_result else None
+        oos_avg_duration_ms = totals.duration('backtest', ['oos_passed', 'oos_failed'])['avg'] or None
 
         # Fail reasons breakdown (from fail_types dict in oos_failed events)
         # CUMULATIVE: each strategy counted for ALL thresholds it violates (like PARAMETRIC)
-        fail_reasons_result = session.execute(
-            text("""
-                SELECT
-                    COALESCE(SUM((event_data->'fail_types'->>'sharpe')::int), 0) as fail_sharpe,
-                    COALESCE(SUM((event_data->'fail_types'->>'wr')::int), 0) as fail_wr,
-                    COALESCE(SUM((event_data->'fail_types'->>'exp')::int), 0) as fail_exp,
-                    COALESCE(SUM((event_data->'fail_types'->>'dd')::int), 0) as fail_dd,
-                    COALESCE(SUM((event_data->'fail_types'->>'trades')::int), 0) as fail_trades,
-                    COALESCE(SUM((event_data->'fail_types'->>'degradation')::int), 0) as fail_degradation
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type = 'oos_failed'
-                  AND event_data->'fail_types' IS NOT NULL
-            """),
-            {'since': since}
-        ).first()
-
         fail_reasons = {
-            'sharpe': int(fail_reasons_result[0]) if fail_reasons_result else 0,
-            'wr': int(fail_reasons_result[1]) if fail_reasons_result else 0,
-            'exp': int(fail_reasons_result[2]) if fail_reasons_result else 0,
-            'dd': int(fail_reasons_result[3]) if fail_reasons_result else 0,
-            'trades': int(fail_reasons_result[4]) if fail_reasons_result else 0,
-            'degradation': int(fail_reasons_result[5]) if fail_reasons_result else 0,
+            reason: int(totals.metric(f'fail_types.{reason}', 'backtest', 'oos_failed')['sum'])
+            for reason in ('sharpe', 'wr', 'exp', 'dd', 'trades', 'degradation')
         }
 
         # Get degradation stats for passed strategies (from IS rows)
@@ -1681,32 +1213,19 @@ class MetricsCollector:
             'avg_duration_ms': oos_avg_duration_ms,
         }
 
-    def _get_score_stats_24h(self, session, since: datetime) -> Dict[str, Any]:
+    def _get_score_stats_24h(self, totals: RollupTotals) -> Dict[str, Any]:
         """Get score calculation statistics for last 24h.
 
         Includes ALL scored strategies (both passed and failed min_score threshold).
         Source: backtest.scored contains all strategies after scoring.
         """
         # backtest.scored includes ALL scores (before threshold check)
-        result = session.execute(
-            text("""
-                SELECT
-                    MIN((event_data->>'score')::float) as min_score,
-                    MAX((event_data->>'score')::float) as max_score,
-                    AVG((event_data->>'score')::float) as avg_score
-                FROM strategy_events
-                WHERE timestamp >= :since
-                  AND stage = 'backtest'
-                  AND event_type = 'scored'
-                  AND event_data->>'score' IS NOT NULL
-            """),
-            {'since': since}
-        ).first()
+        score = totals.metric('score', 'backtest', 'scored')
 
         return {
-            'min_score': float(result[0]) if result and result[0] else None,
-            'max_score': float(result[1]) if result and result[1] else None,
-            'avg_score': float(result[2]) if result and result[2] else None,
+            'min_score': score['min'] or None,
+            'max_score': score['max'] or None,
+            'avg_score': score['avg'] or None,
         }
 
     def _get_retest_stats_24h(self, session, since: datetime) -> Dict[str, Any]:
@@ -3021,18 +2540,20 @@ class MetricsCollector:
         Returns conversion rates through each stage.
         """
         since = datetime.now(UTC) - timedelta(hours=hours)
+        self._refresh_rollups()
 
         with get_session() as session:
-            return self._get_funnel_24h(session, since)
+            return self._get_funnel_24h(session, since, self.rollups.totals(session, since))
 
     def get_failure_analysis(self, hours: int = 24) -> Dict[str, Any]:
         """
         Get detailed failure analysis for the specified time period.
         """
         since = datetime.now(UTC) - timedelta(hours=hours)
+        self._refresh_rollups()
 
         with get_session() as session:
-            return self._get_failures_24h(session, since)
+            return self._get_failures_24h(self.rollups.totals(session, since))
 
     def get_full_snapshot(self) -> Dict[str, Any]:
         """
@@ -3042,36 +2563,41 @@ class MetricsCollector:
         gets logged every collection interval.
         """
         try:
+            self._refresh_rollups()
+
             with get_session() as session:
                 # Time windows
                 now = datetime.now(UTC)
                 window_1min = now - timedelta(seconds=self.interval_seconds)
                 window_24h = now - timedelta(hours=24)
 
+                # 24h rollup sums shared by the event-based sections
+                totals = self.rollups.totals(session, window_24h)
+
                 # Collect all metrics
                 queue_depths = self._get_queue_depths(session)
-                generator_stats = self._get_generator_stats_24h(session, window_24h)
+                generator_stats = self._get_generator_stats_24h(totals)
                 ai_calls_today = self._get_ai_calls_today()
                 unused_patterns = self._get_unused_patterns(session)
-                funnel = self._get_funnel_24h(session, window_24h)
+                funnel = self._get_funnel_24h(session, window_24h, totals)
                 validation_by_source = self._get_validation_by_source_24h(session, window_24h)
                 pool_added_by_source = self._get_pool_added_by_source_24h(session, window_24h)
-                timing = self._get_timing_avg_24h(session, window_24h)
+                timing = self._get_timing_avg_24h(totals)
                 throughput = self._get_throughput_interval(session, window_1min)
-                failures = self._get_failures_24h(session, window_24h)
+                failures = self._get_failures_24h(totals)
                 backpressure = self._get_backpressure_status(session, queue_depths)
                 pool_stats = self._get_pool_stats(session)
                 pool_quality = self._get_pool_quality(session)
                 pool_by_source = self._get_pool_by_source(session)
                 pool_avg_score_by_source = self._get_pool_avg_score_by_source(session)
-                is_stats = self._get_is_stats_24h(session, window_24h)
-                oos_stats = self._get_oos_stats_24h(session, window_24h)
-                score_stats = self._get_score_stats_24h(session, window_24h)
+                is_stats = self._get_is_stats_24h(session, window_24h, totals)
+                oos_stats = self._get_oos_stats_24h(session, window_24h, totals)
+                score_stats = self._get_score_stats_24h(totals)
                 retest_stats = self._get_retest_stats_24h(session, window_24h)
                 robustness_stats = self._get_robustness_stats_24h(session, window_24h)
                 pool_robustness = self._get_pool_robustness_stats(session)
                 live_stats = self._get_live_rotation_stats(session, window_24h)
-                combo_stats = self._get_combo_stats_24h(session, window_24h)
+                combo_stats = self._get_combo_stats_24h(session, window_24h, totals)
                 scheduler_stats = self._get_scheduler_stats(session)
                 subaccount_stats = self._get_subaccount_stats(session)
 
@@ -0,0 +1,370 @@
+"""
+Pipeline Event Rollups
+
+Per-minute counters and duration aggregates of strategy_events, by
+(stage, event_type, status, source), stored in strategy_event_rollups.
+
+The raw events table grows with pipeline throughput; 24h figures computed
+from it cost more every day. Rollups keep the cost constant:
+
+- refresh() recomputes only the buckets since the high-water mark (minus a
+  grace period for late events, e.g. batched EventTracker writes), then
+  moves the mark to now. Recomputing whole buckets is idempotent.
+- totals(since) sums at most 1440 buckets per key for a 24h window.
+
+Windows are minute-aligned: totals(since) includes the whole minute that
+contains `since`.
+
+Numeric event_data fields (IS/OOS metrics, fail types, combo stats, score,
+leverage) are rolled up the same way into strategy_event_metric_rollups:
+count, sum, min and max per metric (see METRICS and CATEGORIES). Categorical
+fields are counted per value as metric '<name>:<value>'.
+
+Still read from strategy_events: distinct counts (bases), joins with other
+events or tables, all-time stats (beyond retention) and sub-minute windows.
+"""
+
+from datetime import datetime, timedelta, UTC
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from sqlalchemy import select, func, delete, text
+
+from src.database import get_session
+from src.database.models import StrategyEventRollup, StrategyEventMetricRollup
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# pg_advisory_xact_lock key: one refresh at a time (collector, API)
+ROLLUP_LOCK_KEY = 727_001
+
+# Generation source: same derivation as MetricsCollector generator stats
+_SOURCE_SQL = """
+        CASE
+            WHEN stage = 'generation' AND event_type = 'created' THEN
+                COALESCE(event_data->>'generation_mode',
+                    CASE
+                        WHEN (event_data->>'pattern_based')::boolean = true THEN 'pattern'
+                        ELSE 'ai_free'
+                    END
+                )
+            ELSE ''
+        END"""
+
+_REFRESH_SQL = text(f"""
+    INSERT INTO strategy_event_rollups (
+        bucket, stage, event_type, status, source,
+        count, duration_count, duration_sum, duration_min, duration_max
+    )
+    SELECT
+        date_trunc('minute', timestamp) AS bucket,
+        stage,
+        event_type,
+        status,{_SOURCE_SQL} AS source,
+        COUNT(*),
+        COUNT(duration_ms),
+        COALESCE(SUM(duration_ms), 0),
+        MIN(duration_ms),
+        MAX(duration_ms)
+    FROM strategy_events
+    WHERE timestamp >= :start
+    GROUP BY 1, 2, 3, 4, 5
+""")
+
+# Legacy oos_failed events logged IS failures too (before is_failed existed)
+_OOS_REASON = "event_data->>'reason' NOT LIKE 'IS %'"
+
+# Numeric event_data fields: (stage, event_type, metric, value SQL, condition SQL)
+METRICS: List[Tuple[str, str, str, str, Optional[str]]] = [
+    ('generation', 'created', 'leverage', "event_data->>'leverage'", None),
+    ('backtest', 'scored', 'score', "event_data->>'score'", None),
+    ('backtest', 'oos_failed', 'events', "1", _OOS_REASON),
+]
+for _field in ('is_sharpe', 'is_win_rate', 'is_expectancy', 'is_trades'):
+    METRICS.append(('backtest', 'is_failed', _field, f"event_data->>'{_field}'", None))
+    METRICS.append(('backtest', 'oos_failed', _field, f"event_data->>'{_field}'", _OOS_REASON))
+for _field in ('oos_sharpe', 'oos_win_rate', 'oos_expectancy', 'oos_trades', 'oos_max_drawdown'):
+    METRICS.append(('backtest', 'oos_failed', _field, f"event_data->>'{_field}'", _OOS_REASON))
+for _event_type, _types in (
+    ('is_failed', ('sharpe', 'wr', 'exp', 'dd', 'trades')),
+    ('oos_failed', ('sharpe', 'wr', 'exp', 'dd', 'trades', 'degradation')),
+):
+    for _field in _types:
+        METRICS.append((
+            'backtest', _event_type, f'fail_types.{_field}',
+            f"event_data->'fail_types'->>'{_field}'", None,
+        ))
+
+# Parametric combo stats; weighted averages stored as avg * combos (sum / combos)
+_COMBO = "event_data->'combo_stats'"
+METRICS.append(('backtest', 'parametric_stats', 'combo.duration_ms', "duration_ms", f"{_COMBO} IS NOT NULL"))
+for _field in ('total', 'passed', 'failed'):
+    METRICS.append(('backtest', 'parametric_stats', f'combo.{_field}', f"{_COMBO}->>'{_field}'", None))
+for _field in ('sharpe', 'trades', 'wr', 'exp', 'dd'):
+    METRICS.append((
+        'backtest', 'parametric_stats', f'combo.fail_reasons.{_field}',
+        f"{_COMBO}->'fail_reasons'->>'{_field}'", None,
+    ))
+for _group in ('failed', 'passed'):
+    for _field in ('sharpe', 'wr', 'exp', 'trades'):
+        METRICS.append((
+            'backtest', 'parametric_stats', f'combo.{_group}_avg.{_field}.weighted',
+            f"({_COMBO}->'{_group}_avg'->>'{_field}')::float * ({_COMBO}->>'{_group}')::int",
+            None,
+        ))
+
+# Categorical event_data fields, counted per value: (stage, event_type, name, value SQL, condition SQL)
+CATEGORIES: List[Tuple[str, str, str, str, Optional[str]]] = [
+    ('generation', 'created', 'origin', """
+        CASE
+            WHEN (event_data->>'pattern_based')::boolean = true THEN 'pattern'
+            WHEN event_data->>'ai_provider' IS NOT NULL THEN 'ai'
+            ELSE 'unknown'
+        END""", None),
+    ('generation', 'created', 'type', "event_data->>'strategy_type'", None),
+    ('generation', 'created', 'direction', "COALESCE(event_data->>'direction', 'UNKNOWN')", None),
+    ('generation', 'created', 'timeframe', "event_data->>'timeframe'", None),
+    ('generation', 'created', 'provider', "COALESCE(event_data->>'ai_provider', 'unknown')",
+     "COALESCE(event_data->>'ai_provider', 'direct') != 'direct'"),
+]
+
+
+def _metric_refresh_sql():
+    """INSERT ... SELECT folding METRICS and CATEGORIES into metric rollups"""
+    def scope(stage, event_type, condition):
+        sql = f"stage = '{stage}' AND event_type = '{event_type}'"
+        return f"{sql} AND {condition}" if condition else sql
+
+    values = [
+        f"('{metric}', CASE WHEN {scope(stage, event_type, condition)} THEN ({value})::float END)"
+        for stage, event_type, metric, value, condition in METRICS
+    ] + [
+        f"(CASE WHEN {scope(stage, event_type, condition)} THEN '{name}:' || ({value}) END, 1.0::float)"
+        for stage, event_type, name, value, condition in CATEGORIES
+    ]
+    event_types = sorted({
+        f"('{stage}', '{event_type}')" for stage, event_type, *_ in METRICS + CATEGORIES
+    })
+    rows = ",\n            ".join(values)
+
+    return text(f"""
+    INSERT INTO strategy_event_metric_rollups (
+        bucket, stage, event_type, status, source, metric,
+        count, sum, min, max
+    )
+    SELECT
+        date_trunc('minute', timestamp) AS bucket,
+        stage,
+        event_type,
+        status,{_SOURCE_SQL} AS source,
+        m.metric,
+        COUNT(*),
+        SUM(m.value),
+        MIN(m.value),
+        MAX(m.value)
+    FROM strategy_events
+    CROSS JOIN LATERAL (
+        VALUES
+            {rows}
+    ) AS m(metric, value)
+    WHERE timestamp >= :start
+      AND (stage, event_type) IN ({', '.join(event_types)})
+      AND m.metric IS NOT NULL
+      AND m.value IS NOT NULL
+    GROUP BY 1, 2, 3, 4, 5, 6
+""")
+
+
+_METRIC_REFRESH_SQL = _metric_refresh_sql()
+
+
+def _floor_minute(ts: datetime) -> datetime:
+    return ts.replace(second=0, microsecond=0)
+
+
+class RollupTotals:
+    """
+    Rollup sums over a window, keyed by (stage, event_type, status, source).
+
+    Filters accept a single value or an iterable of values; None matches all.
+    """
+
+    def __init__(self, rows: Iterable[Tuple], metric_rows: Iterable[Tuple] = ()):
+        """
+        Args:
+            rows: (stage, event_type, status, source, count,
+                   duration_count, duration_sum, duration_min, duration_max)
+            metric_rows: (stage, event_type, status, source, metric,
+                          count, sum, min, max)
+        """
+        self._rows = [tuple(row) for row in rows]
+        self._metric_rows = [tuple(row) for row in metric_rows]
+
+    @staticmethod
+    def _match(value: str, wanted: Union[None, str, Iterable[str]]) -> bool:
+        if wanted is None:
+            return True
+        if isinstance(wanted, str):
+            return value == wanted
+        return value in wanted
+
+    def _select(self, stage=None, event_type=None, status=None, rows=None):
+        return [
+            row for row in (self._rows if rows is None else rows)
+            if self._match(row[0], stage)
+            and self._match(row[1], event_type)
+            and self._match(row[2], status)
+        ]
+
+    def count(self, stage=None, event_type=None, status=None) -> int:
+        """Number of matching events"""
+        return int(sum(row[4] for row in self._select(stage, event_type, status)))
+
+    def count_by_source(self, stage=None, event_type=None, status=None) -> Dict[str, int]:
+        """Number of matching events by source"""
+        counts: Dict[str, int] = {}
+        for row in self._select(stage, event_type, status):
+            counts[row[3]] = counts.get(row[3], 0) + int(row[4])
+        return counts
+
+    def duration(self, stage=None, event_type=None, status=None) -> Dict[str, Optional[float]]:
+        """
+        Duration aggregates of matching events that have duration_ms.
+
+        Returns:
+            Dict with count, avg, min, max (None when count is 0)
+        """
+        rows = [r for r in self._select(stage, event_type, status) if r[5]]
+        count = int(sum(r[5] for r in rows))
+        if count == 0:
+            return {'count': 0, 'avg': None, 'min': None, 'max': None}
+        return {
+            'count': count,
+            'avg': float(sum(r[6] for r in rows)) / count,
+            'min': min(r[7] for r in rows if r[7] is not None),
+            'max': max(r[8] for r in rows if r[8] is not None),
+        }
+
+    def avg_duration_by_source(self, stage=None, event_type=None, status=None) -> Dict[str, float]:
+        """Average duration_ms by source (sources without durations omitted)"""
+        sums: Dict[str, Tuple[int, float]] = {}
+        for row in self._select(stage, event_type, status):
+            if row[5]:
+                n, total = sums.get(row[3], (0, 0.0))
+                sums[row[3]] = (n + int(row[5]), total + float(row[6]))
+        return {source: total / n for source, (n, total) in sums.items()}
+
+    def metric(self, name: str, stage=None, event_type=None, status=None) -> Dict[str, Optional[float]]:
+        """
+        Aggregates of a METRICS field over matching events that have it.
+
+        Returns:
+            Dict with count, sum, avg, min, max (avg/min/max None when count is 0)
+        """
+        rows = [
+            r for r in self._select(stage, event_type, status, self._metric_rows)
+            if r[4] == name and r[5]
+        ]
+        count = int(sum(r[5] for r in rows))
+        if count == 0:
+            return {'count': 0, 'sum': 0.0, 'avg': None, 'min': None, 'max': None}
+        total = float(sum(r[6] for r in rows))
+        return {
+            'count': count,
+            'sum': total,
+            'avg': total / count,
+            'min': min(r[7] for r in rows if r[7] is not None),
+            'max': max(r[8] for r in rows if r[8] is not None),
+        }
+
+    def categories(self, name: str, stage=None, event_type=None, status=None) -> Dict[str, int]:
+        """Number of matching events by value of a CATEGORIES field"""
+        prefix = f'{name}:'
+        counts: Dict[str, int] = {}
+        for row in self._select(stage, event_type, status, self._metric_rows):
+            if row[4].startswith(prefix):
+                value = row[4][len(prefix):]
+                counts[value] = counts.get(value, 0) + int(row[5])
+        return counts
+
+
+class EventRollups:
+    """Maintains and reads strategy_event_rollups and strategy_event_metric_rollups"""
+
+    def __init__(self, grace_minutes: int = 5, retention_hours: int = 168):
+        """
+        Args:
+            grace_minutes: Buckets before the high-water mark recomputed on
+                each refresh (events written late still land in rollups)
+            retention_hours: Rollup buckets kept (also the backfill depth
+                when the table is empty)
+        """
+        self.grace = timedelta(minutes=grace_minutes)
+        self.retention = timedelta(hours=retention_hours)
+        self._high_water: Optional[datetime] = None
+
+    def refresh(self) -> None:
+        """Fold events since the high-water mark into the rollups"""
+        now = datetime.now(UTC)
+
+        with get_session() as session:
+            # Serialize concurrent refreshes (metrics service and API process)
+            session.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': ROLLUP_LOCK_KEY})
+
+            high_water = self._high_water
+            if high_water is None:
+                # Resume from the newest bucket, or backfill the retention window
+                high_water = session.execute(
+                    select(func.max(StrategyEventRollup.bucket))
+                ).scalar() or (now - self.retention)
+
+            start = _floor_minute(max(high_water - self.grace, now - self.retention))
+
+            for model, refresh_sql in (
+                (StrategyEventRollup, _REFRESH_SQL),
+                (StrategyEventMetricRollup, _METRIC_REFRESH_SQL),
+            ):
+                session.execute(delete(model).where(model.bucket >= start))
+                session.execute(refresh_sql, {'start': start})
+                session.execute(delete(model).where(model.bucket < now - self.retention))
+
+        self._high_water = now
+
+    def totals(self, session, since: datetime) -> RollupTotals:
+        """
+        Sum rollups from the minute containing `since` to now.
+
+        Args:
+            session: Database session
+            since: Window start
+
+        Returns:
+            RollupTotals for the window
+        """
+        r = StrategyEventRollup
+        rows = session.execute(
+            select(
+                r.stage, r.event_type, r.status, r.source,
+                func.sum(r.count),
+                func.sum(r.duration_count),
+                func.sum(r.duration_sum),
+                func.min(r.duration_min),
+                func.max(r.duration_max),
+            )
+            .where(r.bucket >= _floor_minute(since))
+            .group_by(r.stage, r.event_type, r.status, r.source)
+        ).all()
+
+        m = StrategyEventMetricRollup
+        metric_rows = session.execute(
+            select(
+                m.stage, m.event_type, m.status, m.source, m.metric,
+                func.sum(m.count),
+                func.sum(m.sum),
+                func.min(m.min),
+                func.max(m.max),
+            )
+            .where(m.bucket >= _floor_minute(since))
+            .group_by(m.stage, m.event_type, m.status, m.source, m.metric)
+        ).all()
+        return RollupTotals(rows, metric_rows)
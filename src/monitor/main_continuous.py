@@ -418,6 +418,10 @@ class ContinuousMonitorProcess:
         logger.info(f"Shutdown requested (signal {signum})")
         self.shutdown_event.set()
         self.force_exit = True
+
+        # Write queued pipeline events before exiting (os._exit skips atexit)
+        EventTracker.flush(timeout=5.0)
+
         os._exit(0)
 
     def run(self):
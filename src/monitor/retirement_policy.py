@@ -16,8 +16,9 @@ from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
 from src.database import get_session
-from src.database.models import Strategy, Subaccount, Trade, BacktestResult
+from src.database.models import Strategy, Subaccount, BacktestResult
 from src.database.event_tracker import EventTracker
+from src.scorer.live_stats import get_live_stats
 from src.utils.logger import get_logger
 from src.utils.strategy_files import remove_from_live
 
@@ -60,7 +61,10 @@ class RetirementPolicy:
 
     def _count_consecutive_losses(self, strategy_id: UUID, session) -> int:
         """
-        Count current streak of consecutive losing trades (from most recent).
+        Current streak of consecutive losing trades (from most recent).
+
+        Read from the strategy's running live stats (kept up to date as
+        trades close), not from the trades table.
 
         Args:
             strategy_id: Strategy UUID
@@ -69,31 +73,7 @@ class RetirementPolicy:
         Returns:
             Current consecutive losses streak (0 if last trade was winning)
         """
-        # Limit query to max needed + buffer for efficiency
-        limit = self.max_consecutive_losses + 10
-
-        trades = (
-            session.query(Trade)
-            .filter(
-                Trade.strategy_id == strategy_id,
-                Trade.exit_time.isnot(None)
-            )
-            .order_by(Trade.exit_time.desc())  # Most recent first
-            .limit(limit)
-            .all()
-        )
-
-        if not trades:
-            return 0
-
-        consecutive = 0
-        for trade in trades:
-            if trade.pnl_usd is not None and trade.pnl_usd < 0:
-                consecutive += 1
-            else:
-                break  # Stop at first winning trade
-
-        return consecutive
+        return get_live_stats(session, strategy_id).loss_streak
 
     def _calculate_trades_degradation(
         self, strategy_id: UUID, session
@@ -5,9 +5,14 @@ Manages the execution of multiple trading strategies across timeframes.
 Includes data provider, adaptive scheduler, and main orchestrator.
 """
 
-from src.data.hyperliquid_websocket import HyperliquidDataProvider
-from src.orchestration.adaptive_scheduler import AdaptiveScheduler
-from src.orchestration.orchestrator import Orchestrator
+from src.utils.lazy_import import lazy_exports
+
+# Lazy: importing any src.orchestration submodule must not load ccxt / Hyperliquid SDK
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'HyperliquidDataProvider': 'src.data.hyperliquid_websocket',
+    'AdaptiveScheduler': 'src.orchestration.adaptive_scheduler',
+    'Orchestrator': 'src.orchestration.orchestrator',
+})
 
 __all__ = [
     'HyperliquidDataProvider',
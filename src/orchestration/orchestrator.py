@@ -12,10 +12,6 @@ Following CLAUDE.md:
 """
 
 import signal
-import importlib.util
-import sys
-import tempfile
-from pathlib import Path
 from typing import List, Optional, Dict, Type
 from dataclasses import dataclass
 from datetime import datetime
@@ -27,6 +23,7 @@ from src.executor.hyperliquid_client import HyperliquidClient
 from src.executor.risk_manager import RiskManager
 from src.executor.position_tracker import PositionTracker
 from src.strategies.base import StrategyCore, Signal
+from src.strategies.loader import get_strategy_loader
 from src.database.connection import get_session
 from src.database.models import Strategy
 from src.utils.logger import get_logger
@@ -154,7 +151,7 @@ class Orchestrator:
         Dynamically load a strategy class from code string.
 
         Args:
-            name: Strategy name (used as module name)
+            name: Strategy name (for logging)
             code: Python code containing the strategy class
 
         Returns:
@@ -165,49 +162,19 @@ class Orchestrator:
             return None
 
         try:
-            # Write code to temp file
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.py',
-                delete=False
-            ) as f:
-                f.write(code)
-                temp_path = Path(f.name)
-
-            # Load module from file
-            spec = importlib.util.spec_from_file_location(name, temp_path)
-
-            if spec is None or spec.loader is None:
-                logger.error(f"Failed to create module spec for {name}")
+            strategy_class = get_strategy_loader().load_class(code)
+
+            if strategy_class is None:
+                logger.error(f"No StrategyCore subclass found in {name}")
                 return None
 
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[name] = module
-            spec.loader.exec_module(module)
-
-            # Find the strategy class (subclass of StrategyCore)
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type) and
-                    issubclass(attr, StrategyCore) and
-                    attr is not StrategyCore
-                ):
-                    logger.debug(f"Found strategy class: {attr_name}")
-                    return attr
-
-            logger.error(f"No StrategyCore subclass found in {name}")
-            return None
+            logger.debug(f"Found strategy class: {strategy_class.__name__}")
+            return strategy_class
 
         except Exception as e:
             logger.error(f"Error loading strategy {name}: {e}", exc_info=True)
             return None
 
-        finally:
-            # Clean up temp file
-            if temp_path.exists():
-                temp_path.unlink()
-
     def initialize_data_provider(self) -> None:
         """Initialize Hyperliquid WebSocket data provider"""
         # Collect all symbols/timeframes from strategies
@@ -34,9 +34,13 @@ def main():
     if _shutdown_requested:
         return
 
-    from src.backtester.main_continuous import ContinuousBacktesterProcess
+    # Startup report is logged by run() after validation and JIT warmup
+    from src.utils.startup import startup_phase
 
-    process = ContinuousBacktesterProcess()
+    with startup_phase('imports'):
+        from src.backtester.main_continuous import ContinuousBacktesterProcess
+    with startup_phase('init'):
+        process = ContinuousBacktesterProcess()
     process.run()
 
 
@@ -31,7 +31,11 @@ signal.signal(signal.SIGTERM, _early_signal_handler)
 
 
 if __name__ == "__main__":
-    from src.data.data_scheduler import DataScheduler
+    from src.utils.startup import startup_phase, log_startup_report
 
-    scheduler = DataScheduler()
+    with startup_phase('imports'):
+        from src.data.data_scheduler import DataScheduler
+    with startup_phase('init'):
+        scheduler = DataScheduler()
+    log_startup_report('data_scheduler')
     scheduler.run()
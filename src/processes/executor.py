@@ -34,9 +34,13 @@ def main():
     if _shutdown_requested:
         return
 
-    from src.executor.main_continuous import ContinuousExecutorProcess
+    from src.utils.startup import startup_phase, log_startup_report
 
-    process = ContinuousExecutorProcess()
+    with startup_phase('imports'):
+        from src.executor.main_continuous import ContinuousExecutorProcess
+    with startup_phase('init'):
+        process = ContinuousExecutorProcess()
+    log_startup_report('executor')
     process.run()
 
 
@@ -34,10 +34,13 @@ def main():
     if _shutdown_requested:
         return
 
-    # Now safe to do heavy imports
-    from src.generator.main_continuous import ContinuousGeneratorProcess
+    from src.utils.startup import startup_phase, log_startup_report
 
-    process = ContinuousGeneratorProcess()
+    with startup_phase('imports'):
+        from src.generator.main_continuous import ContinuousGeneratorProcess
+    with startup_phase('init'):
+        process = ContinuousGeneratorProcess()
+    log_startup_report('generator')
     process.run()
 
 
@@ -34,9 +34,13 @@ def main():
     if _shutdown_requested:
         return
 
-    from src.monitor.main_continuous import ContinuousMonitorProcess
+    from src.utils.startup import startup_phase, log_startup_report
 
-    process = ContinuousMonitorProcess()
+    with startup_phase('imports'):
+        from src.monitor.main_continuous import ContinuousMonitorProcess
+    with startup_phase('init'):
+        process = ContinuousMonitorProcess()
+    log_startup_report('monitor')
     process.run()
 
 
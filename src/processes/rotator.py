@@ -33,9 +33,13 @@ def main():
     if _shutdown_requested:
         return
 
-    from src.rotator.main_continuous import ContinuousRotatorProcess
+    from src.utils.startup import startup_phase, log_startup_report
 
-    process = ContinuousRotatorProcess()
+    with startup_phase('imports'):
+        from src.rotator.main_continuous import ContinuousRotatorProcess
+    with startup_phase('init'):
+        process = ContinuousRotatorProcess()
+    log_startup_report('rotator')
     process.run()
 
 
@@ -34,9 +34,13 @@ def main():
     if _shutdown_requested:
         return
 
-    from src.scheduler.main_continuous import ContinuousSchedulerProcess
+    from src.utils.startup import startup_phase, log_startup_report
 
-    process = ContinuousSchedulerProcess()
+    with startup_phase('imports'):
+        from src.scheduler.main_continuous import ContinuousSchedulerProcess
+    with startup_phase('init'):
+        process = ContinuousSchedulerProcess()
+    log_startup_report('scheduler')
     process.run()
 
 
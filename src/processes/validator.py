@@ -34,9 +34,13 @@ def main():
     if _shutdown_requested:
         return
 
-    from src.validator.main_continuous import ContinuousValidatorProcess
+    from src.utils.startup import startup_phase, log_startup_report
 
-    process = ContinuousValidatorProcess()
+    with startup_phase('imports'):
+        from src.validator.main_continuous import ContinuousValidatorProcess
+    with startup_phase('init'):
+        process = ContinuousValidatorProcess()
+    log_startup_report('validator')
     process.run()
 
 
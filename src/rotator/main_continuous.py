@@ -156,6 +156,12 @@ class ContinuousRotatorProcess:
         logger.info(f"Shutdown requested (signal {signum})")
         self.shutdown_event.set()
         self.force_exit = True
+
+        from src.database.event_tracker import EventTracker
+
+        # Write queued pipeline events before exiting (os._exit skips atexit)
+        EventTracker.flush(timeout=5.0)
+
         os._exit(0)
 
     def run(self):
@@ -1,7 +1,8 @@
 """
 Live Performance Scorer
 
-Calculates performance metrics from live Trade records.
+Calculates performance metrics from live trades, via the per-strategy
+running statistics kept by src.scorer.live_stats.
 Used for monitoring LIVE strategies and retirement decisions.
 
 Score Formula (unified):
@@ -10,20 +11,24 @@ Score Formula (unified):
 """
 
 from datetime import datetime, UTC
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 from uuid import UUID
 import numpy as np
 
 from src.database import get_session
-from src.database.models import Strategy, Trade
+from src.database.models import Strategy, StrategyLiveStats
+from src.scorer.live_stats import get_live_stats
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Variance below this fraction of the mean squared return is rounding residue
+ZERO_VARIANCE_RTOL = 1e-9
+
 
 class LiveScorer:
     """
-    Calculates live performance metrics from Trade records.
+    Calculates live performance metrics from running trade statistics.
 
     Single Responsibility: Calculate score from live trading data.
     """
@@ -69,7 +74,8 @@ class LiveScorer:
 
     def calculate_live_metrics(self, strategy_id: UUID) -> Optional[Dict]:
         """
-        Calculate live performance metrics from Trade records.
+        Calculate live performance metrics from the strategy's running
+        trade statistics (StrategyLiveStats, updated as trades close).
 
         Args:
             strategy_id: Strategy UUID
@@ -87,121 +93,119 @@ class LiveScorer:
             }
         """
         with get_session() as session:
-            trades = (
-                session.query(Trade)
-                .filter(
-                    Trade.strategy_id == strategy_id,
-                    Trade.exit_time.isnot(None)  # Only closed trades
-                )
-                .order_by(Trade.exit_time.asc())
-                .all()
-            )
+            stats = get_live_stats(session, strategy_id)
+            return self.metrics_from_stats(stats)
 
-            if len(trades) < self.min_trades:
-                logger.debug(
-                    f"Strategy {strategy_id}: {len(trades)} trades < min {self.min_trades}"
-                )
-                return None
+    def metrics_from_stats(self, stats: StrategyLiveStats) -> Optional[Dict]:
+        """
+        Live metrics from running trade statistics (see calculate_live_metrics).
 
-            # Calculate trade frequency for Sharpe annualization
-            trades_per_day = self._calculate_trades_per_day(trades)
+        Args:
+            stats: StrategyLiveStats row
 
-            if trades_per_day is None:
-                logger.info(
-                    f"Strategy {strategy_id}: insufficient trade history for metrics "
-                    f"(need {self.min_trades_for_frequency} trades and "
-                    f"{self.min_days_for_frequency} days)"
-                )
-                return None
-
-            # Extract PnL values
-            pnls = [t.pnl_usd for t in trades if t.pnl_usd is not None]
-            pnl_pcts = [t.pnl_pct for t in trades if t.pnl_pct is not None]
-
-            if not pnls:
-                return None
-
-            # Calculate metrics
-            total_trades = len(trades)
-            wins = [p for p in pnls if p > 0]
-            win_rate = len(wins) / total_trades if total_trades > 0 else 0
-
-            # Calculate expectancy
-            expectancy = self._calculate_expectancy(pnl_pcts, win_rate)
-            total_pnl = sum(pnls)
-            sharpe = self._calculate_sharpe(pnl_pcts, trades_per_day)
-            max_drawdown = self._calculate_max_drawdown(pnls)
-
-            # Composite score
-            score = self._calculate_score(
-                expectancy=expectancy,
-                sharpe=sharpe,
-                win_rate=win_rate,
-                max_drawdown=max_drawdown
+        Returns:
+            Metrics dict, or None if insufficient data
+        """
+        strategy_id = stats.strategy_id
+        total_trades = stats.n_trades
+
+        if total_trades < self.min_trades:
+            logger.debug(
+                f"Strategy {strategy_id}: {total_trades} trades < min {self.min_trades}"
             )
+            return None
 
-            return {
-                'total_trades': total_trades,
-                'win_rate': win_rate,
-                'expectancy': expectancy,
-                'sharpe': sharpe,
-                'max_drawdown': max_drawdown,
-                'total_pnl': total_pnl,
-                'score': score
-            }
+        # Calculate trade frequency for Sharpe annualization
+        trades_per_day = self._calculate_trades_per_day(stats)
+
+        if trades_per_day is None:
+            logger.info(
+                f"Strategy {strategy_id}: insufficient trade history for metrics "
+                f"(need {self.min_trades_for_frequency} trades and "
+                f"{self.min_days_for_frequency} days)"
+            )
+            return None
 
-    def _calculate_trades_per_day(self, trades: List[Trade]) -> Optional[float]:
+        if stats.n_pnls == 0:
+            return None
+
+        # Calculate metrics
+        win_rate = stats.n_wins / total_trades if total_trades > 0 else 0
+        expectancy = self._calculate_expectancy(stats, win_rate)
+        sharpe = self._calculate_sharpe(stats, trades_per_day)
+        max_drawdown = float(stats.max_drawdown)
+
+        # Composite score
+        score = self._calculate_score(
+            expectancy=expectancy,
+            sharpe=sharpe,
+            win_rate=win_rate,
+            max_drawdown=max_drawdown
+        )
+
+        return {
+            'total_trades': total_trades,
+            'win_rate': win_rate,
+            'expectancy': expectancy,
+            'sharpe': sharpe,
+            'max_drawdown': max_drawdown,
+            'total_pnl': stats.total_pnl,
+            'score': score
+        }
+
+    def _calculate_trades_per_day(self, stats: StrategyLiveStats) -> Optional[float]:
         """
         Calculate average trades per day for Sharpe annualization.
 
         Returns None if insufficient data for reliable calculation.
         """
-        if len(trades) < self.min_trades_for_frequency:
+        if stats.n_trades < self.min_trades_for_frequency:
             return None
 
-        first_time = min(t.entry_time for t in trades)
-        last_time = max(t.exit_time for t in trades)
-        days_active = (last_time - first_time).total_seconds() / 86400
+        if stats.first_entry_time is None or stats.last_exit_time is None:
+            return None
+
+        days_active = (stats.last_exit_time - stats.first_entry_time).total_seconds() / 86400
 
         if days_active < self.min_days_for_frequency:
             return None
 
-        return len(trades) / days_active
+        return stats.n_trades / days_active
 
-    def _calculate_expectancy(self, pnl_pcts: List[float], win_rate: float) -> float:
+    def _calculate_expectancy(self, stats: StrategyLiveStats, win_rate: float) -> float:
         """
         Calculate expectancy using formal formula.
 
         Formula: (win_rate x avg_win%) - ((1 - win_rate) x avg_loss%)
         """
-        if not pnl_pcts:
+        if stats.n_returns == 0:
             return 0.0
 
         if 0 < win_rate < 1:
-            winning_trades = [p for p in pnl_pcts if p > 0]
-            losing_trades = [p for p in pnl_pcts if p < 0]
-
-            avg_win = np.mean(winning_trades) if winning_trades else 0.0
-            avg_loss = abs(np.mean(losing_trades)) if losing_trades else 0.0
+            avg_win = stats.sum_win_return / stats.n_win_returns if stats.n_win_returns else 0.0
+            avg_loss = abs(stats.sum_loss_return / stats.n_loss_returns) if stats.n_loss_returns else 0.0
 
             return (win_rate * avg_win) - ((1 - win_rate) * avg_loss)
         else:
-            return np.mean(pnl_pcts)
+            return stats.sum_return / stats.n_returns
 
-    def _calculate_sharpe(self, returns: List[float], trades_per_day: Optional[float]) -> float:
+    def _calculate_sharpe(self, stats: StrategyLiveStats, trades_per_day: Optional[float]) -> float:
         """
-        Calculate annualized Sharpe ratio.
+        Calculate annualized Sharpe ratio from return sums.
 
         Uses actual trade frequency for annualization.
         """
-        if len(returns) < 2 or trades_per_day is None:
+        n = stats.n_returns
+        if n < 2 or trades_per_day is None:
             return 0.0
 
-        mean_return = np.mean(returns)
-        std_return = np.std(returns, ddof=1)
-
-        if std_return == 0:
+        mean_return = stats.sum_return / n
+        # Sample variance (ddof=1) from sum and sum of squares. Identical
+        # returns leave only rounding residue: treat as zero variance.
+        variance = (stats.sum_sq_return - stats.sum_return * mean_return) / (n - 1)
+        if variance <= ZERO_VARIANCE_RTOL * (stats.sum_sq_return / n):
             return 0.0
+        std_return = np.sqrt(variance)
 
         # Annualize based on actual trade frequency
         # Crypto markets: 365 days/year
@@ -210,27 +214,6 @@ class LiveScorer:
 
         return float(sharpe)
 
-    def _calculate_max_drawdown(self, pnls: List[float]) -> float:
-        """
-        Calculate maximum drawdown from PnL series.
-
-        Returns max drawdown as positive float (e.g., 0.15 = 15%)
-        """
-        if not pnls:
-            return 0.0
-
-        equity = np.cumsum(pnls)
-        running_max = np.maximum.accumulate(equity)
-        drawdowns = running_max - equity
-
-        max_dd = 0.0
-        for i, dd in enumerate(drawdowns):
-            if running_max[i] > 0:
-                dd_pct = dd / running_max[i]
-                max_dd = max(max_dd, dd_pct)
-
-        return float(max_dd)
-
     def _calculate_score(
         self,
         expectancy: float,
@@ -0,0 +1,231 @@
+"""
+Live Trade Running Statistics
+
+One StrategyLiveStats row per strategy, folded forward each time a live
+trade closes (TradeSync, executor exits) in the same transaction as the
+trade update. LiveScorer, RetirementPolicy and the API read the row: O(1)
+per strategy instead of the full trade history.
+
+Trades are folded in exit order (drawdown and loss streak depend on it).
+The row is rebuilt from the trades table when it does not exist yet
+(strategies that traded before the table) or when a trade closes before
+the last folded one.
+
+Usage:
+    with get_session() as session:
+        trade.exit_time = ...
+        trade.pnl_usd = ...
+        record_closed_trade(session, trade)
+"""
+
+from datetime import datetime, UTC
+from typing import Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.database.models import StrategyLiveStats, Trade
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _naive_utc(ts: Optional[datetime]) -> Optional[datetime]:
+    """Trade times are naive UTC columns, but may be set tz-aware before the flush"""
+    if ts is not None and ts.tzinfo is not None:
+        return ts.astimezone(UTC).replace(tzinfo=None)
+    return ts
+
+
+def reset_stats(stats: StrategyLiveStats) -> None:
+    """Zero all running statistics"""
+    stats.n_trades = 0
+    stats.n_wins = 0
+    stats.n_returns = 0
+    stats.sum_return = 0.0
+    stats.sum_sq_return = 0.0
+    stats.n_win_returns = 0
+    stats.sum_win_return = 0.0
+    stats.n_loss_returns = 0
+    stats.sum_loss_return = 0.0
+    stats.n_pnls = 0
+    stats.total_pnl = 0.0
+    stats.peak_pnl = 0.0
+    stats.max_drawdown = 0.0
+    stats.loss_streak = 0
+    stats.first_entry_time = None
+    stats.last_exit_time = None
+    stats.last_trade_id = None
+
+
+def trade_return(trade: Trade) -> Optional[float]:
+    """
+    Trade return as a fraction of entry notional (0.012 = 1.2%).
+
+    Trade.pnl_pct is stored in percent, but rows written by older executor
+    versions hold a fraction. Derive the return from pnl_usd and the entry
+    notional when possible so both fold in one unit; pnl_pct / 100 otherwise.
+    """
+    notional = (trade.entry_price or 0.0) * (trade.entry_size or 0.0)
+    if trade.pnl_usd is not None and notional > 0:
+        return trade.pnl_usd / notional
+    if trade.pnl_pct is not None:
+        return trade.pnl_pct / 100
+    return None
+
+
+def apply_trade(stats: StrategyLiveStats, trade: Trade) -> None:
+    """
+    Fold one closed trade into the running statistics.
+
+    Same definitions as the trade-list metrics: win = pnl_usd > 0, returns
+    come from trade_return(), drawdown is measured on cumulative pnl_usd
+    against its positive running peak, and a trade without pnl_usd ends a
+    loss streak.
+    """
+    stats.n_trades += 1
+
+    pnl = trade.pnl_usd
+    if pnl is not None:
+        if pnl > 0:
+            stats.n_wins += 1
+        stats.n_pnls += 1
+        stats.total_pnl += pnl
+        stats.peak_pnl = max(stats.peak_pnl, stats.total_pnl)
+        if stats.peak_pnl > 0:
+            drawdown = (stats.peak_pnl - stats.total_pnl) / stats.peak_pnl
+            stats.max_drawdown = max(stats.max_drawdown, drawdown)
+
+    ret = trade_return(trade)
+    if ret is not None:
+        stats.n_returns += 1
+        stats.sum_return += ret
+        stats.sum_sq_return += ret * ret
+        if ret > 0:
+            stats.n_win_returns += 1
+            stats.sum_win_return += ret
+        elif ret < 0:
+            stats.n_loss_returns += 1
+            stats.sum_loss_return += ret
+
+    stats.loss_streak = stats.loss_streak + 1 if pnl is not None and pnl < 0 else 0
+
+    entry_time = _naive_utc(trade.entry_time)
+    exit_time = _naive_utc(trade.exit_time)
+    if entry_time is not None and (stats.first_entry_time is None or entry_time < stats.first_entry_time):
+        stats.first_entry_time = entry_time
+    if stats.last_exit_time is None or exit_time >= stats.last_exit_time:
+        stats.last_exit_time = exit_time
+        stats.last_trade_id = trade.id
+    stats.updated_at = datetime.now(UTC)
+
+
+def rebuild_live_stats(session: Session, stats: StrategyLiveStats) -> StrategyLiveStats:
+    """Recompute a stats row from all closed trades of its strategy"""
+    trades = (
+        session.query(Trade)
+        .filter(
+            Trade.strategy_id == stats.strategy_id,
+            Trade.exit_time.isnot(None)
+        )
+        .order_by(Trade.exit_time.asc())
+        .all()
+    )
+    reset_stats(stats)
+    for trade in trades:
+        apply_trade(stats, trade)
+    stats.updated_at = datetime.now(UTC)
+    return stats
+
+
+def _lock_stats(session: Session, strategy_id: UUID) -> Tuple[StrategyLiveStats, bool]:
+    """
+    Row-lock the stats of a strategy, creating the row if needed.
+
+    Returns:
+        (stats, created) - created rows still need a rebuild
+    """
+    created = session.execute(
+        insert(StrategyLiveStats)
+        .values(strategy_id=strategy_id, updated_at=datetime.now(UTC))
+        .on_conflict_do_nothing(index_elements=['strategy_id'])
+        .returning(StrategyLiveStats.strategy_id)
+    ).first() is not None
+
+    stats = (
+        session.query(StrategyLiveStats)
+        .filter(StrategyLiveStats.strategy_id == strategy_id)
+        .with_for_update()
+        .populate_existing()
+        .one()
+    )
+    return stats, created
+
+
+def _was_closed(trade: Trade) -> bool:
+    """True if the trade was loaded with an exit_time that is now being overwritten"""
+    state = inspect(trade, raiseerr=False)
+    if state is None:
+        return False
+    return any(value is not None for value in state.attrs.exit_time.history.deleted)
+
+
+def record_closed_trade(session: Session, trade: Trade) -> StrategyLiveStats:
+    """
+    Update the strategy's running statistics for a trade that just closed.
+
+    Call in the session that sets the trade's exit fields, so both commit
+    together. The row lock serializes concurrent closes of one strategy.
+    A trade closed twice is counted once: overwriting its exit fields
+    triggers a rebuild, and folding the last folded trade again is skipped.
+
+    Args:
+        session: Session holding the closed trade
+        trade: Trade with exit_time and pnl set
+
+    Returns:
+        Updated StrategyLiveStats
+    """
+    stats, created = _lock_stats(session, trade.strategy_id)
+
+    # Closed before with other exit fields: its old values are in the sums
+    reclosed = _was_closed(trade)
+    if reclosed:
+        logger.warning(f"Trade {trade.id} closed twice, rebuilding live stats")
+    elif not created and stats.last_trade_id == trade.id:
+        logger.warning(f"Trade {trade.id} already folded into live stats, skipping")
+        return stats
+
+    out_of_order = (
+        stats.last_exit_time is not None and _naive_utc(trade.exit_time) < stats.last_exit_time
+    )
+    if created or out_of_order or reclosed:
+        # Flush the trade's exit fields so the rebuild includes it
+        session.flush()
+        return rebuild_live_stats(session, stats)
+
+    apply_trade(stats, trade)
+    return stats
+
+
+def get_live_stats(session: Session, strategy_id: UUID) -> StrategyLiveStats:
+    """
+    Running statistics of a strategy (built from its trades on first use).
+
+    Args:
+        session: Database session
+        strategy_id: Strategy UUID
+    """
+    stats = session.query(StrategyLiveStats).filter(
+        StrategyLiveStats.strategy_id == strategy_id
+    ).first()
+    if stats is not None:
+        return stats
+
+    stats, created = _lock_stats(session, strategy_id)
+    if created:
+        rebuild_live_stats(session, stats)
+        logger.info(f"Built live stats for {strategy_id} from {stats.n_trades} closed trades")
+    return stats
@@ -13,6 +13,8 @@ from typing import Optional, List
 import pandas as pd
 import numpy as np
 
+from src.strategies.indicator_cache import get_indicator_cache
+
 
 # =============================================================================
 # STOP LOSS TYPES
@@ -455,6 +457,34 @@ class StrategyCore(ABC):
         """
         pass
 
+    @staticmethod
+    def cached_indicator(func, *args, **kwargs):
+        """
+        Compute func(*args, **kwargs) through the process-wide indicator cache.
+
+        Strategies computing the same indicator on the same data (RSI(14) on
+        BTC 15m, ...) share one computation per process. The key includes a
+        content digest of every array argument, so truncated/shuffled frames
+        (lookahead tests) and new candles never hit stale entries.
+
+        Args:
+            func: Indicator function (talib/pandas_ta function or a
+                module-level helper - not a closure)
+            *args: Input Series/arrays and positional parameters
+            **kwargs: Indicator parameters
+
+        Returns:
+            Same as func: Series/DataFrame/ndarray or a tuple of them,
+            as a fresh copy the caller may modify
+
+        Example:
+            def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+                df = df.copy()
+                df['rsi'] = self.cached_indicator(ta.RSI, df['close'], timeperiod=14)
+                return df
+        """
+        return get_indicator_cache().get_or_compute(func, args, kwargs)
+
     def generate_signals_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Generate signals for ALL bars in the dataframe.
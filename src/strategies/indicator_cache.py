@@ -0,0 +1,358 @@
+"""
+Indicator Cache
+
+Process-wide cache for indicator computations shared by all strategies.
+
+Generated strategies (pattern_gen, unger, pandas_ta) recompute the same
+indicators - RSI(14), ATR(14), EMA(12/26), BB(20)... - on the same coins
+thousands of times a day. The cache stores each result once per process
+and hands out copies.
+
+Cache key: (function, params, data version)
+- function: qualified name + bytecode digest for Python functions (identical
+  helpers defined in different generated modules share entries), or
+  module.qualname for C extensions (talib)
+- params: repr of non-array arguments
+- data version: 128-bit content digest of every array argument
+
+The data version is derived from the input values themselves, so a new
+candle, a truncated frame (lookahead test) or a shuffled frame (shuffle
+test) produce a different key - there is no stale entry to invalidate.
+Symbol and timeframe are implied by the data: the same OHLCV column is the
+same input regardless of which strategy asked for it.
+
+Eviction: LRU bounded by total stored bytes.
+
+Usage:
+    # In calculate_indicators() of a StrategyCore subclass
+    df['rsi'] = self.cached_indicator(ta.RSI, df['close'], timeperiod=14)
+
+    # Or wrap a whole indicator library (generated templates)
+    ta = cached_module(talib)
+    df['rsi'] = ta.RSI(df['close'], timeperiod=14)
+"""
+
+import hashlib
+import threading
+import types
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_MB = 512
+
+# Random odd 64-bit weights for the content digest (grown on demand)
+_DIGEST_SEED = 0x5EED
+_digest_weights = np.empty((2, 0), dtype=np.uint64)
+_digest_lock = threading.Lock()
+
+
+def _weights(n: int) -> np.ndarray:
+    """Digest weight lanes of length >= n (shared, grown geometrically)"""
+    global _digest_weights
+    weights = _digest_weights
+    if weights.shape[1] >= n:
+        return weights
+    with _digest_lock:
+        if _digest_weights.shape[1] < n:
+            rng = np.random.default_rng(_DIGEST_SEED)
+            size = max(n, 2 * _digest_weights.shape[1], 1 << 14)
+            _digest_weights = rng.integers(0, 2**63, size=(2, size), dtype=np.uint64) * 2 + 1
+        return _digest_weights
+
+
+def data_digest(values: np.ndarray) -> Tuple:
+    """
+    128-bit content digest of an array (two weighted uint64 sums).
+
+    ~15us for 17k float64 bars, 15x cheaper than blake2b. Position-sensitive,
+    so shuffles and truncations change the digest.
+    """
+    arr = np.ascontiguousarray(values)
+    if arr.dtype == object:
+        return ('obj', hashlib.blake2b(repr(arr.tolist()).encode(), digest_size=16).hexdigest())
+
+    if arr.dtype.itemsize == 8:
+        words = arr.reshape(-1).view(np.uint64)
+    else:
+        raw = arr.reshape(-1).view(np.uint8)
+        pad = (-len(raw)) % 8
+        if pad:
+            raw = np.concatenate([raw, np.zeros(pad, dtype=np.uint8)])
+        words = raw.view(np.uint64)
+    n = len(words)
+    weights = _weights(n)
+    return (
+        arr.dtype.str, arr.shape,
+        int((words * weights[0, :n]).sum()),
+        int((words * weights[1, :n]).sum()),
+    )
+
+
+# Weak keys: a digest must not keep a discarded strategy's code object alive
+_CODE_DIGEST_MAX = 4096
+_code_digests: 'weakref.WeakKeyDictionary[types.CodeType, str]' = weakref.WeakKeyDictionary()
+_code_digests_lock = threading.Lock()
+
+
+def _code_digest(code: types.CodeType) -> str:
+    """Digest of a code object (bytecode, constants, names) - stable across modules"""
+    with _code_digests_lock:
+        digest = _code_digests.get(code)
+    if digest is not None:
+        return digest
+
+    h = hashlib.blake2b(digest_size=12)
+    h.update(code.co_code)
+    h.update(repr(code.co_names).encode())
+    h.update(repr(code.co_varnames).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            h.update(_code_digest(const).encode())
+        else:
+            h.update(repr(const).encode())
+    digest = h.hexdigest()
+
+    with _code_digests_lock:
+        if len(_code_digests) >= _CODE_DIGEST_MAX:
+            _code_digests.clear()
+        _code_digests[code] = digest
+    return digest
+
+
+def _function_id(func: Callable) -> Tuple:
+    """
+    Identity of an indicator function for the cache key.
+
+    Plain Python functions are identified by name + bytecode, so the same
+    helper rendered into many generated strategy modules shares entries.
+    Decorated functions (closures, e.g. talib's pandas wrappers) and C
+    functions are identified by module + qualified name.
+
+    Raises:
+        ValueError: For closures defined inside functions (captured values
+            are not part of the key - pass them as arguments instead)
+    """
+    code = getattr(func, '__code__', None)
+    qualname = getattr(func, '__qualname__', None) or repr(func)
+
+    if code is None or func.__closure__:
+        if '<locals>' in qualname or '<lambda>' in qualname:
+            raise ValueError(
+                f"Cannot cache closure '{qualname}': pass captured values as arguments"
+            )
+        return (getattr(func, '__module__', None), qualname)
+
+    return (qualname, _code_digest(code), repr(func.__defaults__), repr(func.__kwdefaults__))
+
+
+def _arg_key(value: Any) -> Any:
+    """Key component for one argument: digest for data, repr for params"""
+    if isinstance(value, pd.Series):
+        return ('series', data_digest(value.values))
+    if isinstance(value, pd.DataFrame):
+        return ('frame', tuple(value.columns), tuple(data_digest(value[c].values) for c in value.columns))
+    if isinstance(value, np.ndarray):
+        return ('array', data_digest(value))
+    return repr(value)
+
+
+def _detach(result: Any) -> Tuple[Any, int]:
+    """Private copy of a result for storage, plus its size in bytes"""
+    if isinstance(result, pd.Series):
+        values = result.to_numpy(copy=True)
+        return ('series', values, result.name), values.nbytes
+    if isinstance(result, pd.DataFrame):
+        columns = {c: result[c].to_numpy(copy=True) for c in result.columns}
+        return ('frame', columns, list(result.columns)), sum(v.nbytes for v in columns.values())
+    if isinstance(result, np.ndarray):
+        values = result.copy()
+        return ('array', values), values.nbytes
+    if isinstance(result, (tuple, list)):
+        parts = [_detach(r) for r in result]
+        return ('seq', type(result), [p[0] for p in parts]), sum(p[1] for p in parts)
+    return ('value', result), 64
+
+
+def _attach(stored: Tuple, index: Optional[pd.Index]) -> Any:
+    """Rebuild a fresh (caller-owned) result from storage"""
+    kind = stored[0]
+    if kind == 'series':
+        _, values, name = stored
+        return pd.Series(values.copy(), index=_fit_index(index, len(values)), name=name)
+    if kind == 'frame':
+        _, columns, order = stored
+        n = len(next(iter(columns.values()))) if columns else 0
+        return pd.DataFrame(
+            {c: columns[c].copy() for c in order}, index=_fit_index(index, n), columns=order
+        )
+    if kind == 'array':
+        return stored[1].copy()
+    if kind == 'seq':
+        _, seq_type, parts = stored
+        return seq_type(_attach(p, index) for p in parts)
+    return stored[1]
+
+
+def _fit_index(index: Optional[pd.Index], n: int) -> pd.Index:
+    return index if index is not None and len(index) == n else pd.RangeIndex(n)
+
+
+class IndicatorCache:
+    """
+    Thread-safe, byte-bounded LRU cache of indicator results.
+
+    Computation happens outside the lock: two threads missing on the same
+    key both compute, the second store wins (results are identical).
+    """
+
+    _instance: Optional['IndicatorCache'] = None
+    _lock = threading.Lock()
+
+    def __init__(self, max_mb: float = DEFAULT_MAX_MB, enabled: bool = True):
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.enabled = enabled
+        self._entries: 'OrderedDict[Tuple, Tuple[Any, int]]' = OrderedDict()
+        self._entries_lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def instance(cls) -> 'IndicatorCache':
+        """Get singleton instance (thread-safe)."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def configure(cls, max_mb: float = DEFAULT_MAX_MB, enabled: bool = True) -> 'IndicatorCache':
+        """Replace the singleton with a new configuration (call once at process start)."""
+        with cls._lock:
+            cls._instance = cls(max_mb=max_mb, enabled=enabled)
+        logger.info(f"IndicatorCache configured: enabled={enabled}, max={max_mb}MB")
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset singleton (for testing)."""
+        with cls._lock:
+            cls._instance = None
+
+    def get_or_compute(
+        self,
+        func: Callable,
+        args: Tuple = (),
+        kwargs: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Return func(*args, **kwargs), served from cache when possible.
+
+        Results are returned as fresh copies indexed like the first pandas
+        argument, so callers may modify them freely.
+        """
+        kwargs = kwargs or {}
+        if not self.enabled:
+            return func(*args, **kwargs)
+
+        key = (
+            _function_id(func),
+            tuple(_arg_key(a) for a in args),
+            tuple(sorted((k, _arg_key(v)) for k, v in kwargs.items())),
+        )
+        index = next(
+            (a.index for a in (*args, *kwargs.values()) if isinstance(a, (pd.Series, pd.DataFrame))),
+            None,
+        )
+
+        with self._entries_lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is not None:
+            return _attach(entry[0], index)
+
+        result = func(*args, **kwargs)
+        stored, nbytes = _detach(result)
+
+        with self._entries_lock:
+            self.misses += 1
+            if nbytes <= self.max_bytes:
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._bytes -= previous[1]
+                self._entries[key] = (stored, nbytes)
+                self._bytes += nbytes
+                while self._bytes > self.max_bytes:
+                    _, (_, evicted_bytes) = self._entries.popitem(last=False)
+                    self._bytes -= evicted_bytes
+                    self.evictions += 1
+
+        return result
+
+    def clear(self) -> None:
+        """Drop all entries (stats are kept)."""
+        with self._entries_lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Cache statistics for logging"""
+        with self._entries_lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'mb': round(self._bytes / (1024 * 1024), 1),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+def get_indicator_cache() -> IndicatorCache:
+    """Get the process-wide IndicatorCache singleton"""
+    return IndicatorCache.instance()
+
+
+class _CachedModule:
+    """Attribute proxy: module functions are called through the indicator cache"""
+
+    def __init__(self, module: types.ModuleType):
+        self._module = module
+        self._wrappers: Dict[str, Callable] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._module, name)
+        if not callable(attr) or isinstance(attr, type):
+            return attr
+        wrapper = self._wrappers.get(name)
+        if wrapper is None:
+            def wrapper(*args, _func=attr, **kwargs):
+                return get_indicator_cache().get_or_compute(_func, args, kwargs)
+            wrapper.__name__ = name
+            wrapper.__doc__ = attr.__doc__
+            self._wrappers[name] = wrapper
+        return wrapper
+
+    def __repr__(self) -> str:
+        return f"<cached {self._module.__name__}>"
+
+
+def cached_module(module: types.ModuleType) -> _CachedModule:
+    """
+    Wrap an indicator library (talib, pandas_ta) so every function call
+    goes through the process-wide indicator cache.
+    """
+    return _CachedModule(module)
@@ -0,0 +1,303 @@
+"""
+Strategy Loader
+
+Process-wide loader for strategy code stored in the database.
+
+Validator, backtester, executor and orchestrator all turn a code string into
+a StrategyCore subclass. The same code is loaded many times per process
+(validation, IS/OOS, WFA, retest, shuffle test), so modules are cached by
+content hash and compiled straight from memory - no temp file, no import
+machinery.
+
+Cache layers:
+- Memory: hash -> module, LRU bounded by module count. Evicted modules are
+  removed from sys.modules (and linecache) so long-running processes don't
+  grow with every strategy tested. Instances created from an evicted module
+  keep working - the class holds a reference to its module globals.
+- Disk: hash -> marshalled code object (one file per hash and interpreter),
+  shared by all processes; skips compile() on reload and across restarts.
+  Bounded by file count: reads refresh a file's mtime, and writes that push
+  the directory over the limit delete the least recently used files. The
+  directory is only listed when the file count may exceed the limit.
+
+Module name: sixbtc_strategy_<hash>. Identical code shares one module; a
+changed line is a different module.
+
+Usage:
+    cls = get_strategy_loader().load_class(code, class_name)
+    strategy = cls()
+"""
+
+import hashlib
+import importlib.util
+import linecache
+import marshal
+import os
+import sys
+import threading
+import types
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Type
+
+from src.strategies.base import StrategyCore
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_MODULES = 256
+DEFAULT_CACHE_DIR = 'data/strategy_code'
+DEFAULT_MAX_DISK_FILES = 5000
+
+MODULE_PREFIX = 'sixbtc_strategy_'
+
+
+def code_hash(code: str) -> str:
+    """Content hash identifying a strategy source (first 16 hex of sha256)"""
+    return hashlib.sha256(code.encode('utf-8')).hexdigest()[:16]
+
+
+class StrategyLoader:
+    """
+    Thread-safe, count-bounded LRU cache of strategy modules.
+
+    Loading holds the lock while the module executes: module bodies only
+    define classes, and serializing avoids two threads registering the same
+    module name.
+    """
+
+    _instance: Optional['StrategyLoader'] = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_modules: int = DEFAULT_MAX_MODULES,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_disk_files: int = DEFAULT_MAX_DISK_FILES
+    ):
+        """
+        Args:
+            max_modules: Modules kept in memory (LRU)
+            cache_dir: Directory for compiled code objects (None = memory only)
+            max_disk_files: Compiled code files kept in cache_dir (LRU by mtime)
+        """
+        self.max_modules = max(1, max_modules)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_disk_files = max(1, max_disk_files)
+        self._modules: 'OrderedDict[str, types.ModuleType]' = OrderedDict()
+        self._modules_lock = threading.RLock()
+        # Files in cache_dir at the last listing plus our writes since (None = not listed yet)
+        self._disk_files: Optional[int] = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.compiles = 0
+        self.evictions = 0
+
+    @classmethod
+    def instance(cls) -> 'StrategyLoader':
+        """Get singleton instance (thread-safe). Memory only until configure() is called."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(cache_dir=None)
+        return cls._instance
+
+    @classmethod
+    def configure(
+        cls,
+        max_modules: int = DEFAULT_MAX_MODULES,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_disk_files: int = DEFAULT_MAX_DISK_FILES
+    ) -> 'StrategyLoader':
+        """Replace the singleton with a new configuration (call once at process start)."""
+        with cls._lock:
+            previous = cls._instance
+            cls._instance = cls(
+                max_modules=max_modules, cache_dir=cache_dir, max_disk_files=max_disk_files
+            )
+        if previous is not None:
+            previous.clear()
+        logger.info(
+            f"StrategyLoader configured: max_modules={max_modules}, cache_dir={cache_dir}, "
+            f"max_disk_files={max_disk_files}"
+        )
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Reset singleton (for testing)."""
+        with cls._lock:
+            previous, cls._instance = cls._instance, None
+        if previous is not None:
+            previous.clear()
+
+    def load_module(self, code: str) -> types.ModuleType:
+        """
+        Return the module for `code`, executing it on first use.
+
+        Raises:
+            SyntaxError, or whatever the module body raises (the failed
+            module is not cached or registered)
+        """
+        key = code_hash(code)
+        with self._modules_lock:
+            module = self._modules.get(key)
+            if module is not None:
+                self._modules.move_to_end(key)
+                self.hits += 1
+                return module
+
+            name = MODULE_PREFIX + key
+            filename = f"<strategy {key}>"
+            compiled = self._compile(key, code, filename)
+
+            module = types.ModuleType(name)
+            module.__file__ = filename
+            # Tracebacks and inspect.getsource() read source from linecache
+            linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+            sys.modules[name] = module
+            try:
+                exec(compiled, module.__dict__)
+            except BaseException:
+                self._unregister(module)
+                raise
+
+            self._modules[key] = module
+            while len(self._modules) > self.max_modules:
+                _, evicted = self._modules.popitem(last=False)
+                self._unregister(evicted)
+                self.evictions += 1
+
+            return module
+
+    def load_class(self, code: str, class_name: Optional[str] = None) -> Optional[Type[StrategyCore]]:
+        """
+        Return a StrategyCore subclass defined by `code`.
+
+        Args:
+            code: Strategy source
+            class_name: Class to return (None = first StrategyCore subclass
+                defined in the module)
+
+        Returns:
+            Strategy class, or None if the module defines no such class
+
+        Raises:
+            Whatever load_module raises
+        """
+        module = self.load_module(code)
+
+        if class_name is not None:
+            cls = getattr(module, class_name, None)
+            if isinstance(cls, type) and issubclass(cls, StrategyCore):
+                return cls
+            return None
+
+        for attr in vars(module).values():
+            if (
+                isinstance(attr, type) and
+                issubclass(attr, StrategyCore) and
+                attr is not StrategyCore and
+                attr.__module__ == module.__name__
+            ):
+                return attr
+        return None
+
+    def _compile(self, key: str, code: str, filename: str) -> types.CodeType:
+        """Code object from the disk cache, or compile() and store it"""
+        path = None
+        if self.cache_dir is not None:
+            path = self.cache_dir / f"{key}.{sys.implementation.cache_tag}.bin"
+            try:
+                data = path.read_bytes()
+                if data[:len(importlib.util.MAGIC_NUMBER)] == importlib.util.MAGIC_NUMBER:
+                    compiled = marshal.loads(data[len(importlib.util.MAGIC_NUMBER):])
+                    self.disk_hits += 1
+                    # Mark as recently used for _prune_disk_cache
+                    os.utime(path)
+                    return compiled
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable code cache {path.name}: {e}")
+
+        compiled = compile(code, filename, 'exec')
+        self.compiles += 1
+
+        if path is not None:
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_bytes(importlib.util.MAGIC_NUMBER + marshal.dumps(compiled))
+                os.replace(tmp_path, path)
+            except OSError as e:
+                tmp_path.unlink(missing_ok=True)
+                logger.debug(f"Could not write code cache {path.name}: {e}")
+            else:
+                if self._disk_files is not None:
+                    self._disk_files += 1
+                if self._disk_files is None or self._disk_files > self.max_disk_files:
+                    self._prune_disk_cache()
+
+        return compiled
+
+    def _prune_disk_cache(self) -> None:
+        """
+        Delete the least recently used code files beyond max_disk_files.
+
+        Lists and stats every code file, so _compile() only calls it on the
+        first write and when its file count passes max_disk_files. Prunes to
+        90% of the limit, leaving room for writes before the next listing.
+        Other processes' writes aren't counted: each process lists again
+        after its own writes fill the headroom. Files deleted by another
+        process are skipped.
+        """
+        entries = []
+        for path in self.cache_dir.glob('*.bin'):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        self._disk_files = len(entries)
+        if len(entries) <= self.max_disk_files:
+            return
+
+        entries.sort()
+        excess = len(entries) - int(self.max_disk_files * 0.9)
+        for _, path in entries[:excess]:
+            path.unlink(missing_ok=True)
+        self._disk_files -= excess
+        logger.debug(f"Pruned {excess} code cache files from {self.cache_dir}")
+
+    @staticmethod
+    def _unregister(module: types.ModuleType) -> None:
+        """Remove a module from sys.modules and its source from linecache"""
+        if sys.modules.get(module.__name__) is module:
+            del sys.modules[module.__name__]
+        linecache.cache.pop(module.__file__, None)
+
+    def clear(self) -> None:
+        """Drop all cached modules (stats are kept)."""
+        with self._modules_lock:
+            for module in self._modules.values():
+                self._unregister(module)
+            self._modules.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Loader statistics for logging"""
+        with self._modules_lock:
+            total = self.hits + self.disk_hits + self.compiles
+            return {
+                'modules': len(self._modules),
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'compiles': self.compiles,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0,
+            }
+
+
+def get_strategy_loader() -> StrategyLoader:
+    """Get the process-wide StrategyLoader singleton"""
+    return StrategyLoader.instance()
@@ -0,0 +1,48 @@
+"""
+Lazy package exports
+
+Package __init__ modules re-export their main classes for convenience
+(`from src.backtester import BacktestEngine`). Importing them eagerly means
+`import src.backtester.cache_reader` also loads numba, and
+`import src.executor.emergency_stop_manager` also loads ccxt and the
+Hyperliquid SDK. lazy_exports() keeps the same names but imports the
+defining submodule on first attribute access (PEP 562).
+
+Usage (in a package __init__.py):
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        'BacktestEngine': 'src.backtester.backtest_engine',
+    })
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ for a package.
+
+    Args:
+        package: Package __name__
+        exports: Exported name -> module that defines it
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package namespace
+    """
+    def __getattr__(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        # Cache on the package: later lookups don't reach __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,82 @@
+"""
+Startup phase timing
+
+Records how long each startup phase of a process takes (imports, init,
+JIT warmup...) and logs one summary line when the process is ready to
+work, so slow restarts show up in the process log.
+
+Usage (process entry point):
+    from src.utils.startup import startup_phase, log_startup_report
+
+    with startup_phase('imports'):
+        from src.validator.main_continuous import ContinuousValidatorProcess
+    with startup_phase('init'):
+        process = ContinuousValidatorProcess()
+    log_startup_report('validator')
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _process_age() -> Optional[float]:
+    """Seconds since this process was exec'd (Linux /proc), None elsewhere"""
+    try:
+        with open('/proc/self/stat') as f:
+            # Fields after the parenthesized command name; starttime is field 22
+            fields = f.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK'))
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Interpreter startup until the entry point imported this module
+_INTERPRETER_S = _process_age()
+_T0 = time.monotonic()
+_phases: List[Tuple[str, float]] = []
+_reported = False
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Time a startup phase (recorded even if the phase raises)"""
+    t0 = time.monotonic()
+    try:
+        yield
+    finally:
+        _phases.append((name, time.monotonic() - t0))
+
+
+def log_startup_report(process: str) -> Dict[str, float]:
+    """
+    Log the startup phases once, when the process is ready to work.
+
+    Args:
+        process: Process name for the log line
+
+    Returns:
+        Seconds per phase, plus 'total' (from exec when available)
+    """
+    global _reported
+
+    report = {}
+    if _INTERPRETER_S is not None:
+        report['interpreter'] = _INTERPRETER_S
+    for name, seconds in _phases:
+        report[name] = report.get(name, 0.0) + seconds
+    report['total'] = (_INTERPRETER_S or 0.0) + time.monotonic() - _T0
+
+    if not _reported:
+        _reported = True
+        phases = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in report.items() if name != 'total')
+        logger.info(f"Startup [{process}]: {phases} | ready in {report['total']:.2f}s")
+
+    return report
@@ -18,10 +18,15 @@ Usage:
     exec_result = ExecutionValidator().validate(strategy_instance, test_data)
 """
 
-from .syntax_validator import SyntaxValidator
-from .lookahead_detector import LookaheadDetector
-from .shuffle_test import ShuffleTester
-from .execution_validator import ExecutionValidator
+from src.utils.lazy_import import lazy_exports
+
+# Lazy: importing any src.validator submodule must not load numba
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "SyntaxValidator": "src.validator.syntax_validator",
+    "LookaheadDetector": "src.validator.lookahead_detector",
+    "ShuffleTester": "src.validator.shuffle_test",
+    "ExecutionValidator": "src.validator.execution_validator",
+})
 
 __all__ = [
     "SyntaxValidator",
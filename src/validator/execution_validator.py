@@ -8,17 +8,14 @@ Runtime validation:
 4. Strategy doesn't crash on edge cases
 """
 
-import importlib.util
-import sys
-import tempfile
 import traceback
 from dataclasses import dataclass
-from pathlib import Path
 from typing import Optional, List
 import numpy as np
 import pandas as pd
 
 from src.strategies.base import StrategyCore, Signal
+from src.strategies.loader import get_strategy_loader
 from src.utils import get_logger
 
 logger = get_logger(__name__)
@@ -162,50 +159,15 @@ class ExecutionValidator:
             Strategy class type or None if failed
         """
         try:
-            # Write code to temporary file
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                suffix='.py',
-                delete=False
-            ) as f:
-                f.write(code)
-                temp_path = Path(f.name)
-
-            # Load as module
-            spec = importlib.util.spec_from_file_location(
-                f"temp_strategy_{class_name}",
-                temp_path
-            )
-
-            if spec is None or spec.loader is None:
-                logger.error("Failed to create module spec")
-                return None
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[spec.name] = module
-
-            try:
-                spec.loader.exec_module(module)
-            except Exception as e:
-                logger.error(f"Failed to execute module: {e}")
-                return None
-            finally:
-                # Clean up temp file
-                temp_path.unlink(missing_ok=True)
-
-            # Get class from module
-            if hasattr(module, class_name):
-                cls = getattr(module, class_name)
-                if isinstance(cls, type) and issubclass(cls, StrategyCore):
-                    return cls
-
-            logger.error(f"Class {class_name} not found or not StrategyCore subclass")
-            return None
-
+            cls = get_strategy_loader().load_class(code, class_name)
         except Exception as e:
-            logger.error(f"Failed to load strategy class: {e}")
+            logger.error(f"Failed to execute module: {e}")
             return None
 
+        if cls is None:
+            logger.error(f"Class {class_name} not found or not StrategyCore subclass")
+        return cls
+
     def _test_signal_generation(
         self,
         strategy: StrategyCore,
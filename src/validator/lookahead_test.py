@@ -5,31 +5,102 @@ This module implements Freqtrade-style lookahead bias detection using the
 two-phase strategy architecture (calculate_indicators + generate_signal).
 
 HOW IT WORKS:
-For each test bar T, compare indicator values between two runs:
-1. BASELINE: calculate_indicators(df[:T+1]) - indicators up to bar T
-2. EXTENDED: calculate_indicators(df[:T+1+lookahead]) - indicators with future data
+1. REFERENCE: calculate_indicators(df) once on the full data
+2. PREFIX: calculate_indicators(df[:T+1]) for a few truncation points T
+3. Compare every bar <= T of the prefix run with the reference, all
+   indicator columns at once
 
-If indicator values at bar T differ between runs, the strategy uses future data
-(lookahead bias) in its indicator calculations.
+A causal indicator is prefix-stable: its value at any bar only depends on
+the bars up to it, so the prefix run is identical to the reference. If any
+value differs, the strategy uses data after T (lookahead bias) in its
+indicator calculations.
 
 This catches:
 - rolling(center=True) - uses future bars in window
 - shift(-N) - looks N bars into the future
 - Any other operation that uses future data
 
+Truncation points are geometrically spaced, so the prefix runs cost about
+as much as one or two full runs (instead of two runs per sample point).
+
 See: https://www.freqtrade.io/en/stable/lookahead-analysis/
 """
 
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict
+from typing import Optional, List
 
 from src.strategies.base import StrategyCore, Signal
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+OHLCV_COLUMNS = {'open', 'high', 'low', 'close', 'volume', 'timestamp'}
+
+
+def columns_to_check(strategy: StrategyCore, df: pd.DataFrame) -> List[str]:
+    """
+    Indicator columns to compare for lookahead tests.
+
+    Uses strategy.indicator_columns if defined, otherwise all non-OHLCV columns.
+    """
+    indicator_columns = getattr(strategy, 'indicator_columns', [])
+    if indicator_columns:
+        return [c for c in indicator_columns if c in df.columns]
+    return [c for c in df.columns if str(c).lower() not in OHLCV_COLUMNS]
+
+
+def mismatched_columns(
+    actual: pd.DataFrame,
+    expected: pd.DataFrame,
+    columns: List[str],
+    tolerance: float = 1e-9
+) -> List[str]:
+    """
+    Compare two indicator frames row by row (by position) in one vectorized diff.
+
+    NaN equals NaN; numeric values are equal within tolerance, others must be ==.
+
+    Args:
+        actual: Indicator frame to check
+        expected: Reference indicator frame (same number of rows)
+        columns: Columns to compare (missing ones are skipped)
+        tolerance: Absolute tolerance for numeric columns
+
+    Returns:
+        Columns with at least one differing row (all columns if row counts differ)
+    """
+    columns = [c for c in columns if c in actual.columns and c in expected.columns]
+    if not columns:
+        return []
+    if len(actual) != len(expected):
+        return columns
+
+    numeric = [
+        c for c in columns
+        if pd.api.types.is_numeric_dtype(actual[c]) and pd.api.types.is_numeric_dtype(expected[c])
+    ]
+    mismatched = set()
+
+    if numeric:
+        a = actual[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+        b = expected[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid='ignore'):
+            equal = (a == b) | (np.isnan(a) & np.isnan(b)) | (np.abs(a - b) < tolerance)
+        mismatched.update(np.asarray(numeric, dtype=object)[~equal.all(axis=0)])
+
+    for col in columns:
+        if col in numeric:
+            continue
+        a = actual[col].to_numpy()
+        b = expected[col].to_numpy()
+        equal = (pd.isna(a) & pd.isna(b)) | (a == b)
+        if not np.all(equal):
+            mismatched.add(col)
+
+    return [c for c in columns if c in mismatched]
+
 
 @dataclass
 class LookaheadTestResult:
@@ -48,9 +119,9 @@ class LookaheadTester:
     Freqtrade-Style Lookahead Bias Detector
 
     Uses the two-phase architecture to compare indicator values:
-    1. Calculate indicators on baseline data (df[:T+1])
-    2. Calculate indicators on extended data (df[:T+1+lookahead])
-    3. Compare indicator values at bar T
+    1. Calculate indicators once on the full data (reference)
+    2. Calculate indicators on prefixes df[:T+1] at a few truncation points
+    3. Compare all bars <= T of each prefix with the reference
 
     If values differ, the strategy has lookahead bias.
 
@@ -60,11 +131,11 @@ class LookaheadTester:
 
     MIN_BARS = 100
     WARMUP_BARS = 50
-    DEFAULT_LOOKAHEAD = 10  # How many future bars to add for extended test
+    DEFAULT_LOOKAHEAD = 10  # Minimum future bars after the last truncation point
 
     def __init__(
         self,
-        sample_points: int = 10,
+        sample_points: int = 5,
         lookahead_bars: int = 10,
         tolerance: float = 1e-9
     ):
@@ -72,8 +143,8 @@ class LookaheadTester:
         Initialize lookahead tester.
 
         Args:
-            sample_points: Number of test points to sample
-            lookahead_bars: Number of future bars to add in extended test
+            sample_points: Number of truncation points (each checks all bars up to it)
+            lookahead_bars: Minimum number of future bars after a truncation point
             tolerance: Numerical tolerance for float comparison
         """
         self.sample_points = sample_points
@@ -89,17 +160,16 @@ class LookaheadTester:
         """
         Run Freqtrade-style lookahead bias test.
 
-        For each test bar T:
-        1. Run calculate_indicators(df[:T+1]) -> baseline indicators
-        2. Run calculate_indicators(df[:T+1+lookahead]) -> extended indicators
-        3. Compare indicator values at bar T between baseline and extended
+        1. Run calculate_indicators(df) -> reference indicators
+        2. For each truncation point T, run calculate_indicators(df[:T+1])
+        3. Compare bars 0..T of the prefix run with the reference
 
         If values differ, the strategy uses future data (lookahead bias).
 
         Args:
             strategy: StrategyCore instance with calculate_indicators() method
             data: Full OHLCV DataFrame
-            sample_points: Override default number of test points
+            sample_points: Override default number of truncation points
 
         Returns:
             LookaheadTestResult with pass/fail and details
@@ -120,25 +190,38 @@ class LookaheadTester:
                 )
             )
 
-        # Get indicator columns from strategy
-        indicator_columns = getattr(strategy, 'indicator_columns', [])
-        if not indicator_columns:
+        if not getattr(strategy, 'indicator_columns', []):
             logger.warning(
                 "Strategy has no indicator_columns defined. "
                 "Lookahead test will check all non-OHLCV columns."
             )
 
+        # Select truncation points (leave room for lookahead)
+        test_indices = self._truncation_points(
+            self.WARMUP_BARS, len(data) - self.lookahead_bars - 1, n_points
+        )
+
         logger.debug(
             f"Running Freqtrade-style lookahead test: "
-            f"{len(data)} bars, {n_points} sample points, "
-            f"{self.lookahead_bars} lookahead bars"
+            f"{len(data)} bars, truncation points {test_indices}"
         )
 
-        # Select test points (leave room for lookahead)
-        start_idx = self.WARMUP_BARS
-        end_idx = len(data) - self.lookahead_bars - 1
-        test_indices = np.linspace(start_idx, end_idx, n_points, dtype=int)
-        test_indices = sorted(set(test_indices))
+        # REFERENCE: indicators on the full data, computed once
+        try:
+            df_reference = strategy.calculate_indicators(data.copy())
+        except Exception as e:
+            details = f"ERRORS: calculate_indicators failed on full data: {e}"
+            logger.warning(f"Lookahead test FAILED: {details}")
+            return LookaheadTestResult(
+                passed=False,
+                lookahead_detected=False,
+                biased_bars=[],
+                total_bars_tested=0,
+                bias_rate=0.0,
+                details=details
+            )
+
+        columns = columns_to_check(strategy, df_reference)
 
         biased_bars = []
         biased_indicators_set = set()
@@ -149,46 +232,17 @@ class LookaheadTester:
             tested_bars += 1
 
             try:
-                # BASELINE: Calculate indicators on data up to bar T
-                df_baseline = data.iloc[:idx + 1].copy()
-                df_baseline_with_indicators = strategy.calculate_indicators(df_baseline)
-
-                # EXTENDED: Calculate indicators on data up to bar T + lookahead
-                df_extended = data.iloc[:idx + 1 + self.lookahead_bars].copy()
-                df_extended_with_indicators = strategy.calculate_indicators(df_extended)
-
-                # Get columns to check
-                if indicator_columns:
-                    columns_to_check = indicator_columns
-                else:
-                    # Check all columns except OHLCV
-                    ohlcv_cols = {'open', 'high', 'low', 'close', 'volume', 'timestamp'}
-                    columns_to_check = [
-                        c for c in df_baseline_with_indicators.columns
-                        if c.lower() not in ohlcv_cols
-                    ]
-
-                # Compare indicator values at bar T
-                for col in columns_to_check:
-                    if col not in df_baseline_with_indicators.columns:
-                        continue
-                    if col not in df_extended_with_indicators.columns:
-                        continue
-
-                    # Get values at bar T (last bar of baseline)
-                    baseline_value = df_baseline_with_indicators[col].iloc[-1]
-                    # Get value at same bar T in extended run
-                    extended_value = df_extended_with_indicators[col].iloc[idx]
-
-                    # Compare values
-                    if not self._values_equal(baseline_value, extended_value):
-                        biased_bars.append(idx)
-                        biased_indicators_set.add(col)
-                        logger.debug(
-                            f"Lookahead detected at bar {idx}, column '{col}': "
-                            f"baseline={baseline_value}, extended={extended_value}"
-                        )
-                        break  # One mismatch is enough to flag this bar
+                # PREFIX: Calculate indicators on data up to bar T
+                df_prefix = strategy.calculate_indicators(data.iloc[:idx + 1].copy())
+
+                # Compare bars 0..T with the reference (which also saw bars after T)
+                mismatched = mismatched_columns(
+                    df_prefix, df_reference.iloc[:idx + 1], columns, self.tolerance
+                )
+                if mismatched:
+                    biased_bars.append(idx)
+                    biased_indicators_set.update(mismatched)
+                    logger.debug(f"Lookahead detected at truncation bar {idx}, columns {mismatched}")
 
             except Exception as e:
                 errors.append(f"Bar {idx}: {str(e)}")
@@ -203,8 +257,8 @@ class LookaheadTester:
         # Build details message
         if passed:
             details = (
-                f"No lookahead bias detected ({tested_bars} bars tested, "
-                f"{len(indicator_columns)} indicators checked)"
+                f"No lookahead bias detected ({tested_bars} truncation points, "
+                f"{len(columns)} indicators checked)"
             )
             logger.info(f"Lookahead test PASSED: {details}")
         else:
@@ -229,32 +283,17 @@ class LookaheadTester:
             details=details
         )
 
-    def _values_equal(self, v1, v2) -> bool:
+    @staticmethod
+    def _truncation_points(start_idx: int, end_idx: int, n_points: int) -> List[int]:
         """
-        Compare two values for equality with tolerance for floats.
+        Geometrically spaced truncation points in [start_idx, end_idx].
 
-        Args:
-            v1: First value
-            v2: Second value
-
-        Returns:
-            True if values are equal (within tolerance for floats)
+        Dense near the start (short histories, warmup edge cases), sparse
+        later, always including end_idx (longest prefix, checks most bars).
         """
-        # Handle NaN
-        if pd.isna(v1) and pd.isna(v2):
-            return True
-        if pd.isna(v1) or pd.isna(v2):
-            return False
-
-        # Handle numeric types
-        try:
-            if isinstance(v1, (int, float, np.number)) and isinstance(v2, (int, float, np.number)):
-                return abs(float(v1) - float(v2)) < self.tolerance
-        except (TypeError, ValueError):
-            pass
-
-        # Fallback to equality
-        return v1 == v2
+        points = np.geomspace(max(start_idx, 1), end_idx, max(n_points, 1))
+        points = np.unique(np.round(points).astype(int))
+        return sorted(set(points.tolist()) | {end_idx})
 
 
 class ConsistencyTester:
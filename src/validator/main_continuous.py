@@ -19,10 +19,11 @@ from datetime import datetime
 from typing import Dict, Optional, Tuple
 
 from src.config import load_config
-from src.database import get_session, Strategy, StrategyProcessor
+from src.database import get_session, Strategy, StrategyProcessor, ClaimQueue
 from src.validator.syntax_validator import SyntaxValidator
 from src.validator.lookahead_detector import LookaheadDetector
 from src.validator.execution_validator import ExecutionValidator
+from src.strategies.loader import StrategyLoader
 from src.utils import get_logger, setup_logging
 
 # Initialize logging at module load
@@ -93,8 +94,25 @@ class ContinuousValidatorProcess:
         self.lookahead_detector = lookahead_detector or LookaheadDetector()
         self.execution_validator = execution_validator or ExecutionValidator()
 
+        # Validated code is loaded again by the backtester: share the compiled code cache
+        StrategyLoader.configure(
+            max_modules=self.config.get('strategy_loader.max_modules', 256),
+            cache_dir=self.config.get('strategy_loader.cache_dir', 'data/strategy_code'),
+            max_disk_files=self.config.get('strategy_loader.max_disk_files', 5000),
+        )
+
         # Strategy processor for claiming
-        self.processor = processor or StrategyProcessor(process_id=f"validator-{os.getpid()}")
+        self.processor = processor or StrategyProcessor(
+            process_id=f"validator-{os.getpid()}",
+            stale_release_interval=self.config.get('pipeline.claiming.stale_release_interval', 60)
+        )
+        # Local prefetch of GENERATED claims (batched UPDATE ... RETURNING)
+        self.claim_queue = ClaimQueue(
+            self.processor,
+            "GENERATED",
+            batch_size=self.config.get('pipeline.claiming.batch_size', 8),
+            low_water=self.config.get('pipeline.claiming.low_water', 2)
+        )
 
         logger.info(
             f"ContinuousValidatorProcess initialized: {self.parallel_threads} threads, "
@@ -126,6 +144,12 @@ class ContinuousValidatorProcess:
             # Log pipeline status periodically
             self._log_pipeline_status()
 
+            # Release claims of crashed processes (periodic, not per claim)
+            try:
+                self.processor.release_stale_claims_if_due()
+            except Exception as e:
+                logger.warning(f"Failed to release stale claims: {e}")
+
             # Process completed validations first (free up slots)
             done_futures = []
             for f in list(self.active_futures.keys()):
@@ -168,7 +192,7 @@ class ContinuousValidatorProcess:
                 continue
 
             # Claim a strategy for validation
-            strategy = self.processor.claim_strategy("GENERATED")
+            strategy = self.claim_queue.get()
 
             if strategy is None:
                 # No strategies to validate, wait and retry
@@ -314,7 +338,8 @@ class ContinuousValidatorProcess:
         self.shutdown_event.set()
         self.force_exit = True
 
-        # Release any claimed strategies
+        # One UPDATE by processing_by releases prefetched and in-flight claims
+        # alike (claim_queue claims under this processor's id)
         self.processor.release_all_by_process()
 
         # Cancel active futures
@@ -325,6 +350,11 @@ class ContinuousValidatorProcess:
         if self.executor:
             self.executor.shutdown(wait=False)
 
+        from src.database.event_tracker import EventTracker
+
+        # Write queued pipeline events before exiting (os._exit skips atexit)
+        EventTracker.flush(timeout=5.0)
+
         os._exit(0)
 
     def run(self):
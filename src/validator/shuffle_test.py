@@ -4,11 +4,11 @@ Future Contamination Test - Phase 3 of validation pipeline
 Empirical test for lookahead bias detection.
 
 Logic:
-1. For each decision point T, provide data ONLY up to T
-2. Record the signal generated
-3. Append FAKE future data (random) after T
-4. Run strategy again with fake future appended
-5. If signal CHANGES based on fake future data -> LOOKAHEAD DETECTED!
+1. Calculate indicators once on the real data (real future after every T)
+2. For each decision point T, append FAKE future data (random) after bar T
+3. Run calculate_indicators again with fake future appended
+4. If any indicator at bars <= T, or the signal at T, CHANGES based on
+   which future follows -> LOOKAHEAD DETECTED!
 
 A correctly implemented strategy should ONLY use past data.
 If changing future data changes the signal, the strategy is peeking ahead.
@@ -25,6 +25,7 @@ from typing import Optional, List, Tuple
 
 from src.strategies.base import StrategyCore, Signal
 from src.utils import get_logger
+from src.validator.lookahead_test import columns_to_check, mismatched_columns
 
 logger = get_logger(__name__)
 
@@ -96,9 +97,10 @@ class ShuffleTester:
     Phase 3: Future Contamination Test for lookahead bias
 
     This test DIRECTLY detects if a strategy uses future data by:
-    1. Running strategy with real data only (up to current bar)
-    2. Running strategy with fake future appended
-    3. If signals differ, the strategy is accessing future data
+    1. Running strategy once on the full real data (reference)
+    2. Running strategy with fake future appended after each test bar
+    3. If indicators (any column, bars <= T) or signals differ, the
+       strategy is accessing future data
 
     This catches:
     - shift(-1) or negative shifts
@@ -111,7 +113,7 @@ class ShuffleTester:
     MIN_BARS_REQUIRED = 100  # Minimum bars needed for testing
     SAMPLE_POINTS = 20  # Number of points to test (reduced from 50 for performance)
     FAKE_FUTURE_BARS = 20  # How many fake future bars to append
-    N_RANDOM_FUTURES = 3  # Number of different random futures to test
+    N_RANDOM_FUTURES = 1  # Fake futures per point (the real data is one more future)
 
     def __init__(
         self,
@@ -180,7 +182,14 @@ class ShuffleTester:
 
         # Sample test indices
         test_indices = np.linspace(start_idx, end_idx, n_points, dtype=int)
-        test_indices = list(set(test_indices))  # Remove duplicates
+        test_indices = sorted(set(test_indices))  # Remove duplicates
+
+        # Reference run on the real data, shared by all test points
+        try:
+            df_reference = strategy.calculate_indicators(data.copy())
+        except Exception as e:
+            logger.debug(f"Indicator calculation failed on full data: {e}")
+            df_reference = None
 
         contaminated_bars = []
         tested_bars = 0
@@ -188,7 +197,7 @@ class ShuffleTester:
         logger.debug(f"Testing {len(test_indices)} points for lookahead bias")
 
         for idx in test_indices:
-            is_contaminated = self._test_single_point(strategy, data, idx)
+            is_contaminated = self._test_single_point(strategy, data, idx, df_reference)
             tested_bars += 1
 
             if is_contaminated:
@@ -230,26 +239,32 @@ class ShuffleTester:
         self,
         strategy: StrategyCore,
         data: pd.DataFrame,
-        current_idx: int
+        current_idx: int,
+        df_reference: Optional[pd.DataFrame]
     ) -> bool:
         """
         Test a single point for lookahead bias.
 
-        Returns True if lookahead is detected (signal changes with fake future).
+        Returns True if lookahead is detected (indicators or signal change
+        with fake future).
         """
+        if df_reference is None:
+            return False  # Can't test if indicator calculation fails
+
         # Get data up to current point (this is what strategy SHOULD see)
-        df_past_only = data.iloc[:current_idx + 1].copy()
+        df_past_only = data.iloc[:current_idx + 1]
 
-        # Generate signal with past data only (two-phase approach)
+        # Reference indicators/signal at T (real future appended)
+        df_reference_past = df_reference.iloc[:current_idx + 1]
+        columns = columns_to_check(strategy, df_reference)
         try:
-            df_past_with_indicators = strategy.calculate_indicators(df_past_only)
-            signal_past_only = strategy.generate_signal(df_past_with_indicators)
+            signal_reference = strategy.generate_signal(df_reference_past)
         except Exception as e:
             logger.debug(f"Signal generation failed at idx {current_idx}: {e}")
             return False  # Can't test if signal generation fails
 
         # Normalize signal for comparison
-        signal_past_only_normalized = self._normalize_signal(signal_past_only)
+        signal_reference_normalized = self._normalize_signal(signal_reference)
 
         # Test with multiple different fake futures
         for i in range(self.n_random_futures):
@@ -259,10 +274,21 @@ class ShuffleTester:
             # Append fake future to past data
             df_with_fake_future = pd.concat([df_past_only, fake_future], ignore_index=True)
 
-            # Generate signal with fake future appended (two-phase approach)
+            # One indicator run per fake future, compared on all columns at once
             try:
                 df_future_with_indicators = strategy.calculate_indicators(df_with_fake_future)
-                signal_with_future = strategy.generate_signal(df_future_with_indicators)
+            except Exception as e:
+                logger.debug(f"Indicator calculation with future failed: {e}")
+                continue
+
+            df_future_past = df_future_with_indicators.iloc[:current_idx + 1]
+            mismatched = mismatched_columns(df_future_past, df_reference_past, columns)
+            if mismatched:
+                logger.debug(f"Indicators changed at idx {current_idx}: {mismatched}")
+                return True  # Lookahead detected!
+
+            try:
+                signal_with_future = strategy.generate_signal(df_future_past)
             except Exception as e:
                 logger.debug(f"Signal generation with future failed: {e}")
                 continue
@@ -270,10 +296,10 @@ class ShuffleTester:
             signal_with_future_normalized = self._normalize_signal(signal_with_future)
 
             # Compare signals
-            if signal_past_only_normalized != signal_with_future_normalized:
+            if signal_reference_normalized != signal_with_future_normalized:
                 logger.debug(
                     f"Signal changed at idx {current_idx}: "
-                    f"{signal_past_only_normalized} -> {signal_with_future_normalized}"
+                    f"{signal_reference_normalized} -> {signal_with_future_normalized}"
                 )
                 return True  # Lookahead detected!
 
@@ -0,0 +1,108 @@
+"""
+Unit tests for the backtester benchmark suite
+
+Covers the deterministic panel generator and the baseline regression gate;
+the timed cases themselves run via `python -m src.backtester.benchmark`.
+"""
+
+import json
+import sys
+
+import numpy as np
+import pytest
+
+from src.backtester import benchmark
+from src.backtester.benchmark import ENTRY_EVERY, compare_to_baseline, make_panel
+
+
+def _report(**metrics):
+    return {
+        'size': {'n_bars': 2000, 'n_symbols': 10, 'n_combos': 100},
+        'results': {'portfolio_kernel': metrics},
+    }
+
+
+class TestMakePanel:
+
+    def test_same_seed_same_panel(self):
+        a = make_panel(500, 4, seed=7)
+        b = make_panel(500, 4, seed=7)
+        for key in a:
+            np.testing.assert_array_equal(a[key], b[key])
+
+    def test_panel_is_valid_ohlc(self):
+        panel = make_panel(1000, 6)
+
+        assert panel['close'].shape == (1000, 6)
+        assert (panel['high'] >= np.maximum(panel['open'], panel['close'])).all()
+        assert (panel['low'] <= np.minimum(panel['open'], panel['close'])).all()
+        assert not panel['entries'][:50].any()
+        # Directions set exactly at entries
+        assert ((panel['directions'] != 0) == panel['entries']).all()
+        assert panel['entries'][:, 0].sum() == pytest.approx((1000 - 50) / ENTRY_EVERY, abs=1)
+
+
+class TestCompareToBaseline:
+
+    def test_within_thresholds_passes(self):
+        baseline = _report(bars_symbols_per_s=1000.0, warmup_s=2.0, peak_rss_mb=300.0)
+        current = _report(bars_symbols_per_s=900.0, warmup_s=2.8, peak_rss_mb=340.0)
+
+        assert compare_to_baseline(current, baseline) == []
+
+    def test_throughput_drop_is_flagged(self):
+        baseline = _report(bars_symbols_per_s=1000.0)
+        current = _report(bars_symbols_per_s=800.0)
+
+        [regression] = compare_to_baseline(current, baseline)
+        assert regression.metric == 'bars_symbols_per_s'
+        assert regression.change == pytest.approx(-0.2)
+
+    def test_small_absolute_changes_are_noise(self):
+        # +100% warmup and RSS, but below the absolute floors
+        baseline = _report(warmup_s=0.2, peak_rss_mb=20.0)
+        current = _report(warmup_s=0.4, peak_rss_mb=40.0)
+        assert compare_to_baseline(current, baseline) == []
+
+        current = _report(warmup_s=1.0, peak_rss_mb=200.0)
+        assert {r.metric for r in compare_to_baseline(current, baseline)} == {'warmup_s', 'peak_rss_mb'}
+
+    def test_size_mismatch_raises(self):
+        baseline = _report(bars_symbols_per_s=1000.0)
+        current = _report(bars_symbols_per_s=1000.0)
+        current['size'] = {**current['size'], 'n_bars': 4000}
+
+        with pytest.raises(ValueError):
+            compare_to_baseline(current, baseline)
+
+
+class TestMain:
+
+    @pytest.fixture
+    def run_main(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(benchmark, 'BENCHMARK_DIR', tmp_path / 'benchmarks')
+        monkeypatch.setattr(benchmark, 'run_suite', lambda size, *args, **kwargs: {
+            'size': benchmark.asdict(size), 'results': {},
+        })
+
+        def run(*argv):
+            monkeypatch.setattr(sys, 'argv', ['benchmark', *argv])
+            return benchmark.main()
+        return run
+
+    def test_explicit_output_does_not_create_default_dir(self, run_main, tmp_path):
+        output = tmp_path / 'run.json'
+
+        assert run_main('--output', str(output)) == 0
+        assert output.exists()
+        assert not (tmp_path / 'benchmarks').exists()
+
+    def test_override_conflicting_with_baseline_is_a_usage_error(self, run_main, tmp_path):
+        baseline = tmp_path / 'baseline.json'
+        baseline.write_text(json.dumps(_report()))
+
+        with pytest.raises(SystemExit) as exc:
+            run_main('--bars', '4000', '--baseline', str(baseline), '--output', str(tmp_path / 'run.json'))
+
+        assert exc.value.code == 2
+        assert not (tmp_path / 'run.json').exists()
@@ -0,0 +1,194 @@
+"""
+Unit tests for BacktestEngine.backtest_is_oos (single-pass IS+OOS)
+
+One indicator pass and one kernel pass over the contiguous range must give
+the IS metrics of a separate IS backtest, and OOS metrics of an independent
+simulation of the OOS bars with indicators warmed up on the IS history.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.backtest_engine import BacktestEngine, SIGNAL_WARMUP_BARS
+from src.config import load_config
+from src.strategies.base import StrategyCore, StopLossType
+
+
+METRIC_KEYS = ['total_trades', 'sharpe_ratio', 'expectancy', 'win_rate', 'max_drawdown', 'total_return']
+
+
+class CrossStrategy(StrategyCore):
+    """SMA cross with ATR stops (causal indicators only)"""
+
+    direction = 'long'
+    sl_type = StopLossType.ATR
+    atr_stop_multiplier = 2.0
+    atr_take_multiplier = 3.0
+    SL_PCT = 0.02
+    TP_PCT = 0.04
+    LEVERAGE = 3
+    exit_after_bars = 30
+
+    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        fast = df['close'].rolling(8).mean()
+        slow = df['close'].rolling(30).mean()
+        df['entry_signal'] = (fast > slow) & (fast.shift(1) <= slow.shift(1))
+        return df
+
+    def generate_signal(self, df, symbol=None):
+        return None
+
+
+@pytest.fixture
+def engine():
+    engine = BacktestEngine(load_config()._raw_config)
+    # Avoid CoinRegistry (DB) lookups
+    engine._coin_max_leverage_cache.update({'AAA': 20, 'BBB': 10, 'CCC': 5})
+    return engine
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(7)
+    frames = {}
+    for symbol, start, n in [('AAA', 0, 3000), ('BBB', 40, 2960), ('CCC', 0, 3000)]:
+        ts = pd.date_range('2025-01-01', periods=3000, freq='15min', tz='UTC')[start:start + n]
+        close = 50 * np.cumprod(1 + rng.normal(0, 0.008, n))
+        frames[symbol] = pd.DataFrame({
+            'timestamp': ts,
+            'open': close,
+            'high': close * (1 + np.abs(rng.normal(0, 0.004, n))),
+            'low': close * (1 - np.abs(rng.normal(0, 0.004, n))),
+            'close': close,
+            'volume': rng.random(n) * 1000,
+        })
+    return frames
+
+
+@pytest.fixture
+def oos_start(data):
+    return data['AAA']['timestamp'].iloc[2200]
+
+
+def test_is_matches_separate_is_backtest(engine, data, oos_start):
+    is_data = {s: df[df['timestamp'] < oos_start].copy() for s, df in data.items()}
+    expected = engine.backtest(CrossStrategy(), is_data, timeframe='15m')
+
+    is_result, oos_result = engine.backtest_is_oos(CrossStrategy(), data, oos_start, timeframe='15m')
+
+    assert is_result['total_trades'] > 0
+    assert oos_result is not None
+    for key in METRIC_KEYS + ['total_signals']:
+        assert is_result[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-12), key
+    assert max(t['exit_idx'] for t in is_result['trades']) < 2200
+
+
+def test_oos_is_independent_segment_with_warm_indicators(engine, data, oos_start):
+    # Reference: signals on the full range, simulate only the OOS bars
+    aligned = engine._align_dataframes(data)
+    symbols = [s for s in aligned if s != '_index']
+    split = int(pd.DatetimeIndex(aligned['_index']).searchsorted(oos_start))
+    signals = engine._generate_portfolio_signals(CrossStrategy(), aligned, symbols, 10)
+    arrays = engine._prepare_simulation_arrays(signals, symbols, len(aligned['_index']))
+    oos_arrays = {k: a if k == 'max_leverages' else a[split:] for k, a in arrays.items()}
+    expected, expected_trades = engine._simulate_portfolio(oos_arrays, symbols, 10, '15m')
+
+    _, oos_result = engine.backtest_is_oos(CrossStrategy(), data, oos_start, max_positions=10, timeframe='15m')
+
+    assert oos_result['total_trades'] > 0
+    for key in METRIC_KEYS:
+        assert oos_result[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-12), key
+    assert oos_result['trades'] == expected_trades.to_dicts()
+    # No cold-start warmup: the OOS period trades from its first bars
+    assert min(t['entry_idx'] for t in oos_result['trades']) < SIGNAL_WARMUP_BARS
+
+
+def test_short_oos_returns_none(engine, data):
+    oos_start = data['AAA']['timestamp'].iloc[-10]
+    is_result, oos_result = engine.backtest_is_oos(CrossStrategy(), data, oos_start, timeframe='15m')
+
+    assert oos_result is None
+    assert is_result['total_trades'] > 0
+
+
+class TestBacktesterIsOosSplit:
+    """ContinuousBacktesterProcess._run_is_backtest with mixed OOS coverage"""
+
+    SYMBOLS = ['AAA', 'BBB', 'CCC', 'DDD', 'EEE', 'FFF']
+
+    @pytest.fixture
+    def process(self, engine):
+        # funding_loader is part of the full data package
+        pytest.importorskip('src.data.funding_loader')
+        from src.backtester.main_continuous import ContinuousBacktesterProcess
+
+        engine._coin_max_leverage_cache.update({s: 10 for s in self.SYMBOLS})
+        process = object.__new__(ContinuousBacktesterProcess)
+        process.engine = engine
+        process.is_oos_single_pass = True
+        return process
+
+    @pytest.fixture
+    def split_data(self):
+        rng = np.random.default_rng(11)
+        ts = pd.date_range('2025-01-01', periods=3000, freq='15min', tz='UTC')
+        is_data, oos_data = {}, {}
+        for symbol in self.SYMBOLS:
+            close = 50 * np.cumprod(1 + rng.normal(0, 0.008, len(ts)))
+            df = pd.DataFrame({
+                'timestamp': ts,
+                'open': close,
+                'high': close * (1 + np.abs(rng.normal(0, 0.004, len(ts)))),
+                'low': close * (1 - np.abs(rng.normal(0, 0.004, len(ts)))),
+                'close': close,
+                'volume': rng.random(len(ts)) * 1000,
+            })
+            is_data[symbol] = df.iloc[:2200].reset_index(drop=True)
+            oos_data[symbol] = df.iloc[2200:].reset_index(drop=True)
+        return is_data, oos_data
+
+    def test_is_only_symbols_stay_in_is_backtest(self, process, engine, split_data):
+        is_data, oos_data = split_data
+        del oos_data['FFF']  # IS-only symbol
+        expected_is = engine.backtest(CrossStrategy(), is_data, timeframe='15m')
+        expected_oos = engine.backtest(CrossStrategy(), oos_data, timeframe='15m')
+
+        with patch.object(engine, 'backtest_is_oos', wraps=engine.backtest_is_oos) as single_pass:
+            is_result, oos_result = process._run_is_backtest(CrossStrategy(), is_data, oos_data, '15m')
+
+        single_pass.assert_not_called()
+        assert is_result['symbols_count'] == len(self.SYMBOLS)
+        for key in METRIC_KEYS:
+            assert is_result[key] == pytest.approx(expected_is[key], rel=1e-9, abs=1e-12), key
+            assert oos_result[key] == pytest.approx(expected_oos[key], rel=1e-9, abs=1e-12), key
+
+    def test_short_oos_symbol_falls_back_to_separate_runs(self, process, engine, split_data):
+        is_data, oos_data = split_data
+        oos_data['FFF'] = oos_data['FFF'].iloc[:5]  # Would cap the common OOS range
+        expected_oos = engine.backtest(
+            CrossStrategy(), {s: df for s, df in oos_data.items() if s != 'FFF'}, timeframe='15m'
+        )
+
+        with patch.object(engine, 'backtest_is_oos', wraps=engine.backtest_is_oos) as single_pass:
+            is_result, oos_result = process._run_is_backtest(CrossStrategy(), is_data, oos_data, '15m')
+
+        single_pass.assert_not_called()
+        assert is_result['symbols_count'] == len(self.SYMBOLS)
+        for key in METRIC_KEYS:
+            assert oos_result[key] == pytest.approx(expected_oos[key], rel=1e-9, abs=1e-12), key
+
+    def test_full_oos_coverage_runs_single_pass(self, process, engine, split_data):
+        is_data, oos_data = split_data
+        expected_is = engine.backtest(CrossStrategy(), is_data, timeframe='15m')
+
+        with patch.object(engine, 'backtest_is_oos', wraps=engine.backtest_is_oos) as single_pass:
+            is_result, oos_result = process._run_is_backtest(CrossStrategy(), is_data, oos_data, '15m')
+
+        single_pass.assert_called_once()
+        assert oos_result is not None
+        for key in METRIC_KEYS:
+            assert is_result[key] == pytest.approx(expected_is[key], rel=1e-9, abs=1e-12), key
@@ -0,0 +1,85 @@
+"""
+Unit tests for BacktestEngine.backtest_windows (incremental WFA)
+
+One indicator pass over the full range must give the same metrics as a
+separate backtest() on each window slice.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.backtest_engine import BacktestEngine
+from src.config import load_config
+from src.strategies.base import StrategyCore, StopLossType
+
+
+METRIC_KEYS = ['total_trades', 'sharpe_ratio', 'expectancy', 'win_rate', 'max_drawdown', 'total_return']
+
+
+class CrossStrategy(StrategyCore):
+    """SMA cross with ATR stops (causal indicators only)"""
+
+    direction = 'long'
+    sl_type = StopLossType.ATR
+    atr_stop_multiplier = 2.0
+    atr_take_multiplier = 3.0
+    SL_PCT = 0.02
+    TP_PCT = 0.04
+    LEVERAGE = 3
+    exit_after_bars = 30
+
+    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        fast = df['close'].rolling(8).mean()
+        slow = df['close'].rolling(30).mean()
+        df['entry_signal'] = (fast > slow) & (fast.shift(1) <= slow.shift(1))
+        return df
+
+    def generate_signal(self, df, symbol=None):
+        return None
+
+
+@pytest.fixture
+def engine():
+    engine = BacktestEngine(load_config()._raw_config)
+    # Avoid CoinRegistry (DB) lookups
+    engine._coin_max_leverage_cache.update({'AAA': 20, 'BBB': 10, 'CCC': 5})
+    return engine
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(11)
+    frames = {}
+    for symbol, start, n in [('AAA', 0, 3000), ('BBB', 40, 2960), ('CCC', 0, 2900)]:
+        ts = pd.date_range('2025-01-01', periods=3000, freq='15min', tz='UTC')[start:start + n]
+        close = 50 * np.cumprod(1 + rng.normal(0, 0.008, n))
+        frames[symbol] = pd.DataFrame({
+            'timestamp': ts,
+            'open': close,
+            'high': close * (1 + np.abs(rng.normal(0, 0.004, n))),
+            'low': close * (1 - np.abs(rng.normal(0, 0.004, n))),
+            'close': close,
+            'volume': rng.random(n) * 1000,
+        })
+    return frames
+
+
+def test_windows_match_per_window_backtests(engine, data):
+    percentages = [0.03, 0.25, 0.5, 0.75, 1.0]
+
+    window_ends = []
+    expected = []
+    for pct in percentages:
+        sliced = {s: df.iloc[:int(len(df) * pct)].copy() for s, df in data.items()}
+        window_ends.append(min(df['timestamp'].iloc[-1] for df in sliced.values()))
+        expected.append(engine.backtest(CrossStrategy(), sliced, timeframe='15m'))
+
+    results = engine.backtest_windows(CrossStrategy(), data, window_ends, timeframe='15m')
+
+    assert len(results) == len(percentages)
+    assert sum(r['total_trades'] for r in results) > 0
+    for result, exp in zip(results, expected):
+        for key in METRIC_KEYS:
+            assert result[key] == pytest.approx(exp[key], rel=1e-9, abs=1e-12), key
@@ -0,0 +1,155 @@
+"""
+Unit tests for the backtester executor factory (thread vs process mode)
+
+Process mode runs jobs in spawned workers that build their own
+ContinuousBacktesterProcess; a job must give the same result there as in
+thread mode.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.worker_pool import create_backtest_executor, run_backtest_job
+
+SYMBOLS = ['AAA', 'BBB', 'CCC']
+
+STRATEGY_CODE = '''
+from src.strategies.base import StrategyCore, StopLossType
+
+
+class Strategy_POOL_test(StrategyCore):
+    direction = 'long'
+    sl_type = StopLossType.PERCENTAGE
+    SL_PCT = 0.02
+    TP_PCT = 0.04
+    LEVERAGE = 3
+    exit_after_bars = 30
+
+    def calculate_indicators(self, df):
+        df = df.copy()
+        fast = df['close'].rolling(8).mean()
+        slow = df['close'].rolling(30).mean()
+        df['entry_signal'] = (fast > slow) & (fast.shift(1) <= slow.shift(1))
+        return df
+
+    def generate_signal(self, df, symbol=None):
+        return None
+'''
+
+
+class SyntheticDataLoader:
+    """BacktestDataLoader stand-in: seeded random walks, no parquet cache"""
+
+    cache_dir = 'unused'
+    panel_store = SimpleNamespace(get=lambda timeframe: None)
+
+    def load_multi_symbol_is_oos(self, symbols, timeframe, is_days, oos_days, target_count):
+        rng = np.random.default_rng(5)
+        ts = pd.date_range('2025-01-01', periods=3000, freq='15min', tz='UTC')
+        is_data, oos_data = {}, {}
+        for symbol in symbols:
+            close = 50 * np.cumprod(1 + rng.normal(0, 0.008, len(ts)))
+            df = pd.DataFrame({
+                'timestamp': ts, 'open': close, 'high': close * 1.003,
+                'low': close * 0.997, 'close': close, 'volume': 1000.0,
+            })
+            is_data[symbol] = df.iloc[:2200].reset_index(drop=True)
+            oos_data[symbol] = df.iloc[2200:].reset_index(drop=True)
+        return is_data, oos_data
+
+
+def build_test_backtester(process_id: str):
+    """
+    Worker factory (module level: pickled by reference into spawned workers).
+
+    Injected data loader; coin validation, fingerprint dedup, funding and
+    strategy deletion (DB and parquet cache) are stubbed.
+    """
+    from src.backtester.main_continuous import ContinuousBacktesterProcess
+
+    backtester = ContinuousBacktesterProcess(
+        processor=MagicMock(process_id=process_id),
+        data_loader=SyntheticDataLoader(),
+        worker_mode=True,
+    )
+    backtester.funding_enabled = False
+    backtester.signal_fingerprinter.check = lambda *args: None
+    backtester._validate_trading_coins = lambda coins, timeframe: (list(coins), 'ok')
+    backtester._delete_strategy = lambda strategy_id, reason: None
+    backtester.engine._coin_max_leverage_cache.update({symbol: 10 for symbol in SYMBOLS})
+    return backtester
+
+
+class TestCreateBacktestExecutor:
+    """Executor selection for ContinuousBacktesterProcess"""
+
+    def test_thread_mode(self):
+        executor, log_listener = create_backtest_executor('thread', max_workers=2, process_id='bt-test')
+        try:
+            assert isinstance(executor, ThreadPoolExecutor)
+            assert log_listener is None
+            assert executor.submit(sum, [1, 2, 3]).result() == 6
+        finally:
+            executor.shutdown(wait=True)
+
+    def test_process_mode_creates_pool_and_log_listener(self):
+        executor, log_listener = create_backtest_executor('process', max_workers=2, process_id='bt-test')
+        try:
+            # Workers are spawned lazily on first submit; nothing is started here
+            assert isinstance(executor, ProcessPoolExecutor)
+            assert log_listener is not None
+        finally:
+            executor.shutdown(wait=True)
+            log_listener.stop()
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError, match="Unknown backtesting executor mode"):
+            create_backtest_executor('fiber', max_workers=2, process_id='bt-test')
+
+
+class TestProcessModeJobs:
+
+    @pytest.fixture(autouse=True)
+    def backtester_module(self):
+        # funding_loader is part of the full data package
+        pytest.importorskip('src.data.funding_loader')
+
+    def test_backtest_job_matches_thread_mode(self):
+        job = ('id-pool-test', 'Strategy_POOL_test', STRATEGY_CODE, '15m', SYMBOLS, None)
+        expected = build_test_backtester('bt-test')._backtest_strategy(*job)
+
+        executor, log_listener = create_backtest_executor(
+            'process', max_workers=1, process_id='bt-test', worker_factory=build_test_backtester
+        )
+        try:
+            result = executor.submit(run_backtest_job, *job).result(timeout=300)
+        finally:
+            executor.shutdown(wait=True)
+            log_listener.stop()
+
+        assert result == expected
+        assert result == (False, 'No parametric combinations passed thresholds')
+
+
+class TestSignalFingerprintOrder:
+
+    @pytest.fixture(autouse=True)
+    def backtester_module(self):
+        pytest.importorskip('src.data.funding_loader')
+
+    def test_strategy_discarded_before_backtest_registers_no_fingerprint(self):
+        backtester = build_test_backtester('bt-test')
+        backtester.signal_fingerprinter.check = MagicMock(return_value=None)
+        backtester._validate_trading_coins = lambda coins, timeframe: (None, 'no_valid_coins')
+
+        result = backtester._backtest_strategy(
+            'id-pool-test', 'Strategy_POOL_test', STRATEGY_CODE, '15m', SYMBOLS, None
+        )
+
+        assert result == (False, 'Trading coins validation failed: no_valid_coins')
+        backtester.signal_fingerprinter.check.assert_not_called()
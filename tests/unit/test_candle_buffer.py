@@ -0,0 +1,102 @@
+"""
+Unit tests for the columnar live candle ring buffer
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.data.candle_buffer import CandleBuffer
+
+
+START = datetime(2025, 1, 1)
+
+
+def _push(buffer, i, close=None):
+    close = float(i) if close is None else close
+    return buffer.update(START + timedelta(minutes=15 * i), close, close + 1, close - 1, close, 10.0 * i)
+
+
+class TestCandleBuffer:
+
+    def test_wraps_and_keeps_last_candles_in_order(self):
+        buffer = CandleBuffer(capacity=5)
+        for i in range(12):
+            assert _push(buffer, i)
+
+        assert len(buffer) == 5
+        timestamps, values = buffer.arrays()
+        np.testing.assert_array_equal(values[:, 3], [7, 8, 9, 10, 11])
+        assert timestamps[-1] == np.datetime64(START + timedelta(minutes=15 * 11), 'ns')
+
+        _, last_two = buffer.arrays(limit=2)
+        np.testing.assert_array_equal(last_two[:, 3], [10, 11])
+
+    def test_arrays_are_read_only_views(self):
+        buffer = CandleBuffer(capacity=5)
+        for i in range(3):
+            _push(buffer, i)
+
+        _, values = buffer.arrays()
+        with pytest.raises(ValueError):
+            values[0, 0] = 1.0
+
+    def test_forming_candle_updates_cached_frame_in_place(self):
+        buffer = CandleBuffer(capacity=10)
+        for i in range(4):
+            _push(buffer, i)
+
+        df = buffer.to_dataframe(limit=3)
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert df.index.name == 'timestamp'
+
+        assert not _push(buffer, 3, close=42.0)
+        assert buffer.to_dataframe(limit=3)['close'].iloc[-1] == 42.0
+        assert df['close'].iloc[-1] == 3.0  # Copies handed out earlier stay as read
+        assert len(buffer) == 4
+
+    def test_readers_get_independent_copies(self):
+        buffer = CandleBuffer(capacity=10)
+        for i in range(4):
+            _push(buffer, i)
+
+        # First consumer adds a signal column and edits values in place
+        first = buffer.to_dataframe(limit=3)
+        first['entry_signal'] = True
+        first.loc[first.index[0], 'close'] = -1.0
+
+        second = buffer.to_dataframe(limit=3)
+        assert list(second.columns) == ['open', 'high', 'low', 'close', 'volume']
+        np.testing.assert_array_equal(second['close'].values, [1.0, 2.0, 3.0])
+
+        # Forming update still patches the cached frame
+        assert not _push(buffer, 3, close=42.0)
+        assert buffer.to_dataframe(limit=3)['close'].iloc[-1] == 42.0
+
+    def test_closed_candle_invalidates_cached_frame(self):
+        buffer = CandleBuffer(capacity=10)
+        for i in range(4):
+            _push(buffer, i)
+        df = buffer.to_dataframe()
+
+        _push(buffer, 4)
+        new_df = buffer.to_dataframe()
+        assert new_df is not df
+        assert len(df) == 4 and len(new_df) == 5
+        assert new_df['close'].iloc[-1] == 4.0
+
+    def test_older_candles_are_ignored(self):
+        buffer = CandleBuffer(capacity=10)
+        for i in range(4):
+            _push(buffer, i)
+
+        assert not _push(buffer, 1, close=99.0)
+        _, values = buffer.arrays()
+        np.testing.assert_array_equal(values[:, 3], [0, 1, 2, 3])
+
+    def test_empty_buffer(self):
+        buffer = CandleBuffer(capacity=3)
+        assert not buffer
+        assert buffer.last_timestamp is None
+        assert buffer.to_dataframe().empty
@@ -0,0 +1,173 @@
+"""
+Unit tests for candle-close-driven executor scheduling
+
+The WebSocket reports a closed candle once the next one starts; the
+executor batches those events, evaluates only the subscribed subaccounts
+and coins, and evaluates on the closed candle (never the forming one).
+"""
+
+import asyncio
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.candle_buffer import CandleBuffer
+from src.data.hyperliquid_websocket import HyperliquidDataProvider
+
+pytest.importorskip('hyperliquid')
+from src.executor.main_continuous import ContinuousExecutorProcess  # noqa: E402
+
+
+START = datetime(2026, 1, 1)
+
+
+def _executor_process():
+    """ContinuousExecutorProcess with only what signal evaluation uses"""
+    process = object.__new__(ContinuousExecutorProcess)
+    process._signal_pool = None
+    process._candle_close_queue = asyncio.Queue()
+    process._active_subaccounts = []
+    process._indicators_cache = {}
+    process._indicators_cache_lock = threading.Lock()
+    process._order_locks = {}
+    process.close_latency_histogram = MagicMock()
+    return process
+
+
+def _subaccount(id: int, timeframe: str, coins: list) -> dict:
+    return {
+        'id': id, 'strategy_id': f'strategy-{id}', 'strategy_name': f'Strategy_{id}',
+        'strategy_code': '', 'timeframe': timeframe, 'trading_coins': coins,
+    }
+
+
+def _candles(n: int, start: datetime = START) -> pd.DataFrame:
+    index = pd.date_range(start, periods=n, freq='15min', name='timestamp')
+    close = np.arange(n, dtype=float) + 100.0
+    return pd.DataFrame(
+        {'open': close, 'high': close + 1, 'low': close - 1, 'close': close, 'volume': 1.0},
+        index=index,
+    )
+
+
+class TestCandleCloseWorker:
+
+    def test_events_batched_and_grouped_by_interval_and_close(self):
+        process = _executor_process()
+        process._active_subaccounts = [
+            _subaccount(1, '15m', ['BTC']),
+            _subaccount(2, '15m', ['SOL']),        # No closed coin - not evaluated
+            _subaccount(3, '1h', ['BTC', 'ETH']),
+        ]
+        process._process_subaccount = AsyncMock()
+        close_15m, close_1h = pd.Timestamp('2026-01-01 10:15'), pd.Timestamp('2026-01-01 09:00')
+
+        async def run():
+            # Queued before the worker starts: drained as one batch
+            for symbol, interval, closed_at in [
+                ('BTC', '15m', close_15m), ('ETH', '15m', close_15m), ('BTC', '1h', close_1h),
+            ]:
+                process._on_candle_close(symbol, interval, closed_at)
+
+            worker = asyncio.create_task(process._candle_close_worker())
+            while process.close_latency_histogram.observe.call_count < 3:
+                await asyncio.sleep(0)
+            worker.cancel()
+
+        asyncio.run(run())
+
+        calls = {
+            call.args[0]['id']: (call.kwargs['symbols'], call.kwargs['closed_at'])
+            for call in process._process_subaccount.await_args_list
+        }
+        assert calls == {
+            1: ({'BTC', 'ETH'}, close_15m),
+            3: ({'BTC'}, close_1h),
+        }
+
+    def test_prepare_runs_off_the_event_loop(self):
+        process = _executor_process()
+        threads = []
+
+        def prepare(subaccount):
+            threads.append(threading.get_ident())
+            return None
+
+        process._prepare_subaccount = prepare
+        asyncio.run(process._process_subaccount(_subaccount(1, '15m', ['BTC'])))
+
+        assert threads and threads[0] != threading.get_ident()
+
+
+class TestClosedCandleEvaluation:
+
+    @pytest.fixture
+    def process(self):
+        process = _executor_process()
+        process.strategy = MagicMock()
+        process.strategy.calculate_indicators.side_effect = lambda df: df
+        process.strategy.generate_signal.return_value = None
+        return process
+
+    def _evaluate(self, process, data, closed_at):
+        process._get_market_data = AsyncMock(return_value=data)
+        asyncio.run(process._process_coin(
+            subaccount=_subaccount(1, '15m', ['BTC']), strategy=process.strategy,
+            symbol='BTC', timeframe='15m', closed_at=closed_at,
+        ))
+        return process.strategy.calculate_indicators.call_args.args[0]
+
+    def test_forming_candle_dropped(self, process):
+        data = _candles(60)
+        evaluated = self._evaluate(process, data, closed_at=data.index[-2])
+
+        assert len(evaluated) == 59
+        assert evaluated.index[-1] == data.index[-2]
+
+    def test_cache_key_includes_last_candle(self, process):
+        # Full ring buffer: the window keeps its length as it slides
+        first, second = _candles(60), _candles(60, START + timedelta(minutes=15))
+        self._evaluate(process, first, closed_at=first.index[-1])
+        self._evaluate(process, second, closed_at=second.index[-1])
+
+        assert process.strategy.calculate_indicators.call_count == 2
+        keys = list(process._indicators_cache)
+        assert keys[0].endswith(f':60:{first.index[-1]}')
+        assert keys[1].endswith(f':60:{second.index[-1]}')
+
+
+class TestWebSocketCandleClose:
+
+    @pytest.fixture
+    def provider(self):
+        provider = object.__new__(HyperliquidDataProvider)
+        provider.candles = defaultdict(lambda: defaultdict(lambda: CandleBuffer(capacity=10)))
+        provider.current_candles = defaultdict(dict)
+        provider.async_lock = asyncio.Lock()
+        provider.closes = []
+        provider._candle_close_callback = lambda *event: provider.closes.append(event)
+        return provider
+
+    @staticmethod
+    def _message(minutes: int, close: float) -> dict:
+        ts = START + timedelta(minutes=minutes)
+        return {'data': {
+            's': 'BTC', 'i': '15m', 't': int(ts.timestamp() * 1000),
+            'o': close, 'h': close, 'l': close, 'c': close, 'v': 1.0,
+        }}
+
+    def test_close_fires_only_when_next_candle_starts(self, provider):
+        async def run():
+            await provider._handle_candle(self._message(0, 100.0))   # First candle: nothing closed
+            await provider._handle_candle(self._message(0, 101.0))   # Forming candle update
+            await provider._handle_candle(self._message(15, 102.0))  # Previous candle closed
+            await provider._handle_candle(self._message(0, 99.0))    # Late update: ignored
+
+        asyncio.run(run())
+
+        assert provider.closes == [('BTC', '15m', pd.Timestamp(START))]
@@ -0,0 +1,81 @@
+"""
+Unit tests for the local claim prefetch queue
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from src.database.claim_queue import ClaimQueue
+
+
+def _processor(available):
+    """StrategyProcessor mock claiming from a list of strategy ids"""
+    processor = MagicMock()
+    processor.timeout_seconds = 900
+    pending = list(available)
+
+    def claim_batch(status, n):
+        batch = [SimpleNamespace(id=sid) for sid in pending[:n]]
+        del pending[:n]
+        return batch
+
+    processor.claim_batch.side_effect = claim_batch
+    processor.release_claims.side_effect = lambda ids: len(list(ids))
+    processor.touch_claim.return_value = True
+    return processor
+
+
+class TestClaimQueue:
+
+    def test_refills_in_batches_at_low_water(self):
+        processor = _processor(range(10))
+        queue = ClaimQueue(processor, "GENERATED", batch_size=4, low_water=1)
+
+        ids = [queue.get().id for _ in range(6)]
+
+        assert ids == [0, 1, 2, 3, 4, 5]
+        # Initial fill of 4, refill of 3 when one was left
+        assert [c.args for c in processor.claim_batch.call_args_list] == [
+            ("GENERATED", 4), ("GENERATED", 3)
+        ]
+
+    def test_returns_none_when_nothing_available(self):
+        queue = ClaimQueue(_processor([]), "VALIDATED", batch_size=4, low_water=1)
+        assert queue.get() is None
+        assert len(queue) == 0
+
+    def test_release_gives_back_unused_claims(self):
+        processor = _processor(range(5))
+        queue = ClaimQueue(processor, "GENERATED", batch_size=4, low_water=1)
+        queue.get()
+
+        assert queue.release() == 3
+        processor.release_claims.assert_called_once_with([1, 2, 3])
+        assert len(queue) == 0
+
+    def test_expired_prefetched_claims_are_released(self):
+        processor = _processor(range(8))
+        queue = ClaimQueue(processor, "GENERATED", batch_size=4, low_water=0, max_age_seconds=10)
+
+        with patch('src.database.claim_queue.time.monotonic', return_value=100.0):
+            assert queue.get().id == 0
+        with patch('src.database.claim_queue.time.monotonic', return_value=200.0):
+            assert queue.get().id == 4
+
+        processor.release_claims.assert_called_once_with([1, 2, 3])
+
+    def test_handed_out_claims_are_touched(self):
+        processor = _processor(range(4))
+        queue = ClaimQueue(processor, "GENERATED", batch_size=4, low_water=0)
+
+        assert queue.get().id == 0
+        assert queue.get().id == 1
+        assert [c.args for c in processor.touch_claim.call_args_list] == [(0,), (1,)]
+
+    def test_lost_claims_are_skipped(self):
+        processor = _processor(range(4))
+        processor.touch_claim.side_effect = lambda sid: sid != 0
+        queue = ClaimQueue(processor, "GENERATED", batch_size=4, low_water=0)
+
+        assert queue.get().id == 1
+        processor.release_claims.assert_not_called()
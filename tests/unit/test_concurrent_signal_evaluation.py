@@ -0,0 +1,87 @@
+"""
+Unit tests for concurrent executor signal evaluation
+
+In concurrent mode a subaccount's coins are evaluated in parallel in the
+signal pool, but order placement (position check + execution) stays
+serialized per subaccount.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.base import Signal
+
+pytest.importorskip('hyperliquid')
+from src.executor.main_continuous import ContinuousExecutorProcess  # noqa: E402
+
+
+COINS = ['AAA', 'BBB', 'CCC', 'DDD']
+
+
+def _candles(n: int = 60) -> pd.DataFrame:
+    index = pd.date_range('2026-01-01', periods=n, freq='15min', name='timestamp')
+    close = np.arange(n, dtype=float) + 100.0
+    return pd.DataFrame(
+        {'open': close, 'high': close + 1, 'low': close - 1, 'close': close, 'volume': 1.0},
+        index=index,
+    )
+
+
+@pytest.fixture
+def process():
+    process = object.__new__(ContinuousExecutorProcess)
+    process._signal_pool = ThreadPoolExecutor(max_workers=len(COINS))
+    process.max_coins_per_subaccount = len(COINS)
+    process._indicators_cache = {}
+    process._indicators_cache_lock = threading.Lock()
+    process._order_locks = {}
+    yield process
+    process._signal_pool.shutdown(wait=True)
+
+
+def test_coins_evaluated_in_parallel_orders_serialized(process):
+    # Every coin's indicator pass waits for all others: passes only if concurrent
+    barrier = threading.Barrier(len(COINS), timeout=5)
+
+    def calculate_indicators(df):
+        barrier.wait()
+        return df
+
+    strategy = MagicMock()
+    strategy.calculate_indicators.side_effect = calculate_indicators
+    strategy.generate_signal.return_value = Signal(direction='long', reason='test')
+
+    async def get_market_data(symbol, timeframe):
+        return _candles()
+
+    open_positions = set()
+    placing = []
+    max_placing = 0
+
+    async def execute_signal(subaccount, signal, df, symbol):
+        nonlocal max_placing
+        placing.append(symbol)
+        max_placing = max(max_placing, len(placing))
+        await asyncio.sleep(0.01)  # Order round trip: other coins would interleave here
+        open_positions.add(symbol)
+        placing.remove(symbol)
+
+    process._prepare_subaccount = lambda subaccount: (strategy, list(COINS))
+    process._get_market_data = get_market_data
+    process._get_open_trade = lambda subaccount_id, symbol: None
+    process._is_at_max_positions = lambda subaccount_id: len(open_positions) >= 3
+    process._execute_signal = execute_signal
+
+    subaccount = {'id': 1, 'strategy_id': 'strategy-1', 'timeframe': '15m'}
+    asyncio.run(process._process_subaccount(subaccount))
+
+    assert strategy.calculate_indicators.call_count == len(COINS)
+    assert max_placing == 1
+    # Position limit checked under the lock: never exceeded by racing coins
+    assert len(open_positions) == 3
@@ -0,0 +1,99 @@
+"""
+Construction and helper tests for the continuous pipeline processes
+
+The validator and backtester processes (and every backtest pool worker)
+build their components in __init__; these construct them with the
+database mocked so a missing import or component fails here instead of
+at service startup.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.database import StrategyProcessor
+
+
+@pytest.fixture
+def processor():
+    processor = MagicMock(spec=StrategyProcessor)
+    processor.process_id = 'test-process'
+    processor.timeout_seconds = 1800
+    return processor
+
+
+def test_validator_process_init(processor):
+    from src.validator.main_continuous import ContinuousValidatorProcess
+
+    validator = ContinuousValidatorProcess(processor=processor)
+    try:
+        assert validator.claim_queue.processor is processor
+        assert validator.claim_queue.status == 'GENERATED'
+        processor.claim_batch.assert_not_called()
+    finally:
+        validator.executor.shutdown(wait=False)
+
+
+class TestBacktesterProcessInit:
+    @pytest.fixture(autouse=True)
+    def backtester_module(self):
+        # funding_loader is part of the full data package
+        pytest.importorskip('src.data.funding_loader')
+        from src.backtester import main_continuous
+        return main_continuous
+
+    @pytest.mark.parametrize('worker_mode', [False, True])
+    def test_init(self, backtester_module, processor, worker_mode):
+        threads = backtester_module.load_config()._raw_config['backtesting']['threads']
+
+        with patch.dict(threads, {'mode': 'thread'}), \
+                patch.object(backtester_module, 'get_session') as get_session:
+            backtester = backtester_module.ContinuousBacktesterProcess(
+                processor=processor, data_loader=MagicMock(), worker_mode=worker_mode
+            )
+
+        try:
+            assert backtester.claim_queue.processor is processor
+            assert backtester.claim_queue.status == 'VALIDATED'
+            assert (backtester.executor is None) == worker_mode
+            # Worker processes skip the startup strategy file sync
+            assert get_session.called != worker_mode
+        finally:
+            if backtester.executor:
+                backtester.executor.shutdown(wait=False)
+
+
+class TestParametricComboStats:
+    @pytest.fixture
+    def backtester(self):
+        pytest.importorskip('src.data.funding_loader')
+        from src.backtester.main_continuous import ContinuousBacktesterProcess
+
+        backtester = object.__new__(ContinuousBacktesterProcess)
+        backtester.min_sharpe = 1.0
+        backtester.min_win_rate = 0.4
+        backtester.min_expectancy = 0.0
+        backtester.max_drawdown = 0.3
+        return backtester
+
+    def test_totals_cover_combos_eliminated_by_halving(self, backtester):
+        # 3 of a 12-combo grid reached the full panel, 1 passes
+        results_df = pd.DataFrame({
+            'sharpe': [1.5, 0.5, 1.2],
+            'win_rate': [0.5, 0.5, 0.3],
+            'expectancy': [0.01, 0.01, 0.01],
+            'max_drawdown': [0.1, 0.1, 0.1],
+            'total_trades': [50, 50, 50],
+        })
+        results_df.attrs['combinations_total'] = 12
+        valid = results_df.iloc[[0]]
+
+        stats = backtester._parametric_combo_stats(results_df, valid, min_trades_tf=20)
+
+        assert stats['total'] == 12
+        assert stats['passed'] == 1
+        assert stats['failed'] == 11
+        assert stats['eliminated'] == 9
+        assert stats['fail_reasons']['sharpe'] == 1
+        assert stats['fail_reasons']['wr'] == 1
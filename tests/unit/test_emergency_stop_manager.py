@@ -122,6 +122,85 @@ class TestCanTrade:
         assert mock_ctx.query.return_value.filter.return_value.first.call_count == 4
 
 
+class TestStateIndex:
+    """Tests for the in-memory stop index (executor hot path)."""
+
+    @staticmethod
+    def _mock_session(mock_session, active_stops):
+        mock_ctx = MagicMock()
+        mock_ctx.__enter__ = MagicMock(return_value=mock_ctx)
+        mock_ctx.__exit__ = MagicMock(return_value=False)
+        mock_ctx.query.return_value.filter.return_value.all.return_value = active_stops
+        mock_ctx.query.return_value.filter.return_value.first.return_value = None
+        mock_session.return_value = mock_ctx
+        return mock_ctx
+
+    @patch('src.executor.emergency_stop_manager.get_session')
+    def test_can_trade_uses_index_without_queries(self, mock_session, manager):
+        """Verify can_trade answers from the index once it is loaded."""
+        strategy_id = uuid4()
+        stop = MagicMock()
+        stop.scope = 'strategy'
+        stop.scope_id = str(strategy_id)
+        stop.stop_reason = '10 consecutive losses'
+        stop.cooldown_until = datetime.now(UTC) + timedelta(hours=24)
+        mock_ctx = self._mock_session(mock_session, [stop])
+
+        manager.enable_state_index(refresh_seconds=3600)
+        mock_ctx.query.reset_mock()
+
+        blocked = manager.can_trade(1, strategy_id)
+        allowed = manager.can_trade(1, uuid4())
+
+        assert blocked['allowed'] is False
+        assert blocked['blocked_by'] == [f'strategy_{strategy_id}']
+        assert blocked['cooldown_until'] == stop.cooldown_until
+        assert allowed['allowed'] is True
+        mock_ctx.query.assert_not_called()
+
+    @patch('src.executor.emergency_stop_manager.get_session')
+    def test_trigger_and_reset_update_index(self, mock_session, manager):
+        """Verify trigger_stop/reset_on_rotation keep the index current."""
+        mock_ctx = self._mock_session(mock_session, [])
+        manager.enable_state_index(refresh_seconds=3600)
+
+        manager.trigger_stop('subaccount', '3', 'DD 26%', 'halt_entries', 'rotation')
+        assert manager.can_trade(3, uuid4())['blocked_by'] == ['subaccount_3']
+
+        mock_ctx.query.return_value.filter.return_value.first.return_value = MagicMock()
+        manager.reset_on_rotation(3)
+        assert manager.can_trade(3, uuid4())['allowed'] is True
+
+    @patch('src.executor.emergency_stop_manager.get_session')
+    def test_failed_reset_keeps_stop_indexed(self, mock_session, manager):
+        """Verify a reset that does not commit leaves the stop in the index."""
+        mock_ctx = self._mock_session(mock_session, [])
+        manager.enable_state_index(refresh_seconds=3600)
+        manager.trigger_stop('subaccount', '3', 'DD 26%', 'halt_entries', 'rotation')
+
+        mock_ctx.query.return_value.filter.return_value.first.return_value = MagicMock()
+        mock_ctx.commit.side_effect = RuntimeError('connection lost')
+        with pytest.raises(RuntimeError):
+            manager.reset_on_rotation(3)
+
+        assert manager.can_trade(3, uuid4())['blocked_by'] == ['subaccount_3']
+
+    @patch('src.executor.emergency_stop_manager.get_session')
+    def test_index_reconciles_with_db(self, mock_session, manager):
+        """Verify stale index is reloaded (stops written by other processes)."""
+        mock_ctx = self._mock_session(mock_session, [])
+        manager.enable_state_index(refresh_seconds=0)
+
+        stop = MagicMock()
+        stop.scope = 'portfolio'
+        stop.scope_id = 'global'
+        stop.stop_reason = 'Daily loss'
+        stop.cooldown_until = None
+        mock_ctx.query.return_value.filter.return_value.all.return_value = [stop]
+
+        assert manager.can_trade(1, uuid4())['blocked_by'] == ['portfolio_global']
+
+
 class TestTriggerStop:
     """Tests for trigger_stop method."""
 
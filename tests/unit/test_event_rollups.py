@@ -0,0 +1,79 @@
+"""
+Unit tests for pipeline event rollup sums
+"""
+
+from src.metrics import rollups
+from src.metrics.rollups import RollupTotals
+
+
+# (stage, event_type, status, source, count, duration_count, duration_sum, duration_min, duration_max)
+ROWS = [
+    ('generation', 'created', 'completed', 'pattern', 10, 10, 1000.0, 50, 200),
+    ('generation', 'created', 'completed', 'unger', 5, 0, 0.0, None, None),
+    ('validation', 'completed', 'completed', '', 8, 8, 800.0, 20, 300),
+    ('validation', 'lookahead_failed', 'failed', '', 3, 3, 60.0, 10, 30),
+    ('shuffle_test', 'passed', 'passed', '', 4, 0, 0.0, None, None),
+    ('shuffle_test', 'failed', 'failed', '', 2, 0, 0.0, None, None),
+]
+
+
+class TestRollupTotals:
+
+    def test_counts_with_filters(self):
+        totals = RollupTotals(ROWS)
+        assert totals.count('generation', 'created') == 15
+        assert totals.count('validation', status='failed') == 3
+        assert totals.count('shuffle_test', ['passed', 'failed']) == 6
+        assert totals.count(['validation', 'shuffle_test'], status='failed') == 5
+        assert totals.count('pool', 'entered') == 0
+
+    def test_counts_by_source(self):
+        totals = RollupTotals(ROWS)
+        assert totals.count_by_source('generation', 'created') == {'pattern': 10, 'unger': 5}
+
+    def test_duration_aggregates(self):
+        totals = RollupTotals(ROWS)
+        duration = totals.duration('validation')
+        assert duration == {'count': 11, 'avg': 860.0 / 11, 'min': 10, 'max': 300}
+        assert totals.duration('shuffle_test') == {'count': 0, 'avg': None, 'min': None, 'max': None}
+        assert totals.avg_duration_by_source('generation', 'created') == {'pattern': 100.0}
+
+
+# (stage, event_type, status, source, metric, count, sum, min, max)
+METRIC_ROWS = [
+    ('backtest', 'is_failed', 'failed', '', 'is_sharpe', 4, 2.0, -0.5, 1.5),
+    ('backtest', 'is_failed', 'failed', '', 'is_sharpe', 2, 1.0, 0.1, 0.9),
+    ('backtest', 'oos_failed', 'failed', '', 'is_sharpe', 3, 4.5, 1.0, 2.0),
+    ('backtest', 'is_failed', 'failed', '', 'fail_types.dd', 3, 3.0, 1.0, 1.0),
+    ('generation', 'created', 'completed', 'pattern', 'direction:LONG', 6, 6.0, 1.0, 1.0),
+    ('generation', 'created', 'completed', 'unger', 'direction:LONG', 2, 2.0, 1.0, 1.0),
+    ('generation', 'created', 'completed', 'unger', 'direction:SHORT', 1, 1.0, 1.0, 1.0),
+    ('generation', 'created', 'completed', 'unger', 'type:MOM', 3, 3.0, 1.0, 1.0),
+]
+
+
+class TestRollupMetrics:
+
+    def test_metric_aggregates(self):
+        totals = RollupTotals(ROWS, METRIC_ROWS)
+        assert totals.metric('is_sharpe', 'backtest', 'is_failed') == {
+            'count': 6, 'sum': 3.0, 'avg': 0.5, 'min': -0.5, 'max': 1.5,
+        }
+        assert totals.metric('is_sharpe', 'backtest')['count'] == 9
+        assert totals.metric('fail_types.dd', 'backtest', 'is_failed')['sum'] == 3.0
+        assert totals.metric('score', 'backtest', 'scored') == {
+            'count': 0, 'sum': 0.0, 'avg': None, 'min': None, 'max': None,
+        }
+
+    def test_categories_summed_across_sources(self):
+        totals = RollupTotals(ROWS, METRIC_ROWS)
+        assert totals.categories('direction', 'generation', 'created') == {'LONG': 8, 'SHORT': 1}
+        assert totals.categories('type', 'generation', 'created') == {'MOM': 3}
+        assert totals.categories('timeframe', 'generation', 'created') == {}
+
+    def test_refresh_sql_covers_every_metric(self):
+        sql = str(rollups._METRIC_REFRESH_SQL)
+        for _, _, metric, _, _ in rollups.METRICS:
+            assert f"'{metric}'" in sql
+        for _, _, name, _, _ in rollups.CATEGORIES:
+            assert f"'{name}:'" in sql
@@ -0,0 +1,73 @@
+"""
+Unit tests for the batched EventTracker writer
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.database.event_tracker import EventWriter
+
+
+@pytest.fixture
+def session():
+    """Mocked get_session yielding one session for all writes"""
+    mock_session = MagicMock()
+    with patch('src.database.event_tracker.get_session') as mock_get_session:
+        mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
+        mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+        yield mock_session
+
+
+def _row(i):
+    return {'strategy_name': f'Strategy_{i}', 'event_type': 'started', 'stage': 'backtest', 'status': 'started'}
+
+
+class TestEventWriter:
+
+    def test_flush_writes_queued_events_in_batches(self, session):
+        writer = EventWriter(batch_size=10, flush_interval=0.05)
+        for i in range(25):
+            assert writer.submit(_row(i))
+
+        assert writer.flush(timeout=5.0)
+
+        rows = [row for call in session.execute.call_args_list for row in call.args[1]]
+        assert [r['strategy_name'] for r in rows] == [f'Strategy_{i}' for i in range(25)]
+        assert all(len(call.args[1]) <= 10 for call in session.execute.call_args_list)
+        assert writer.stats() == {'written': 25, 'dropped': 0, 'failed': 0, 'backlog': 0}
+
+    def test_full_queue_drops_events(self, session):
+        writer = EventWriter(queue_size=2)
+        # Writer thread not started: nothing drains the queue
+        writer._thread = MagicMock()
+
+        assert writer.submit(_row(0))
+        assert writer.submit(_row(1))
+        assert not writer.submit(_row(2))
+        assert writer.stats()['dropped'] == 1
+        assert writer.stats()['backlog'] == 2
+
+    def test_failed_insert_is_counted_not_raised(self, session):
+        session.execute.side_effect = RuntimeError("db down")
+        writer = EventWriter(batch_size=5, flush_interval=0.05)
+        for i in range(3):
+            writer.submit(_row(i))
+
+        assert writer.flush(timeout=5.0)
+        assert writer.stats()['failed'] == 3
+        assert writer.stats()['written'] == 0
+
+    def test_bad_row_only_drops_itself(self, session):
+        def execute(statement, rows):
+            if any(row['strategy_name'] == 'Strategy_1' for row in rows):
+                raise RuntimeError("value too long for type character varying(100)")
+
+        session.execute.side_effect = execute
+        writer = EventWriter(batch_size=5, flush_interval=0.05)
+        for i in range(3):
+            writer.submit(_row(i))
+
+        assert writer.flush(timeout=5.0)
+        assert writer.stats()['written'] == 2
+        assert writer.stats()['failed'] == 1
@@ -0,0 +1,142 @@
+"""
+Unit tests for the process-wide indicator cache
+"""
+
+import gc
+import weakref
+
+import numpy as np
+import pandas as pd
+import pytest
+import talib
+
+from src.strategies.base import StrategyCore
+from src.strategies.indicator_cache import IndicatorCache, cached_module, data_digest
+
+
+HELPER_SOURCE = '''
+def rolling_mean(close, period):
+    return close.rolling(period).mean()
+'''
+
+
+@pytest.fixture
+def cache():
+    IndicatorCache.reset()
+    yield IndicatorCache.instance()
+    IndicatorCache.reset()
+
+
+@pytest.fixture
+def close():
+    rng = np.random.default_rng(3)
+    return pd.Series(100 * np.cumprod(1 + rng.normal(0, 0.01, 2000)), name='close')
+
+
+def _load_helper(module_name):
+    namespace = {'__name__': module_name}
+    exec(HELPER_SOURCE, namespace)
+    return namespace['rolling_mean']
+
+
+class TestIndicatorCache:
+
+    def test_hit_returns_equal_independent_copy(self, cache, close):
+        first = StrategyCore.cached_indicator(talib.RSI, close, timeperiod=14)
+        second = StrategyCore.cached_indicator(talib.RSI, close.copy(), timeperiod=14)
+
+        pd.testing.assert_series_equal(first, second)
+        assert cache.get_stats()['hits'] == 1
+
+        second.iloc[:] = 0.0
+        third = StrategyCore.cached_indicator(talib.RSI, close, timeperiod=14)
+        pd.testing.assert_series_equal(first, third)
+
+    def test_params_and_data_are_part_of_the_key(self, cache, close):
+        StrategyCore.cached_indicator(talib.RSI, close, timeperiod=14)
+        StrategyCore.cached_indicator(talib.RSI, close, timeperiod=21)
+
+        # Truncated and shuffled inputs (lookahead/shuffle tests) must miss
+        truncated = close.iloc[:1500]
+        result = StrategyCore.cached_indicator(talib.RSI, truncated, timeperiod=14)
+        np.testing.assert_allclose(result.values, talib.RSI(truncated, timeperiod=14).values)
+
+        shuffled = close.sample(frac=1.0, random_state=1).reset_index(drop=True)
+        StrategyCore.cached_indicator(talib.RSI, shuffled, timeperiod=14)
+
+        assert cache.get_stats()['hits'] == 0
+        assert cache.get_stats()['misses'] == 4
+
+    def test_hit_uses_caller_index(self, cache, close):
+        StrategyCore.cached_indicator(talib.EMA, close, timeperiod=20)
+        shifted = close.copy()
+        shifted.index = shifted.index + 500
+
+        result = StrategyCore.cached_indicator(talib.EMA, shifted, timeperiod=20)
+        assert cache.get_stats()['hits'] == 1
+        assert result.index.equals(shifted.index)
+
+    def test_identical_helpers_in_different_modules_share_entries(self, cache, close):
+        helper_a = _load_helper('strategy_a')
+        helper_b = _load_helper('strategy_b')
+
+        a = StrategyCore.cached_indicator(helper_a, close, 20)
+        b = StrategyCore.cached_indicator(helper_b, close, 20)
+
+        pd.testing.assert_series_equal(a, b)
+        assert cache.get_stats()['hits'] == 1
+
+    def test_discarded_helpers_are_not_kept_alive(self, cache, close):
+        helper = _load_helper('strategy_discarded')
+        StrategyCore.cached_indicator(helper, close, 20)
+        code_ref = weakref.ref(helper.__code__)
+
+        del helper
+        gc.collect()
+
+        assert code_ref() is None
+
+    def test_tuple_results_and_cached_module(self, cache, close):
+        ta = cached_module(talib)
+        high, low = close * 1.01, close * 0.99
+
+        k1, d1 = ta.STOCH(high, low, close)
+        k2, d2 = ta.STOCH(high, low, close)
+        k_ref, d_ref = talib.STOCH(high, low, close)
+
+        pd.testing.assert_series_equal(k2, k_ref)
+        pd.testing.assert_series_equal(d2, d_ref)
+        assert cache.get_stats()['hits'] == 1
+
+    def test_closures_are_rejected(self, cache, close):
+        period = 10
+
+        with pytest.raises(ValueError, match='closure'):
+            StrategyCore.cached_indicator(lambda s: s.rolling(period).mean(), close)
+
+    def test_lru_eviction_respects_byte_budget(self, close):
+        cache = IndicatorCache.configure(max_mb=3 * close.nbytes / (1024 * 1024))
+        try:
+            for period in range(5, 10):
+                StrategyCore.cached_indicator(talib.SMA, close, timeperiod=period)
+
+            stats = cache.get_stats()
+            assert stats['entries'] == 3
+            assert stats['evictions'] == 2
+        finally:
+            IndicatorCache.reset()
+
+    def test_disabled_cache_computes_directly(self, close):
+        cache = IndicatorCache.configure(enabled=False)
+        try:
+            result = StrategyCore.cached_indicator(talib.RSI, close, timeperiod=14)
+            pd.testing.assert_series_equal(result, talib.RSI(close, timeperiod=14))
+            assert cache.get_stats()['entries'] == 0
+        finally:
+            IndicatorCache.reset()
+
+    def test_digest_is_position_sensitive(self):
+        values = np.arange(100, dtype=np.float64)
+        assert data_digest(values) == data_digest(values.copy())
+        assert data_digest(values) != data_digest(values[::-1])
+        assert data_digest(values) != data_digest(values[:-1])
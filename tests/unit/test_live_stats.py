@@ -0,0 +1,291 @@
+"""
+Unit tests for the running live-trade statistics (src.scorer.live_stats)
+
+Folding trades one at a time must give the metrics LiveScorer used to
+compute from the full trade list. Row locking and rebuilds need PostgreSQL;
+these cover the folding and the metrics read from it.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta, UTC
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.database.models import StrategyLiveStats, Trade
+from src.scorer.live_scorer import LiveScorer
+from src.scorer.live_stats import apply_trade, record_closed_trade, reset_stats, trade_return
+
+
+CONFIG = {
+    'monitor': {
+        'retirement': {'min_trades': 10},
+        'live_scoring': {'min_trades_for_frequency': 10, 'min_days_for_frequency': 7},
+    },
+    'scorer': {'weights': {'expectancy': 0.45, 'sharpe': 0.25, 'win_rate': 0.15, 'drawdown': 0.15}},
+}
+
+
+def _trades(n: int, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    start = datetime(2026, 1, 1)
+    trades = []
+    for k in range(n):
+        entry = start + timedelta(hours=12 * k)
+        pnl = float(rng.normal(0.5, 4.0))
+        trades.append(SimpleNamespace(
+            id=uuid.uuid4(),
+            strategy_id=None,
+            entry_time=entry,
+            exit_time=entry + timedelta(hours=3),
+            entry_price=100.0,
+            entry_size=1.0,
+            pnl_usd=pnl,
+            pnl_pct=pnl,  # Percent of the 100 USD notional
+        ))
+    return trades
+
+
+def _fold(trades) -> StrategyLiveStats:
+    stats = StrategyLiveStats(strategy_id=uuid.uuid4())
+    reset_stats(stats)
+    for trade in trades:
+        apply_trade(stats, trade)
+    return stats
+
+
+def _reference_metrics(trades):
+    """Trade-list metrics LiveScorer computed before the running stats"""
+    pnls = np.array([t.pnl_usd for t in trades])
+    returns = np.array([t.pnl_pct / 100 for t in trades])
+    win_rate = (pnls > 0).sum() / len(trades)
+    expectancy = win_rate * returns[returns > 0].mean() - (1 - win_rate) * abs(returns[returns < 0].mean())
+
+    days = (max(t.exit_time for t in trades) - min(t.entry_time for t in trades)).total_seconds() / 86400
+    sharpe = returns.mean() / returns.std(ddof=1) * np.sqrt(365 * len(trades) / days)
+
+    equity = np.cumsum(pnls)
+    running_max = np.maximum.accumulate(equity)
+    drawdowns = np.where(running_max > 0, (running_max - equity) / np.where(running_max > 0, running_max, 1), 0)
+
+    return {
+        'total_trades': len(trades),
+        'win_rate': win_rate,
+        'expectancy': expectancy,
+        'sharpe': sharpe,
+        'max_drawdown': drawdowns.max(),
+        'total_pnl': pnls.sum(),
+    }
+
+
+class TestRunningStats:
+    def test_metrics_match_trade_list(self):
+        trades = _trades(200)
+        metrics = LiveScorer(CONFIG).metrics_from_stats(_fold(trades))
+
+        for key, value in _reference_metrics(trades).items():
+            assert metrics[key] == pytest.approx(value, rel=1e-9), key
+        assert 0 <= metrics['score'] <= 100
+
+    def test_loss_streak(self):
+        trades = _trades(20)
+        for trade, pnl in zip(trades[-4:], [5.0, -1.0, -2.0, -0.5]):
+            trade.pnl_usd = pnl
+        assert _fold(trades).loss_streak == 3
+
+        trades[-1].pnl_usd = None  # No PnL ends the streak
+        assert _fold(trades).loss_streak == 0
+
+    def test_drawdown_needs_positive_peak(self):
+        trades = _trades(12)
+        for trade in trades:
+            trade.pnl_usd = -1.0
+        stats = _fold(trades)
+        assert stats.max_drawdown == 0.0
+        assert stats.peak_pnl == 0.0
+        assert stats.total_pnl == -12.0
+
+    def test_identical_returns_zero_sharpe(self):
+        trades = _trades(30)
+        for trade in trades:
+            trade.pnl_usd = 1.3
+            trade.pnl_pct = 1.3
+        assert LiveScorer(CONFIG).metrics_from_stats(_fold(trades))['sharpe'] == 0.0
+
+    def test_insufficient_history(self):
+        scorer = LiveScorer(CONFIG)
+        assert scorer.metrics_from_stats(_fold(_trades(5))) is None
+
+        # Enough trades, but all within 2 days
+        trades = _trades(12)
+        for k, trade in enumerate(trades):
+            trade.entry_time = datetime(2026, 1, 1) + timedelta(hours=3 * k)
+            trade.exit_time = trade.entry_time + timedelta(hours=1)
+        assert scorer.metrics_from_stats(_fold(trades)) is None
+
+    def test_aware_exit_times_stored_naive(self):
+        trades = _trades(3)
+        trades[-1].exit_time = trades[-1].exit_time.replace(tzinfo=UTC)
+        stats = _fold(trades)
+        assert stats.last_exit_time == trades[-1].exit_time.replace(tzinfo=None)
+
+
+def _session_returning(*results):
+    """get_session() stand-in whose query(...).filter(...).first() yields results in turn"""
+    session = MagicMock()
+    session.query.return_value.filter.return_value.first.side_effect = list(results)
+    get_session = MagicMock()
+    get_session.return_value.__enter__.return_value = session
+    return get_session
+
+
+def _open_trade(direction: str = 'LONG'):
+    return SimpleNamespace(
+        id=uuid.uuid4(), strategy_id=uuid.uuid4(), symbol='BTC', direction=direction,
+        entry_time=datetime(2026, 1, 1), entry_price=100.0, entry_size=0.5,
+        exit_time=None, pnl_usd=None, pnl_pct=None,
+    )
+
+
+def _fold_recorder():
+    """record_closed_trade stand-in folding into one in-memory stats row"""
+    stats = StrategyLiveStats(strategy_id=uuid.uuid4())
+    reset_stats(stats)
+    return stats, lambda session, trade: apply_trade(stats, trade)
+
+
+def _executor_process():
+    """ContinuousExecutorProcess with only what _record_exit uses"""
+    from src.executor.main_continuous import ContinuousExecutorProcess
+
+    process = object.__new__(ContinuousExecutorProcess)
+    process.client = MagicMock()
+    process.emergency_manager = MagicMock()
+    process.position_index = MagicMock()
+    process.trailing_service = MagicMock()
+    process._time_exit_tracking = {}
+    return process
+
+
+class TestTradeReturnUnits:
+    """Executor exits and TradeSync must fold the same return for the same trade"""
+
+    def test_trade_return_from_notional(self):
+        trade = _open_trade()
+        trade.pnl_usd, trade.pnl_pct = 1.0, 2.0
+        assert trade_return(trade) == pytest.approx(0.02)
+
+        # Rows written with pnl_pct as a fraction fold the same
+        trade.pnl_pct = 0.02
+        assert trade_return(trade) == pytest.approx(0.02)
+
+    def test_trade_return_falls_back_to_pnl_pct(self):
+        trade = _open_trade()
+        trade.entry_size = None
+        trade.pnl_usd, trade.pnl_pct = 1.0, 2.0
+        assert trade_return(trade) == pytest.approx(0.02)
+
+        trade.pnl_pct = None
+        assert trade_return(trade) is None
+
+    def test_trade_sync_path(self):
+        from src.executor.trade_sync import TradeSync
+
+        trade = _open_trade()
+        stats, recorder = _fold_recorder()
+        trade_data = {
+            'exit_time': datetime(2026, 1, 1, 3), 'exit_price': 102.0, 'size': 0.5,
+            'net_pnl': 1.0, 'total_fee': 0.0, 'entry_fee': 0.0, 'exit_fee': 0.0,
+            'exit_tid': 42, 'duration_minutes': 180, 'symbol': 'BTC', 'side': 'long',
+        }
+
+        with patch('src.executor.trade_sync.get_session', _session_returning(None, trade)), \
+                patch('src.executor.trade_sync.record_closed_trade', recorder):
+            asyncio.run(TradeSync(config={})._update_trade_in_db(trade_data, iteration=1))
+
+        assert trade.pnl_pct == pytest.approx(2.0)
+        assert stats.n_returns == 1
+        assert stats.sum_return == pytest.approx(0.02)
+
+    def test_executor_exit_path(self):
+        pytest.importorskip('hyperliquid')
+        from src.executor import main_continuous
+
+        trade = _open_trade()
+        stats, recorder = _fold_recorder()
+        process = _executor_process()
+
+        with patch.object(main_continuous, 'get_session', _session_returning(trade)), \
+                patch.object(main_continuous, 'record_closed_trade', recorder):
+            process._record_exit({'id': trade.id, 'symbol': 'BTC'}, 102.0, 'TP')
+
+        assert trade.pnl_usd == pytest.approx(1.0)
+        assert trade.pnl_pct == pytest.approx(2.0)
+        assert stats.n_returns == 1
+        assert stats.sum_return == pytest.approx(0.02)
+
+
+class TestClosedTwice:
+    """A trade closed by both TradeSync and an executor exit counts once"""
+
+    def _record(self, stats, trade, created=False):
+        with patch('src.scorer.live_stats._lock_stats', return_value=(stats, created)):
+            return record_closed_trade(MagicMock(), trade)
+
+    def test_last_folded_trade_is_skipped(self):
+        trades = _trades(3)
+        stats = _fold(trades[:2])
+
+        self._record(stats, trades[2])
+        self._record(stats, trades[2])
+
+        assert stats.n_trades == 3
+        assert stats.last_trade_id == trades[2].id
+        assert stats.total_pnl == pytest.approx(sum(t.pnl_usd for t in trades))
+
+    def test_overwritten_exit_rebuilds(self):
+        stats = _fold(_trades(2))
+        trade = Trade(id=uuid.uuid4(), strategy_id=stats.strategy_id, entry_price=100.0, entry_size=1.0)
+        set_committed_value(trade, 'exit_time', datetime(2026, 1, 1, 3))  # Closed by TradeSync
+        trade.exit_time = datetime(2026, 1, 2)
+        trade.pnl_usd = 1.0
+
+        with patch('src.scorer.live_stats.rebuild_live_stats') as rebuild:
+            self._record(stats, trade)
+
+        rebuild.assert_called_once()
+        assert stats.n_trades == 2
+
+    def test_executor_skips_trade_closed_by_trade_sync(self):
+        pytest.importorskip('hyperliquid')
+        from src.executor import main_continuous
+
+        trade = _open_trade()
+        stats, recorder = _fold_recorder()
+        process = _executor_process()
+
+        def query(model):
+            # Stand-in for the trades table: honours an exit_time IS NULL filter
+            def filter(*criteria):
+                open_only = any('exit_time IS NULL' in str(c) for c in criteria)
+                found = trade if trade.exit_time is None or not open_only else None
+                return MagicMock(first=MagicMock(return_value=found))
+            return MagicMock(filter=filter)
+
+        session = MagicMock(query=query)
+        get_session = MagicMock()
+        get_session.return_value.__enter__.return_value = session
+
+        with patch.object(main_continuous, 'get_session', get_session), \
+                patch.object(main_continuous, 'record_closed_trade', recorder):
+            process._record_exit({'id': trade.id, 'symbol': 'BTC'}, 102.0, 'TP')
+            process._record_exit({'id': trade.id, 'symbol': 'BTC'}, 98.0, 'SL')
+
+        assert stats.n_trades == 1
+        assert trade.exit_price == 102.0
+        assert trade.exit_reason == 'TP'
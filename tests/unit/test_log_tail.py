@@ -0,0 +1,202 @@
+"""
+Unit tests for the seek-based log tail reader (src.api.log_tail)
+
+LogTailReader must return what reading the whole file and walking it
+backwards returned, for any block size, and stay correct when the file
+grows, rotates or is truncated between requests. LogFollower must return
+only lines completed since the previous poll.
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from src.api.log_tail import LOG_LEVELS, LineFilter, LogFollower, LogTailReader, parse_log_line
+
+
+LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+
+
+def _log_lines(n: int, seed: int = 11, start: int = 0):
+    rng = np.random.default_rng(seed)
+    lines = []
+    for k in range(start, start + n):
+        level = LEVELS[rng.integers(0, 5)]
+        kind = rng.integers(0, 10)
+        if kind == 0:
+            lines.append('')
+        elif kind == 1:
+            lines.append(f'2026-01-01 10:00:{k % 60:02d},123 - src.api.routes - {level} - api call {k} ñ')
+        elif kind == 2:
+            lines.append(f'{level}:     127.0.0.1:{k} - "GET /api/status" 200 OK')
+        elif kind == 3:
+            lines.append(f'  Traceback continuation {k}')
+        else:
+            lines.append(f'2026-01-01 10:{k % 60:02d}:00 {level:<8} src.generator.main: Generated strategy {k}')
+    return lines
+
+
+def _reference(path, lines=500, level=None, search=None):
+    """Whole-file readlines tail the reader replaced"""
+    min_idx = LOG_LEVELS.index(level.upper()) if level else 0
+    result = []
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in reversed(f.readlines()):
+            line = line.strip()
+            parsed = parse_log_line(line) if line else None
+            if not parsed:
+                continue
+            if parsed.level in LOG_LEVELS and LOG_LEVELS.index(parsed.level) < min_idx:
+                continue
+            if search and search.lower() not in parsed.message.lower() and search.lower() not in parsed.logger.lower():
+                continue
+            result.append(parsed)
+            if len(result) >= lines:
+                break
+    return result
+
+
+def _key(lines):
+    # Uvicorn lines carry the parse time as timestamp
+    return [(l.level, l.logger, l.message) for l in lines]
+
+
+def _write(path, lines, mode='w'):
+    with open(path, mode, encoding='utf-8') as f:
+        f.write(''.join(line + '\n' for line in lines))
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    path = tmp_path / 'generator.log'
+    _write(path, _log_lines(3000))
+    return path
+
+
+class TestLogTailReader:
+    @pytest.mark.parametrize('block_size', [7, 100, 4096, 64 * 1024])
+    @pytest.mark.parametrize('lines,level,search', [
+        (50, None, None),
+        (500, 'warning', None),
+        (20, None, 'STRATEGY 2'),
+        (5000, 'ERROR', 'api'),
+    ])
+    def test_matches_whole_file_read(self, log_path, block_size, lines, level, search):
+        reader = LogTailReader(block_size=block_size)
+        result = reader.read(str(log_path), lines=lines, level=level, search=search)
+        assert _key(result) == _key(_reference(log_path, lines, level, search))
+
+    def test_stops_at_enough_lines(self, log_path):
+        reader = LogTailReader(block_size=1024)
+        reader.read(str(log_path), lines=10)
+        (entry,) = reader._cache.values()
+        assert entry.start > log_path.stat().st_size * 0.9
+        assert entry.end == log_path.stat().st_size
+
+    def test_appended_lines_merge_with_cache(self, log_path):
+        reader = LogTailReader(block_size=512)
+        reader.read(str(log_path), lines=100, level='INFO')
+        (entry,) = reader._cache.values()
+        start = entry.start
+
+        _write(log_path, _log_lines(30, seed=12, start=3000), mode='a')
+        result = reader.read(str(log_path), lines=100, level='INFO')
+
+        assert _key(result) == _key(_reference(log_path, 100, 'INFO'))
+        assert entry.start == start  # Only the appended bytes were read
+        assert entry.end == log_path.stat().st_size
+
+        # More lines than cached: continue back from the cached start
+        result = reader.read(str(log_path), lines=400, level='INFO')
+        assert _key(result) == _key(_reference(log_path, 400, 'INFO'))
+
+    def test_large_append_replaces_cache(self, log_path):
+        reader = LogTailReader(block_size=512)
+        reader.read(str(log_path), lines=10)
+        _write(log_path, _log_lines(500, seed=13, start=3000), mode='a')
+        assert _key(reader.read(str(log_path), lines=10)) == _key(_reference(log_path, 10))
+        assert _key(reader.read(str(log_path), lines=300)) == _key(_reference(log_path, 300))
+
+    def test_rotation_and_truncation(self, log_path, tmp_path):
+        reader = LogTailReader()
+        reader.read(str(log_path), lines=100)
+
+        rotated = tmp_path / 'new.log'
+        _write(rotated, _log_lines(40, seed=14))
+        os.replace(rotated, log_path)
+        assert _key(reader.read(str(log_path), lines=100)) == _key(_reference(log_path, 100))
+
+        _write(log_path, _log_lines(5, seed=15))  # Same inode, shorter
+        assert _key(reader.read(str(log_path), lines=100)) == _key(_reference(log_path, 100))
+
+    def test_partial_last_line_waits(self, log_path):
+        reader = LogTailReader()
+        with open(log_path, 'a') as f:
+            f.write('2026-01-02 00:00:00 ERROR    src.executor: half writ')
+        assert reader.read(str(log_path), lines=1, level='ERROR')[0].message != 'half written'
+
+        with open(log_path, 'a') as f:
+            f.write('ten\n')
+        assert reader.read(str(log_path), lines=1, level='ERROR')[0].message == 'half written'
+
+    def test_missing_and_empty_file(self, tmp_path):
+        reader = LogTailReader()
+        assert reader.read(str(tmp_path / 'missing.log')) == []
+        (tmp_path / 'empty.log').touch()
+        assert reader.read(str(tmp_path / 'empty.log')) == []
+
+    def test_cache_is_bounded(self, log_path):
+        reader = LogTailReader(max_entries=3)
+        for search in ['a', 'b', 'c', 'd', 'e']:
+            reader.read(str(log_path), lines=5, search=search)
+        assert len(reader._cache) == 3
+
+
+class TestLogFollower:
+    @staticmethod
+    def _expected(tmp_path, new, level=None, search=None):
+        """Matching lines of the appended part, oldest first"""
+        path = tmp_path / 'appended.log'
+        _write(path, new)
+        return _reference(path, 5000, level, search)[::-1]
+
+    def test_only_new_matching_lines(self, log_path, tmp_path):
+        follower = LogFollower(str(log_path), LineFilter('WARNING', 'strategy'))
+        assert follower.poll() == []  # Starts at EOF
+
+        new = _log_lines(200, seed=16, start=3000)
+        _write(log_path, new, mode='a')
+        lines = follower.poll()
+
+        assert lines and _key(lines) == _key(self._expected(tmp_path, new, 'WARNING', 'strategy'))
+        assert follower.poll() == []
+
+    def test_partial_line_and_rotation(self, log_path, tmp_path):
+        follower = LogFollower(str(log_path), LineFilter())
+        follower.poll()
+
+        with open(log_path, 'a') as f:
+            f.write('2026-01-02 00:00:00 INFO     src.rotator: rota')
+        assert follower.poll() == []
+        with open(log_path, 'a') as f:
+            f.write('ted\n')
+        assert [l.message for l in follower.poll()] == ['rotated']
+
+        rotated = tmp_path / 'new.log'
+        _write(rotated, ['2026-01-02 00:00:01 INFO     src.rotator: fresh file'])
+        os.replace(rotated, log_path)
+        assert [l.message for l in follower.poll()] == ['fresh file']
+
+    def test_reads_backlog_in_chunks(self, log_path, tmp_path):
+        follower = LogFollower(str(log_path), LineFilter(), max_read=1000)
+        follower.poll()
+        new = _log_lines(100, seed=17, start=3000)
+        _write(log_path, new, mode='a')
+
+        lines, polls = [], 0
+        while follower.offset < log_path.stat().st_size:
+            lines.extend(follower.poll())
+            polls += 1
+        assert polls > 1
+        assert _key(lines) == _key(self._expected(tmp_path, new))
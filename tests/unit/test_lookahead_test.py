@@ -0,0 +1,110 @@
+"""
+Unit tests for the prefix-stable lookahead testers
+
+LookaheadTester compares prefix indicator runs with one full-data run;
+ShuffleTester compares fake-future runs with the same full-data run.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.strategies.base import StrategyCore
+from src.validator.lookahead_test import LookaheadTester, mismatched_columns
+from src.validator.shuffle_test import ShuffleTester
+
+
+class CausalStrategy(StrategyCore):
+    """EMA/rolling indicators (no future data)"""
+
+    indicator_columns = ['sma', 'ema', 'entry_signal']
+
+    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = df.copy()
+        df['sma'] = df['close'].rolling(20).mean()
+        df['ema'] = df['close'].ewm(span=30, adjust=False).mean()
+        df['entry_signal'] = df['close'] > df['sma']
+        return df
+
+    def generate_signal(self, df, symbol=None):
+        return None
+
+
+class ShiftStrategy(CausalStrategy):
+    """Peeks one bar ahead"""
+
+    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = super().calculate_indicators(df)
+        df['entry_signal'] = df['close'].shift(-1) > df['close']
+        return df
+
+
+class CenteredStrategy(CausalStrategy):
+    """Centered rolling window"""
+
+    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        df = super().calculate_indicators(df)
+        df['sma'] = df['close'].rolling(20, center=True).mean()
+        return df
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(5)
+    n = 600
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, n))
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2025-01-01', periods=n, freq='15min', tz='UTC'),
+        'open': close,
+        'high': close * 1.002,
+        'low': close * 0.998,
+        'close': close,
+        'volume': rng.random(n) * 1000,
+    })
+
+
+class TestLookaheadTester:
+
+    def test_causal_strategy_passes(self, data):
+        result = LookaheadTester().validate(CausalStrategy(), data)
+        assert result.passed
+        assert result.total_bars_tested >= 2
+
+    @pytest.mark.parametrize('strategy_cls, column', [
+        (ShiftStrategy, 'entry_signal'),
+        (CenteredStrategy, 'sma'),
+    ])
+    def test_future_data_is_detected(self, data, strategy_cls, column):
+        result = LookaheadTester().validate(strategy_cls(), data)
+        assert not result.passed
+        assert result.lookahead_detected
+        assert result.biased_indicators == [column]
+
+    def test_truncation_points_are_geometric_and_include_end(self):
+        points = LookaheadTester._truncation_points(50, 589, 5)
+        assert points[0] == 50
+        assert points[-1] == 589
+        gaps = np.diff(points)
+        assert all(gaps[i] < gaps[i + 1] for i in range(len(gaps) - 1))
+
+
+class TestShuffleTester:
+
+    def test_causal_strategy_passes(self, data):
+        result = ShuffleTester(sample_points=5).validate(CausalStrategy(), data)
+        assert result.passed
+        assert result.total_bars_tested == 5
+
+    def test_future_data_is_detected(self, data):
+        result = ShuffleTester(sample_points=5).validate(CenteredStrategy(), data)
+        assert result.lookahead_detected
+
+
+def test_mismatched_columns_treats_nan_as_equal():
+    a = pd.DataFrame({'x': [np.nan, 1.0, 2.0], 'flag': [True, False, True], 'label': ['a', None, 'c']})
+    b = a.copy()
+    assert mismatched_columns(a, b, ['x', 'flag', 'label', 'missing']) == []
+
+    b.loc[2, 'x'] = 2.1
+    b.loc[0, 'label'] = 'z'
+    assert mismatched_columns(a, b, ['x', 'flag', 'label']) == ['x', 'label']
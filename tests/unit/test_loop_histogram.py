@@ -0,0 +1,37 @@
+"""
+Unit tests for the executor loop duration histogram
+"""
+
+from src.executor.loop_histogram import LoopDurationHistogram
+
+
+class TestLoopDurationHistogram:
+
+    def test_percentiles_use_bucket_upper_bounds(self):
+        histogram = LoopDurationHistogram(buckets=(1.0, 5.0, 10.0))
+        for seconds in [0.2] * 90 + [3.0] * 8 + [7.0, 12.0]:
+            histogram.observe(seconds)
+
+        assert histogram.count == 100
+        assert histogram.percentile(50) == 1.0
+        assert histogram.percentile(95) == 5.0
+        # Open-ended last bucket reports the observed max
+        assert histogram.percentile(100) == 12.0
+        assert histogram.max == 12.0
+
+    def test_percentile_never_exceeds_max(self):
+        histogram = LoopDurationHistogram(buckets=(1.0, 5.0))
+        histogram.observe(2.0)
+        assert histogram.percentile(50) == 2.0
+
+    def test_reset_and_summary(self):
+        histogram = LoopDurationHistogram()
+        assert histogram.summary() == "no loops"
+        assert histogram.percentile(50) is None
+
+        histogram.observe(0.3)
+        assert 'n=1' in histogram.summary()
+
+        histogram.reset()
+        assert histogram.count == 0
+        assert histogram.max is None
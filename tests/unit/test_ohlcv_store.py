@@ -0,0 +1,155 @@
+"""
+Unit tests for the monthly-partitioned OHLCV store
+
+Partitioned reads must match the legacy single-file reads, and incremental
+writes must only touch the months they cover.
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.cache_reader import BacktestCacheReader
+from src.data.ohlcv_store import OHLCVStore
+
+
+def _ohlcv(start: str, periods: int, seed: int = 1, freq: str = '1h') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range(start, periods=periods, freq=freq, tz='UTC')
+    close = 100.0 * np.cumprod(1 + rng.normal(0, 0.01, periods))
+    return pd.DataFrame({
+        'timestamp': ts,
+        'open': close * 0.999,
+        'high': close * 1.002,
+        'low': close * 0.998,
+        'close': close,
+        'volume': rng.random(periods) * 1000,
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    return OHLCVStore(str(tmp_path))
+
+
+class TestOHLCVStore:
+
+    def test_write_splits_by_month_and_round_trips(self, store):
+        df = _ohlcv('2025-01-20', 24 * 60)  # Jan 20 -> Mar 21
+        store.write('BTC', '1h', df)
+
+        manifest = store.manifest('BTC', '1h')
+        assert sorted(manifest['partitions']) == ['2025-01', '2025-02', '2025-03']
+        assert manifest['rows'] == len(df)
+        assert manifest['gaps'] == []
+
+        read = store.read('BTC', '1h')
+        assert (read['timestamp'].values == df['timestamp'].values).all()
+        np.testing.assert_array_equal(read['close'].values, df['close'].values)
+
+    def test_incremental_write_only_rewrites_touched_months(self, store):
+        store.write('BTC', '1h', _ohlcv('2025-01-01', 24 * 70))
+        series_dir = store.series_dir('BTC', '1h')
+        january_mtime = (series_dir / '2025-01.parquet').stat().st_mtime_ns
+
+        tail = _ohlcv('2025-03-12', 48, seed=2)
+        store.write('BTC', '1h', tail)
+
+        assert (series_dir / '2025-01.parquet').stat().st_mtime_ns == january_mtime
+        read = store.read('BTC', '1h')
+        assert read['timestamp'].is_unique
+        assert read['timestamp'].max() == tail['timestamp'].max()
+        # New rows win over stored rows with the same timestamp
+        overlap = read[read['timestamp'] == tail['timestamp'].iloc[0]]
+        assert overlap['close'].iloc[0] == tail['close'].iloc[0]
+
+    def test_read_loads_only_overlapping_partitions(self, store):
+        store.write('BTC', '1h', _ohlcv('2025-01-01', 24 * 120))
+
+        with patch('src.data.ohlcv_store.pd.read_parquet', wraps=pd.read_parquet) as read_parquet:
+            df = store.read('BTC', '1h', start='2025-03-05', end='2025-03-20')
+
+        assert [call.args[0].name for call in read_parquet.call_args_list] == ['2025-03.parquet']
+        assert df['timestamp'].min() == pd.Timestamp('2025-03-05', tz='UTC')
+        assert df['timestamp'].max() == pd.Timestamp('2025-03-20', tz='UTC')
+
+    def test_manifest_tracks_gaps_inside_and_across_partitions(self, store):
+        df = _ohlcv('2025-01-25', 24 * 20)
+        ts = df['timestamp']
+        inside = (ts >= '2025-01-26 00:00') & (ts < '2025-01-26 03:00')
+        across = (ts >= '2025-01-31 22:00') & (ts < '2025-02-01 02:00')
+        store.write('BTC', '1h', df[~inside & ~across])
+
+        gaps = store.manifest('BTC', '1h')['gaps']
+        assert [gap[2] for gap in gaps] == [3, 4]
+
+        # Filling the hole clears it
+        store.write('BTC', '1h', df[across])
+        assert [gap[2] for gap in store.manifest('BTC', '1h')['gaps']] == [3]
+
+    def test_replace_drops_stale_partitions(self, store):
+        store.write('BTC', '1h', _ohlcv('2025-01-01', 24 * 70))
+        store.write('BTC', '1h', _ohlcv('2025-03-01', 24 * 5), replace=True)
+
+        assert sorted(store.manifest('BTC', '1h')['partitions']) == ['2025-03']
+        assert not (store.series_dir('BTC', '1h') / '2025-01.parquet').exists()
+
+    def test_write_repairs_missing_and_corrupted_partitions(self, store):
+        store.write('BTC', '1h', _ohlcv('2025-01-01', 24 * 70))
+        series_dir = store.series_dir('BTC', '1h')
+        (series_dir / '2025-01.parquet').unlink()
+        (series_dir / '2025-03.parquet').write_bytes(b'not parquet')
+
+        tail = _ohlcv('2025-03-05', 24, seed=2)
+        store.write('BTC', '1h', tail)
+
+        manifest = store.manifest('BTC', '1h')
+        assert sorted(manifest['partitions']) == ['2025-02', '2025-03']
+        assert manifest['partitions']['2025-03']['rows'] == len(tail)
+        read = store.read('BTC', '1h')
+        assert len(read) == 24 * 28 + len(tail)
+
+    def test_migrate_legacy_file(self, store, tmp_path):
+        df = _ohlcv('2025-01-01', 24 * 45)
+        df.to_parquet(tmp_path / 'ETH_1h.parquet')
+        assert store.list_series('1h') == [('ETH', '1h')]
+
+        assert store.migrate_legacy('ETH', '1h')
+
+        assert not (tmp_path / 'ETH_1h.parquet').exists()
+        assert store.list_series('1h') == [('ETH', '1h')]
+        assert len(store.read('ETH', '1h')) == len(df)
+
+
+class TestCacheReaderWindow:
+    """Windowed partition reads keep BacktestCacheReader.read semantics"""
+
+    @pytest.mark.parametrize('days,end_date', [
+        (None, None),
+        (20, None),
+        (10, '2025-03-03'),
+        (35, '2025-02-14 12:30'),  # end_date inside a gap
+    ])
+    def test_matches_full_read(self, tmp_path, days, end_date):
+        df = _ohlcv('2025-01-01', 24 * 100)
+        df = df[~df['timestamp'].between('2025-02-13', '2025-02-15')]
+        OHLCVStore(str(tmp_path)).write('BTC', '1h', df)
+        end = pd.Timestamp(end_date, tz='UTC') if end_date else None
+
+        expected = df if end is None else df[df['timestamp'] <= end]
+        if days is not None:
+            expected = expected[expected['timestamp'] >= expected['timestamp'].max() - timedelta(days=days)]
+
+        read = BacktestCacheReader(str(tmp_path)).read('BTC', '1h', days=days, end_date=end)
+        assert (read['timestamp'].values == expected['timestamp'].values).all()
+
+    def test_cache_info_from_manifest(self, tmp_path):
+        OHLCVStore(str(tmp_path)).write('BTC', '1h', _ohlcv('2025-01-01', 24 * 30 + 1))
+
+        info = BacktestCacheReader(str(tmp_path)).get_cache_info('BTC', '1h')
+
+        assert info['candles'] == 24 * 30 + 1
+        assert info['days'] == 30
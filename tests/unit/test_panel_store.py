@@ -0,0 +1,127 @@
+"""
+Unit tests for the shared OHLCV panel store
+
+Panel reads must be indistinguishable from parquet reads
+(BacktestCacheReader.read semantics), and fall back to parquet whenever
+the panel can't answer a request.
+"""
+
+import os
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.cache_reader import BacktestCacheReader
+from src.backtester.data_loader import BacktestDataLoader
+from src.backtester.panel_store import PanelStore
+
+
+def _ohlcv(start: str, periods: int, seed: int, drop_every: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    ts = pd.date_range(start, periods=periods, freq='15min', tz='UTC')
+    close = 100.0 * np.cumprod(1 + rng.normal(0, 0.01, periods))
+    df = pd.DataFrame({
+        'timestamp': ts,
+        'open': close * 0.999,
+        'high': close * 1.002,
+        'low': close * 0.998,
+        'close': close,
+        'volume': rng.random(periods) * 1000,
+    })
+    if drop_every:
+        df = df[df.index % drop_every != 0].reset_index(drop=True)
+    return df
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    cache = tmp_path / 'binance'
+    cache.mkdir()
+    _ohlcv('2025-01-01', 4000, 1).to_parquet(cache / 'BTC_15m.parquet')
+    _ohlcv('2025-01-10', 3000, 2).to_parquet(cache / 'ETH_15m.parquet')          # Listed later
+    _ohlcv('2025-01-01', 3800, 3, drop_every=97).to_parquet(cache / 'SOL_15m.parquet')  # Gaps
+    return cache
+
+
+def _assert_same(panel_df: pd.DataFrame, parquet_df: pd.DataFrame):
+    assert len(panel_df) == len(parquet_df)
+    assert (panel_df['timestamp'].values == parquet_df['timestamp'].values).all()
+    for col in ('open', 'high', 'low', 'close', 'volume'):
+        np.testing.assert_array_equal(panel_df[col].values, parquet_df[col].values)
+
+
+class TestPanelStore:
+    """Panel build + reader integration"""
+
+    @pytest.mark.parametrize('days,end_offset', [(None, None), (20, None), (10, -3), (35, -1)])
+    def test_panel_reads_match_parquet(self, cache_dir, days, end_offset):
+        store = PanelStore(cache_dir=str(cache_dir))
+        assert store.rebuild('15m') is not None
+
+        parquet_reader = BacktestCacheReader(str(cache_dir))
+        panel_reader = BacktestCacheReader(str(cache_dir), panel_store=store)
+        end_date = None
+        if end_offset is not None:
+            end_date = pd.Timestamp('2025-02-10', tz='UTC') + timedelta(days=end_offset)
+
+        for symbol in ('BTC', 'ETH', 'SOL'):
+            expected = parquet_reader.read(symbol, '15m', days=days, end_date=end_date)
+            panel_df = store.get('15m').symbol_frame(symbol, days=days, end_date=end_date)
+            assert panel_df is not None
+            _assert_same(panel_df, expected)
+            _assert_same(panel_reader.read(symbol, '15m', days=days, end_date=end_date), expected)
+
+    def test_gapless_columns_are_views_of_the_panel(self, cache_dir):
+        store = PanelStore(cache_dir=str(cache_dir))
+        store.rebuild('15m')
+        panel = store.get('15m')
+
+        df = panel.symbol_frame('BTC', days=10)
+        assert np.shares_memory(df['close'].values, panel.arrays['close'])
+        assert not df['close'].values.flags.writeable
+
+    def test_falls_back_when_panel_cannot_answer(self, cache_dir):
+        store = PanelStore(cache_dir=str(cache_dir), history_days=15)
+        store.rebuild('15m')
+        panel = store.get('15m')
+
+        # Request older than the panel history
+        assert panel.symbol_frame('BTC', days=30) is None
+        assert panel.symbol_frame('BTC', days=10) is not None
+
+        # Reader still returns the full parquet answer
+        reader = BacktestCacheReader(str(cache_dir), panel_store=store)
+        _assert_same(reader.read('BTC', '15m', days=30), BacktestCacheReader(str(cache_dir)).read('BTC', '15m', days=30))
+
+        # Parquet rewritten after the build: panel is ignored for that symbol
+        newer = _ohlcv('2025-01-01', 4100, 9)
+        newer.to_parquet(cache_dir / 'BTC_15m.parquet')
+        os.utime(cache_dir / 'BTC_15m.parquet', ns=(1, 1))
+        _assert_same(reader.read('BTC', '15m', days=10), BacktestCacheReader(str(cache_dir)).read('BTC', '15m', days=10))
+
+    def test_rebuild_swaps_version_and_readers_remap(self, cache_dir):
+        store = PanelStore(cache_dir=str(cache_dir))
+        first = store.rebuild('15m')
+        assert store.get('15m').version == first
+
+        _ohlcv('2025-01-01', 4200, 1).to_parquet(cache_dir / 'BTC_15m.parquet')
+        second = PanelStore(cache_dir=str(cache_dir)).rebuild('15m')
+
+        assert second != first
+        assert store.get('15m').version == second
+        assert len(store.get('15m').symbol_frame('BTC')) == 4200
+
+    def test_is_oos_split_matches_parquet_loader(self, cache_dir):
+        PanelStore(cache_dir=str(cache_dir)).rebuild('15m')
+
+        panel_loader = BacktestDataLoader(str(cache_dir))
+        parquet_loader = BacktestDataLoader(str(cache_dir), panel_store=PanelStore(str(cache_dir), panel_dir=str(cache_dir / 'none')))
+
+        is_df, oos_df = panel_loader.load_is_oos('BTC', '15m', is_days=20, oos_days=10)
+        exp_is, exp_oos = parquet_loader.load_is_oos('BTC', '15m', is_days=20, oos_days=10)
+
+        _assert_same(is_df, exp_is)
+        _assert_same(oos_df, exp_oos)
+        assert list(oos_df.index) == list(exp_oos.index)
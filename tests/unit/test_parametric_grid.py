@@ -0,0 +1,245 @@
+"""
+Unit tests for the batched parametric grid kernel
+
+The grid kernel must reproduce the per-combo reference path
+(_simulate_single_param_set(_v2) + _calc_metrics) for every combination.
+"""
+
+import numpy as np
+import pytest
+
+from src.backtester.parametric_backtest import (
+    ParametricBacktester,
+    _calc_metrics,
+    _simulate_single_param_set,
+    _simulate_single_param_set_v2,
+    _convert_sl_to_pct,
+    _convert_tp_to_pct,
+)
+from src.backtester.parametric_constants import BREAKEVEN_BUFFER
+from src.strategies.base import StopLossType, TakeProfitType
+
+
+METRIC_NAMES = ['sharpe', 'max_drawdown', 'win_rate', 'expectancy', 'total_trades', 'total_return']
+
+
+@pytest.fixture
+def config():
+    return {
+        'backtesting': {'initial_capital': 10000.0},
+        'risk': {
+            'limits': {'max_open_positions_per_subaccount': 5},
+            'fixed_fractional': {'risk_per_trade_pct': 0.02},
+        },
+        'hyperliquid': {'fee_rate': 0.00045, 'slippage': 0.0005, 'min_notional': 10.0},
+    }
+
+
+@pytest.fixture
+def panel():
+    """Synthetic (n_bars, n_symbols) OHLC panel with random entry signals"""
+    rng = np.random.default_rng(7)
+    n_bars, n_symbols = 600, 6
+    close = 100.0 * np.cumprod(1 + rng.normal(0, 0.006, (n_bars, n_symbols)), axis=0)
+    high = close * (1 + np.abs(rng.normal(0, 0.004, (n_bars, n_symbols))))
+    low = close * (1 - np.abs(rng.normal(0, 0.004, (n_bars, n_symbols))))
+    entries = rng.random((n_bars, n_symbols)) < 0.03
+    directions = np.where(rng.random((n_bars, n_symbols)) < 0.5, 1, -1).astype(np.int8)
+    max_leverages = np.array([50, 20, 10, 5, 3, 40], dtype=np.int32)
+    funding = np.cumsum(rng.normal(0, 1e-5, (n_bars, n_symbols)), axis=0)
+    return {
+        'ohlc': {'close': close, 'high': high, 'low': low},
+        'entries': entries,
+        'directions': directions,
+        'max_leverages': max_leverages,
+        'funding': funding,
+    }
+
+
+def _reference_row(bt, equity_curve, trade_pnls, trade_wins):
+    return dict(zip(
+        METRIC_NAMES,
+        _calc_metrics(equity_curve, trade_pnls, trade_wins, bt.initial_capital, bt.bars_per_year),
+    ))
+
+
+def _params_key(params):
+    return tuple(sorted(params.items()))
+
+
+def _assert_matches(df, expected):
+    for exp in expected:
+        row = df[
+            (df['leverage'] == exp['leverage']) &
+            (df['exit_bars'] == exp['exit_bars']) &
+            np.isclose(df['sl_pct'], exp['sl_pct']) &
+            np.isclose(df['tp_pct'], exp['tp_pct'])
+        ]
+        if 'params' in exp:
+            row = row[row['params'].apply(lambda p: p == exp['params'])]
+        assert len(row) == 1
+        row = row.iloc[0]
+        assert row['total_trades'] == exp['total_trades']
+        for name in ('sharpe', 'max_drawdown', 'win_rate', 'expectancy', 'total_return'):
+            assert row[name] == pytest.approx(exp[name], rel=1e-7, abs=1e-9), name
+
+
+class TestParametricGridKernel:
+    """Batched kernel vs per-combo reference kernels"""
+
+    def test_backtest_pattern_matches_per_combo_kernel(self, config, panel):
+        bt = ParametricBacktester(config)
+        bt.set_timeframe('15m')
+        df = bt.backtest_pattern(
+            pattern_signals=panel['entries'],
+            ohlc_data=panel['ohlc'],
+            directions=panel['directions'],
+            max_leverages=panel['max_leverages'],
+            funding_cumsum=panel['funding'],
+        )
+
+        param_sets, _ = bt._generate_parameter_sets()
+        assert len(df) == len(param_sets)
+
+        ohlc = panel['ohlc']
+        expected = []
+        for sl_pct, tp_pct, leverage, exit_bars in param_sets:
+            curve, pnls, wins = _simulate_single_param_set(
+                ohlc['close'], ohlc['high'], ohlc['low'],
+                panel['entries'], panel['directions'],
+                sl_pct, tp_pct, leverage, panel['max_leverages'], exit_bars,
+                bt.initial_capital, bt.fee_rate, bt.slippage,
+                bt.max_positions, bt.risk_pct, bt.min_notional,
+                panel['funding'],
+            )
+            row = _reference_row(bt, curve, pnls, wins)
+            row.update(sl_pct=sl_pct, tp_pct=tp_pct, leverage=leverage, exit_bars=exit_bars)
+            expected.append(row)
+
+        _assert_matches(df, expected)
+        assert df['score'].is_monotonic_decreasing
+
+    def test_backtest_typed_trailing_matches_per_combo_kernel(self, config, panel):
+        bt = ParametricBacktester(config)
+        bt.set_parameter_space({'exit_bars': [0, 20]})
+        df = bt.backtest_typed(
+            pattern_signals=panel['entries'],
+            ohlc_data=panel['ohlc'],
+            directions=panel['directions'],
+            max_leverages=panel['max_leverages'],
+            sl_type=StopLossType.TRAILING,
+            tp_type=TakeProfitType.RR_RATIO,
+            funding_cumsum=panel['funding'],
+        )
+
+        param_sets, _ = bt._generate_typed_param_sets(StopLossType.TRAILING, TakeProfitType.RR_RATIO)
+        assert len(df) == len(param_sets)
+
+        ohlc = panel['ohlc']
+        entries = panel['entries']
+        expected = []
+        for params in param_sets[::7]:
+            sl_params, tp_params = params['sl_params'], params['tp_params']
+            sl_pcts = _convert_sl_to_pct(
+                StopLossType.TRAILING, entries, ohlc['close'], panel['directions'],
+                trailing_pct=sl_params['trailing_pct'],
+            )
+            tp_pcts = _convert_tp_to_pct(
+                TakeProfitType.RR_RATIO, entries, ohlc['close'], panel['directions'],
+                sl_pcts, rr_ratio=tp_params['rr_ratio'],
+            )
+            curve, pnls, wins = _simulate_single_param_set_v2(
+                ohlc['close'], ohlc['high'], ohlc['low'], entries, panel['directions'],
+                sl_pcts, tp_pcts, params['leverage'], panel['max_leverages'], params['exit_bars'],
+                bt.initial_capital, bt.fee_rate, bt.slippage,
+                bt.max_positions, bt.risk_pct, bt.min_notional,
+                True, sl_params['activation_pct'], BREAKEVEN_BUFFER,
+                panel['funding'],
+            )
+            row = _reference_row(bt, curve, pnls, wins)
+            row.update(
+                sl_pct=float(np.median(sl_pcts[entries])),
+                tp_pct=float(np.median(tp_pcts[entries])),
+                leverage=params['leverage'],
+                exit_bars=params['exit_bars'],
+                params={
+                    'sl_type': 'trailing',
+                    'tp_type': 'rr_ratio',
+                    **sl_params,
+                    **tp_params,
+                    'leverage': params['leverage'],
+                    'exit_bars': params['exit_bars'],
+                },
+            )
+            expected.append(row)
+
+        _assert_matches(df, expected)
+
+    def test_typed_atr_no_signals_returns_zero_metrics(self, config, panel):
+        bt = ParametricBacktester(config)
+        df = bt.backtest_typed(
+            pattern_signals=np.zeros_like(panel['entries']),
+            ohlc_data=panel['ohlc'],
+            directions=panel['directions'],
+            max_leverages=panel['max_leverages'],
+            sl_type=StopLossType.ATR,
+            tp_type=TakeProfitType.ATR,
+        )
+
+        assert len(df) > 0
+        assert (df['total_trades'] == 0).all()
+        assert (df['sharpe'] == 0).all()
+
+
+class TestSuccessiveHalving:
+    """backtesting.parametric_search.mode = halving"""
+
+    def _run(self, config, panel, mode, **search):
+        config = {**config, 'backtesting': {**config['backtesting'], 'parametric_search': {'mode': mode, **search}}}
+        bt = ParametricBacktester(config)
+        bt.set_timeframe('15m')
+        return bt.backtest_typed(
+            pattern_signals=panel['entries'],
+            ohlc_data=panel['ohlc'],
+            directions=panel['directions'],
+            max_leverages=panel['max_leverages'],
+            sl_type=StopLossType.PERCENTAGE,
+            tp_type=TakeProfitType.PERCENTAGE,
+            funding_cumsum=panel['funding'],
+        )
+
+    def test_survivors_have_exhaustive_metrics(self, config, panel):
+        exhaustive = self._run(config, panel, 'exhaustive')
+        halving = self._run(config, panel, 'halving', min_combos=0, min_survivors=10)
+
+        assert 10 <= len(halving) < len(exhaustive)
+        assert halving.attrs['combinations_total'] == len(exhaustive)
+        assert halving['score'].is_monotonic_decreasing
+
+        by_params = {_params_key(row['params']): row for _, row in exhaustive.iterrows()}
+        for _, row in halving.iterrows():
+            expected = by_params[_params_key(row['params'])]
+            for name in METRIC_NAMES + ['score']:
+                assert row[name] == pytest.approx(expected[name], rel=1e-9, abs=1e-12), name
+
+    def test_full_fidelity_rung_keeps_exhaustive_top(self, config, panel):
+        exhaustive = self._run(config, panel, 'exhaustive')
+        halving = self._run(
+            config, panel, 'halving',
+            min_combos=0, min_survivors=0, keep_fraction=0.25, rungs=[{'bars': 1.0, 'symbols': 1.0}],
+        )
+
+        n_keep = int(np.ceil(0.25 * len(exhaustive)))
+        # Same scores as the exhaustive top n_keep (combos may differ only among ties)
+        np.testing.assert_allclose(halving['score'].values, exhaustive['score'].values[:n_keep])
+
+    def test_small_grid_runs_exhaustively(self, config, panel):
+        exhaustive = self._run(config, panel, 'exhaustive')
+        halving = self._run(config, panel, 'halving', min_combos=len(exhaustive) + 1)
+
+        assert len(halving) == len(exhaustive)
+
+    def test_unknown_mode_raises(self, config):
+        config = {**config, 'backtesting': {**config['backtesting'], 'parametric_search': {'mode': 'random'}}}
+        with pytest.raises(ValueError, match='parametric_search.mode'):
+            ParametricBacktester(config)
@@ -0,0 +1,141 @@
+"""
+Unit tests for the executor's in-memory open position index
+"""
+
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from src.executor.position_index import OpenPositionIndex
+
+
+def _trade(subaccount_id, symbol):
+    trade = MagicMock()
+    trade.id = uuid4()
+    trade.subaccount_id = subaccount_id
+    trade.symbol = symbol
+    trade.direction = 'LONG'
+    trade.entry_price = 100.0
+    trade.entry_size = 1.5
+    return trade
+
+
+@pytest.fixture
+def mock_session():
+    with patch('src.executor.position_index.get_session') as mock_session:
+        mock_ctx = MagicMock()
+        mock_ctx.__enter__ = MagicMock(return_value=mock_ctx)
+        mock_ctx.__exit__ = MagicMock(return_value=False)
+        mock_session.return_value = mock_ctx
+        yield mock_ctx
+
+
+class TestOpenPositionIndex:
+
+    def test_lookups_after_refresh_need_no_queries(self, mock_session):
+        mock_session.query.return_value.filter.return_value.all.return_value = [
+            _trade(1, 'BTC'), _trade(1, 'ETH'), _trade(2, 'BTC'),
+        ]
+        index = OpenPositionIndex(refresh_seconds=3600)
+        index.refresh()
+        mock_session.query.reset_mock()
+
+        assert index.get(1, 'BTC')['symbol'] == 'BTC'
+        assert index.get(2, 'ETH') is None
+        assert index.count(1) == 2
+        assert index.count(3) == 0
+        mock_session.query.assert_not_called()
+
+    def test_get_returns_copy(self, mock_session):
+        mock_session.query.return_value.filter.return_value.all.return_value = [_trade(1, 'BTC')]
+        index = OpenPositionIndex(refresh_seconds=3600)
+
+        index.get(1, 'BTC')['subaccount_id'] = 1
+        assert 'subaccount_id' not in index.get(1, 'BTC')
+
+    def test_add_and_remove_track_executor_writes(self, mock_session):
+        mock_session.query.return_value.filter.return_value.all.return_value = []
+        index = OpenPositionIndex(refresh_seconds=3600)
+        index.refresh()
+
+        index.add(4, {'id': 'abc', 'symbol': 'SOL', 'direction': 'SHORT',
+                      'entry_price': 20.0, 'entry_size': 3.0})
+        assert index.get(4, 'SOL')['id'] == 'abc'
+        assert index.count(4) == 1
+
+        index.remove('abc')
+        assert index.get(4, 'SOL') is None
+
+    def test_stale_index_is_reconciled(self, mock_session):
+        mock_session.query.return_value.filter.return_value.all.return_value = []
+        index = OpenPositionIndex(refresh_seconds=0)
+        assert index.count(1) == 0
+
+        # Trade opened by another component
+        mock_session.query.return_value.filter.return_value.all.return_value = [_trade(1, 'BTC')]
+        assert index.count(1) == 1
+
+    def test_count_includes_every_open_trade_on_a_symbol(self, mock_session):
+        first, second = _trade(1, 'BTC'), _trade(1, 'BTC')
+        mock_session.query.return_value.filter.return_value.all.return_value = [first, second]
+        index = OpenPositionIndex(refresh_seconds=3600)
+        index.refresh()
+
+        assert index.count(1) == 2
+        assert index.get(1, 'BTC')['id'] == str(first.id)
+
+        index.remove(str(first.id))
+        assert index.count(1) == 1
+        assert index.get(1, 'BTC')['id'] == str(second.id)
+
+    def test_confirm_open_drops_trades_closed_elsewhere(self, mock_session):
+        trade = _trade(1, 'BTC')
+        mock_session.query.return_value.filter.return_value.all.return_value = [trade]
+        index = OpenPositionIndex(refresh_seconds=3600)
+        index.refresh()
+
+        mock_session.query.return_value.filter.return_value.first.return_value = (trade.id,)
+        assert index.confirm_open(str(trade.id)) is True
+        assert index.count(1) == 1
+
+        # TradeSync recorded the SL/TP close
+        mock_session.query.return_value.filter.return_value.first.return_value = None
+        assert index.confirm_open(str(trade.id)) is False
+        assert index.get(1, 'BTC') is None
+
+
+class TestExecutorClose:
+
+    @pytest.fixture
+    def process(self):
+        pytest.importorskip('hyperliquid')
+        from src.executor.main_continuous import ContinuousExecutorProcess
+
+        process = object.__new__(ContinuousExecutorProcess)
+        process.dry_run = False
+        process.client = MagicMock()
+        process.position_index = MagicMock()
+        process._record_exit = MagicMock()
+        return process
+
+    def _close(self, process):
+        import asyncio
+        signal = MagicMock(reason='signal')
+        asyncio.run(process._close_position(
+            {'id': 1}, {'id': 'abc', 'symbol': 'BTC', 'entry_price': 100.0}, signal, 101.0
+        ))
+
+    def test_trade_closed_by_sync_is_not_closed_on_exchange(self, process):
+        process.position_index.confirm_open.return_value = False
+        self._close(process)
+
+        process.client.close_position.assert_not_called()
+        process._record_exit.assert_called_once()
+
+    def test_open_trade_is_closed_on_exchange(self, process):
+        process.position_index.confirm_open.return_value = True
+        self._close(process)
+
+        process.client.close_position.assert_called_once_with(1, 'BTC', reason='signal')
+        process._record_exit.assert_called_once()
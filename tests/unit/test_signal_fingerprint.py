@@ -0,0 +1,174 @@
+"""
+Unit tests for entry-signal fingerprinting (pre-backtest dedup)
+
+Index lookups need PostgreSQL; these cover the fingerprints themselves and
+the reference panel read from the OHLCV cache.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.backtest_engine import SIGNAL_WARMUP_BARS
+from src.backtester.signal_fingerprint import (
+    SignalFingerprinter, fingerprint_entries, jaccard, minhash, lsh_bands,
+)
+from src.data.ohlcv_store import OHLCVStore
+
+
+class _Config:
+    """Dotted-key config stand-in"""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get(self, key, default=None):
+        return self.values.get(key, default)
+
+
+def _entries(n: int, every: int, offset: int = 0) -> np.ndarray:
+    entries = np.zeros(n, dtype=bool)
+    entries[offset::every] = True
+    return entries
+
+
+class TestFingerprint:
+
+    def test_identical_entries_same_hash(self):
+        a = fingerprint_entries(_entries(5000, 37), 'k', '15m')
+        b = fingerprint_entries(_entries(5000, 37), 'k', '15m')
+
+        assert a.signal_hash == b.signal_hash
+        assert a.bands == b.bands
+        assert a.n_signals == len(range(0, 5000, 37))
+
+    def test_key_separates_equivalence_classes(self):
+        entries = _entries(5000, 37)
+        long = fingerprint_entries(entries, 'panel|15m|long|percentage|percentage', '15m')
+        short = fingerprint_entries(entries, 'panel|15m|short|percentage|percentage', '15m')
+
+        assert long.signal_hash != short.signal_hash
+        assert not set(long.bands) & set(short.bands)
+
+    def test_near_duplicates_share_bands(self):
+        base = _entries(5000, 37)
+        near = base.copy()
+        near[np.flatnonzero(base)[:3]] = False  # ~98% Jaccard
+        other = _entries(5000, 41, offset=5)
+
+        a = fingerprint_entries(base, 'k', '15m')
+        b = fingerprint_entries(near, 'k', '15m')
+        c = fingerprint_entries(other, 'k', '15m')
+
+        assert a.signal_hash != b.signal_hash
+        assert set(a.bands) & set(b.bands)
+        assert jaccard(a.bitset, b.bitset) == pytest.approx(1 - 3 / a.n_signals)
+        assert jaccard(a.bitset, c.bitset) < 0.1
+
+    def test_minhash_estimates_jaccard(self):
+        rng = np.random.default_rng(0)
+        a = rng.choice(100_000, 2000, replace=False)
+        b = np.concatenate([a[:1500], rng.choice(np.arange(100_000, 200_000), 500, replace=False)])
+        expected = 1500 / 3000
+
+        estimate = np.mean(minhash(a) == minhash(b))
+
+        assert estimate == pytest.approx(expected, abs=0.15)
+        assert len(lsh_bands(minhash(a), 'k')) == 16
+
+
+class _EveryNBars:
+    """Minimal strategy: entry every n bars"""
+    signal_column = 'entry_signal'
+    direction = 'long'
+
+    def __init__(self, every: int):
+        self.every = every
+
+    def calculate_indicators(self, df):
+        df = df.copy()
+        df['entry_signal'] = (np.arange(len(df)) % self.every) == 0
+        return df
+
+
+@pytest.fixture
+def fingerprinter(tmp_path):
+    store = OHLCVStore(str(tmp_path))
+    ts = pd.date_range('2025-04-20', '2025-06-02', freq='1h', tz='UTC')
+    for symbol in ['BTC', 'ETH']:
+        store.write(symbol, '1h', pd.DataFrame({
+            'timestamp': ts, 'open': 1.0, 'high': 1.0, 'low': 1.0, 'close': 1.0, 'volume': 1.0,
+        }))
+    return SignalFingerprinter(_Config({
+        'backtesting.signal_fingerprint.reference_symbols': ['BTC', 'ETH'],
+        'backtesting.signal_fingerprint.reference_end': '2025-06-01',
+        'backtesting.signal_fingerprint.reference_days': 30,
+    }), str(tmp_path))
+
+
+class TestSignalFingerprinter:
+
+    def test_reference_panel_window(self, fingerprinter):
+        panel = fingerprinter.reference_panel('1h')
+
+        assert list(panel) == ['BTC', 'ETH']
+        assert len(panel['BTC']) == 30 * 24 + 1
+
+    def test_fingerprint_skips_warmup_and_sparse_strategies(self, fingerprinter):
+        fp = fingerprinter.fingerprint(_EveryNBars(24), '1h')
+
+        bars = 30 * 24 + 1
+        per_symbol = len([i for i in range(0, bars, 24) if i >= SIGNAL_WARMUP_BARS])
+        assert fp.n_bits == 2 * bars
+        assert fp.n_signals == 2 * per_symbol
+        assert fingerprinter.fingerprint(_EveryNBars(10_000), '1h') is None
+
+    def test_exit_parameters_are_part_of_the_key(self, fingerprinter):
+        base = fingerprinter.fingerprint(_EveryNBars(24), '1h')
+        other_exit = _EveryNBars(24)
+        other_exit.exit_after_bars = 40
+        other_tp = _EveryNBars(24)
+        other_tp.tp_pct = 0.05
+
+        assert fingerprinter.fingerprint(_EveryNBars(24), '1h').signal_hash == base.signal_hash
+        assert fingerprinter.fingerprint(other_exit, '1h').signal_hash != base.signal_hash
+        assert fingerprinter.fingerprint(other_tp, '1h').signal_hash != base.signal_hash
+
+    def test_template_exit_constants_are_part_of_the_key(self, fingerprinter):
+        class Template(_EveryNBars):
+            # Generated strategies define uppercase constants over StrategyCore defaults
+            sl_pct, tp_pct, leverage = 0.02, 0.04, 1
+
+            def __init__(self, every, sl, tp, leverage):
+                super().__init__(every)
+                self.SL_PCT, self.TP_PCT, self.LEVERAGE = sl, tp, leverage
+
+        tight = fingerprinter.fingerprint(Template(24, 0.01, 0.03, 2), '1h')
+        wide = fingerprinter.fingerprint(Template(24, 0.05, 0.03, 10), '1h')
+        lowercase = _EveryNBars(24)
+        lowercase.sl_pct, lowercase.tp_pct, lowercase.leverage = 0.01, 0.03, 2
+
+        assert tight.signal_hash != wide.signal_hash
+        assert fingerprinter.fingerprint(lowercase, '1h').signal_hash == tight.signal_hash
+
+    def test_exit_signal_is_part_of_the_key(self, fingerprinter):
+        class WithExits(_EveryNBars):
+            def __init__(self, every, exit_every):
+                super().__init__(every)
+                self.exit_every = exit_every
+
+            def calculate_indicators(self, df):
+                df = super().calculate_indicators(df)
+                df['exit_signal'] = (np.arange(len(df)) % self.exit_every) == 3
+                return df
+
+        base = fingerprinter.fingerprint(_EveryNBars(24), '1h')
+        a = fingerprinter.fingerprint(WithExits(24, 12), '1h')
+        b = fingerprinter.fingerprint(WithExits(24, 6), '1h')
+
+        assert len({base.signal_hash, a.signal_hash, b.signal_hash}) == 3
+        assert fingerprinter.fingerprint(WithExits(24, 12), '1h').signal_hash == a.signal_hash
+
+    def test_missing_reference_data_disables_timeframe(self, fingerprinter):
+        assert fingerprinter.reference_panel('15m') is None
+        assert fingerprinter.fingerprint(_EveryNBars(24), '15m') is None
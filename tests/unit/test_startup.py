@@ -0,0 +1,56 @@
+"""
+Unit tests for startup helpers: lazy package exports and phase timing
+"""
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+from src.utils import startup
+from src.utils.lazy_import import lazy_exports
+
+
+@pytest.fixture
+def package():
+    module = types.ModuleType('lazy_pkg')
+    module.__getattr__, module.__dir__ = lazy_exports('lazy_pkg', {'dumps': 'json'})
+    sys.modules['lazy_pkg'] = module
+    yield module
+    del sys.modules['lazy_pkg']
+
+
+class TestLazyExports:
+
+    def test_export_resolved_on_first_access(self, package):
+        import json
+
+        assert 'dumps' not in vars(package)
+        assert package.dumps is json.dumps
+        assert 'dumps' in vars(package)  # Cached: __getattr__ not hit again
+        assert 'dumps' in dir(package)
+
+    def test_unknown_name_raises_attribute_error(self, package):
+        with pytest.raises(AttributeError):
+            package.loads
+
+    def test_backtester_package_import_does_not_load_numba(self):
+        code = "import sys, src.backtester; assert 'numba' not in sys.modules"
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+
+class TestStartupReport:
+
+    def test_phases_accumulate_into_report(self, monkeypatch):
+        monkeypatch.setattr(startup, '_phases', [])
+        monkeypatch.setattr(startup, '_reported', False)
+
+        with startup.startup_phase('imports'):
+            pass
+        with startup.startup_phase('init'):
+            pass
+
+        report = startup.log_startup_report('test')
+        assert {'imports', 'init', 'total'} <= set(report)
+        assert report['total'] >= report['imports'] + report['init']
@@ -0,0 +1,123 @@
+"""
+Unit tests for the content-hash strategy loader
+
+Identical code must share one module, evicted modules must leave
+sys.modules, and compiled code must be reused from disk (bounded by file
+count).
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from src.strategies.base import StrategyCore
+from src.strategies.loader import MODULE_PREFIX, StrategyLoader, code_hash
+
+STRATEGY_CODE = '''
+from src.strategies.base import StrategyCore
+
+
+class Strategy_{name}(StrategyCore):
+    sl_pct = 0.02
+
+    def calculate_indicators(self, df):
+        return df
+
+    def generate_signal(self, df, symbol=None):
+        return None
+'''
+
+
+def _code(name: str) -> str:
+    return STRATEGY_CODE.format(name=name)
+
+
+@pytest.fixture
+def loader(tmp_path):
+    loader = StrategyLoader(max_modules=2, cache_dir=str(tmp_path))
+    yield loader
+    loader.clear()
+
+
+class TestStrategyLoader:
+
+    def test_same_code_shares_module(self, loader):
+        first = loader.load_class(_code('A'), 'Strategy_A')
+        second = loader.load_class(_code('A'), 'Strategy_A')
+
+        assert first is second
+        assert issubclass(first, StrategyCore)
+        assert first.__module__ == MODULE_PREFIX + code_hash(_code('A'))
+        assert first.__module__ in sys.modules
+        assert loader.get_stats()['hits'] == 1
+
+    def test_class_lookup(self, loader):
+        assert loader.load_class(_code('A'), 'Strategy_Missing') is None
+        assert loader.load_class(_code('A')).__name__ == 'Strategy_A'
+
+    def test_lru_eviction_unregisters_module(self, loader):
+        cls_a = loader.load_class(_code('A'), 'Strategy_A')
+        loader.load_class(_code('B'), 'Strategy_B')
+        loader.load_class(_code('C'), 'Strategy_C')
+
+        assert cls_a.__module__ not in sys.modules
+        assert loader.get_stats()['modules'] == 2
+        assert loader.get_stats()['evictions'] == 1
+        # Instances of evicted classes keep working
+        assert cls_a().sl_pct == 0.02
+
+    def test_compiled_code_reused_from_disk(self, loader, tmp_path):
+        loader.load_class(_code('A'), 'Strategy_A')
+        assert loader.get_stats()['compiles'] == 1
+
+        other = StrategyLoader(cache_dir=str(tmp_path))
+        try:
+            assert other.load_class(_code('A'), 'Strategy_A') is not None
+            assert other.get_stats()['disk_hits'] == 1
+            assert other.get_stats()['compiles'] == 0
+        finally:
+            other.clear()
+
+    def test_disk_cache_prunes_least_recently_used(self, tmp_path):
+        loader = StrategyLoader(cache_dir=str(tmp_path), max_disk_files=3)
+        try:
+            for i, name in enumerate('ABC'):
+                loader.load_module(_code(name))
+                for path in tmp_path.glob(f'{code_hash(_code(name))}.*'):
+                    os.utime(path, (i, i))
+
+            # Reading A from disk makes it the most recently used file
+            reader = StrategyLoader(cache_dir=str(tmp_path))
+            reader.load_module(_code('A'))
+            reader.clear()
+            loader.load_module(_code('D'))
+
+            kept = {path.name.split('.')[0] for path in tmp_path.glob('*.bin')}
+            assert kept == {code_hash(_code(name)) for name in 'AD'}
+        finally:
+            loader.clear()
+
+    def test_disk_cache_listed_only_when_limit_may_be_exceeded(self, tmp_path):
+        loader = StrategyLoader(cache_dir=str(tmp_path), max_disk_files=3)
+        try:
+            with patch.object(loader, '_prune_disk_cache', wraps=loader._prune_disk_cache) as prune:
+                for name in 'ABC':
+                    loader.load_module(_code(name))
+                assert prune.call_count == 1  # First write only
+
+                loader.load_module(_code('D'))
+                assert prune.call_count == 2
+            assert len(list(tmp_path.glob('*.bin'))) == 2
+        finally:
+            loader.clear()
+
+    def test_failing_module_is_not_registered(self, loader):
+        code = _code('A') + '\nraise RuntimeError("boom")\n'
+
+        with pytest.raises(RuntimeError):
+            loader.load_module(code)
+
+        assert MODULE_PREFIX + code_hash(code) not in sys.modules
+        assert loader.get_stats()['modules'] == 0
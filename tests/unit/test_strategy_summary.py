@@ -0,0 +1,107 @@
+"""
+Unit tests for keyset pagination over strategy summaries
+
+The trigger sync needs PostgreSQL; these page an in-memory SQLite copy of
+the table and check cursors walk the (sort value, strategy_id) order
+without gaps or repeats.
+"""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+
+from src.database.models import StrategySummary
+from src.database.strategy_summary import decode_cursor, encode_cursor, keyset_page
+
+
+@compiles(UUID, 'sqlite')
+def _uuid_sqlite(type_, compiler, **kw):
+    return 'CHAR(32)'
+
+
+@pytest.fixture
+def session():
+    engine = create_engine('sqlite://')
+    StrategySummary.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+
+    start = datetime(2026, 1, 1)
+    for k in range(53):
+        session.add(StrategySummary(
+            strategy_id=uuid.uuid4(),
+            name=f'Strategy_MOM_{k:03d}_15m',
+            strategy_type='MOM',
+            timeframe='15m',
+            status='ACTIVE' if k % 3 else 'FAILED',
+            created_at=start + timedelta(hours=k // 4),  # Ties on created_at
+            score_backtest=float(k % 7) if k % 5 else None,
+        ))
+    session.commit()
+    yield session
+    session.close()
+
+
+def _walk(query, sort_column, limit):
+    rows, cursor, pages = [], None, 0
+    while True:
+        page, cursor = keyset_page(query, sort_column, cursor, limit)
+        rows.extend(page)
+        pages += 1
+        if cursor is None:
+            return rows, pages
+
+
+class TestKeysetPage:
+    def test_pages_cover_created_order(self, session):
+        query = session.query(StrategySummary.strategy_id, StrategySummary.created_at)
+        rows, pages = _walk(query, StrategySummary.created_at, limit=10)
+
+        expected = sorted(query.all(), key=lambda r: (r.created_at, r.strategy_id), reverse=True)
+        assert rows == expected
+        assert pages == 6
+
+    def test_filtered_score_ranking(self, session):
+        query = session.query(StrategySummary).filter(
+            StrategySummary.status == 'ACTIVE',
+            StrategySummary.score_backtest.isnot(None),
+        )
+        rows, _ = _walk(query, StrategySummary.score_backtest, limit=4)
+
+        expected = sorted(query.all(), key=lambda r: (r.score_backtest, r.strategy_id), reverse=True)
+        assert [r.strategy_id for r in rows] == [r.strategy_id for r in expected]
+
+    def test_exact_last_page_has_no_cursor(self, session):
+        query = session.query(StrategySummary).filter(StrategySummary.status == 'FAILED')
+        rows, cursor = keyset_page(query, StrategySummary.created_at, None, limit=query.count())
+        assert cursor is None
+        assert len(rows) == 18
+
+    def test_offset_first_page(self, session):
+        query = session.query(StrategySummary.strategy_id, StrategySummary.created_at)
+        all_rows, _ = keyset_page(query, StrategySummary.created_at, None, limit=53)
+        rows, _ = keyset_page(query, StrategySummary.created_at, None, limit=5, offset=20)
+        assert rows == all_rows[20:25]
+
+
+class TestCursor:
+    def test_round_trip(self):
+        strategy_id = uuid.uuid4()
+        ts = datetime(2026, 3, 4, 5, 6, 7, 891011)
+
+        assert decode_cursor(encode_cursor(ts, strategy_id), StrategySummary.created_at) == (ts, strategy_id)
+        assert decode_cursor(encode_cursor(61.25, strategy_id), StrategySummary.score_backtest) == (61.25, strategy_id)
+
+    @pytest.mark.parametrize('cursor', ['', 'not-a-cursor', encode_cursor(1.0, uuid.uuid4())[:-3]])
+    def test_malformed(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, StrategySummary.score_backtest)
+
+    def test_wrong_sort_column(self):
+        cursor = encode_cursor(datetime(2026, 1, 1), uuid.uuid4())
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, StrategySummary.score_backtest)
@@ -0,0 +1,140 @@
+"""
+Unit tests for the columnar trade log and the portfolio metrics kernel
+
+BacktestEngine keeps trades in a TRADE_DTYPE array and computes metrics in
+_portfolio_metrics_numba; both must match the dict trades and the Python
+metrics they replace.
+"""
+
+import numpy as np
+import pytest
+
+from src.backtester.backtest_engine import BacktestEngine
+from src.backtester.trade_log import TRADE_DTYPE, TradeLog
+from src.config import load_config
+
+
+def _reference_metrics(trades, equity_curve, initial_capital, bars_per_year):
+    """The list-of-dicts metrics the kernel replaced"""
+    pnls = np.array([t['pnl'] for t in trades])
+    total_return = pnls.sum() / initial_capital
+    win_rate = (pnls > 0).sum() / len(trades)
+
+    win_pcts = [t['pnl'] / t['notional'] for t in trades if t['notional'] > 0 and t['pnl'] > 0]
+    loss_pcts = [abs(t['pnl'] / t['notional']) for t in trades if t['notional'] > 0 and t['pnl'] <= 0]
+    avg_win = np.mean(win_pcts) if win_pcts else 0.0
+    avg_loss = np.mean(loss_pcts) if loss_pcts else 0.0
+    expectancy = win_rate * avg_win - (1 - win_rate) * avg_loss
+
+    equity = np.maximum(np.array(equity_curve), 0.0)
+    running_max = np.maximum.accumulate(equity)
+    max_drawdown = np.max(np.where(running_max > 0, (running_max - equity) / running_max, 0.0))
+
+    returns = np.array([t['pnl'] / t['margin'] for t in trades if t['margin'] > 0])
+    years = (len(equity_curve) - 1) / bars_per_year
+    sharpe = returns.mean() / returns.std() * np.sqrt(min(len(trades) / years, 365))
+    if total_return < -0.5:
+        sharpe = min(sharpe, -abs(total_return) * 2)
+    elif total_return < 0 and sharpe > 0:
+        sharpe = 0.0
+
+    return {
+        'total_return': total_return,
+        'win_rate': win_rate,
+        'expectancy': expectancy,
+        'max_drawdown': max_drawdown,
+        'sharpe_ratio': sharpe,
+        'profit_factor': pnls[pnls > 0].sum() / -pnls[pnls < 0].sum(),
+        'avg_leverage': np.mean([t['leverage'] for t in trades]),
+        'consistency': np.mean(np.array(equity_curve) > initial_capital),
+        'cagr': (equity_curve[-1] / initial_capital) ** (1 / years) - 1,
+    }
+
+
+@pytest.fixture
+def engine():
+    return BacktestEngine(load_config()._raw_config)
+
+
+@pytest.fixture
+def trade_log():
+    rng = np.random.default_rng(5)
+    n = 500
+    records = np.zeros(n, dtype=TRADE_DTYPE)
+    records['symbol_idx'] = rng.integers(0, 3, n)
+    records['entry_idx'] = np.sort(rng.integers(0, 5000, n))
+    records['exit_idx'] = records['entry_idx'] + rng.integers(1, 50, n)
+    records['entry_price'] = rng.uniform(10, 100, n)
+    records['exit_price'] = records['entry_price'] * (1 + rng.normal(0, 0.02, n))
+    records['margin'] = rng.uniform(10, 100, n)
+    records['leverage'] = rng.integers(1, 10, n)
+    records['notional'] = records['margin'] * records['leverage']
+    records['size'] = records['notional'] / records['entry_price']
+    records['pnl'] = rng.normal(0.5, 5.0, n)
+    records['exit_reason'] = rng.integers(0, 5, n)
+    records['direction'] = rng.choice([1, -1], n)
+    return TradeLog(records, ['AAA', 'BBB', 'CCC'], fee_rate=0.00045)
+
+
+@pytest.fixture
+def equity_curve(trade_log):
+    curve = np.full(5101, 10000.0)
+    np.add.at(curve, trade_log.records['exit_idx'] + 1, trade_log.records['pnl'])
+    return np.cumsum(curve - 10000.0) + 10000.0
+
+
+class TestTradeLog:
+    def test_items_are_trade_dicts(self, trade_log):
+        trade = trade_log[3]
+        row = trade_log.records[3]
+
+        assert trade['symbol'] == trade_log.symbols[row['symbol_idx']]
+        assert trade['pnl'] == row['pnl']
+        assert trade['return_on_margin'] == pytest.approx(row['pnl'] / row['margin'])
+        assert trade['fees'] == pytest.approx(row['notional'] * 0.00045 * 2)
+        assert trade['exit_reason'] in ('sl', 'tp', 'signal', 'time_exit', 'end')
+        assert trade['direction'] == ('long' if row['direction'] == 1 else 'short')
+
+    def test_sequence_protocol(self, trade_log):
+        dicts = trade_log.to_dicts()
+
+        assert len(trade_log) == 500
+        assert list(trade_log) == dicts
+        assert trade_log[-1] == dicts[-1]
+        assert trade_log[10:13] == dicts[10:13]
+        assert trade_log == dicts
+        assert trade_log[0] is dicts[0]  # cached after to_dicts()
+
+    def test_empty(self):
+        trades = TradeLog(np.zeros(0, dtype=TRADE_DTYPE), [], 0.0)
+        assert len(trades) == 0
+        assert not trades
+        assert list(trades) == []
+
+
+class TestPortfolioMetrics:
+    def test_kernel_matches_reference(self, engine, trade_log, equity_curve):
+        metrics = engine._calculate_portfolio_metrics(trade_log, equity_curve, 10000.0, timeframe='15m')
+        expected = _reference_metrics(trade_log.to_dicts(), equity_curve, 10000.0, 35040)
+
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value, rel=1e-9, abs=1e-12), key
+        assert metrics['total_trades'] == 500
+        assert metrics['final_equity'] == equity_curve[-1]
+        assert metrics['trades'] is trade_log
+
+    def test_dict_trades_match_trade_log(self, engine, trade_log, equity_curve):
+        columnar = engine._calculate_portfolio_metrics(trade_log, equity_curve, 10000.0, timeframe='1h')
+        dicts = engine._calculate_portfolio_metrics(
+            trade_log.to_dicts(), list(equity_curve), 10000.0, timeframe='1h'
+        )
+
+        for key in columnar:
+            if key != 'trades':
+                assert dicts[key] == pytest.approx(columnar[key], rel=1e-12), key
+
+    def test_no_trades(self, engine):
+        empty = TradeLog(np.zeros(0, dtype=TRADE_DTYPE), ['AAA'], 0.0)
+        metrics = engine._calculate_portfolio_metrics(empty, np.full(10, 10000.0), 10000.0)
+        assert metrics['total_trades'] == 0
+        assert metrics['sharpe_ratio'] == 0.0
@@ -31,6 +31,7 @@ export async function getStrategies(params?: {
   timeframe?: string;
   limit?: number;
   offset?: number;
+  cursor?: string;
 }) {
   const searchParams = new URLSearchParams();
   if (params?.status) searchParams.set('status', params.status);
@@ -38,6 +39,7 @@ export async function getStrategies(params?: {
   if (params?.timeframe) searchParams.set('timeframe', params.timeframe);
   if (params?.limit) searchParams.set('limit', params.limit.toString());
   if (params?.offset) searchParams.set('offset', params.offset.toString());
+  if (params?.cursor) searchParams.set('cursor', params.cursor);
 
   const query = searchParams.toString();
   return fetchJson<import('../types').StrategiesResponse>(
@@ -127,6 +129,19 @@ export async function getLogs(service: string, params?: {
   );
 }
 
+// Server-Sent Events URL following new log lines (use with EventSource)
+export function getLogStreamUrl(service: string, params?: {
+  level?: string;
+  search?: string;
+}) {
+  const searchParams = new URLSearchParams();
+  if (params?.level) searchParams.set('level', params.level);
+  if (params?.search) searchParams.set('search', params.search);
+
+  const query = searchParams.toString();
+  return `${API_BASE}/logs/${service}/stream${query ? `?${query}` : ''}`;
+}
+
 // Config
 export async function getConfig() {
   return fetchJson<{ config: Record<string, unknown> }>(`${API_BASE}/config`);
@@ -843,8 +843,8 @@ export default function Strategies() {
   const { data: liveData } = useStrategies({ status: 'LIVE', limit: 1 });
 
   const tabCounts: Record<TabType, number | undefined> = {
-    pool: poolData?.total,
-    live: liveData?.total,
+    pool: poolData?.total ?? undefined,
+    live: liveData?.total ?? undefined,
     rankings: undefined,
     history: undefined,
   };
@@ -78,6 +78,15 @@ export interface BacktestMetrics {
   period_days: number | null;
 }
 
+export interface LiveStats {
+  total_trades: number;
+  win_rate: number | null;
+  total_pnl: number;
+  max_drawdown: number;
+  loss_streak: number;
+  last_exit_time: string | null;
+}
+
 export interface StrategyDetail {
   id: string;
   name: string;
@@ -92,13 +101,15 @@ export interface StrategyDetail {
   backtest: BacktestMetrics | null;
   live_pnl: number | null;
   live_trades: number | null;
+  live_stats: LiveStats | null;
 }
 
 export interface StrategiesResponse {
   items: StrategyListItem[];
-  total: number;
+  total: number | null;  // First page only
   limit: number;
   offset: number;
+  next_cursor: string | null;
 }
 
 export interface TradeItem {
@@ -271,6 +282,7 @@ export interface RankingResponse {
   avg_score: number;
   avg_sharpe?: number | null;
   avg_pnl?: number | null;
+  next_cursor: string | null;
 }
 
 // =============================================================================